@@ -12,16 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
-import torch.distributed as dist
 from torch import IntTensor, Tensor
 
 from torchmetrics.detection.helpers import _fix_empty_tensors, _input_validator
+from torchmetrics.functional.detection._coco_eval import _coco_rle_encode, _coco_rle_unpack
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.data import _cumsum
+from torchmetrics.utilities.distributed import _gather_tensor_lists, gather_all_tensors
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _PYCOCOTOOLS_AVAILABLE, _TORCHVISION_GREATER_EQUAL_0_8
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -235,6 +238,9 @@ class MeanAveragePrecision(Metric):
             Else, please provide a list of ints.
         class_metrics:
             Option to enable per-class metrics for mAP and mAR_100. Has a performance impact.
+        num_threads:
+            Number of threads used to evaluate images and to accumulate the precision/recall curves of the classes in
+            parallel during ``compute``. Defaults to ``1``, which evaluates everything in the calling thread.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -244,6 +250,8 @@ class MeanAveragePrecision(Metric):
             If ``iou_type`` is equal to ``segm`` and ``pycocotools`` is not installed
         ValueError:
             If ``class_metrics`` is not a boolean
+        ValueError:
+            If ``num_threads`` is not a positive integer
         ValueError:
             If ``preds`` is not of type (:class:`~List[Dict[str, Tensor]]`)
         ValueError:
@@ -319,6 +327,7 @@ class MeanAveragePrecision(Metric):
         rec_thresholds: Optional[List[float]] = None,
         max_detection_thresholds: Optional[List[int]] = None,
         class_metrics: bool = False,
+        num_threads: int = 1,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -358,6 +367,11 @@ class MeanAveragePrecision(Metric):
             raise ValueError("Expected argument `class_metrics` to be a boolean")
 
         self.class_metrics = class_metrics
+
+        if not isinstance(num_threads, int) or num_threads < 1:
+            raise ValueError(f"Expected argument `num_threads` to be an integer larger than 0 but got {num_threads}")
+        self.num_threads = num_threads
+
         self.add_state("detections", default=[], dist_reduce_fx=None)
         self.add_state("detection_scores", default=[], dist_reduce_fx=None)
         self.add_state("detection_labels", default=[], dist_reduce_fx=None)
@@ -371,13 +385,13 @@ class MeanAveragePrecision(Metric):
         for item in preds:
             detections = self._get_safe_item_values(item)
 
-            self.detections.append(detections)  # type: ignore[arg-type]
+            self.detections.append(detections)
             self.detection_labels.append(item["labels"])
             self.detection_scores.append(item["scores"])
 
         for item in target:
             groundtruths = self._get_safe_item_values(item)
-            self.groundtruths.append(groundtruths)  # type: ignore[arg-type]
+            self.groundtruths.append(groundtruths)
             self.groundtruth_labels.append(item["labels"])
 
     def _move_list_states_to_cpu(self) -> None:
@@ -387,14 +401,10 @@ class MeanAveragePrecision(Metric):
             current_to_cpu = []
             if isinstance(current_val, Sequence):
                 for cur_v in current_val:
-                    # Cannot handle RLE as Tensor
-                    if not isinstance(cur_v, tuple):
-                        cur_v = cur_v.to("cpu")
-                    current_to_cpu.append(cur_v)
+                    current_to_cpu.append(cur_v.to("cpu"))  # noqa: PERF401
             setattr(self, key, current_to_cpu)
 
-    def _get_safe_item_values(self, item: Dict[str, Any]) -> Union[Tensor, Tuple]:
-        import pycocotools.mask as mask_utils
+    def _get_safe_item_values(self, item: Dict[str, Any]) -> Tensor:
         from torchvision.ops import box_convert
 
         if self.iou_type == "bbox":
@@ -403,235 +413,157 @@ class MeanAveragePrecision(Metric):
                 boxes = box_convert(boxes, in_fmt=self.box_format, out_fmt="xyxy")
             return boxes
         if self.iou_type == "segm":
-            masks = []
-            for i in item["masks"].cpu().numpy():
-                rle = mask_utils.encode(np.asfortranarray(i))
-                masks.append((tuple(rle["size"]), rle["counts"]))
-            return tuple(masks)
+            # masks are stored in a packed run-length encoding, such that they can be synced like any other tensor
+            masks = item["masks"] if item["masks"].ndim == 3 else item["masks"].reshape(0, 0, 0)
+            return _coco_rle_encode(masks)
         raise Exception(f"IOU type {self.iou_type} is not supported")
 
+    def _get_item_geometry(self, states: List[Tensor], idx: int) -> Union[Tensor, Tuple]:
+        """Return the boxes or the masks as a tuple of coco rle ``(size, counts)`` pairs of the given image."""
+        if self.iou_type != "segm":
+            return states[idx]
+        import pycocotools.mask as mask_utils
+
+        _, height, width, lengths, counts = _coco_rle_unpack(states[idx].cpu())
+        masks = []
+        for mask_counts in counts.split(lengths.tolist()):
+            rle = mask_utils.frPyObjects({"size": [height, width], "counts": mask_counts.tolist()}, height, width)
+            masks.append((tuple(rle["size"]), rle["counts"]))
+        return tuple(masks)
+
     def _get_classes(self) -> List:
         """Return a list of unique classes found in ground truth and detection data."""
         if len(self.detection_labels) > 0 or len(self.groundtruth_labels) > 0:
             return torch.cat(self.detection_labels + self.groundtruth_labels).unique().tolist()
         return []
 
-    def _compute_iou(self, idx: int, class_id: int, max_det: int) -> Tensor:
-        """Compute the Intersection over Union (IoU) between bounding boxes for the given image and class.
+    def _evaluate_image(self, idx: int, class_ids: List, max_det: int) -> Dict[Tuple[int, int], Optional[dict]]:
+        """Perform evaluation for all classes and area ranges of a single image.
+
+        The boxes or masks, their areas and the IoU matrix of every class are computed once per image and reused for
+        all area ranges. Images are independent of each other, so this can be called concurrently for several images.
 
         Args:
             idx:
-                Image Id, equivalent to the index of supplied samples
-            class_id:
-                Class Id of the supplied ground truth and detection labels
+                Image Id, equivalent to the index of supplied samples.
+            class_ids:
+                List of label class Ids.
             max_det:
-                Maximum number of evaluated detection bounding boxes
-
-        """
-        # if self.iou_type == "bbox":
-        gt = self.groundtruths[idx]
-        det = self.detections[idx]
-
-        gt_label_mask = (self.groundtruth_labels[idx] == class_id).nonzero().squeeze(1)
-        det_label_mask = (self.detection_labels[idx] == class_id).nonzero().squeeze(1)
-
-        if len(gt_label_mask) == 0 or len(det_label_mask) == 0:
-            return Tensor([])
-
-        gt = [gt[i] for i in gt_label_mask]
-        det = [det[i] for i in det_label_mask]
+                Maximum number of evaluated detection bounding boxes.
 
-        if len(gt) == 0 or len(det) == 0:
-            return Tensor([])
+        Returns:
+            Dictionary mapping ``(class_id, area_index)`` to the evaluation result, which is ``None`` if the image has
+            neither ground truths nor detections of that class.
 
-        # Sort by scores and use only max detections
+        """
+        gt = self._get_item_geometry(self.groundtruths, idx)
+        det = self._get_item_geometry(self.detections, idx)
+        gt_areas = compute_area(list(gt), iou_type=self.iou_type).to(self.device)
+        det_areas = compute_area(list(det), iou_type=self.iou_type).to(self.device)
         scores = self.detection_scores[idx]
-        scores_filtered = scores[self.detection_labels[idx] == class_id]
-        inds = torch.argsort(scores_filtered, descending=True)
-
-        # TODO Fix (only for masks is necessary)
-        det = [det[i] for i in inds]
-        if len(det) > max_det:
-            det = det[:max_det]
-
-        return compute_iou(det, gt, self.iou_type).to(self.device)
-
-    def __evaluate_image_gt_no_preds(
-        self, gt: Tensor, gt_label_mask: Tensor, area_range: Tuple[int, int], num_iou_thrs: int
-    ) -> Dict[str, Any]:
-        """Evaluate images with a ground truth but no predictions."""
-        # GTs
-        gt = [gt[i] for i in gt_label_mask]
-        num_gt = len(gt)
-        areas = compute_area(gt, iou_type=self.iou_type).to(self.device)
-        ignore_area = (areas < area_range[0]) | (areas > area_range[1])
-        gt_ignore, _ = torch.sort(ignore_area.to(torch.uint8))
-        gt_ignore = gt_ignore.to(torch.bool)
-
-        # Detections
-        num_det = 0
-        det_ignore = torch.zeros((num_iou_thrs, num_det), dtype=torch.bool, device=self.device)
-
-        return {
-            "dtMatches": torch.zeros((num_iou_thrs, num_det), dtype=torch.bool, device=self.device),
-            "gtMatches": torch.zeros((num_iou_thrs, num_gt), dtype=torch.bool, device=self.device),
-            "dtScores": torch.zeros(num_det, dtype=torch.float32, device=self.device),
-            "gtIgnore": gt_ignore,
-            "dtIgnore": det_ignore,
-        }
+        num_iou_thrs = len(self.iou_thresholds)
 
-    def __evaluate_image_preds_no_gt(
+        results: Dict[Tuple[int, int], Optional[dict]] = {}
+        for class_id in class_ids:
+            gt_label_mask = (self.groundtruth_labels[idx] == class_id).nonzero().squeeze(1)
+            det_label_mask = (self.detection_labels[idx] == class_id).nonzero().squeeze(1)
+
+            # No Gt and No predictions --> ignore image
+            if len(gt_label_mask) == 0 and len(det_label_mask) == 0:
+                results.update({(class_id, area_idx): None for area_idx in range(len(self.bbox_area_ranges))})
+                continue
+
+            # sort dt highest score first and use only max detections
+            scores_sorted, dtind = torch.sort(scores[det_label_mask], descending=True)
+            det_index = det_label_mask[dtind][:max_det]
+            ious = Tensor([])
+            if len(gt_label_mask) > 0 and len(det_index) > 0:
+                ious = compute_iou([det[i] for i in det_index], [gt[i] for i in gt_label_mask], self.iou_type)
+                ious = ious.to(self.device)
+
+            for area_idx, area_range in enumerate(self.bbox_area_ranges.values()):
+                results[class_id, area_idx] = self._evaluate_image_area(
+                    ious,
+                    gt_areas[gt_label_mask] if len(gt_label_mask) > 0 else gt_areas[:0],
+                    det_areas[det_index] if len(det_index) > 0 else det_areas[:0],
+                    scores_sorted,
+                    area_range,
+                    num_iou_thrs,
+                )
+        return results
+
+    def _evaluate_image_area(
         self,
-        det: Tensor,
-        idx: int,
-        det_label_mask: Tensor,
-        max_det: int,
-        area_range: Tuple[int, int],
+        ious: Tensor,
+        gt_areas: Tensor,
+        det_areas: Tensor,
+        scores_sorted: Tensor,
+        area_range: Tuple[float, float],
         num_iou_thrs: int,
     ) -> Dict[str, Any]:
-        """Evaluate images with a prediction but no ground truth."""
-        # GTs
-        num_gt = 0
-
-        gt_ignore = torch.zeros(num_gt, dtype=torch.bool, device=self.device)
-
-        # Detections
-
-        det = [det[i] for i in det_label_mask]
-        scores = self.detection_scores[idx]
-        scores_filtered = scores[det_label_mask]
-        scores_sorted, dtind = torch.sort(scores_filtered, descending=True)
-
-        det = [det[i] for i in dtind]
-        if len(det) > max_det:
-            det = det[:max_det]
-        num_det = len(det)
-        det_areas = compute_area(det, iou_type=self.iou_type).to(self.device)
-        det_ignore_area = (det_areas < area_range[0]) | (det_areas > area_range[1])
-        ar = det_ignore_area.reshape((1, num_det))
-        det_ignore = torch.repeat_interleave(ar, num_iou_thrs, 0)
-
-        return {
-            "dtMatches": torch.zeros((num_iou_thrs, num_det), dtype=torch.bool, device=self.device),
-            "gtMatches": torch.zeros((num_iou_thrs, num_gt), dtype=torch.bool, device=self.device),
-            "dtScores": scores_sorted.to(self.device),
-            "gtIgnore": gt_ignore.to(self.device),
-            "dtIgnore": det_ignore.to(self.device),
-        }
-
-    def _evaluate_image(
-        self, idx: int, class_id: int, area_range: Tuple[int, int], max_det: int, ious: dict
-    ) -> Optional[dict]:
-        """Perform evaluation for single class and image.
+        """Perform evaluation for single class, image and area range.
 
         Args:
-            idx:
-                Image Id, equivalent to the index of supplied samples.
-            class_id:
-                Class Id of the supplied ground truth and detection labels.
+            ious:
+                IoU between the sorted detections and the ground truths of the class.
+            gt_areas:
+                Areas of the ground truths of the class.
+            det_areas:
+                Areas of the sorted detections of the class.
+            scores_sorted:
+                Scores of all detections of the class, sorted by descending score.
             area_range:
                 List of lower and upper bounding box area threshold.
-            max_det:
-                Maximum number of evaluated detection bounding boxes.
-            ious:
-                IoU results for image and class.
+            num_iou_thrs:
+                Number of IoU thresholds.
 
         """
-        gt = self.groundtruths[idx]
-        det = self.detections[idx]
-        gt_label_mask = (self.groundtruth_labels[idx] == class_id).nonzero().squeeze(1)
-        det_label_mask = (self.detection_labels[idx] == class_id).nonzero().squeeze(1)
-
-        # No Gt and No predictions --> ignore image
-        if len(gt_label_mask) == 0 and len(det_label_mask) == 0:
-            return None
-
-        num_iou_thrs = len(self.iou_thresholds)
-
-        # Some GT but no predictions
-        if len(gt_label_mask) > 0 and len(det_label_mask) == 0:
-            return self.__evaluate_image_gt_no_preds(gt, gt_label_mask, area_range, num_iou_thrs)
-
-        # Some predictions but no GT
-        if len(gt_label_mask) == 0 and len(det_label_mask) > 0:
-            return self.__evaluate_image_preds_no_gt(det, idx, det_label_mask, max_det, area_range, num_iou_thrs)
-
-        gt = [gt[i] for i in gt_label_mask]
-        det = [det[i] for i in det_label_mask]
-        if len(gt) == 0 and len(det) == 0:
-            return None
-        if isinstance(det, dict):
-            det = [det]
-        if isinstance(gt, dict):
-            gt = [gt]
+        num_gt, num_det = len(gt_areas), len(det_areas)
 
-        areas = compute_area(gt, iou_type=self.iou_type).to(self.device)
-
-        ignore_area = torch.logical_or(areas < area_range[0], areas > area_range[1])
-
-        # sort dt highest score first, sort gt ignore last
-        ignore_area_sorted, gtind = torch.sort(ignore_area.to(torch.uint8))
+        # sort gt ignore last
+        ignore_area = (gt_areas < area_range[0]) | (gt_areas > area_range[1])
         # Convert to uint8 temporarily and back to bool, because "Sort currently does not support bool dtype on CUDA"
+        gt_ignore, gtind = torch.sort(ignore_area.to(torch.uint8))
+        gt_ignore = gt_ignore.to(torch.bool)
 
-        ignore_area_sorted = ignore_area_sorted.to(torch.bool).to(self.device)
-
-        gt = [gt[i] for i in gtind]
-        scores = self.detection_scores[idx]
-        scores_filtered = scores[det_label_mask]
-        scores_sorted, dtind = torch.sort(scores_filtered, descending=True)
-        det = [det[i] for i in dtind]
-        if len(det) > max_det:
-            det = det[:max_det]
-        # load computed ious
-        ious = ious[idx, class_id][:, gtind] if len(ious[idx, class_id]) > 0 else ious[idx, class_id]
-
-        num_iou_thrs = len(self.iou_thresholds)
-        num_gt = len(gt)
-        num_det = len(det)
         gt_matches = torch.zeros((num_iou_thrs, num_gt), dtype=torch.bool, device=self.device)
         det_matches = torch.zeros((num_iou_thrs, num_det), dtype=torch.bool, device=self.device)
-        gt_ignore = ignore_area_sorted
         det_ignore = torch.zeros((num_iou_thrs, num_det), dtype=torch.bool, device=self.device)
 
         if torch.numel(ious) > 0:
-            for idx_iou, t in enumerate(self.iou_thresholds):
-                for idx_det, _ in enumerate(det):
-                    m = MeanAveragePrecision._find_best_gt_match(t, gt_matches, idx_iou, gt_ignore, ious, idx_det)
-                    if m == -1:
-                        continue
-                    det_ignore[idx_iou, idx_det] = gt_ignore[m]
-                    det_matches[idx_iou, idx_det] = 1
-                    gt_matches[idx_iou, m] = 1
+            ious = ious[:, gtind]
+            thresholds = torch.tensor(self.iou_thresholds, dtype=ious.dtype, device=ious.device)
+            for idx_det in range(num_det):
+                match_idx, matched = MeanAveragePrecision._find_best_gt_match(
+                    thresholds, gt_matches, gt_ignore, ious, idx_det
+                )
+                det_ignore[:, idx_det] = gt_ignore[match_idx] & matched
+                det_matches[:, idx_det] = matched
+                gt_matches[matched, match_idx[matched]] = True
 
         # set unmatched detections outside of area range to ignore
-        det_areas = compute_area(det, iou_type=self.iou_type).to(self.device)
         det_ignore_area = (det_areas < area_range[0]) | (det_areas > area_range[1])
-        ar = det_ignore_area.reshape((1, num_det))
-        det_ignore = torch.logical_or(
-            det_ignore, torch.logical_and(det_matches == 0, torch.repeat_interleave(ar, num_iou_thrs, 0))
-        )
+        det_ignore = det_ignore | (~det_matches & det_ignore_area.reshape(1, num_det))
 
         return {
-            "dtMatches": det_matches.to(self.device),
-            "gtMatches": gt_matches.to(self.device),
-            "dtScores": scores_sorted.to(self.device),
+            "dtMatches": det_matches,
+            "gtMatches": gt_matches,
+            "dtScores": scores_sorted.to(self.device) if num_det > 0 else scores_sorted.new_zeros(0).float(),
             "gtIgnore": gt_ignore.to(self.device),
             "dtIgnore": det_ignore.to(self.device),
         }
 
     @staticmethod
     def _find_best_gt_match(
-        threshold: int, gt_matches: Tensor, idx_iou: float, gt_ignore: Tensor, ious: Tensor, idx_det: int
-    ) -> int:
-        """Return id of best ground truth match with current detection.
+        thresholds: Tensor, gt_matches: Tensor, gt_ignore: Tensor, ious: Tensor, idx_det: int
+    ) -> Tuple[Tensor, Tensor]:
+        """Return id of best ground truth match with current detection for all thresholds at once.
 
         Args:
-            threshold:
-                Current threshold value.
+            thresholds:
+                Tensor with all threshold values.
             gt_matches:
-                Tensor showing if a ground truth matches for threshold ``t`` exists.
-            idx_iou:
-                Id of threshold ``t``.
+                Tensor showing if a ground truth matches for each threshold exists.
             gt_ignore:
                 Tensor showing if ground truth should be ignored.
             ious:
@@ -639,15 +571,15 @@ class MeanAveragePrecision(Metric):
             idx_det:
                 Id of current detection.
 
+        Returns:
+            The index of the best ground truth for each threshold and whether that ground truth is a match.
+
         """
-        previously_matched = gt_matches[idx_iou]  # type: ignore[index]
         # Remove previously matched or ignored gts
-        remove_mask = previously_matched | gt_ignore
+        remove_mask = gt_matches | gt_ignore
         gt_ious = ious[idx_det] * ~remove_mask
-        match_idx = gt_ious.argmax().item()
-        if gt_ious[match_idx] > threshold:  # type: ignore[index]
-            return match_idx  # type: ignore[return-value]
-        return -1
+        match_idx = gt_ious.argmax(dim=1)
+        return match_idx, gt_ious.gather(1, match_idx[:, None]).squeeze(1) > thresholds
 
     def _summarize(
         self,
@@ -704,18 +636,19 @@ class MeanAveragePrecision(Metric):
         """
         img_ids = range(len(self.groundtruths))
         max_detections = self.max_detection_thresholds[-1]
-        area_ranges = self.bbox_area_ranges.values()
-
-        ious = {
-            (idx, class_id): self._compute_iou(idx, class_id, max_detections)
-            for idx in img_ids
-            for class_id in class_ids
-        }
+        num_areas = len(self.bbox_area_ranges)
 
+        # images are evaluated independently, optionally fanned out over a pool of threads
+        evaluate = partial(self._evaluate_image, class_ids=class_ids, max_det=max_detections)
+        if self.num_threads > 1:
+            with ThreadPoolExecutor(max_workers=self.num_threads) as pool:
+                img_evals = list(pool.map(evaluate, img_ids))
+        else:
+            img_evals = [evaluate(img_id) for img_id in img_ids]
         eval_imgs = [
-            self._evaluate_image(img_id, class_id, area, max_detections, ious)  # type: ignore[arg-type]
+            img_evals[img_id][class_id, area_idx]
             for class_id in class_ids
-            for area in area_ranges
+            for area_idx in range(num_areas)
             for img_id in img_ids
         ]
 
@@ -733,10 +666,11 @@ class MeanAveragePrecision(Metric):
         rec_thresholds_tensor = torch.tensor(self.rec_thresholds)
 
         # retrieve E at each category, area range, and max number of detections
-        for idx_cls, _ in enumerate(class_ids):
+        def accumulate(idx_cls: int) -> None:
+            # every class writes to its own slice of the precision, recall and scores tensors
             for idx_bbox_area, _ in enumerate(self.bbox_area_ranges):
                 for idx_max_det_thresholds, max_det in enumerate(self.max_detection_thresholds):
-                    recall, precision, scores = MeanAveragePrecision.__calculate_recall_precision_scores(
+                    MeanAveragePrecision.__calculate_recall_precision_scores(
                         recall,
                         precision,
                         scores,
@@ -750,6 +684,13 @@ class MeanAveragePrecision(Metric):
                         num_bbox_areas=num_bbox_areas,
                     )
 
+        if self.num_threads > 1:
+            with ThreadPoolExecutor(max_workers=self.num_threads) as pool:
+                list(pool.map(accumulate, range(num_classes)))
+        else:
+            for idx_cls in range(num_classes):
+                accumulate(idx_cls)
+
         return precision, recall  # type: ignore[return-value]
 
     def _summarize_results(self, precisions: Tensor, recalls: Tensor) -> Tuple[MAPMetricResults, MARMetricResults]:
@@ -831,29 +772,26 @@ class MeanAveragePrecision(Metric):
 
         tp_sum = _cumsum(tps, dim=1, dtype=torch.float)
         fp_sum = _cumsum(fps, dim=1, dtype=torch.float)
-        for idx, (tp, fp) in enumerate(zip(tp_sum, fp_sum)):
-            tp_len = len(tp)
-            rc = tp / npig
-            pr = tp / (fp + tp + torch.finfo(torch.float64).eps)
-            prec = torch.zeros((num_rec_thrs,))
-            score = torch.zeros((num_rec_thrs,))
-
-            recall[idx, idx_cls, idx_bbox_area, idx_max_det_thresholds] = rc[-1] if tp_len else 0
-
-            # Remove zigzags for AUC
-            diff_zero = torch.zeros((1,), device=pr.device)
-            diff = torch.ones((1,), device=pr.device)
-            while not torch.all(diff == 0):
-                diff = torch.clamp(torch.cat(((pr[1:] - pr[:-1]), diff_zero), 0), min=0)
-                pr += diff
-
-            inds = torch.searchsorted(rc, rec_thresholds.to(rc.device), right=False)
-            num_inds = inds.argmax() if inds.max() >= tp_len else num_rec_thrs
-            inds = inds[:num_inds]  # type: ignore[misc]
-            prec[:num_inds] = pr[inds]  # type: ignore[misc]
-            score[:num_inds] = det_scores_sorted[inds]  # type: ignore[misc]
-            precision[idx, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = prec
-            scores[idx, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = score
+        # all IoU thresholds are handled at once, shape (num_iou_thrs, num_det)
+        tp_len = tp_sum.shape[1]
+        rc = tp_sum / npig
+        pr = tp_sum / (fp_sum + tp_sum + torch.finfo(torch.float64).eps)
+        recall[:, idx_cls, idx_bbox_area, idx_max_det_thresholds] = rc[:, -1] if tp_len else 0
+        if tp_len == 0:
+            precision[:, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = 0
+            scores[:, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = 0
+            return recall, precision, scores
+
+        # Remove zigzags for AUC
+        pr = pr.flip(1).cummax(dim=1).values.flip(1)
+
+        inds = torch.searchsorted(rc, rec_thresholds.to(rc.device).expand(len(rc), num_rec_thrs).contiguous())
+        valid = inds < tp_len
+        inds = inds.clamp(max=tp_len - 1)
+        prec = torch.where(valid, pr.gather(1, inds), torch.zeros_like(pr[:, :1]))
+        score = torch.where(valid, det_scores_sorted[inds], torch.zeros_like(det_scores_sorted[:1]))
+        precision[:, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = prec.cpu()
+        scores[:, :, idx_cls, idx_bbox_area, idx_max_det_thresholds] = score.cpu()
 
         return recall, precision, scores
 
@@ -888,44 +826,22 @@ class MeanAveragePrecision(Metric):
         metrics.classes = torch.tensor(classes, dtype=torch.int)
         return metrics
 
-    def _apply(self, fn: Callable) -> torch.nn.Module:  # type: ignore[override]
-        """Custom apply function.
-
-        Excludes the detections and groundtruths from the casting when the iou_type is set to `segm` as the state is
-        no longer a tensor but a tuple.
-
-        """
-        if self.iou_type == "segm":
-            this = super()._apply(fn, exclude_state=("detections", "groundtruths"))
-        else:
-            this = super()._apply(fn)
-        return this
-
     def _sync_dist(self, dist_sync_fn: Optional[Callable] = None, process_group: Optional[Any] = None) -> None:
         """Custom sync function.
 
-        For the iou_type `segm` the detections and groundtruths are no longer tensors but tuples. Therefore, we need
-        to gather the list of tuples and then convert it back to a list of tuples.
+        All states are lists with one tensor per image, which are packed into a single flat buffer and gathered at
+        once instead of one gather per image and state.
 
         """
-        super()._sync_dist(dist_sync_fn=dist_sync_fn, process_group=process_group)  # type: ignore[arg-type]
-
-        if self.iou_type == "segm":
-            self.detections = self._gather_tuple_list(self.detections, process_group)  # type: ignore[arg-type]
-            self.groundtruths = self._gather_tuple_list(self.groundtruths, process_group)  # type: ignore[arg-type]
-
-    @staticmethod
-    def _gather_tuple_list(
-        list_to_gather: List[Union[tuple, Tensor]], process_group: Optional[Any] = None
-    ) -> List[Any]:
-        """Gather a list of tuples over multiple devices."""
-        world_size = dist.get_world_size(group=process_group)
-        dist.barrier(group=process_group)
-
-        list_gathered = [None for _ in range(world_size)]
-        dist.all_gather_object(list_gathered, list_to_gather, group=process_group)
-
-        return [list_gathered[rank][idx] for idx in range(len(list_gathered[0])) for rank in range(world_size)]  # type: ignore[arg-type,index]
+        states = list(self._reductions)
+        gathered = _gather_tensor_lists(
+            [getattr(self, attr) for attr in states],
+            device=self.device,
+            group=process_group or self.process_group,
+            dist_sync_fn=dist_sync_fn or gather_all_tensors,
+        )
+        for attr, values in zip(states, gathered):
+            setattr(self, attr, values)
 
     def plot(
         self, val: Optional[Union[Dict[str, Tensor], Sequence[Dict[str, Tensor]]]] = None, ax: Optional[_AX_TYPE] = None
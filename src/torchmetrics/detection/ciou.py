@@ -16,7 +16,6 @@ from typing import Any, Optional, Sequence, Union
 from torch import Tensor
 
 from torchmetrics.detection.iou import IntersectionOverUnion
-from torchmetrics.functional.detection.ciou import _ciou_compute, _ciou_update
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCHVISION_GREATER_EQUAL_0_13
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -97,7 +96,7 @@ class CompleteIntersectionOverUnion(IntersectionOverUnion):
 
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = True
-    full_state_update: bool = True
+    full_state_update: bool = False
 
     _iou_type: str = "ciou"
     _invalid_val: float = -2.0  # unsure, min val could be just -1.5 as well
@@ -117,14 +116,6 @@ class CompleteIntersectionOverUnion(IntersectionOverUnion):
             )
         super().__init__(box_format, iou_threshold, class_metrics, respect_labels, **kwargs)
 
-    @staticmethod
-    def _iou_update_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _ciou_update(*args, **kwargs)
-
-    @staticmethod
-    def _iou_compute_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _ciou_compute(*args, **kwargs)
-
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
     ) -> _PLOT_OUT_TYPE:
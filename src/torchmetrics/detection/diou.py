@@ -16,7 +16,6 @@ from typing import Any, Optional, Sequence, Union
 from torch import Tensor
 
 from torchmetrics.detection.iou import IntersectionOverUnion
-from torchmetrics.functional.detection.diou import _diou_compute, _diou_update
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCHVISION_GREATER_EQUAL_0_13
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -97,7 +96,7 @@ class DistanceIntersectionOverUnion(IntersectionOverUnion):
 
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = True
-    full_state_update: bool = True
+    full_state_update: bool = False
 
     _iou_type: str = "diou"
     _invalid_val: float = -1.0
@@ -117,14 +116,6 @@ class DistanceIntersectionOverUnion(IntersectionOverUnion):
             )
         super().__init__(box_format, iou_threshold, class_metrics, respect_labels, **kwargs)
 
-    @staticmethod
-    def _iou_update_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _diou_update(*args, **kwargs)
-
-    @staticmethod
-    def _iou_compute_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _diou_compute(*args, **kwargs)
-
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
     ) -> _PLOT_OUT_TYPE:
@@ -16,7 +16,6 @@ from typing import Any, Optional, Sequence, Union
 from torch import Tensor
 
 from torchmetrics.detection.iou import IntersectionOverUnion
-from torchmetrics.functional.detection.giou import _giou_compute, _giou_update
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCHVISION_GREATER_EQUAL_0_8
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -97,7 +96,7 @@ class GeneralizedIntersectionOverUnion(IntersectionOverUnion):
 
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = True
-    full_state_update: bool = True
+    full_state_update: bool = False
 
     _iou_type: str = "giou"
     _invalid_val: float = -1.0
@@ -112,14 +111,6 @@ class GeneralizedIntersectionOverUnion(IntersectionOverUnion):
     ) -> None:
         super().__init__(box_format, iou_threshold, class_metrics, respect_labels, **kwargs)
 
-    @staticmethod
-    def _iou_update_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _giou_update(*args, **kwargs)
-
-    @staticmethod
-    def _iou_compute_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _giou_compute(*args, **kwargs)
-
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
     ) -> _PLOT_OUT_TYPE:
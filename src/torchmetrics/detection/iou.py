@@ -11,13 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import torch
 from torch import Tensor
+from torch.nn.utils.rnn import pad_sequence
 
 from torchmetrics.detection.helpers import _fix_empty_tensors, _input_validator
-from torchmetrics.functional.detection.iou import _iou_compute, _iou_update
+from torchmetrics.functional.detection.iou import _batched_box_iou
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCHVISION_GREATER_EQUAL_0_8
@@ -129,10 +130,13 @@ class IntersectionOverUnion(Metric):
 
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = True
-    full_state_update: bool = True
+    full_state_update: bool = False
 
-    groundtruth_labels: List[Tensor]
-    iou_matrix: List[Tensor]
+    iou_sum: Tensor
+    iou_count: Tensor
+    class_labels: List[Tensor]
+    class_iou_sum: List[Tensor]
+    class_iou_count: List[Tensor]
     _iou_type: str = "iou"
     _invalid_val: float = -1.0
 
@@ -167,31 +171,50 @@ class IntersectionOverUnion(Metric):
             raise ValueError("Expected argument `respect_labels` to be a boolean")
         self.respect_labels = respect_labels
 
-        self.add_state("groundtruth_labels", default=[], dist_reduce_fx=None)
-        self.add_state("iou_matrix", default=[], dist_reduce_fx=None)
-
-    @staticmethod
-    def _iou_update_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _iou_update(*args, **kwargs)
-
-    @staticmethod
-    def _iou_compute_fn(*args: Any, **kwargs: Any) -> Tensor:
-        return _iou_compute(*args, **kwargs)
+        self.add_state("iou_sum", default=torch.tensor(0.0), dist_reduce_fx="sum")
+        self.add_state("iou_count", default=torch.tensor(0), dist_reduce_fx="sum")
+        self.add_state("class_labels", default=[], dist_reduce_fx=None)
+        self.add_state("class_iou_sum", default=[], dist_reduce_fx=None)
+        self.add_state("class_iou_count", default=[], dist_reduce_fx=None)
 
     def update(self, preds: List[Dict[str, Tensor]], target: List[Dict[str, Tensor]]) -> None:
-        """Update state with predictions and targets."""
-        _input_validator(preds, target, ignore_score=True)
+        """Update state with predictions and targets.
 
-        for p, t in zip(preds, target):
-            det_boxes = self._get_safe_item_values(p["boxes"])
-            gt_boxes = self._get_safe_item_values(t["boxes"])
-            self.groundtruth_labels.append(t["labels"])
+        All images of the batch are padded to a common number of boxes and evaluated in a single vectorized pass, and
+        only the sums and counts of the valid pairwise values are kept, globally and per ground truth class.
 
-            iou_matrix = self._iou_update_fn(det_boxes, gt_boxes, self.iou_threshold, self._invalid_val)  # N x M
-            if self.respect_labels:
-                label_eq = p["labels"].unsqueeze(1) == t["labels"].unsqueeze(0)  # N x M
-                iou_matrix[~label_eq] = self._invalid_val
-            self.iou_matrix.append(iou_matrix)
+        """
+        _input_validator(preds, target, ignore_score=True)
+        if len(preds) == 0:
+            return
+
+        det_boxes = [self._get_safe_item_values(p["boxes"]) for p in preds]
+        gt_boxes = [self._get_safe_item_values(t["boxes"]) for t in target]
+        det_valid = self._get_valid_mask(det_boxes)
+        gt_valid = self._get_valid_mask(gt_boxes)
+        gt_labels = pad_sequence([t["labels"].reshape(-1) for t in target], batch_first=True)
+
+        values = _batched_box_iou(
+            pad_sequence(det_boxes, batch_first=True), pad_sequence(gt_boxes, batch_first=True), self._iou_type
+        )  # B x N x M
+        keep = det_valid.unsqueeze(2) & gt_valid.unsqueeze(1) & (values != self._invalid_val)
+        if self.iou_threshold is not None:
+            keep &= ~(values < self.iou_threshold)
+        if self.respect_labels:
+            det_labels = pad_sequence([p["labels"].reshape(-1) for p in preds], batch_first=True)
+            keep &= det_labels.unsqueeze(2) == gt_labels.unsqueeze(1)
+
+        column_sums = torch.where(keep, values, torch.zeros_like(values)).sum(1)  # B x M
+        column_counts = keep.sum(1)
+        self.iou_sum += column_sums.sum().to(self.iou_sum.dtype)
+        self.iou_count += column_counts.sum()
+
+        self.class_labels.append(gt_labels[gt_valid].long())
+        self.class_iou_sum.append(column_sums[gt_valid].to(self.iou_sum.dtype))
+        self.class_iou_count.append(column_counts[gt_valid])
+        # keep the per-class states at one entry per seen class instead of one entry per ground truth box
+        labels, sums, counts = self._reduce_class_stats()
+        self.class_labels, self.class_iou_sum, self.class_iou_count = [labels], [sums], [counts]
 
     def _get_safe_item_values(self, boxes: Tensor) -> Tensor:
         from torchvision.ops import box_convert
@@ -201,27 +224,40 @@ class IntersectionOverUnion(Metric):
             boxes = box_convert(boxes, in_fmt=self.box_format, out_fmt="xyxy")
         return boxes
 
+    @staticmethod
+    def _get_valid_mask(boxes: List[Tensor]) -> Tensor:
+        """Return a mask of shape ``(B, max_num_boxes)`` marking the real boxes in the padded batch."""
+        num_boxes = torch.tensor([len(b) for b in boxes], device=boxes[0].device)
+        max_boxes = int(num_boxes.max()) if len(num_boxes) > 0 else 0
+        return torch.arange(max_boxes, device=num_boxes.device).unsqueeze(0) < num_boxes.unsqueeze(1)
+
+    def _reduce_class_stats(self) -> Tuple[Tensor, Tensor, Tensor]:
+        """Merge the accumulated per-class states into one sum and count per unique ground truth class."""
+        labels = (
+            dim_zero_cat(self.class_labels)
+            if self.class_labels
+            else torch.zeros(0, dtype=torch.long, device=self.device)
+        )
+        if labels.numel() == 0:
+            return labels, self.iou_sum.new_zeros(0), self.iou_count.new_zeros(0)
+        classes, inverse = labels.unique(return_inverse=True)
+        sums = self.iou_sum.new_zeros(len(classes)).index_add_(0, inverse, dim_zero_cat(self.class_iou_sum))
+        counts = self.iou_count.new_zeros(len(classes)).index_add_(0, inverse, dim_zero_cat(self.class_iou_count))
+        return classes, sums, counts
+
     def _get_gt_classes(self) -> List:
         """Returns a list of unique classes found in ground truth and detection data."""
-        if len(self.groundtruth_labels) > 0:
-            return torch.cat(self.groundtruth_labels).unique().tolist()
-        return []
+        return self._reduce_class_stats()[0].tolist()
 
     def compute(self) -> dict:
         """Computes IoU based on inputs passed in to ``update`` previously."""
-        score = torch.cat([mat[mat != self._invalid_val] for mat in self.iou_matrix], 0).mean()
+        score = self.iou_sum / self.iou_count
         results: Dict[str, Tensor] = {f"{self._iou_type}": score}
 
         if self.class_metrics:
-            gt_labels = dim_zero_cat(self.groundtruth_labels)
-            classes = gt_labels.unique().tolist() if len(gt_labels) > 0 else []
-            for cl in classes:
-                masked_iou, observed = torch.zeros_like(score), torch.zeros_like(score)
-                for mat, gt_lab in zip(self.iou_matrix, self.groundtruth_labels):
-                    scores = mat[:, gt_lab == cl]
-                    masked_iou += scores[scores != self._invalid_val].sum()
-                    observed += scores[scores != self._invalid_val].numel()
-                results.update({f"{self._iou_type}/cl_{cl}": masked_iou / observed})
+            classes, sums, counts = self._reduce_class_stats()
+            for cl, class_sum, class_count in zip(classes.tolist(), sums, counts):
+                results.update({f"{self._iou_type}/cl_{cl}": class_sum / class_count})
         return results
 
     def plot(
@@ -14,19 +14,29 @@
 import contextlib
 import io
 import json
+from itertools import islice
 from types import ModuleType
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, Union
+from typing import IO, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
 from lightning_utilities import apply_to_collection
 from torch import Tensor
-from torch import distributed as dist
-from typing_extensions import Literal
+from typing_extensions import Literal, TypedDict
 
 from torchmetrics.detection.helpers import _fix_empty_tensors, _input_validator, _validate_iou_type_arg
+from torchmetrics.functional.detection._coco_eval import (
+    _coco_accumulate,
+    _coco_evaluate,
+    _coco_evaluate_images,
+    _coco_rle_area,
+    _coco_rle_encode,
+    _coco_rle_unpack,
+    _coco_summarize,
+)
 from torchmetrics.metric import Metric
 from torchmetrics.utilities import rank_zero_warn
+from torchmetrics.utilities.distributed import _gather_tensor_lists, gather_all_tensors
 from torchmetrics.utilities.imports import (
     _FASTER_COCO_EVAL_AVAILABLE,
     _MATPLOTLIB_AVAILABLE,
@@ -47,8 +57,17 @@ if not _TORCHVISION_GREATER_EQUAL_0_8 or not (_PYCOCOTOOLS_AVAILABLE or _FASTER_
     ]
 
 
-def _load_backend_tools(backend: Literal["pycocotools", "faster_coco_eval"]) -> Tuple[object, object, ModuleType]:
-    """Load the backend tools for the given backend."""
+def _load_backend_tools(
+    backend: Literal["pycocotools", "faster_coco_eval", "torch"],
+) -> Tuple[object, object, ModuleType]:
+    """Load the backend tools for the given backend.
+
+    The ``"torch"`` backend evaluates without any COCO package, but the conversion utilities still rely on one. In
+    that case whichever of ``pycocotools`` and ``faster_coco_eval`` is installed is used.
+
+    """
+    if backend == "torch":
+        backend = "pycocotools" if _PYCOCOTOOLS_AVAILABLE or not _FASTER_COCO_EVAL_AVAILABLE else "faster_coco_eval"
     if backend == "pycocotools":
         if not _PYCOCOTOOLS_AVAILABLE:
             raise ModuleNotFoundError(
@@ -73,6 +92,20 @@ def _load_backend_tools(backend: Literal["pycocotools", "faster_coco_eval"]) ->
     return COCO, COCOeval, mask_utils
 
 
+class _CocoTorchInputs(TypedDict):
+    """Per-image inputs of the native COCO evaluation, see ``_coco_evaluate_images``."""
+
+    det_geometry: List[Tensor]
+    det_scores: List[Tensor]
+    det_labels: List[Tensor]
+    det_areas: List[Tensor]
+    gt_geometry: List[Tensor]
+    gt_labels: List[Tensor]
+    gt_crowds: List[Tensor]
+    gt_areas: List[Tensor]
+    image_ids: List[int]
+
+
 class MeanAveragePrecision(Metric):
     r"""Compute the `Mean-Average-Precision (mAP) and Mean-Average-Recall (mAR)`_ for object detection predictions.
 
@@ -154,16 +187,21 @@ class MeanAveragePrecision(Metric):
         Caution: If the initialization parameters are changed, dictionary keys for mAR can change as well.
 
     .. note::
-        This metric supports, at the moment, two different backends for the evaluation. The default backend is
+        This metric supports, at the moment, three different backends for the evaluation. The default backend is
         ``"pycocotools"``, which either require the official `pycocotools`_ implementation or this
         `fork of pycocotools`_ to be installed. We recommend using the fork as it is better maintained and easily
         available to install via pip: `pip install pycocotools`. It is also this fork that will be installed if you
         install ``torchmetrics[detection]``. The second backend is the `faster-coco-eval`_ implementation, which can be
         installed with ``pip install faster-coco-eval``. This implementation is a maintained open-source implementation
         that is faster and corrects certain corner cases that the official implementation has. Our own testing has shown
-        that the results are identical to the official implementation. Regardless of the backend we also require you to
-        have `torchvision` version 0.8.0 or newer installed. Please install with ``pip install torchvision>=0.8`` or
-        ``pip install torchmetrics[detection]``.
+        that the results are identical to the official implementation. The third backend, ``"torch"``, implements the
+        COCO evaluation protocol directly on tensors and does not require any of the above packages. IoU computation,
+        matching and the accumulation of the precision/recall curves are batched over all images and classes, which
+        makes it considerably faster on large datasets and allows it to run on the device where the states live. It
+        reproduces the results of `pycocotools`_, except that ``map`` is reported for the last of the
+        ``max_detection_thresholds`` instead of a hardcoded value of 100, like `faster-coco-eval`_. Regardless of the
+        backend we also require you to have `torchvision` version 0.8.0 or newer installed. Please install with
+        ``pip install torchvision>=0.8`` or ``pip install torchmetrics[detection]``.
 
     Args:
         box_format:
@@ -212,13 +250,21 @@ class MeanAveragePrecision(Metric):
         average:
             Method for averaging scores over labels. Choose between "``"macro"`` and ``"micro"``.
         backend:
-            Backend to use for the evaluation. Choose between ``"pycocotools"`` and ``"faster_coco_eval"``.
+            Backend to use for the evaluation. Choose between ``"pycocotools"``, ``"faster_coco_eval"`` and
+            ``"torch"``.
+        incremental:
+            Only available with ``backend="torch"``. If ``True``, detections are matched to the ground truth already
+            during ``update`` and only the compact per-detection matching results (score, label, true positive and
+            ignore flags for each IoU threshold and area range) together with the ignore flags of the ground truths
+            are stored. Boxes and masks are never retained, which keeps the memory footprint independent of the
+            image resolution and makes ``compute`` reduce to sorting and cumulative sums. Cannot be combined with
+            ``extended_summary=True``.
 
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
         ModuleNotFoundError:
-            If ``pycocotools`` is not installed
+            If ``backend`` is not ``"torch"`` and neither ``pycocotools`` nor ``faster_coco_eval`` is installed
         ModuleNotFoundError:
             If ``torchvision`` is not installed or version installed is lower than 0.8.0
         ValueError:
@@ -233,6 +279,8 @@ class MeanAveragePrecision(Metric):
             If ``max_detection_thresholds`` is not None or a list of ints
         ValueError:
             If ``class_metrics`` is not a boolean
+        ValueError:
+            If ``incremental`` is ``True`` and ``backend`` is not ``"torch"`` or ``extended_summary`` is ``True``
 
     Example::
 
@@ -372,12 +420,20 @@ class MeanAveragePrecision(Metric):
         class_metrics: bool = False,
         extended_summary: bool = False,
         average: Literal["macro", "micro"] = "macro",
-        backend: Literal["pycocotools", "faster_coco_eval"] = "pycocotools",
+        backend: Literal["pycocotools", "faster_coco_eval", "torch"] = "pycocotools",
+        incremental: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
 
-        if not (_PYCOCOTOOLS_AVAILABLE or _FASTER_COCO_EVAL_AVAILABLE):
+        if backend not in ("pycocotools", "faster_coco_eval", "torch"):
+            raise ValueError(
+                "Expected argument `backend` to be one of ('pycocotools', 'faster_coco_eval', 'torch')"
+                f" but got {backend}"
+            )
+        self.backend = backend
+
+        if backend != "torch" and not (_PYCOCOTOOLS_AVAILABLE or _FASTER_COCO_EVAL_AVAILABLE):
             raise ModuleNotFoundError(
                 "`MAP` metric requires that `pycocotools` or `faster-coco-eval` installed."
                 " Please install with `pip install pycocotools` or `pip install faster-coco-eval` or"
@@ -433,11 +489,16 @@ class MeanAveragePrecision(Metric):
             raise ValueError(f"Expected argument `average` to be one of ('macro', 'micro') but got {average}")
         self.average = average
 
-        if backend not in ("pycocotools", "faster_coco_eval"):
+        if not isinstance(incremental, bool):
+            raise ValueError("Expected argument `incremental` to be a boolean")
+        if incremental and backend != "torch":
+            raise ValueError("Argument `incremental=True` is only supported with `backend='torch'`")
+        if incremental and extended_summary:
             raise ValueError(
-                f"Expected argument `backend` to be one of ('pycocotools', 'faster_coco_eval') but got {backend}"
+                "Argument `incremental=True` cannot be combined with `extended_summary=True`, as the iou matrices"
+                " are not kept after each update"
             )
-        self.backend = backend
+        self.incremental = incremental
 
         self.add_state("detection_box", default=[], dist_reduce_fx=None)
         self.add_state("detection_mask", default=[], dist_reduce_fx=None)
@@ -448,6 +509,11 @@ class MeanAveragePrecision(Metric):
         self.add_state("groundtruth_labels", default=[], dist_reduce_fx=None)
         self.add_state("groundtruth_crowds", default=[], dist_reduce_fx=None)
         self.add_state("groundtruth_area", default=[], dist_reduce_fx=None)
+        if self.incremental:
+            self.add_state("detection_ranks", default=[], dist_reduce_fx=None)
+            self.add_state("detection_matches", default=[], dist_reduce_fx=None)
+            self.add_state("detection_ignores", default=[], dist_reduce_fx=None)
+            self.add_state("groundtruth_ignores", default=[], dist_reduce_fx=None)
 
     @property
     def coco(self) -> object:
@@ -491,12 +557,16 @@ class MeanAveragePrecision(Metric):
         """
         _input_validator(preds, target, iou_type=self.iou_type)  # type: ignore[arg-type]
 
+        if self.incremental:
+            self._update_incremental(preds, target)
+            return
+
         for item in preds:
             bbox_detection, mask_detection = self._get_safe_item_values(item, warn=self.warn_on_many_detections)
             if bbox_detection is not None:
                 self.detection_box.append(bbox_detection)
             if mask_detection is not None:
-                self.detection_mask.append(mask_detection)  # type: ignore[arg-type]
+                self.detection_mask.append(mask_detection)
             self.detection_labels.append(item["labels"])
             self.detection_scores.append(item["scores"])
 
@@ -505,13 +575,16 @@ class MeanAveragePrecision(Metric):
             if bbox_groundtruth is not None:
                 self.groundtruth_box.append(bbox_groundtruth)
             if mask_groundtruth is not None:
-                self.groundtruth_mask.append(mask_groundtruth)  # type: ignore[arg-type]
+                self.groundtruth_mask.append(mask_groundtruth)
             self.groundtruth_labels.append(item["labels"])
             self.groundtruth_crowds.append(item.get("iscrowd", torch.zeros_like(item["labels"])))
             self.groundtruth_area.append(item.get("area", torch.zeros_like(item["labels"])))
 
     def compute(self) -> dict:
         """Computes the metric."""
+        if self.backend == "torch":
+            return self._compute_torch()
+
         coco_preds, coco_target = self._get_coco_datasets(average=self.average)
 
         result_dict = {}
@@ -587,6 +660,224 @@ class MeanAveragePrecision(Metric):
 
         return result_dict
 
+    def _compute_torch(self) -> dict:
+        """Computes the metric with the native tensor implementation of the COCO evaluation."""
+        result_dict = {}
+        for i_type in self.iou_type:
+            prefix = "" if len(self.iou_type) == 1 else f"{i_type}_"
+            coco_eval = self._evaluate_torch(i_type, average=self.average)
+            stats = _coco_summarize(
+                coco_eval["precision"], coco_eval["recall"], self.iou_thresholds, self.max_detection_thresholds
+            )
+            result_dict.update(self._coco_stats_to_tensor_dict(stats, prefix=prefix))
+
+            if self.extended_summary:
+                result_dict.update({
+                    f"{prefix}ious": coco_eval["ious"],
+                    f"{prefix}precision": coco_eval["precision"].cpu(),
+                    f"{prefix}recall": coco_eval["recall"].cpu(),
+                    f"{prefix}scores": coco_eval["scores"].cpu(),
+                })
+
+            if self.class_metrics:
+                if self.average == "micro":
+                    coco_eval = self._evaluate_torch(i_type, average="macro")
+                # evaluating a single class is the same as slicing the results of all classes
+                class_stats = [
+                    _coco_summarize(
+                        coco_eval["precision"][:, :, k : k + 1],
+                        coco_eval["recall"][:, k : k + 1],
+                        self.iou_thresholds,
+                        self.max_detection_thresholds,
+                    )
+                    for k in range(len(self._get_classes()))
+                ]
+                map_per_class_values = torch.tensor([s[0] for s in class_stats], dtype=torch.float32)
+                mar_per_class_values = torch.tensor([s[8] for s in class_stats], dtype=torch.float32)
+            else:
+                map_per_class_values = torch.tensor([-1], dtype=torch.float32)
+                mar_per_class_values = torch.tensor([-1], dtype=torch.float32)
+            result_dict.update(
+                {
+                    f"{prefix}map_per_class": map_per_class_values,
+                    f"{prefix}mar_{self.max_detection_thresholds[-1]}_per_class": mar_per_class_values,
+                },
+            )
+        result_dict.update({"classes": torch.tensor(self._get_classes(), dtype=torch.int32)})
+        return result_dict
+
+    def _evaluate_torch(self, i_type: str, average: Literal["macro", "micro"]) -> Dict[str, Any]:
+        """Run the native COCO evaluation for a single iou type on the states of the metric."""
+        if self.incremental:
+            # detections were already matched during `update`, only the accumulation is left
+            variant = self._incremental_variants().index((average, i_type))
+            num_variants, num_thresholds = len(self._incremental_variants()), len(self.iou_thresholds)
+            labels = [torch.zeros_like(x) if average == "micro" else x for x in self.detection_labels]
+            gt_labels = [torch.zeros_like(x) if average == "micro" else x for x in self.groundtruth_labels]
+            ranks = _cat_or_empty(self.detection_ranks, (0, 2), torch.long)
+            matches = _cat_or_empty(self.detection_matches, (0, num_variants, 4, num_thresholds), torch.bool)
+            ignores = _cat_or_empty(self.detection_ignores, (0, num_variants, 4, num_thresholds), torch.bool)
+            return _coco_accumulate(
+                det_scores=_cat_or_empty(self.detection_scores, (0,)),
+                det_labels=_cat_or_empty(labels, (0,), torch.long),
+                det_ranks=ranks[:, ("macro", "micro").index(average)],
+                det_matched=matches[:, variant],
+                det_ignored=ignores[:, variant],
+                gt_labels=_cat_or_empty(gt_labels, (0,), torch.long),
+                gt_ignored=_cat_or_empty(self.groundtruth_ignores, (0, 4), torch.bool),
+                class_ids=self._get_classes(),
+                rec_thresholds=self.rec_thresholds,
+                max_detection_thresholds=self.max_detection_thresholds,
+            )
+
+        inputs = self._get_torch_inputs(
+            i_type,
+            average,
+            detections={
+                "boxes": self.detection_box,
+                "masks": self.detection_mask,
+                "scores": self.detection_scores,
+                "labels": self.detection_labels,
+            },
+            groundtruths={
+                "boxes": self.groundtruth_box,
+                "masks": self.groundtruth_mask,
+                "labels": self.groundtruth_labels,
+                "iscrowd": self.groundtruth_crowds,
+                "area": self.groundtruth_area,
+            },
+        )
+        return _coco_evaluate(
+            **inputs,
+            class_ids=self._get_classes(),
+            iou_type=i_type,
+            iou_thresholds=self.iou_thresholds,
+            rec_thresholds=self.rec_thresholds,
+            max_detection_thresholds=self.max_detection_thresholds,
+            return_ious=self.extended_summary,
+        )
+
+    def _get_torch_inputs(
+        self,
+        i_type: str,
+        average: Literal["macro", "micro"],
+        detections: Dict[str, List[Tensor]],
+        groundtruths: Dict[str, List[Tensor]],
+    ) -> _CocoTorchInputs:
+        """Convert per-image detections and groundtruths to the inputs of the native COCO evaluation."""
+        if average == "micro":
+            # for micro averaging we set everything to be the same class
+            groundtruth_labels = [torch.zeros_like(x) for x in groundtruths["labels"]]
+            detection_labels = [torch.zeros_like(x) for x in detections["labels"]]
+        else:
+            groundtruth_labels = groundtruths["labels"]
+            detection_labels = detections["labels"]
+
+        if i_type == "bbox":
+            det_geometry, gt_geometry = detections["boxes"], groundtruths["boxes"]
+            det_areas = [b.reshape(-1, 4)[:, 2:].double().prod(1) for b in det_geometry]
+        else:
+            det_geometry, gt_geometry = detections["masks"], groundtruths["masks"]
+            det_areas = [_coco_rle_area(m) for m in det_geometry]
+        # the area of ground truths is either given by the user or based on the masks, if those are available
+        if "segm" in self.iou_type:
+            gt_default_areas = [_coco_rle_area(m) for m in groundtruths["masks"]]
+        else:
+            gt_default_areas = [b.reshape(-1, 4)[:, 2:].double().prod(1) for b in groundtruths["boxes"]]
+        gt_areas = [torch.where(a > 0, a.double(), d) for a, d in zip(groundtruths["area"], gt_default_areas)]
+
+        # in the same way as the coco format, images without any ground truth masks are not evaluated for `segm` only
+        image_ids = list(range(len(groundtruth_labels)))
+        if "bbox" not in self.iou_type:
+            image_ids = [i for i in image_ids if int(groundtruths["masks"][i][0]) > 0]
+
+        def _select(values: List[Tensor]) -> List[Tensor]:
+            return [values[i] for i in image_ids]
+
+        return {
+            "det_geometry": _select(det_geometry),
+            "det_scores": _select(detections["scores"]),
+            "det_labels": _select(detection_labels),
+            "det_areas": _select(det_areas),
+            "gt_geometry": _select(gt_geometry),
+            "gt_labels": _select(groundtruth_labels),
+            "gt_crowds": _select(groundtruths["iscrowd"]),
+            "gt_areas": _select(gt_areas),
+            "image_ids": image_ids,
+        }
+
+    def _incremental_variants(self) -> List[Tuple[Literal["macro", "micro"], str]]:
+        """Return the (average, iou type) combinations that detections are matched for in incremental mode."""
+        averages: List[Literal["macro", "micro"]] = ["macro"] if self.average == "macro" else ["micro"]
+        if self.average == "micro" and self.class_metrics:
+            averages.append("macro")
+        return [(average, i_type) for average in averages for i_type in self.iou_type]
+
+    def _update_incremental(self, preds: List[Dict[str, Tensor]], target: List[Dict[str, Tensor]]) -> None:
+        """Match the detections of a batch of images and only keep the results of the matching as states."""
+        detections: Dict[str, List[Tensor]] = {"boxes": [], "masks": [], "scores": [], "labels": []}
+        for item in preds:
+            bbox_detection, mask_detection = self._get_safe_item_values(item, warn=self.warn_on_many_detections)
+            if bbox_detection is not None:
+                detections["boxes"].append(bbox_detection)
+            if mask_detection is not None:
+                detections["masks"].append(mask_detection)
+            detections["scores"].append(item["scores"])
+            detections["labels"].append(item["labels"])
+        groundtruths: Dict[str, List[Tensor]] = {"boxes": [], "masks": [], "labels": [], "iscrowd": [], "area": []}
+        for item in target:
+            bbox_groundtruth, mask_groundtruth = self._get_safe_item_values(item)
+            if bbox_groundtruth is not None:
+                groundtruths["boxes"].append(bbox_groundtruth)
+            if mask_groundtruth is not None:
+                groundtruths["masks"].append(mask_groundtruth)
+            groundtruths["labels"].append(item["labels"])
+            groundtruths["iscrowd"].append(item.get("iscrowd", torch.zeros_like(item["labels"])))
+            groundtruths["area"].append(item.get("area", torch.zeros_like(item["labels"])))
+
+        scores = _cat_or_empty([s.reshape(-1) for s in detections["scores"]], (0,))
+        device, max_det = scores.device, self.max_detection_thresholds[-1]
+        det_image = torch.repeat_interleave(
+            torch.arange(len(preds), device=device),
+            torch.tensor([len(s) for s in detections["scores"]], dtype=torch.long, device=device),
+        )
+        gt_image = torch.repeat_interleave(
+            torch.arange(len(target), device=device),
+            torch.tensor([len(lab) for lab in groundtruths["labels"]], dtype=torch.long, device=device),
+        )
+
+        ranks = torch.full((len(scores), 2), max_det, dtype=torch.long, device=device)
+        matches, ignores = [], []
+        gt_ignored = torch.ones(len(gt_image), 4, dtype=torch.bool, device=device)
+        for average, i_type in self._incremental_variants():
+            inputs = self._get_torch_inputs(i_type, average, detections, groundtruths)
+            image_ids = torch.tensor(inputs["image_ids"], dtype=torch.long, device=device)
+            result, _ = _coco_evaluate_images(
+                **inputs, iou_type=i_type, iou_thresholds=self.iou_thresholds, max_det=max_det
+            )
+            # detections of images that are not evaluated keep a rank of `max_det` and are therefore never counted,
+            # in the same way their ground truths are ignored for all area ranges
+            det_evaluated, gt_evaluated = torch.isin(det_image, image_ids), torch.isin(gt_image, image_ids)
+            ranks[det_evaluated, ("macro", "micro").index(average)] = result["det_ranks"]
+            matched = scores.new_zeros((len(scores), 4, len(self.iou_thresholds)), dtype=torch.bool)
+            ignored = torch.zeros_like(matched)
+            matched[det_evaluated], ignored[det_evaluated] = result["det_matched"], result["det_ignored"]
+            matches.append(matched)
+            ignores.append(ignored)
+            gt_ignored[gt_evaluated] = result["gt_ignored"]
+
+        # records are kept per image, such that the order of detections with tied scores does not depend on how
+        # images are distributed over batches and processes
+        det_counts = [len(s) for s in detections["scores"]]
+        matches, ignores = torch.stack(matches, dim=1), torch.stack(ignores, dim=1)
+        self.detection_scores.extend(scores.split(det_counts))
+        self.detection_labels.extend(x.reshape(-1) for x in detections["labels"])
+        self.detection_ranks.extend(ranks.split(det_counts))
+        self.detection_matches.extend(matches.split(det_counts))
+        self.detection_ignores.extend(ignores.split(det_counts))
+        self.groundtruth_labels.extend(x.reshape(-1) for x in groundtruths["labels"])
+        self.groundtruth_ignores.extend(gt_ignored.split([len(x) for x in groundtruths["labels"]]))
+
     def _get_coco_datasets(self, average: Literal["macro", "micro"]) -> Tuple[object, object]:
         """Returns the coco datasets for the target and the predictions."""
         if average == "micro":
@@ -602,14 +893,14 @@ class MeanAveragePrecision(Metric):
         coco_target.dataset = self._get_coco_format(
             labels=groundtruth_labels,
             boxes=self.groundtruth_box if len(self.groundtruth_box) > 0 else None,
-            masks=self.groundtruth_mask if len(self.groundtruth_mask) > 0 else None,
+            masks=[self._rle_to_coco(m) for m in self.groundtruth_mask] if len(self.groundtruth_mask) > 0 else None,
             crowds=self.groundtruth_crowds,
             area=self.groundtruth_area,
         )
         coco_preds.dataset = self._get_coco_format(
             labels=detection_labels,
             boxes=self.detection_box if len(self.detection_box) > 0 else None,
-            masks=self.detection_mask if len(self.detection_mask) > 0 else None,
+            masks=[self._rle_to_coco(m) for m in self.detection_mask] if len(self.detection_mask) > 0 else None,
             scores=self.detection_scores,
         )
 
@@ -648,12 +939,14 @@ class MeanAveragePrecision(Metric):
 
         The function accepts a file for the predictions and a file for the target in coco format and converts them to
         a list of dictionaries containing the boxes, labels and scores in the input format of this metric.
+        The annotations are parsed into columnar arrays in a single pass and grouped per image by sorting, the coco api
+        of the backend is only used for rasterizing segmentation masks.
 
         Args:
             coco_preds: Path to the json file containing the predictions in coco format
             coco_target: Path to the json file containing the targets in coco format
             iou_type: Type of input, either `bbox` for bounding boxes or `segm` for segmentation masks
-            backend: Backend to use for the conversion. Either `pycocotools` or `faster_coco_eval`.
+            backend: Backend to use for the conversion of segmentations. Either `pycocotools` or `faster_coco_eval`.
 
         Returns:
             A tuple containing the predictions and targets in the input format of this metric. Each element of the
@@ -672,80 +965,52 @@ class MeanAveragePrecision(Metric):
 
         """
         iou_type = _validate_iou_type_arg(iou_type)  # type: ignore[arg-type]
-        coco, _, _ = _load_backend_tools(backend)
-
-        with contextlib.redirect_stdout(io.StringIO()):
-            gt = coco(coco_target)  # type: ignore[operator]
-            dt = gt.loadRes(coco_preds)
-
-        gt_dataset = gt.dataset["annotations"]
-        dt_dataset = dt.dataset["annotations"]
-
-        target: dict = {}
-        for t in gt_dataset:
-            if t["image_id"] not in target:
-                target[t["image_id"]] = {
-                    "labels": [],
-                    "iscrowd": [],
-                    "area": [],
-                }
-                if "bbox" in iou_type:
-                    target[t["image_id"]]["boxes"] = []
-                if "segm" in iou_type:
-                    target[t["image_id"]]["masks"] = []
-
-            if "bbox" in iou_type:
-                target[t["image_id"]]["boxes"].append(t["bbox"])
-            if "segm" in iou_type:
-                target[t["image_id"]]["masks"].append(gt.annToMask(t))
-            target[t["image_id"]]["labels"].append(t["category_id"])
-            target[t["image_id"]]["iscrowd"].append(t["iscrowd"])
-            target[t["image_id"]]["area"].append(t["area"])
-
-        preds: dict = {}
-        for p in dt_dataset:
-            if p["image_id"] not in preds:
-                preds[p["image_id"]] = {"scores": [], "labels": []}
-                if "bbox" in iou_type:
-                    preds[p["image_id"]]["boxes"] = []
-                if "segm" in iou_type:
-                    preds[p["image_id"]]["masks"] = []
-            if "bbox" in iou_type:
-                preds[p["image_id"]]["boxes"].append(p["bbox"])
-            if "segm" in iou_type:
-                preds[p["image_id"]]["masks"].append(gt.annToMask(p))
-            preds[p["image_id"]]["scores"].append(p["score"])
-            preds[p["image_id"]]["labels"].append(p["category_id"])
-        for k in target:  # add empty predictions for images without predictions
-            if k not in preds:
-                preds[k] = {"scores": [], "labels": []}
-                if "bbox" in iou_type:
-                    preds[k]["boxes"] = []
-                if "segm" in iou_type:
-                    preds[k]["masks"] = []
-
-        batched_preds, batched_target = [], []
-        for key in target:
-            bp = {
-                "scores": torch.tensor(preds[key]["scores"], dtype=torch.float32),
-                "labels": torch.tensor(preds[key]["labels"], dtype=torch.int32),
-            }
-            if "bbox" in iou_type:
-                bp["boxes"] = torch.tensor(np.array(preds[key]["boxes"]), dtype=torch.float32)
-            if "segm" in iou_type:
-                bp["masks"] = torch.tensor(np.array(preds[key]["masks"]), dtype=torch.uint8)
-            batched_preds.append(bp)
-
-            bt = {
-                "labels": torch.tensor(target[key]["labels"], dtype=torch.int32),
-                "iscrowd": torch.tensor(target[key]["iscrowd"], dtype=torch.int32),
-                "area": torch.tensor(target[key]["area"], dtype=torch.float32),
-            }
-            if "bbox" in iou_type:
-                bt["boxes"] = torch.tensor(target[key]["boxes"], dtype=torch.float32)
-            if "segm" in iou_type:
-                bt["masks"] = torch.tensor(np.array(target[key]["masks"]), dtype=torch.uint8)
-            batched_target.append(bt)
+        with open(coco_target) as f:
+            gt_dataset = json.load(f)
+        with open(coco_preds) as f:
+            dt_dataset = json.load(f)
+        # the coco api is only needed to rasterize segmentations, boxes are read without it
+        needs_mask_utils = "segm" in iou_type or any("bbox" not in ann for ann in dt_dataset)
+        mask_utils = _load_backend_tools(backend)[2] if needs_mask_utils else None
+
+        image_sizes = {img["id"]: (img.get("height"), img.get("width")) for img in gt_dataset.get("images", [])}
+        if any(ann["image_id"] not in image_sizes for ann in dt_dataset):
+            raise ValueError("Results do not correspond to current coco set: found predictions for unknown images")
+        gt = _coco_annotations_to_columns(gt_dataset["annotations"], iou_type, image_sizes, mask_utils, is_target=True)
+        dt = _coco_annotations_to_columns(dt_dataset, iou_type, image_sizes, mask_utils, is_target=False)
+
+        # images are returned in order of their first annotation in the target file
+        image_ids, first_index = np.unique(gt["image_id"], return_index=True)
+        image_ids = image_ids[np.argsort(first_index, kind="stable")]
+        gt_counts = _coco_group_by_image(gt, image_ids)
+        dt_counts = _coco_group_by_image(dt, image_ids)
+
+        batched_preds: List[Dict[str, Tensor]] = [{} for _ in image_ids]
+        for key, dtype in (("scores", torch.float32), ("labels", torch.int32), ("boxes", torch.float32)):
+            if key in dt:
+                for bp, value in zip(batched_preds, torch.from_numpy(dt[key]).to(dtype).split(dt_counts)):
+                    bp[key] = value
+        batched_target: List[Dict[str, Tensor]] = [{} for _ in image_ids]
+        for key, dtype in (
+            ("labels", torch.int32),
+            ("iscrowd", torch.int32),
+            ("area", torch.float32),
+            ("boxes", torch.float32),
+        ):
+            if key in gt:
+                for bt, value in zip(batched_target, torch.from_numpy(gt[key]).to(dtype).split(gt_counts)):
+                    bt[key] = value
+
+        if "segm" in iou_type:
+            for image_id, bp, bt, dt_rles, gt_rles in zip(
+                image_ids.tolist(),
+                batched_preds,
+                batched_target,
+                _split_list(dt["masks"], dt_counts),
+                _split_list(gt["masks"], gt_counts),
+            ):
+                bp["masks"] = _coco_decode_masks(dt_rles, image_sizes[image_id], mask_utils)
+                bt["masks"] = _coco_decode_masks(gt_rles, image_sizes[image_id], mask_utils)
 
         return batched_preds, batched_target
 
@@ -780,43 +1045,38 @@ class MeanAveragePrecision(Metric):
             >>> metric.tm_to_coco("tm_map_input")
 
         """
-        target_dataset = self._get_coco_format(
+        groundtruth_mask = [self._rle_to_coco(m) for m in self.groundtruth_mask]
+        detection_mask = [self._rle_to_coco(m) for m in self.detection_mask]
+        target_images, target_annotations = self._get_coco_images_and_annotations(
             labels=self.groundtruth_labels,
             boxes=self.groundtruth_box if len(self.groundtruth_box) > 0 else None,
-            masks=self.groundtruth_mask if len(self.groundtruth_mask) > 0 else None,
+            masks=groundtruth_mask if len(groundtruth_mask) > 0 else None,
             crowds=self.groundtruth_crowds,
             area=self.groundtruth_area,
         )
-        preds_dataset = self._get_coco_format(
+        _, preds_annotations = self._get_coco_images_and_annotations(
             labels=self.detection_labels,
             boxes=self.detection_box if len(self.detection_box) > 0 else None,
-            masks=self.detection_mask if len(self.detection_mask) > 0 else None,
+            masks=detection_mask if len(detection_mask) > 0 else None,
             scores=self.detection_scores,
         )
-        if "segm" in self.iou_type:
-            # the rle masks needs to be decoded to be written to a file
-            preds_dataset["annotations"] = apply_to_collection(
-                preds_dataset["annotations"], dtype=bytes, function=lambda x: x.decode("utf-8")
-            )
-            preds_dataset["annotations"] = apply_to_collection(
-                preds_dataset["annotations"],
-                dtype=np.uint32,
-                function=lambda x: int(x),
-            )
-            target_dataset = apply_to_collection(target_dataset, dtype=bytes, function=lambda x: x.decode("utf-8"))
-
-        preds_json = json.dumps(preds_dataset["annotations"], indent=4)
-        target_json = json.dumps(target_dataset, indent=4)
 
+        # annotations are written one by one, such that the full dataset is never materialized as a single string
         with open(f"{name}_preds.json", "w") as f:
-            f.write(preds_json)
+            _write_json_array(f, preds_annotations)
 
         with open(f"{name}_target.json", "w") as f:
-            f.write(target_json)
+            f.write('{"images": ')
+            _write_json_array(f, target_images)
+            f.write(', "annotations": ')
+            _write_json_array(f, target_annotations)
+            f.write(', "categories": ')
+            json.dump([{"id": i, "name": str(i)} for i in self._get_classes()], f)
+            f.write("}")
 
     def _get_safe_item_values(
         self, item: Dict[str, Any], warn: bool = False
-    ) -> Tuple[Optional[Tensor], Optional[Tuple]]:
+    ) -> Tuple[Optional[Tensor], Optional[Tensor]]:
         """Convert and return the boxes or masks from the item depending on the iou_type.
 
         Args:
@@ -836,18 +1096,26 @@ class MeanAveragePrecision(Metric):
                 boxes = box_convert(boxes, in_fmt=self.box_format, out_fmt="xywh")
             output[0] = boxes  # type: ignore[call-overload]
         if "segm" in self.iou_type:
-            masks = []
-            for i in item["masks"].cpu().numpy():
-                rle = self.mask_utils.encode(np.asfortranarray(i))
-                masks.append((tuple(rle["size"]), rle["counts"]))
-            output[1] = tuple(masks)  # type: ignore[call-overload]
+            # masks are stored in a packed run-length encoding, that is computed on the device of the masks
+            masks = item["masks"] if item["masks"].ndim == 3 else item["masks"].reshape(0, 0, 0)
+            output[1] = _coco_rle_encode(masks)  # type: ignore[call-overload]
         if warn and (
             (output[0] is not None and len(output[0]) > self.max_detection_thresholds[-1])
-            or (output[1] is not None and len(output[1]) > self.max_detection_thresholds[-1])
+            or (output[1] is not None and int(output[1][0]) > self.max_detection_thresholds[-1])
         ):
             _warning_on_too_many_detections(self.max_detection_thresholds[-1])
         return output  # type: ignore[return-value]
 
+    def _rle_to_coco(self, rle: Tensor) -> Tuple[Tuple[Tuple[int, int], bytes], ...]:
+        """Convert packed run-length encoded masks to a tuple of compressed coco rle ``(size, counts)`` pairs."""
+        _, height, width, lengths, counts = _coco_rle_unpack(rle.cpu())
+        if not len(lengths):
+            return ()
+        # all masks of an image are compressed with a single call instead of one call per mask
+        uncompressed = [{"size": [height, width], "counts": c.tolist()} for c in counts.split(lengths.tolist())]
+        coco_rles = self.mask_utils.frPyObjects(uncompressed, height, width)
+        return tuple((tuple(coco_rle["size"]), coco_rle["counts"]) for coco_rle in coco_rles)
+
     def _get_classes(self) -> List:
         """Return a list of unique classes found in ground truth and detection data."""
         if len(self.detection_labels) > 0 or len(self.groundtruth_labels) > 0:
@@ -858,7 +1126,7 @@ class MeanAveragePrecision(Metric):
         self,
         labels: List[torch.Tensor],
         boxes: Optional[List[torch.Tensor]] = None,
-        masks: Optional[List[torch.Tensor]] = None,
+        masks: Optional[List[Tuple]] = None,
         scores: Optional[List[torch.Tensor]] = None,
         crowds: Optional[List[torch.Tensor]] = None,
         area: Optional[List[torch.Tensor]] = None,
@@ -869,30 +1137,61 @@ class MeanAveragePrecision(Metric):
         https://cocodataset.org/#format-data
 
         """
-        images = []
-        annotations = []
-        annotation_id = 1  # has to start with 1, otherwise COCOEval results are wrong
+        images, annotations = self._get_coco_images_and_annotations(labels, boxes, masks, scores, crowds, area)
+        classes = [{"id": i, "name": str(i)} for i in self._get_classes()]
+        return {"images": images, "annotations": list(annotations), "categories": classes}
 
-        for image_id, image_labels in enumerate(labels):
-            if boxes is not None:
-                image_boxes = boxes[image_id]
-                image_boxes = image_boxes.cpu().tolist()
-            if masks is not None:
-                image_masks = masks[image_id]
-                if len(image_masks) == 0 and boxes is None:
-                    continue
-            image_labels = image_labels.cpu().tolist()  # type: ignore[assignment]
+    def _get_coco_images_and_annotations(
+        self,
+        labels: List[torch.Tensor],
+        boxes: Optional[List[torch.Tensor]] = None,
+        masks: Optional[List[Tuple]] = None,
+        scores: Optional[List[torch.Tensor]] = None,
+        crowds: Optional[List[torch.Tensor]] = None,
+        area: Optional[List[torch.Tensor]] = None,
+    ) -> Tuple[List[Dict], Iterator[Dict]]:
+        """Return the coco image entries and a lazy iterator over the coco annotations of the cached inputs.
+
+        The annotations are generated image by image, such that they can be streamed to a file without materializing
+        the full dataset in memory.
 
+        """
+        images = []
+        for image_id in range(len(labels)):
+            if masks is not None and len(masks[image_id]) == 0 and boxes is None:
+                continue
             images.append({"id": image_id})
-            if "segm" in self.iou_type and len(image_masks) > 0:
-                images[-1]["height"], images[-1]["width"] = image_masks[0][0][0], image_masks[0][0][1]  # type: ignore[assignment]
+            if "segm" in self.iou_type and masks is not None and len(masks[image_id]) > 0:
+                height, width = masks[image_id][0][0]
+                images[-1]["height"], images[-1]["width"] = int(height), int(width)
+        image_ids = [image["id"] for image in images]
+        return images, self._iter_coco_annotations(image_ids, labels, boxes, masks, scores, crowds, area)
+
+    def _iter_coco_annotations(
+        self,
+        image_ids: List[int],
+        labels: List[torch.Tensor],
+        boxes: Optional[List[torch.Tensor]] = None,
+        masks: Optional[List[Tuple]] = None,
+        scores: Optional[List[torch.Tensor]] = None,
+        crowds: Optional[List[torch.Tensor]] = None,
+        area: Optional[List[torch.Tensor]] = None,
+    ) -> Iterator[Dict]:
+        """Yield the coco annotations of the given images, converting each per-image tensor to python only once."""
+        annotation_id = 1  # has to start with 1, otherwise COCOEval results are wrong
+        for image_id in image_ids:
+            image_labels = labels[image_id].cpu().tolist()
+            image_boxes = boxes[image_id].cpu().tolist() if boxes is not None else None
+            image_masks = masks[image_id] if masks is not None else None
+            image_scores = scores[image_id].cpu().tolist() if scores is not None else None
+            image_crowds = crowds[image_id].cpu().tolist() if crowds is not None else None
+            image_area = area[image_id].cpu().tolist() if area is not None else None
 
             for k, image_label in enumerate(image_labels):
-                if boxes is not None:
+                if image_boxes is not None:
                     image_box = image_boxes[k]
-                if masks is not None and len(image_masks) > 0:
-                    image_mask = image_masks[k]
-                    image_mask = {"size": image_mask[0], "counts": image_mask[1]}
+                if image_masks is not None and len(image_masks) > 0:
+                    image_mask = {"size": image_masks[k][0], "counts": image_masks[k][1]}
 
                 if "bbox" in self.iou_type and len(image_box) != 4:
                     raise ValueError(
@@ -907,8 +1206,8 @@ class MeanAveragePrecision(Metric):
 
                 area_stat_box = None
                 area_stat_mask = None
-                if area is not None and area[image_id][k].cpu().tolist() > 0:  # type: ignore[operator]
-                    area_stat = area[image_id][k].cpu().tolist()
+                if image_area is not None and image_area[k] > 0:
+                    area_stat = image_area[k]
                 else:
                     area_stat = (
                         self.mask_utils.area(image_mask) if "segm" in self.iou_type else image_box[2] * image_box[3]
@@ -922,31 +1221,28 @@ class MeanAveragePrecision(Metric):
                     "image_id": image_id,
                     "area": area_stat,
                     "category_id": image_label,
-                    "iscrowd": crowds[image_id][k].cpu().tolist() if crowds is not None else 0,
+                    "iscrowd": image_crowds[k] if image_crowds is not None else 0,
                 }
                 if area_stat_box is not None:
                     annotation["area_bbox"] = area_stat_box
                     annotation["area_segm"] = area_stat_mask
 
-                if boxes is not None:
+                if image_boxes is not None:
                     annotation["bbox"] = image_box
-                if masks is not None:
+                if image_masks is not None:
                     annotation["segmentation"] = image_mask
 
-                if scores is not None:
-                    score = scores[image_id][k].cpu().tolist()
+                if image_scores is not None:
+                    score = image_scores[k]
                     if not isinstance(score, float):
                         raise ValueError(
                             f"Invalid input score of sample {image_id}, element {k}"
                             f" (expected value of type float, got type {type(score)})"
                         )
                     annotation["score"] = score
-                annotations.append(annotation)
+                yield annotation
                 annotation_id += 1
 
-        classes = [{"id": i, "name": str(i)} for i in self._get_classes()]
-        return {"images": images, "annotations": annotations, "categories": classes}
-
     def plot(
         self, val: Optional[Union[Dict[str, Tensor], Sequence[Dict[str, Tensor]]]] = None, ax: Optional[_AX_TYPE] = None
     ) -> _PLOT_OUT_TYPE:
@@ -1010,47 +1306,142 @@ class MeanAveragePrecision(Metric):
     # specialized synchronization and apply functions for this metric
     # --------------------
 
-    def _apply(self, fn: Callable) -> torch.nn.Module:  # type: ignore[override]
-        """Custom apply function.
-
-        Excludes the detections and groundtruths from the casting when the iou_type is set to `segm` as the state is
-        no longer a tensor but a tuple.
-
-        """
-        return super()._apply(fn, exclude_state=("detection_mask", "groundtruth_mask"))
-
     def _sync_dist(self, dist_sync_fn: Optional[Callable] = None, process_group: Optional[Any] = None) -> None:
         """Custom sync function.
 
-        For the iou_type `segm` the detections and groundtruths are no longer tensors but tuples. Therefore, we need
-        to gather the list of tuples and then convert it back to a list of tuples.
-
-        """
-        super()._sync_dist(dist_sync_fn=dist_sync_fn, process_group=process_group)  # type: ignore[arg-type]
-
-        if "segm" in self.iou_type:
-            self.detection_mask = self._gather_tuple_list(self.detection_mask, process_group)  # type: ignore[arg-type]
-            self.groundtruth_mask = self._gather_tuple_list(self.groundtruth_mask, process_group)  # type: ignore[arg-type]
-
-    @staticmethod
-    def _gather_tuple_list(list_to_gather: List[Tuple], process_group: Optional[Any] = None) -> List[Any]:
-        """Gather a list of tuples over multiple devices.
-
-        Args:
-            list_to_gather: input list of tuples that should be gathered across devices
-            process_group: process group to gather the list of tuples
-
-        Returns:
-            list of tuples gathered across devices
+        All states are lists with one tensor per image, which would require one gather per image and state. Instead,
+        all states are packed into a single flat buffer with an index of the shapes and gathered at once.
 
         """
-        world_size = dist.get_world_size(group=process_group)
-        dist.barrier(group=process_group)
+        states = list(self._reductions)
+        gathered = _gather_tensor_lists(
+            [getattr(self, attr) for attr in states],
+            device=self.device,
+            group=process_group or self.process_group,
+            dist_sync_fn=dist_sync_fn or gather_all_tensors,
+        )
+        for attr, values in zip(states, gathered):
+            setattr(self, attr, values)
+
+
+def _cat_or_empty(values: List[Tensor], shape: Tuple[int, ...], dtype: torch.dtype = torch.float32) -> Tensor:
+    """Concatenate a list of tensors along the first dimension or return an empty tensor if the list is empty."""
+    return torch.cat(values) if len(values) > 0 else torch.zeros(shape, dtype=dtype)
+
+
+def _coco_json_default(obj: Any) -> Any:
+    """Convert the bytes and numpy scalars produced by the coco mask api to json serializable objects."""
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8")
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json_array(f: IO[str], items: Iterable[Any], chunk_size: int = 4096) -> None:
+    """Write an iterable of json serializable items to a file as a json array, encoding them in chunks."""
+    encoder = json.JSONEncoder(default=_coco_json_default)
+    items = iter(items)
+    f.write("[")
+    chunk = list(islice(items, chunk_size))
+    separator = ""
+    while chunk:
+        f.write(separator + encoder.encode(chunk)[1:-1])
+        separator = ", "
+        chunk = list(islice(items, chunk_size))
+    f.write("]")
+
+
+def _coco_annotations_to_columns(
+    annotations: List[Dict[str, Any]],
+    iou_type: Tuple[str, ...],
+    image_sizes: Dict[int, Tuple[int, int]],
+    mask_utils: Optional[ModuleType],
+    is_target: bool,
+) -> Dict[str, Any]:
+    """Parse a list of coco annotations into columnar arrays in a single pass.
+
+    Predictions that only provide one of ``bbox`` and ``segmentation`` get the other one derived from it, the same way
+    the ``loadRes`` method of the coco api does. Segmentations are kept as a list of coco run-length encodings.
 
-        list_gathered = [None for _ in range(world_size)]
-        dist.all_gather_object(list_gathered, list_to_gather, group=process_group)
+    """
+    image_id, category_id, score, iscrowd, area, boxes, masks = [], [], [], [], [], [], []
+    for ann in annotations:
+        image_id.append(ann["image_id"])
+        category_id.append(ann["category_id"])
+        if is_target:
+            iscrowd.append(ann.get("iscrowd", 0))
+            area.append(ann["area"])
+        else:
+            score.append(ann["score"])
+        rle = None
+        if "segm" in iou_type or ("segmentation" in ann and "bbox" not in ann):
+            segmentation = ann.get("segmentation")
+            if segmentation is None:
+                x, y, w, h = ann["bbox"]
+                segmentation = [[x, y, x, y + h, x + w, y + h, x + w, y]]
+            rle = _coco_segmentation_to_rle(segmentation, image_sizes[ann["image_id"]], mask_utils)
+            masks.append(rle)
+        if "bbox" in iou_type:
+            boxes.append(ann["bbox"] if "bbox" in ann else mask_utils.toBbox(rle).tolist())  # type: ignore[union-attr]
+
+    columns: Dict[str, Any] = {
+        "image_id": np.asarray(image_id, dtype=np.int64),
+        "labels": np.asarray(category_id, dtype=np.int64),
+    }
+    if is_target:
+        columns["iscrowd"] = np.asarray(iscrowd, dtype=np.int64)
+        columns["area"] = np.asarray(area, dtype=np.float64)
+    else:
+        columns["scores"] = np.asarray(score, dtype=np.float64)
+    if "bbox" in iou_type:
+        columns["boxes"] = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if "segm" in iou_type:
+        columns["masks"] = masks
+    return columns
+
+
+def _coco_segmentation_to_rle(segmentation: Any, image_size: Tuple[int, int], mask_utils: Any) -> Dict[str, Any]:
+    """Convert a polygon, uncompressed or compressed coco segmentation to a compressed run-length encoding."""
+    height, width = image_size
+    if isinstance(segmentation, list):
+        return mask_utils.merge(mask_utils.frPyObjects(segmentation, height, width))
+    if isinstance(segmentation["counts"], list):
+        return mask_utils.frPyObjects(segmentation, height, width)
+    return segmentation
+
+
+def _coco_group_by_image(columns: Dict[str, Any], image_ids: np.ndarray) -> List[int]:
+    """Reorder the columns in-place such that annotations are grouped by image, following the order of ``image_ids``.
+
+    Annotations of images not in ``image_ids`` are dropped, the order of annotations within an image is preserved.
+
+    Returns:
+        The number of annotations of each image, to be used for splitting the columns.
 
-        return [list_gathered[rank][idx] for idx in range(len(list_gathered[0])) for rank in range(world_size)]  # type: ignore[arg-type,index]
+    """
+    sorter = np.argsort(image_ids, kind="stable")
+    sorted_ids = np.append(image_ids[sorter], np.iinfo(np.int64).max)  # sentinel for unknown trailing ids
+    index = np.searchsorted(sorted_ids[:-1], columns["image_id"])
+    known = sorted_ids[index] == columns["image_id"]
+    position = sorter[index[known]]
+    order = np.flatnonzero(known)[np.argsort(position, kind="stable")]
+    for key, value in columns.items():
+        columns[key] = [value[i] for i in order] if isinstance(value, list) else value[order]
+    return np.bincount(position, minlength=len(image_ids)).tolist()
+
+
+def _split_list(values: List[Any], counts: List[int]) -> List[List[Any]]:
+    """Split a list into consecutive chunks of the given sizes."""
+    offsets = np.cumsum([0, *counts]).tolist()
+    return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _coco_decode_masks(rles: List[Dict[str, Any]], image_size: Tuple[int, int], mask_utils: Any) -> Tensor:
+    """Decode the coco run-length encodings of an image into a single ``(N, H, W)`` uint8 mask tensor."""
+    if len(rles) == 0:
+        return torch.zeros((0, *image_size), dtype=torch.uint8)
+    return torch.from_numpy(np.ascontiguousarray(mask_utils.decode(rles).transpose(2, 0, 1)))
 
 
 def _warning_on_too_many_detections(limit: int) -> None:
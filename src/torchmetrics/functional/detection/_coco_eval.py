@@ -0,0 +1,653 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tensor implementation of the COCO evaluation protocol used by ``MeanAveragePrecision(backend="torch")``.
+
+The implementation mirrors ``COCOeval.evaluate``, ``COCOeval.accumulate`` and ``COCOeval.summarize`` from
+`pycocotools`, but every step is expressed as batched tensor operations over all (image, class) pairs at once:
+
+- IoU values are only computed for (detection, ground truth) pairs that share image and class
+- greedy matching iterates over the detection rank, while all pairs, area ranges and IoU thresholds are matched
+  simultaneously
+- precision/recall curves are computed with cumulative sums and interpolated with ``searchsorted``
+
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import torch
+from torch import Tensor
+
+_COCO_AREA_RANGES = ((0.0, 1e5**2), (0.0, 32.0**2), (32.0**2, 96.0**2), (96.0**2, 1e5**2))
+# upper bound on the number of elements in the boolean matching state of a single chunk of (image, class) pairs
+_COCO_MATCHING_BUDGET = 2**24
+
+
+def _coco_pairwise_box_iou(det_boxes: Tensor, gt_boxes: Tensor, gt_crowds: Tensor) -> Tensor:
+    """Compute the IoU between aligned pairs of ``xywh`` boxes, following the convention of ``pycocotools``.
+
+    For crowd ground truths the intersection is normalized by the area of the detection instead of the union.
+
+    Args:
+        det_boxes: float tensor of shape ``(P, 4)`` with detection boxes
+        gt_boxes: float tensor of shape ``(P, 4)`` with ground truth boxes
+        gt_crowds: bool tensor of shape ``(P,)`` indicating crowd ground truths
+
+    Returns:
+        float64 tensor of shape ``(P,)`` with the IoU of each pair
+
+    """
+    det_boxes, gt_boxes = det_boxes.double(), gt_boxes.double()
+    width = torch.minimum(det_boxes[:, 2] + det_boxes[:, 0], gt_boxes[:, 2] + gt_boxes[:, 0]) - torch.maximum(
+        det_boxes[:, 0], gt_boxes[:, 0]
+    )
+    height = torch.minimum(det_boxes[:, 3] + det_boxes[:, 1], gt_boxes[:, 3] + gt_boxes[:, 1]) - torch.maximum(
+        det_boxes[:, 1], gt_boxes[:, 1]
+    )
+    intersection = width * height
+    det_area = det_boxes[:, 2] * det_boxes[:, 3]
+    gt_area = gt_boxes[:, 2] * gt_boxes[:, 3]
+    union = torch.where(gt_crowds, det_area, det_area + gt_area - intersection)
+    return torch.where((width > 0) & (height > 0), intersection / union, torch.zeros_like(union))
+
+
+def _coco_rle_encode(masks: Tensor) -> Tensor:
+    """Encode binary masks into a packed run-length encoding, computed on the device of the masks.
+
+    The counts follow the uncompressed RLE format of ``pycocotools``: pixels are traversed in column-major order and
+    runs alternate between background and foreground, starting with background.
+
+    Args:
+        masks: tensor of shape ``(N, H, W)`` with binary masks of a single image
+
+    Returns:
+        int32 tensor ``[N, H, W, k_1, ..., k_N, counts_1, ..., counts_N]``, where ``k_i`` is the number of counts of
+        the ``i``-th mask
+
+    """
+    num, height, width = masks.shape
+    size, device = height * width, masks.device
+    # a run starts at every change of value in column-major order, and at position 0 if the first pixel is foreground
+    columns = masks.bool().transpose(1, 2)
+    change = torch.zeros(num, width, height, dtype=torch.bool, device=device)
+    if size > 0:
+        torch.ne(columns[:, :, 1:], columns[:, :, :-1], out=change[:, :, 1:])
+        torch.ne(columns[:, 1:, 0], columns[:, :-1, -1], out=change[:, 1:, 0])
+        change[:, 0, 0] = columns[:, 0, 0]
+    rows, positions = change.view(num, size).nonzero(as_tuple=True)
+    lengths = torch.bincount(rows, minlength=num)
+    previous = torch.zeros_like(positions)
+    previous[1:] = torch.where(rows[1:] == rows[:-1], positions[:-1], 0)
+    # every mask ends with the run up to the last pixel, which is placed after the runs of that mask
+    ends = torch.cumsum(lengths, 0)
+    last = torch.zeros(num, dtype=torch.long, device=device)
+    last[lengths > 0] = positions[ends[lengths > 0] - 1]
+    counts = torch.empty(positions.numel() + num, dtype=torch.long, device=device)
+    counts[torch.arange(positions.numel(), device=device) + rows] = positions - previous
+    counts[ends + torch.arange(num, device=device)] = size - last
+    header = torch.tensor([num, height, width], device=device)
+    return torch.cat([header, lengths + 1, counts]).int()
+
+
+def _coco_rle_unpack(rle: Tensor) -> Tuple[int, int, int, Tensor, Tensor]:
+    """Split a packed run-length encoding into ``(N, H, W, lengths, counts)``."""
+    num, height, width = (int(v) for v in rle[:3].tolist())
+    lengths = rle[3 : 3 + num].long()
+    return num, height, width, lengths, rle[3 + num :].long()
+
+
+def _coco_rle_decode(rle: Tensor) -> Tensor:
+    """Decode a packed run-length encoding back into binary masks of shape ``(N, H, W)``."""
+    num, height, width, lengths, counts = _coco_rle_unpack(rle)
+    run = _coco_group_ranks(torch.repeat_interleave(torch.arange(num, device=rle.device), lengths), num)[0]
+    flat = torch.repeat_interleave(run % 2 == 1, counts)
+    return flat.reshape(num, width, height).transpose(1, 2)
+
+
+def _coco_rle_area(rle: Tensor) -> Tensor:
+    """Compute the foreground area of every mask in a packed run-length encoding as a float64 tensor."""
+    num, _, _, lengths, counts = _coco_rle_unpack(rle)
+    mask = torch.repeat_interleave(torch.arange(num, device=rle.device), lengths)
+    run = _coco_group_ranks(mask, num)[0]
+    area = torch.zeros(num, dtype=torch.float64, device=rle.device)
+    return area.index_add_(0, mask, torch.where(run % 2 == 1, counts, 0).double())
+
+
+def _coco_rle_runs(rle: Tensor) -> Tuple[int, Tensor, Tensor, Tensor]:
+    """Return the number of masks and the mask index, start and end (exclusive) of every foreground run."""
+    num, _, _, lengths, counts = _coco_rle_unpack(rle)
+    mask = torch.repeat_interleave(torch.arange(num, device=rle.device), lengths)
+    run, _ = _coco_group_ranks(mask, num)
+    ends = torch.cumsum(counts, 0)
+    ends = ends - (ends - counts)[torch.cumsum(lengths, 0)[mask] - lengths[mask]]
+    foreground = run % 2 == 1
+    return num, mask[foreground], (ends - counts)[foreground], ends[foreground]
+
+
+def _coco_rle_iou(det_rle: Tensor, gt_rle: Tensor, gt_crowds: Tensor) -> Tensor:
+    """Compute the IoU between all pairs of run-length encoded masks of a single image, following ``pycocotools``.
+
+    The intersection is computed on the foreground intervals directly: the number of ground truth pixels covered
+    before a position is a piecewise linear function of that position, which is evaluated with ``searchsorted`` at
+    the start and end of every foreground interval of the detections.
+
+    Args:
+        det_rle: packed run-length encoding of ``D`` detection masks
+        gt_rle: packed run-length encoding of ``N`` ground truth masks
+        gt_crowds: bool tensor of shape ``(N,)`` indicating crowd ground truths
+
+    Returns:
+        float64 tensor of shape ``(D, N)`` with the IoU of each pair
+
+    """
+    num_det, det_mask, det_starts, det_ends = _coco_rle_runs(det_rle)
+    num_gt, gt_mask, gt_starts, gt_ends = _coco_rle_runs(gt_rle)
+    # pad the foreground intervals of the ground truths to a (N, K) layout, padded intervals lie beyond any position
+    gt_run, gt_num_runs = _coco_group_ranks(gt_mask, num_gt)
+    max_runs = int(gt_num_runs.max()) if num_gt > 0 and gt_mask.numel() > 0 else 0
+    limit = torch.iinfo(torch.long).max
+    starts = torch.full((num_gt, max_runs), limit, dtype=torch.long, device=det_rle.device)
+    ends = torch.full_like(starts, limit)
+    starts[gt_mask, gt_run], ends[gt_mask, gt_run] = gt_starts, gt_ends
+    covered = torch.zeros(num_gt, max_runs + 1, dtype=torch.long, device=det_rle.device)
+    covered[:, 1:] = torch.cumsum(torch.where(ends < limit, ends - starts, 0), 1)
+
+    def _coverage(positions: Tensor) -> Tensor:
+        # number of foreground pixels of every ground truth before each position, shape (N, len(positions))
+        positions = positions[None, :].expand(num_gt, -1).contiguous()
+        inside = torch.searchsorted(ends, positions, right=True)
+        start = starts.gather(1, inside.clamp(max=max(max_runs - 1, 0))) if max_runs > 0 else positions
+        return covered.gather(1, inside) + (positions - start).clamp(min=0) * (inside < max_runs)
+
+    intersection = torch.zeros(num_gt, num_det, dtype=torch.long, device=det_rle.device)
+    intersection.index_add_(1, det_mask, _coverage(det_ends) - _coverage(det_starts))
+    intersection = intersection.T.double()
+    det_area = _coco_rle_area(det_rle)[:, None]
+    gt_area = _coco_rle_area(gt_rle)[None, :]
+    union = torch.where(gt_crowds[None, :], det_area, det_area + gt_area - intersection)
+    return torch.where(intersection > 0, intersection / union, torch.zeros_like(union))
+
+
+def _coco_last_argmax(values: Tensor, mask: Tensor) -> Tuple[Tensor, Tensor]:
+    """Return the last index along the last dim holding the maximum of ``values`` within ``mask``.
+
+    ``pycocotools`` replaces the current match whenever a later candidate has an IoU greater than or equal to it, so
+    ties are resolved in favour of the last candidate.
+
+    """
+    masked = torch.where(mask, values, torch.full_like(values, -1.0))
+    hit = mask & (masked == masked.max(dim=-1, keepdim=True).values)
+    positions = torch.arange(values.shape[-1], device=values.device)
+    index = torch.where(hit, positions, torch.full_like(positions, -1)).max(dim=-1).values
+    return index.clamp(min=0), index >= 0
+
+
+def _coco_match(
+    ious: Tensor,
+    det_valid: Tensor,
+    det_outside: Tensor,
+    gt_valid: Tensor,
+    gt_crowds: Tensor,
+    gt_ignore: Tensor,
+    iou_thresholds: Tensor,
+) -> Tuple[Tensor, Tensor]:
+    """Greedily match score-sorted detections to ground truths for a batch of (image, class) pairs.
+
+    The pairs are expected to be sorted by decreasing number of detections, such that only a shrinking prefix of the
+    batch needs to be processed for detections of lower rank.
+
+    Args:
+        ious: float tensor of shape ``(G, D, N)`` with the IoU between detections sorted by score and ground truths
+        det_valid: bool tensor of shape ``(G, D)`` marking non-padded detections
+        det_outside: bool tensor of shape ``(G, A, D)`` marking detections with area outside each area range
+        gt_valid: bool tensor of shape ``(G, N)`` marking non-padded ground truths
+        gt_crowds: bool tensor of shape ``(G, N)`` marking crowd ground truths
+        gt_ignore: bool tensor of shape ``(G, A, N)`` marking ground truths ignored for each area range
+        iou_thresholds: float tensor of shape ``(T,)``
+
+    Returns:
+        Two bool tensors of shape ``(G, A, T, D)`` indicating whether each detection was matched and whether it should
+        be ignored
+
+    """
+    num_groups, num_det, num_gt = ious.shape
+    num_areas, num_thresholds = gt_ignore.shape[1], iou_thresholds.numel()
+    shape = (num_groups, num_areas, num_thresholds)
+    thresholds = iou_thresholds.clamp(max=1 - 1e-10).view(1, 1, -1, 1)
+    gt_available = gt_valid[:, None, None, :]
+    gt_crowds = gt_crowds[:, None, None, :]
+    gt_ignore = gt_ignore[:, :, None, :].expand(*shape, num_gt)
+    positions = torch.arange(num_gt, device=ious.device)
+    active = det_valid.sum(0).tolist()
+
+    gt_matched = torch.zeros(*shape, num_gt, dtype=torch.bool, device=ious.device)
+    det_matched = torch.zeros(*shape, num_det, dtype=torch.bool, device=ious.device)
+    det_ignored = torch.zeros(*shape, num_det, dtype=torch.bool, device=ious.device)
+    # without any ground truths nothing can be matched and only the area ranges decide which detections are ignored
+    for d in range(num_det if num_gt > 0 else 0):
+        g = active[d]
+        iou = ious[:g, d, None, None, :]
+        candidate = gt_available[:g] & (~gt_matched[:g] | gt_crowds[:g]) & (iou >= thresholds)
+        iou = iou.expand_as(candidate)
+        # regular ground truths always take precedence over ignored ones
+        index, found = _coco_last_argmax(iou, candidate & ~gt_ignore[:g])
+        index_ignored, found_ignored = _coco_last_argmax(iou, candidate & gt_ignore[:g])
+        index = torch.where(found, index, index_ignored)
+        found |= found_ignored
+
+        det_matched[:g, ..., d] = found
+        det_ignored[:g, ..., d] = found & gt_ignore[:g].gather(-1, index[..., None]).squeeze(-1)
+        gt_matched[:g] |= found[..., None] & (positions == index[..., None])
+
+    det_ignored |= ~det_matched & det_outside[:, :, None, :]
+    return det_matched, det_ignored
+
+
+def _coco_group_ranks(group: Tensor, num_groups: int) -> Tuple[Tensor, Tensor]:
+    """Return the position of each element within its (sorted, contiguous) group and the size of every group."""
+    counts = torch.bincount(group, minlength=num_groups)
+    starts = torch.cumsum(counts, 0) - counts
+    return torch.arange(group.numel(), device=group.device) - starts[group], counts
+
+
+def _coco_pair_ious(
+    iou_type: str,
+    det_geometry: List[Tensor],
+    gt_geometry: List[Tensor],
+    det_index: Tensor,
+    gt_index: Tensor,
+    gt_crowds: Tensor,
+    det_counts: Tensor,
+    gt_counts: Tensor,
+    det_image: Tensor,
+) -> Tensor:
+    """Compute the IoU for the (detection, ground truth) pairs given by indices into the flattened inputs."""
+    if iou_type == "bbox":
+        det_boxes = torch.cat([b.reshape(-1, 4) for b in det_geometry]) if det_geometry else gt_crowds.new_zeros(0, 4)
+        gt_boxes = torch.cat([b.reshape(-1, 4) for b in gt_geometry]) if gt_geometry else gt_crowds.new_zeros(0, 4)
+        return _coco_pairwise_box_iou(det_boxes[det_index], gt_boxes[gt_index], gt_crowds[gt_index])
+
+    # masks of different images can have different sizes, so the IoU matrix is computed image by image
+    det_offsets = torch.cumsum(det_counts, 0) - det_counts
+    gt_offsets = torch.cumsum(gt_counts, 0) - gt_counts
+    matrices, matrix_offsets, offset = [], [], 0
+    for i, (det_masks, gt_masks) in enumerate(zip(det_geometry, gt_geometry)):
+        matrix_offsets.append(offset)
+        if det_counts[i] == 0 or gt_counts[i] == 0:
+            continue
+        start, stop = int(gt_offsets[i]), int(gt_offsets[i] + gt_counts[i])
+        matrices.append(_coco_rle_iou(det_masks, gt_masks, gt_crowds[start:stop]).flatten())
+        offset += matrices[-1].numel()
+    if not matrices:
+        return gt_crowds.new_zeros(0, dtype=torch.float64)
+    flat = torch.cat(matrices)
+    matrix_offsets_ = torch.tensor(matrix_offsets, device=flat.device)
+    image = det_image[det_index]
+    det_local = det_index - det_offsets[image]
+    gt_local = gt_index - gt_offsets[image]
+    return flat[matrix_offsets_[image] + det_local * gt_counts[image] + gt_local]
+
+
+def _coco_evaluate_images(
+    det_geometry: List[Tensor],
+    det_scores: List[Tensor],
+    det_labels: List[Tensor],
+    det_areas: List[Tensor],
+    gt_geometry: List[Tensor],
+    gt_labels: List[Tensor],
+    gt_crowds: List[Tensor],
+    gt_areas: List[Tensor],
+    iou_type: str,
+    iou_thresholds: Sequence[float],
+    max_det: int,
+    class_ids: Optional[Sequence[int]] = None,
+    image_ids: Optional[Sequence[int]] = None,
+    return_ious: bool = False,
+) -> Tuple[Dict[str, Tensor], Optional[Dict[Tuple[int, int], Union[Tensor, list]]]]:
+    """Match detections to ground truths image by image and class by class, like ``COCOeval.evaluate``.
+
+    All per-image inputs are lists with one element per evaluated image. ``det_geometry`` and ``gt_geometry`` contain
+    boxes in ``xywh`` format when ``iou_type="bbox"`` and masks in the packed run-length encoding of
+    ``_coco_rle_encode`` when ``iou_type="segm"``. Images are independent of each other, so this can be called on
+    any subset of the images.
+
+    Returns:
+        A dict with the keys ``det_ranks`` with the rank of each detection by score within its (image, class) pair,
+        ``det_matched`` and ``det_ignored`` of shape ``(num_det, A, T)``, and ``gt_ignored`` of shape ``(num_gt, A)``.
+        All are given in the order of the flattened input. Only detections with a rank below ``max_det`` can be
+        matched. The second element is ``None`` unless ``return_ious=True``, in which case it contains the IoU
+        matrix of every (image, class) pair, where the class runs over ``class_ids``, with the same layout as
+        ``COCOeval.ious``.
+
+    """
+    device = gt_labels[0].device if gt_labels else torch.device("cpu")
+    num_images, num_areas = len(gt_labels), len(_COCO_AREA_RANGES)
+    image_ids = list(range(num_images)) if image_ids is None else list(image_ids)
+    iou_thr = torch.tensor(iou_thresholds, dtype=torch.float64, device=device)
+    area_ranges = torch.tensor(_COCO_AREA_RANGES, dtype=torch.float64, device=device)
+
+    def _flat(values: List[Tensor], dtype: torch.dtype) -> Tensor:
+        if not values:
+            return torch.zeros(0, dtype=dtype, device=device)
+        return torch.cat([v.reshape(-1).to(device=device, dtype=dtype) for v in values])
+
+    det_counts = torch.tensor([len(s) for s in det_scores], dtype=torch.long, device=device)
+    gt_counts = torch.tensor([len(lab) for lab in gt_labels], dtype=torch.long, device=device)
+    det_image = torch.repeat_interleave(torch.arange(num_images, device=device), det_counts)
+    gt_image = torch.repeat_interleave(torch.arange(num_images, device=device), gt_counts)
+    det_score, det_area = _flat(det_scores, torch.float64), _flat(det_areas, torch.float64)
+    gt_crowd, gt_area = _flat(gt_crowds, torch.bool), _flat(gt_areas, torch.float64)
+    det_label, gt_label = _flat(det_labels, torch.long), _flat(gt_labels, torch.long)
+    num_det_total = det_score.numel()
+
+    labels, label_index = torch.unique(torch.cat([det_label, gt_label]), return_inverse=True)
+    det_group = label_index[:num_det_total] * num_images + det_image
+    gt_group = label_index[num_det_total:] * num_images + gt_image
+
+    # sort detections by (class, image) and then by descending score, only the `max_det` best of each pair are matched
+    det_index = torch.sort(-det_score, stable=True).indices
+    det_index = det_index[torch.sort(det_group[det_index], stable=True).indices]
+    gt_index = torch.sort(gt_group, stable=True).indices
+    groups = torch.unique(torch.cat([det_group, gt_group]))
+    num_groups = groups.numel()
+    det_ranks = torch.empty_like(det_index)
+    det_ranks[det_index] = _coco_group_ranks(torch.searchsorted(groups, det_group[det_index]), num_groups)[0]
+    det_index = det_index[det_ranks[det_index] < max_det]
+    det_g = torch.searchsorted(groups, det_group[det_index])
+    gt_g = torch.searchsorted(groups, gt_group[gt_index])
+    det_rank, num_det = _coco_group_ranks(det_g, num_groups)
+    gt_pos, num_gt = _coco_group_ranks(gt_g, num_groups)
+
+    # IoU is only needed between detections and ground truths of the same (image, class) pair
+    pairs_per_det = num_gt[det_g]
+    pair_det = torch.repeat_interleave(torch.arange(det_index.numel(), device=device), pairs_per_det)
+    pair_gt = (torch.cumsum(num_gt, 0) - num_gt)[det_g[pair_det]] + _coco_group_ranks(pair_det, det_index.numel())[0]
+    pair_iou = _coco_pair_ious(
+        iou_type,
+        det_geometry,
+        gt_geometry,
+        det_index[pair_det],
+        gt_index[pair_gt],
+        gt_crowd,
+        det_counts,
+        gt_counts,
+        det_image,
+    )
+
+    det_area_k = det_area[det_index]
+    det_outside = (det_area_k[:, None] < area_ranges[:, 0]) | (det_area_k[:, None] > area_ranges[:, 1])
+    gt_ignored = gt_crowd[:, None] | (gt_area[:, None] < area_ranges[:, 0]) | (gt_area[:, None] > area_ranges[:, 1])
+    gt_ignore = gt_ignored[gt_index]
+
+    # match chunks of (image, class) pairs with similar number of detections to limit padding and memory
+    det_matched = torch.zeros(det_index.numel(), num_areas, iou_thr.numel(), dtype=torch.bool, device=device)
+    det_ignored = torch.zeros_like(det_matched)
+    group_order = torch.sort(num_det, descending=True, stable=True).indices
+    group_chunk = torch.empty_like(group_order)
+    bounds, start, max_gt = [], 0, max(int(num_gt.max()), 1) if num_groups else 1
+    while start < num_groups:
+        size = int(num_det[group_order[start]])
+        step = max(1, _COCO_MATCHING_BUDGET // (num_areas * iou_thr.numel() * max(size, max_gt, 1)))
+        bounds.append((start, min(start + step, num_groups)))
+        group_chunk[group_order[start : start + step]] = len(bounds) - 1
+        start += step
+    pair_order = torch.sort(group_chunk[det_g[pair_det]], stable=True).indices
+    pair_chunk_counts = torch.bincount(group_chunk[det_g[pair_det]], minlength=len(bounds)).tolist()
+    pair_start = 0
+    for chunk, (lo, hi) in enumerate(bounds):
+        chunk_groups = group_order[lo:hi]
+        local = torch.full((num_groups,), -1, dtype=torch.long, device=device)
+        local[chunk_groups] = torch.arange(chunk_groups.numel(), device=device)
+        pairs = pair_order[pair_start : pair_start + pair_chunk_counts[chunk]]
+        pair_start += pair_chunk_counts[chunk]
+        pad_det, pad_gt = int(num_det[chunk_groups].max()), int(num_gt[chunk_groups].max())
+        if pad_det == 0:
+            continue
+        shape = (chunk_groups.numel(), pad_det, pad_gt)
+        ious = torch.full(shape, -1.0, dtype=torch.float64, device=device)
+        ious[local[det_g[pair_det[pairs]]], det_rank[pair_det[pairs]], gt_pos[pair_gt[pairs]]] = pair_iou[pairs]
+
+        dets = torch.nonzero(local[det_g] >= 0).squeeze(1)
+        gts = torch.nonzero(local[gt_g] >= 0).squeeze(1)
+        det_slot, gt_slot = (local[det_g[dets]], det_rank[dets]), (local[gt_g[gts]], gt_pos[gts])
+        det_valid = torch.zeros(shape[:2], dtype=torch.bool, device=device)
+        det_valid[det_slot] = True
+        det_out = torch.zeros(shape[0], pad_det, num_areas, dtype=torch.bool, device=device)
+        det_out[det_slot] = det_outside[dets]
+        gt_valid = torch.zeros(shape[0], pad_gt, dtype=torch.bool, device=device)
+        gt_valid[gt_slot] = True
+        gt_crowd_pad = torch.zeros_like(gt_valid)
+        gt_crowd_pad[gt_slot] = gt_crowd[gt_index[gts]]
+        gt_ignore_pad = torch.zeros(shape[0], pad_gt, num_areas, dtype=torch.bool, device=device)
+        gt_ignore_pad[gt_slot] = gt_ignore[gts]
+
+        matched, ignored = _coco_match(
+            ious, det_valid, det_out.transpose(1, 2), gt_valid, gt_crowd_pad, gt_ignore_pad.transpose(1, 2), iou_thr
+        )
+        det_matched[dets] = matched.permute(0, 3, 1, 2)[det_slot]
+        det_ignored[dets] = ignored.permute(0, 3, 1, 2)[det_slot]
+
+    output = {
+        "det_ranks": det_ranks,
+        "det_matched": torch.zeros(num_det_total, *det_matched.shape[1:], dtype=torch.bool, device=device).index_put(
+            (det_index,), det_matched
+        ),
+        "det_ignored": torch.zeros(num_det_total, *det_ignored.shape[1:], dtype=torch.bool, device=device).index_put(
+            (det_index,), det_ignored
+        ),
+        "gt_ignored": gt_ignored,
+    }
+    if not return_ious:
+        return output, None
+
+    class_ids = labels.tolist() if class_ids is None else list(class_ids)
+    ious_dict: Dict[Tuple[int, int], Union[Tensor, list]] = {
+        (image_id, class_id): [] for image_id in image_ids for class_id in class_ids
+    }
+    det_pair_group = det_g[pair_det]
+    for g, group in enumerate(groups.tolist()):
+        key = (image_ids[group % num_images], int(labels[group // num_images]))
+        if int(num_det[g]) == 0 or int(num_gt[g]) == 0 or key not in ious_dict:
+            continue
+        matrix = torch.zeros(int(num_det[g]), int(num_gt[g]), dtype=torch.float32, device=device)
+        pairs = torch.nonzero(det_pair_group == g).squeeze(1)
+        matrix[det_rank[pair_det[pairs]], gt_pos[pair_gt[pairs]]] = pair_iou[pairs].float()
+        ious_dict[key] = matrix
+    return output, ious_dict
+
+
+def _coco_accumulate(
+    det_scores: Tensor,
+    det_labels: Tensor,
+    det_ranks: Tensor,
+    det_matched: Tensor,
+    det_ignored: Tensor,
+    gt_labels: Tensor,
+    gt_ignored: Tensor,
+    class_ids: Sequence[int],
+    rec_thresholds: Sequence[float],
+    max_detection_thresholds: Sequence[int],
+) -> Dict[str, Tensor]:
+    """Accumulate matched detections into precision/recall curves per class, like ``COCOeval.accumulate``.
+
+    Detections of the same class are expected in the order of their images and, within an image, in the order of
+    their rank, which is how ``pycocotools`` resolves ties between detections with identical scores. Annotations with
+    a label that is not part of ``class_ids`` are not evaluated.
+
+    Returns:
+        A dict with the keys ``precision`` ``(T, R, K, A, M)``, ``recall`` ``(T, K, A, M)`` and ``scores``
+        ``(T, R, K, A, M)``, with the same layout as ``COCOeval.eval``
+
+    """
+    device = det_scores.device
+    num_classes, num_max_det = len(class_ids), len(max_detection_thresholds)
+    num_areas, num_thr = det_matched.shape[1:]
+    rec_thr = torch.tensor(rec_thresholds, dtype=torch.float64, device=device)
+    classes = torch.tensor(class_ids, dtype=torch.long, device=device)
+    det_scores, det_labels, gt_labels = det_scores.double(), det_labels.long(), gt_labels.long()
+
+    det_keep = torch.isin(det_labels, classes) & (det_ranks < max_detection_thresholds[-1])
+    det_index = torch.nonzero(det_keep).squeeze(1)
+    det_class = torch.searchsorted(classes, det_labels[det_index])
+    order = torch.sort(det_class, stable=True).indices
+    det_index, det_class = det_index[order], det_class[order]
+    gt_keep = torch.isin(gt_labels, classes)
+    num_regular_gt = torch.zeros(num_classes, num_areas, dtype=torch.long, device=device)
+    num_regular_gt.index_add_(0, torch.searchsorted(classes, gt_labels[gt_keep]), (~gt_ignored[gt_keep]).long())
+
+    precision = -torch.ones(num_thr, rec_thr.numel(), num_classes, num_areas, num_max_det, dtype=torch.float64)
+    precision = precision.to(device)
+    recall = -torch.ones(num_thr, num_classes, num_areas, num_max_det, dtype=torch.float64, device=device)
+    scores = -torch.ones_like(precision)
+    class_counts = torch.bincount(det_class, minlength=num_classes).tolist()
+    eps = torch.finfo(torch.float64).eps
+    zero = torch.zeros((), dtype=torch.float64, device=device)
+    offset = 0
+    for k in range(num_classes):
+        areas = torch.nonzero(num_regular_gt[k] > 0).squeeze(1)
+        class_index = det_index[offset : offset + class_counts[k]]
+        offset += class_counts[k]
+        if areas.numel() == 0:
+            continue
+        for m, max_det_m in enumerate(max_detection_thresholds):
+            select = class_index[det_ranks[class_index] < max_det_m]
+            num_selected = select.numel()
+            if num_selected == 0:
+                precision[:, :, k, areas, m] = 0
+                recall[:, k, areas, m] = 0
+                scores[:, :, k, areas, m] = 0
+                continue
+            order = torch.sort(-det_scores[select], stable=True).indices
+            select = select[order]
+            matched = det_matched[select][:, areas].permute(1, 2, 0)
+            ignored = det_ignored[select][:, areas].permute(1, 2, 0)
+            tp = torch.cumsum(matched & ~ignored, dim=-1).double()
+            fp = torch.cumsum(~matched & ~ignored, dim=-1).double()
+            rc = tp / num_regular_gt[k, areas].view(-1, 1, 1)
+            pr = tp / (fp + tp + eps)
+            # make the precision monotonically decreasing before interpolating at the recall thresholds
+            pr = torch.flip(torch.cummax(torch.flip(pr, dims=(-1,)), dim=-1).values, dims=(-1,))
+            inds = torch.searchsorted(rc.contiguous(), rec_thr.expand(*rc.shape[:2], -1).contiguous())
+            valid = inds < num_selected
+            inds = inds.clamp(max=num_selected - 1)
+            q = torch.where(valid, pr.gather(-1, inds), zero)
+            ss = torch.where(valid, det_scores[select][inds], zero)
+            recall[:, k, areas, m] = rc[..., -1].T
+            precision[:, :, k, areas, m] = q.permute(1, 2, 0)
+            scores[:, :, k, areas, m] = ss.permute(1, 2, 0)
+    return {"precision": precision, "recall": recall, "scores": scores}
+
+
+def _coco_evaluate(
+    det_geometry: List[Tensor],
+    det_scores: List[Tensor],
+    det_labels: List[Tensor],
+    det_areas: List[Tensor],
+    gt_geometry: List[Tensor],
+    gt_labels: List[Tensor],
+    gt_crowds: List[Tensor],
+    gt_areas: List[Tensor],
+    class_ids: Sequence[int],
+    iou_type: str,
+    iou_thresholds: Sequence[float],
+    rec_thresholds: Sequence[float],
+    max_detection_thresholds: Sequence[int],
+    image_ids: Optional[Sequence[int]] = None,
+    return_ious: bool = False,
+) -> Dict[str, Union[Tensor, Dict]]:
+    """Evaluate detections against ground truths with the COCO protocol.
+
+    See :func:`_coco_evaluate_images` for the format of the inputs.
+
+    Returns:
+        A dict with the keys ``precision`` ``(T, R, K, A, M)``, ``recall`` ``(T, K, A, M)``, ``scores``
+        ``(T, R, K, A, M)`` and, if ``return_ious=True``, ``ious`` with the IoU matrix of every (image, class) pair.
+        The layout is identical to ``COCOeval.eval`` and ``COCOeval.ious``.
+
+    """
+    matches, ious = _coco_evaluate_images(
+        det_geometry,
+        det_scores,
+        det_labels,
+        det_areas,
+        gt_geometry,
+        gt_labels,
+        gt_crowds,
+        gt_areas,
+        iou_type=iou_type,
+        iou_thresholds=iou_thresholds,
+        max_det=max_detection_thresholds[-1],
+        class_ids=class_ids,
+        image_ids=image_ids,
+        return_ious=return_ious,
+    )
+    device = matches["det_ranks"].device
+
+    def _flat(values: List[Tensor]) -> Tensor:
+        return torch.cat([v.reshape(-1).to(device) for v in values]) if values else torch.zeros(0, device=device)
+
+    output: Dict[str, Union[Tensor, Dict]] = dict(
+        _coco_accumulate(
+            _flat(det_scores),
+            _flat(det_labels),
+            matches["det_ranks"],
+            matches["det_matched"],
+            matches["det_ignored"],
+            _flat(gt_labels),
+            matches["gt_ignored"],
+            class_ids=class_ids,
+            rec_thresholds=rec_thresholds,
+            max_detection_thresholds=max_detection_thresholds,
+        )
+    )
+    if ious is not None:
+        output["ious"] = ious
+    return output
+
+
+def _coco_summarize(
+    precision: Tensor,
+    recall: Tensor,
+    iou_thresholds: Sequence[float],
+    max_detection_thresholds: Sequence[int],
+) -> List[float]:
+    """Summarize precision and recall into the 12 standard COCO statistics, like ``COCOeval.summarize``.
+
+    Contrary to ``pycocotools`` the overall mAP is reported for ``max_detection_thresholds[-1]`` instead of a
+    hardcoded value of 100, matching the behaviour of ``faster_coco_eval``.
+
+    """
+    iou_thr = torch.tensor(iou_thresholds, dtype=torch.float64)
+    last = len(max_detection_thresholds) - 1
+
+    def _mean(values: Tensor) -> float:
+        values = values[values > -1]
+        return values.mean().item() if values.numel() > 0 else -1.0
+
+    def _at_iou(values: Tensor, threshold: float) -> Tensor:
+        return values[torch.nonzero(iou_thr == threshold).squeeze(1).to(values.device)]
+
+    return [
+        _mean(precision[..., 0, last]),
+        _mean(_at_iou(precision, 0.5)[..., 0, last]),
+        _mean(_at_iou(precision, 0.75)[..., 0, last]),
+        _mean(precision[..., 1, last]),
+        _mean(precision[..., 2, last]),
+        _mean(precision[..., 3, last]),
+        _mean(recall[..., 0, 0]),
+        _mean(recall[..., 0, 1]),
+        _mean(recall[..., 0, last]),
+        _mean(recall[..., 1, last]),
+        _mean(recall[..., 2, last]),
+        _mean(recall[..., 3, last]),
+    ]
@@ -11,55 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple, cast
+from typing import Collection, Dict, List, Optional, Set, Tuple
 
 import torch
 from torch import Tensor
 
 from torchmetrics.utilities import rank_zero_warn
-
-_Color = Tuple[int, int]  # A (category_id, instance_id) tuple that uniquely identifies a panoptic segment.
-
-
-def _nested_tuple(nested_list: List) -> Tuple:
-    """Construct a nested tuple from a nested list.
-
-    Args:
-        nested_list: The nested list to convert to a nested tuple.
-
-    Returns:
-        A nested tuple with the same content.
-
-    """
-    return tuple(map(_nested_tuple, nested_list)) if isinstance(nested_list, list) else nested_list
-
-
-def _to_tuple(t: Tensor) -> Tuple:
-    """Convert a tensor into a nested tuple.
-
-    Args:
-        t: The tensor to convert.
-
-    Returns:
-        A nested tuple with the same content.
-
-    """
-    return _nested_tuple(t.tolist())
-
-
-def _get_color_areas(inputs: Tensor) -> Dict[Tuple, Tensor]:
-    """Measure the size of each instance.
-
-    Args:
-        inputs: the input tensor containing the colored pixels.
-
-    Returns:
-        A dictionary specifying the `(category_id, instance_id)` and the corresponding number of occurrences.
-
-    """
-    unique_keys, unique_keys_area = torch.unique(inputs, dim=0, return_counts=True)
-    # dictionary indexed by color tuples
-    return dict(zip(_to_tuple(unique_keys), unique_keys_area))
+from torchmetrics.utilities.data import _bincount
 
 
 def _parse_categories(things: Collection[int], stuffs: Collection[int]) -> Tuple[Set[int], Set[int]]:
@@ -211,200 +169,27 @@ def _prepocess_inputs(
     return out
 
 
-def _calculate_iou(
-    pred_color: _Color,
-    target_color: _Color,
-    pred_areas: Dict[_Color, Tensor],
-    target_areas: Dict[_Color, Tensor],
-    intersection_areas: Dict[Tuple[_Color, _Color], Tensor],
-    void_color: _Color,
-) -> Tensor:
-    """Helper function that calculates the IoU from precomputed areas of segments and their intersections.
-
-    Args:
-        pred_color: The `(category_id, instance_id)`, or "color", of a predicted segment that is being matched with a
-            target segment.
-        target_color: The `(category_id, instance_id)`, or "color", of a ground truth segment that is being matched
-            with a predicted segment.
-        pred_areas: Mapping from colors of the predicted segments to their extents.
-        target_areas: Mapping from colors of the ground truth segments to their extents.
-        intersection_areas: Mapping from tuples of `(pred_color, target_color)` to their extent.
-        void_color: An additional color that is masked out during metrics calculation.
-
-    Returns:
-        The calculated IoU as a torch.Tensor containing a single scalar value.
-
-    """
-    if pred_color[0] != target_color[0]:
-        raise ValueError(
-            "Attempting to compute IoU on segments with different category ID: "
-            f"pred {pred_color[0]}, target {target_color[0]}"
-        )
-    if pred_color == void_color:
-        raise ValueError("Attempting to compute IoU on a void segment.")
-    intersection = intersection_areas[(pred_color, target_color)]
-    pred_area = pred_areas[pred_color]
-    target_area = target_areas[target_color]
-    pred_void_area = intersection_areas.get((pred_color, void_color), 0)
-    void_target_area = intersection_areas.get((void_color, target_color), 0)
-    union = pred_area - pred_void_area + target_area - void_target_area - intersection
-    return intersection / union
-
-
-def _filter_false_negatives(
-    target_areas: Dict[_Color, Tensor],
-    target_segment_matched: Set[_Color],
-    intersection_areas: Dict[Tuple[_Color, _Color], Tensor],
-    void_color: Tuple[int, int],
-) -> Iterator[int]:
-    """Filter false negative segments and yield their category IDs.
-
-    False negatives occur when a ground truth segment is not matched with a prediction.
-    Areas that are mostly void in the prediction are ignored.
-
-    Args:
-        target_areas: Mapping from colors of the ground truth segments to their extents.
-        target_segment_matched: Set of ground truth segments that have been matched to a prediction.
-        intersection_areas: Mapping from tuples of `(pred_color, target_color)` to their extent.
-        void_color: An additional color that is masked out during metrics calculation.
-
-    Yields:
-        Category IDs of segments that account for false negatives.
-
-    """
-    false_negative_colors = set(target_areas) - target_segment_matched
-    false_negative_colors.discard(void_color)
-    for target_color in false_negative_colors:
-        void_target_area = intersection_areas.get((void_color, target_color), 0)
-        if void_target_area / target_areas[target_color] <= 0.5:
-            yield target_color[0]
-
-
-def _filter_false_positives(
-    pred_areas: Dict[_Color, Tensor],
-    pred_segment_matched: Set[_Color],
-    intersection_areas: Dict[Tuple[_Color, _Color], Tensor],
-    void_color: Tuple[int, int],
-) -> Iterator[int]:
-    """Filter false positive segments and yield their category IDs.
-
-    False positives occur when a predicted segment is not matched with a corresponding target one.
-    Areas that are mostly void in the target are ignored.
-
-    Args:
-        pred_areas: Mapping from colors of the predicted segments to their extents.
-        pred_segment_matched: Set of predicted segments that have been matched to a ground truth.
-        intersection_areas: Mapping from tuples of `(pred_color, target_color)` to their extent.
-        void_color: An additional color that is masked out during metrics calculation.
-
-    Yields:
-        Category IDs of segments that account for false positives.
-
-    """
-    false_positive_colors = set(pred_areas) - pred_segment_matched
-    false_positive_colors.discard(void_color)
-    for pred_color in false_positive_colors:
-        pred_void_area = intersection_areas.get((pred_color, void_color), 0)
-        if pred_void_area / pred_areas[pred_color] <= 0.5:
-            yield pred_color[0]
-
-
-def _panoptic_quality_update_sample(
+def _panoptic_quality_update(
     flatten_preds: Tensor,
     flatten_target: Tensor,
     cat_id_to_continuous_id: Dict[int, int],
     void_color: Tuple[int, int],
-    stuffs_modified_metric: Optional[Set[int]] = None,
+    modified_metric_stuffs: Optional[Set[int]] = None,
 ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
-    """Calculate stat scores required to compute the metric **for a single sample**.
+    """Calculate stat scores required to compute the metric for a full batch.
 
     Computed scores: iou sum, true positives, false positives, false negatives.
 
+    All samples are processed at once: the `(sample, category_id, instance_id)` color of every point is encoded as an
+    int64 key, such that segment areas and pairwise intersection areas each come from a single ``torch.unique`` call
+    and matching, false positives and false negatives are resolved with vectorized masks.
+
     NOTE: For the modified PQ case, this implementation uses the `true_positives` output tensor to aggregate the actual
         TPs for things classes, but the number of target segments for stuff classes.
         The `iou_sum` output tensor, instead, aggregates the IoU values at different thresholds (i.e., 0.5 for things
         and 0 for stuffs).
         This allows seamlessly using the same `.compute()` method for both PQ variants.
 
-    Args:
-        flatten_preds: A flattened prediction tensor referring to a single sample, shape (num_points, 2).
-        flatten_target: A flattened target tensor referring to a single sample, shape (num_points, 2).
-        cat_id_to_continuous_id: Mapping from original category IDs to continuous IDs
-        void_color: an additional, unused color.
-        stuffs_modified_metric: Set of stuff category IDs for which the PQ metric is computed using the "modified"
-            formula. If not specified, the original formula is used for all categories.
-
-    Returns:
-        - IOU Sum
-        - True positives
-        - False positives
-        - False negatives.
-
-    """
-    stuffs_modified_metric = stuffs_modified_metric or set()
-    device = flatten_preds.device
-    num_categories = len(cat_id_to_continuous_id)
-    iou_sum = torch.zeros(num_categories, dtype=torch.double, device=device)
-    true_positives = torch.zeros(num_categories, dtype=torch.int, device=device)
-    false_positives = torch.zeros(num_categories, dtype=torch.int, device=device)
-    false_negatives = torch.zeros(num_categories, dtype=torch.int, device=device)
-
-    # calculate the area of each prediction, ground truth and pairwise intersection.
-    # NOTE: mypy needs `cast()` because the annotation for `_get_color_areas` is too generic.
-    pred_areas = cast(Dict[_Color, Tensor], _get_color_areas(flatten_preds))
-    target_areas = cast(Dict[_Color, Tensor], _get_color_areas(flatten_target))
-    # intersection matrix of shape [num_pixels, 2, 2]
-    intersection_matrix = torch.transpose(torch.stack((flatten_preds, flatten_target), -1), -1, -2)
-    intersection_areas = cast(Dict[Tuple[_Color, _Color], Tensor], _get_color_areas(intersection_matrix))
-
-    # select intersection of things of same category with iou > 0.5
-    pred_segment_matched = set()
-    target_segment_matched = set()
-    for pred_color, target_color in intersection_areas:
-        # test only non void, matching category
-        if target_color == void_color:
-            continue
-        if pred_color[0] != target_color[0]:
-            continue
-        iou = _calculate_iou(pred_color, target_color, pred_areas, target_areas, intersection_areas, void_color)
-        continuous_id = cat_id_to_continuous_id[target_color[0]]
-        if target_color[0] not in stuffs_modified_metric and iou > 0.5:
-            pred_segment_matched.add(pred_color)
-            target_segment_matched.add(target_color)
-            iou_sum[continuous_id] += iou
-            true_positives[continuous_id] += 1
-        elif target_color[0] in stuffs_modified_metric and iou > 0:
-            iou_sum[continuous_id] += iou
-
-    for cat_id in _filter_false_negatives(target_areas, target_segment_matched, intersection_areas, void_color):
-        if cat_id not in stuffs_modified_metric:
-            continuous_id = cat_id_to_continuous_id[cat_id]
-            false_negatives[continuous_id] += 1
-
-    for cat_id in _filter_false_positives(pred_areas, pred_segment_matched, intersection_areas, void_color):
-        if cat_id not in stuffs_modified_metric:
-            continuous_id = cat_id_to_continuous_id[cat_id]
-            false_positives[continuous_id] += 1
-
-    for cat_id, _ in target_areas:
-        if cat_id in stuffs_modified_metric:
-            continuous_id = cat_id_to_continuous_id[cat_id]
-            true_positives[continuous_id] += 1
-
-    return iou_sum, true_positives, false_positives, false_negatives
-
-
-def _panoptic_quality_update(
-    flatten_preds: Tensor,
-    flatten_target: Tensor,
-    cat_id_to_continuous_id: Dict[int, int],
-    void_color: Tuple[int, int],
-    modified_metric_stuffs: Optional[Set[int]] = None,
-) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
-    """Calculate stat scores required to compute the metric for a full batch.
-
-    Computed scores: iou sum, true positives, false positives, false negatives.
-
     Args:
         flatten_preds: A flattened prediction tensor, shape (B, num_points, 2).
         flatten_target: A flattened target tensor, shape (B, num_points, 2).
@@ -426,24 +211,85 @@ def _panoptic_quality_update(
     true_positives = torch.zeros(num_categories, dtype=torch.int, device=device)
     false_positives = torch.zeros(num_categories, dtype=torch.int, device=device)
     false_negatives = torch.zeros(num_categories, dtype=torch.int, device=device)
-
-    # Loop over each sample independently: segments must not be matched across frames.
-    for flatten_preds_single, flatten_target_single in zip(flatten_preds, flatten_target):
-        result = _panoptic_quality_update_sample(
-            flatten_preds_single,
-            flatten_target_single,
-            cat_id_to_continuous_id,
-            void_color,
-            stuffs_modified_metric=modified_metric_stuffs,
-        )
-        iou_sum += result[0]
-        true_positives += result[1]
-        false_positives += result[2]
-        false_negatives += result[3]
+    if flatten_preds.numel() == 0:
+        return iou_sum, true_positives, false_positives, false_negatives
+
+    # map category IDs to continuous IDs, the void category (the largest ID) is mapped to `num_categories`
+    cat_ids = sorted(cat_id_to_continuous_id)
+    continuous_ids = torch.tensor([*(cat_id_to_continuous_id[c] for c in cat_ids), num_categories], device=device)
+    boundaries = torch.tensor([*cat_ids, void_color[0]], dtype=flatten_preds.dtype, device=device)
+    modified = torch.zeros(num_categories + 1, dtype=torch.bool, device=device)
+    modified[[cat_id_to_continuous_id[c] for c in modified_metric_stuffs or set()]] = True
+
+    # encode the (sample, category, instance) color of every point as a single int64 key.
+    # Segments must not be matched across frames, hence the sample index is part of the key.
+    colors = torch.stack((flatten_preds, flatten_target))  # 2 x B x num_points x 2
+    categories = continuous_ids[torch.searchsorted(boundaries, colors[..., 0].contiguous())]
+    _, instances = torch.unique(colors[..., 1], return_inverse=True)
+    num_instances = int(instances.max()) + 1
+    samples = torch.arange(colors.shape[1], device=device).view(1, -1, 1)
+    keys = (samples * (num_categories + 1) + categories) * num_instances + instances
+
+    # area of each segment and of each pairwise intersection of segments
+    pred_keys, pred_idx, pred_areas = torch.unique(keys[0], return_inverse=True, return_counts=True)
+    target_keys, target_idx, target_areas = torch.unique(keys[1], return_inverse=True, return_counts=True)
+    num_targets = len(target_keys)
+    pair_keys, intersection_areas = torch.unique(pred_idx * num_targets + target_idx, return_counts=True)
+    pair_pred, pair_target = pair_keys // num_targets, pair_keys % num_targets
+    pred_cat = (pred_keys // num_instances) % (num_categories + 1)
+    target_cat = (target_keys // num_instances) % (num_categories + 1)
+    pred_void, target_void = pred_cat == num_categories, target_cat == num_categories
+
+    # area of each segment that overlaps with void in the other input
+    with_void = target_void[pair_target]
+    pred_void_area = torch.zeros_like(pred_areas).index_add_(0, pair_pred[with_void], intersection_areas[with_void])
+    with_void = pred_void[pair_pred]
+    void_target_area = torch.zeros_like(target_areas).index_add_(
+        0, pair_target[with_void], intersection_areas[with_void]
+    )
+
+    # IoU of all intersecting, non void segments with matching category
+    candidates = ~target_void[pair_target] & (pred_cat[pair_pred] == target_cat[pair_target])
+    pair_pred, pair_target = pair_pred[candidates], pair_target[candidates]
+    intersection = intersection_areas[candidates]
+    union = (
+        pred_areas[pair_pred]
+        - pred_void_area[pair_pred]
+        + target_areas[pair_target]
+        - void_target_area[pair_target]
+        - intersection
+    )
+    iou = intersection / union
+    pair_cat = target_cat[pair_target]
+    # segments are matched if iou > 0.5, for the modified metric stuffs all intersecting segments are summed up
+    matched = ~modified[pair_cat] & (iou > 0.5)
+    summed = matched | (modified[pair_cat] & (iou > 0))
+    iou_sum += torch.zeros(num_categories + 1, dtype=torch.double, device=device).index_add_(
+        0, pair_cat[summed], iou[summed].double()
+    )[:num_categories]
+    true_positives += _bincount_categories(pair_cat[matched], num_categories)
+
+    pred_matched = torch.zeros_like(pred_void)
+    pred_matched[pair_pred[matched]] = True
+    target_matched = torch.zeros_like(target_void)
+    target_matched[pair_target[matched]] = True
+
+    # unmatched segments are false negatives / positives, unless they are mostly void in the other input
+    false_negative = ~target_void & ~target_matched & ~modified[target_cat] & (void_target_area / target_areas <= 0.5)
+    false_negatives += _bincount_categories(target_cat[false_negative], num_categories)
+    false_positive = ~pred_void & ~pred_matched & ~modified[pred_cat] & (pred_void_area / pred_areas <= 0.5)
+    false_positives += _bincount_categories(pred_cat[false_positive], num_categories)
+    # for the modified metric stuffs, the number of target segments is aggregated as true positives
+    true_positives += _bincount_categories(target_cat[modified[target_cat]], num_categories)
 
     return iou_sum, true_positives, false_positives, false_negatives
 
 
+def _bincount_categories(categories: Tensor, num_categories: int) -> Tensor:
+    """Count the occurrences of each continuous category ID, dropping the void category."""
+    return _bincount(categories, minlength=num_categories + 1)[:num_categories].int()
+
+
 def _panoptic_quality_compute(
     iou_sum: Tensor,
     true_positives: Tensor,
@@ -38,6 +38,66 @@ def _iou_update(
     return iou
 
 
+def _batched_box_iou(
+    preds: torch.Tensor, target: torch.Tensor, iou_type: str = "iou", eps: float = 1e-7
+) -> torch.Tensor:
+    """Compute the pairwise IoU variant between two padded batches of boxes in a single vectorized pass.
+
+    Mirrors the ``box_iou``, ``generalized_box_iou``, ``distance_box_iou`` and ``complete_box_iou`` functions of
+    torchvision, but broadcasts over a leading batch dimension such that all images of a batch are handled at once.
+
+    Args:
+        preds: boxes in ``(x1, y1, x2, y2)`` format of shape ``(B, N, 4)``
+        target: boxes in ``(x1, y1, x2, y2)`` format of shape ``(B, M, 4)``
+        iou_type: one of ``"iou"``, ``"giou"``, ``"diou"`` or ``"ciou"``
+        eps: small number to prevent division by zero for ``"diou"`` and ``"ciou"``
+
+    Returns:
+        Tensor of shape ``(B, N, M)`` with the pairwise values
+
+    """
+    if iou_type not in ("iou", "giou", "diou", "ciou"):
+        raise ValueError(
+            f"Expected argument `iou_type` to be one of ('iou', 'giou', 'diou', 'ciou') but got {iou_type}"
+        )
+    if preds.dtype not in (torch.float32, torch.float64):
+        preds = preds.float()
+    if target.dtype not in (torch.float32, torch.float64):
+        target = target.float()
+
+    boxes1, boxes2 = preds[:, :, None], target[:, None]
+    area1 = (preds[..., 2] - preds[..., 0]) * (preds[..., 3] - preds[..., 1])
+    area2 = (target[..., 2] - target[..., 0]) * (target[..., 3] - target[..., 1])
+    wh = (torch.min(boxes1[..., 2:], boxes2[..., 2:]) - torch.max(boxes1[..., :2], boxes2[..., :2])).clamp(min=0)
+    inter = wh[..., 0] * wh[..., 1]
+    union = area1[:, :, None] + area2[:, None] - inter
+    iou = inter / union
+    if iou_type == "iou":
+        return iou
+
+    whi = (torch.max(boxes1[..., 2:], boxes2[..., 2:]) - torch.min(boxes1[..., :2], boxes2[..., :2])).clamp(min=0)
+    if iou_type == "giou":
+        areai = whi[..., 0] * whi[..., 1]
+        return iou - (areai - union) / areai
+
+    diagonal_distance_squared = (whi[..., 0] ** 2) + (whi[..., 1] ** 2) + eps
+    centers1 = (preds[..., :2] + preds[..., 2:]) / 2
+    centers2 = (target[..., :2] + target[..., 2:]) / 2
+    centers_distance_squared = ((centers1[:, :, None, 0] - centers2[:, None, :, 0]) ** 2) + (
+        (centers1[:, :, None, 1] - centers2[:, None, :, 1]) ** 2
+    )
+    diou = iou - (centers_distance_squared / diagonal_distance_squared)
+    if iou_type == "diou":
+        return diou
+
+    w_pred, h_pred = preds[..., 2] - preds[..., 0], preds[..., 3] - preds[..., 1]
+    w_gt, h_gt = target[..., 2] - target[..., 0], target[..., 3] - target[..., 1]
+    v = (4 / (torch.pi**2)) * torch.pow(torch.atan(w_pred / h_pred)[:, :, None] - torch.atan(w_gt / h_gt)[:, None], 2)
+    with torch.no_grad():
+        alpha = v / (1 - iou + v + eps)
+    return diou - alpha * v
+
+
 def _iou_compute(iou: torch.Tensor, aggregate: bool = True) -> torch.Tensor:
     if not aggregate:
         return iou
@@ -73,28 +73,48 @@ def _spectral_distortion_index_compute(
         tensor(0.0234)
 
     """
-    length = preds.shape[1]
+    target_sums, target_numel = _spectral_distortion_index_band_sums(target)
+    preds_sums, preds_numel = _spectral_distortion_index_band_sums(preds)
+    return _spectral_distortion_index_from_band_sums(preds_sums, preds_numel, target_sums, target_numel, p, reduction)
 
-    m1 = torch.zeros((length, length), device=preds.device)
-    m2 = torch.zeros((length, length), device=preds.device)
 
+def _spectral_distortion_index_band_sums(img: Tensor) -> Tuple[Tensor, Tensor]:
+    """Sum the universal image quality index maps between all pairs of bands of a batch of images.
+
+    Args:
+        img: batch of multispectral images
+
+    Return:
+        Upper triangular matrix with the sum for every pair of bands, and the number of summed elements of each pair
+
+    """
+    length = img.shape[1]
+    sums = torch.zeros((length, length), device=img.device)
+    numel = 0
     for k in range(length):
         num = length - (k + 1)
         if num == 0:
             continue
-        stack1 = target[:, k : k + 1, :, :].repeat(num, 1, 1, 1)
-        stack2 = torch.cat([target[:, r : r + 1, :, :] for r in range(k + 1, length)], dim=0)
-        score = [
-            s.mean() for s in universal_image_quality_index(stack1, stack2, reduction="none").split(preds.shape[0])
-        ]
-        m1[k, k + 1 :] = torch.stack(score, 0)
-
-        stack1 = preds[:, k : k + 1, :, :].repeat(num, 1, 1, 1)
-        stack2 = torch.cat([preds[:, r : r + 1, :, :] for r in range(k + 1, length)], dim=0)
-        score = [
-            s.mean() for s in universal_image_quality_index(stack1, stack2, reduction="none").split(preds.shape[0])
-        ]
-        m2[k, k + 1 :] = torch.stack(score, 0)
+        stack1 = img[:, k : k + 1, :, :].repeat(num, 1, 1, 1)
+        stack2 = torch.cat([img[:, r : r + 1, :, :] for r in range(k + 1, length)], dim=0)
+        score = universal_image_quality_index(stack1, stack2, reduction="none")
+        sums[k, k + 1 :] = score.reshape(num, -1).sum(dim=1)
+        numel = score.numel() // num
+    return sums, torch.tensor(numel, device=img.device)
+
+
+def _spectral_distortion_index_from_band_sums(
+    preds_sums: Tensor,
+    preds_numel: Tensor,
+    target_sums: Tensor,
+    target_numel: Tensor,
+    p: int = 1,
+    reduction: Literal["elementwise_mean", "sum", "none"] = "elementwise_mean",
+) -> Tensor:
+    """Compute Spectral Distortion Index from the band pair sums of ``_spectral_distortion_index_band_sums``."""
+    length = preds_sums.shape[0]
+    m1 = target_sums / target_numel.clamp(min=1)
+    m2 = preds_sums / preds_numel.clamp(min=1)
     m1 = m1 + m1.T
     m2 = m2 + m2.T
 
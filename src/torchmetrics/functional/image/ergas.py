@@ -69,6 +69,17 @@ def _ergas_compute(
         >>> torch.round(_ergas_compute(preds, target))
         tensor(10.)
 
+    """
+    rmse_per_band, mean_target = _ergas_band_statistics(preds, target)
+    return _ergas_from_band_statistics(rmse_per_band, mean_target, ratio, reduction)
+
+
+def _ergas_band_statistics(preds: Tensor, target: Tensor) -> Tuple[Tensor, Tensor]:
+    """Compute the root mean squared error and the mean of the target of every image and band.
+
+    These are all that is needed for the ERGAS score of an image, such that a batch of images can be reduced to two
+    tensors of shape ``(B, C)``.
+
     """
     b, c, h, w = preds.shape
     preds = preds.reshape(b, c, h * w)
@@ -78,7 +89,17 @@ def _ergas_compute(
     sum_squared_error = torch.sum(diff * diff, dim=2)
     rmse_per_band = torch.sqrt(sum_squared_error / (h * w))
     mean_target = torch.mean(target, dim=2)
+    return rmse_per_band, mean_target
 
+
+def _ergas_from_band_statistics(
+    rmse_per_band: Tensor,
+    mean_target: Tensor,
+    ratio: float = 4,
+    reduction: Literal["elementwise_mean", "sum", "none", None] = "elementwise_mean",
+) -> Tensor:
+    """Compute ERGAS from the per image and band statistics of ``_ergas_band_statistics``."""
+    c = rmse_per_band.shape[1]
     ergas_score = 100 / ratio * torch.sqrt(torch.sum((rmse_per_band / mean_target) ** 2, dim=1) / c)
     return reduce(ergas_score, reduction)
 
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, Optional, Tuple, Union
 
 import torch
 from torch import Tensor, nn
 
-from torchmetrics.functional.image.lpips import _LPIPS
+from torchmetrics.functional.image.lpips import _LPIPS, _chunked_similarity, _validate_evaluation_args
 from torchmetrics.utilities.imports import _TORCHVISION_AVAILABLE
 
 if not _TORCHVISION_AVAILABLE:
@@ -162,6 +163,7 @@ def perceptual_path_length(
     upper_discard: Optional[float] = 0.99,
     sim_net: Union[nn.Module, Literal["alex", "vgg", "squeeze"]] = "vgg",
     device: Union[str, torch.device] = "cpu",
+    max_batch_size: Optional[int] = None,
 ) -> Tuple[Tensor, Tensor, Tensor]:
     r"""Computes the perceptual path length (`PPL`_) of a generator model.
 
@@ -184,6 +186,11 @@ def perceptual_path_length(
     if `conditional=False`, and `forward(z: Tensor, labels: Tensor) -> Tensor` if `conditional=True`. The returned
     tensor should have shape `(num_samples, C, H, W)` and be scaled to the range [0, 255].
 
+    The images of the next batch are generated on a background thread while the current batch is scored. Unlike
+    :func:`~torchmetrics.functional.image.learned_perceptual_image_patch_similarity` there is no reduced precision
+    mode: the images on a path differ by about ``epsilon``, far below the rounding error of ``float16`` or
+    ``bfloat16``, so the distances would be dominated by rounding.
+
     Args:
         generator: Generator model, with specific requirements. See above.
         num_samples: Number of samples to use for the PPL computation.
@@ -197,6 +204,8 @@ def perceptual_path_length(
         sim_net: Similarity network to use. Can be a `nn.Module` or one of 'alex', 'vgg', 'squeeze', where the three
             latter options correspond to the pretrained networks from the `LPIPS`_ paper.
         device: Device to use for the computation.
+        max_batch_size: If set, the image pairs of every batch are passed through the similarity network in chunks of
+            at most this many pairs to bound the memory of the activations. The result does not depend on it.
 
     Returns:
         A tuple containing the mean, standard deviation and all distances.
@@ -229,6 +238,7 @@ def perceptual_path_length(
     _perceptual_path_length_validate_arguments(
         num_samples, conditional, batch_size, interpolation_method, epsilon, resize, lower_discard, upper_discard
     )
+    _validate_evaluation_args(max_batch_size, None)
     _validate_generator_model(generator, conditional)
     generator = generator.to(device)
 
@@ -246,10 +256,9 @@ def perceptual_path_length(
     else:
         raise ValueError(f"sim_net must be a nn.Module or one of 'alex', 'vgg', 'squeeze', got {sim_net}")
 
-    with torch.inference_mode():
-        distances = []
-        num_batches = math.ceil(num_samples / batch_size)
-        for batch_idx in range(num_batches):
+    def _generate(batch_idx: int) -> Tuple[Tensor, Tensor]:
+        # inference mode is thread local, so it is entered on the background thread as well
+        with torch.inference_mode():
             batch_latent1 = latent1[batch_idx * batch_size : (batch_idx + 1) * batch_size].to(device)
             batch_latent2 = latent2[batch_idx * batch_size : (batch_idx + 1) * batch_size].to(device)
 
@@ -264,12 +273,21 @@ def perceptual_path_length(
             out1, out2 = outputs.chunk(2, dim=0)
 
             # rescale to lpips expected domain: [0, 255] -> [0, 1] -> [-1, 1]
-            out1_rescale = 2 * (out1 / 255) - 1
-            out2_rescale = 2 * (out2 / 255) - 1
+            return 2 * (out1 / 255) - 1, 2 * (out2 / 255) - 1
 
-            similarity = net(out1_rescale, out2_rescale)
-            dist = similarity / epsilon**2
-            distances.append(dist.detach())
+    with torch.inference_mode():
+        distances = []
+        num_batches = math.ceil(num_samples / batch_size)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_batch = executor.submit(_generate, 0)
+            for batch_idx in range(num_batches):
+                out1_rescale, out2_rescale = next_batch.result()
+                if batch_idx + 1 < num_batches:
+                    next_batch = executor.submit(_generate, batch_idx + 1)
+
+                similarity = _chunked_similarity(net, out1_rescale, out2_rescale, max_batch_size)
+                dist = similarity / epsilon**2
+                distances.append(dist.detach())
 
         distances = torch.cat(distances)
 
@@ -12,14 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import math
-from typing import Optional, Tuple, Union
+from typing import Optional, Sequence, Tuple, Union
 
+import numpy as np
 import torch
 from torch import Tensor, tensor
 from torch.nn.functional import conv2d, pad
 from typing_extensions import Literal
 
-from torchmetrics.utilities.checks import _check_same_shape
+from torchmetrics.functional.image.utils import (
+    _check_same_image_shape,
+    _check_tile_size,
+    _read_padded_region,
+    _region_reader,
+    _RegionReader,
+    _tile_grid,
+)
 from torchmetrics.utilities.distributed import reduce
 
 
@@ -46,32 +54,37 @@ def _scc_update(preds: Tensor, target: Tensor, hp_filter: Tensor, window_size: i
     """
     if preds.dtype != target.dtype:
         target = target.to(preds.dtype)
-    _check_same_shape(preds, target)
-    if preds.ndim not in (3, 4):
+    _scc_check_shapes(preds, target, window_size)
+
+    if len(preds.shape) == 3:
+        preds = preds.unsqueeze(1)
+        target = target.unsqueeze(1)
+
+    preds = preds.to(torch.float32)
+    target = target.to(torch.float32)
+    hp_filter = hp_filter[None, None, :].to(dtype=preds.dtype, device=preds.device)
+    return preds, target, hp_filter
+
+
+def _scc_check_shapes(preds: Union[Tensor, np.ndarray], target: Union[Tensor, np.ndarray], window_size: int) -> None:
+    """Check the shapes of the inputs of Spatial Correlation Coefficient and the local window size."""
+    _check_same_image_shape(preds, target)
+    if len(preds.shape) not in (3, 4):
         raise ValueError(
             "Expected `preds` and `target` to have batch of colored images with BxCxHxW shape"
             "  or batch of grayscale images of BxHxW shape."
             f" Got preds: {preds.shape} and target: {target.shape}."
         )
 
-    if len(preds.shape) == 3:
-        preds = preds.unsqueeze(1)
-        target = target.unsqueeze(1)
-
     if not window_size > 0:
         raise ValueError(f"Expected `window_size` to be a positive integer. Got {window_size}.")
 
-    if window_size > preds.size(2) or window_size > preds.size(3):
+    if window_size > preds.shape[-2] or window_size > preds.shape[-1]:
         raise ValueError(
             f"Expected `window_size` to be less than or equal to the size of the image."
-            f" Got window_size: {window_size} and image size: {preds.size(2)}x{preds.size(3)}."
+            f" Got window_size: {window_size} and image size: {preds.shape[-2]}x{preds.shape[-1]}."
         )
 
-    preds = preds.to(torch.float32)
-    target = target.to(torch.float32)
-    hp_filter = hp_filter[None, None, :].to(dtype=preds.dtype, device=preds.device)
-    return preds, target, hp_filter
-
 
 def _symmetric_reflect_pad_2d(input_img: Tensor, pad: Union[int, Tuple[int, ...]]) -> Tensor:
     """Applies symmetric padding to the 2D image tensor input using ``reflect`` mode (d c b a | a b c d | d c b a)."""
@@ -116,7 +129,11 @@ def _local_variance_covariance(preds: Tensor, target: Tensor, window: Tensor) ->
 
     preds = pad(preds, (left_padding, right_padding, left_padding, right_padding))
     target = pad(target, (left_padding, right_padding, left_padding, right_padding))
+    return _valid_variance_covariance(preds, target, window)
 
+
+def _valid_variance_covariance(preds: Tensor, target: Tensor, window: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+    """Computes local variance and covariance of the input tensors for all windows inside the inputs."""
     preds_mean = conv2d(preds, window, stride=1, padding=0)
     target_mean = conv2d(target, window, stride=1, padding=0)
 
@@ -152,7 +169,11 @@ def _scc_per_channel_compute(preds: Tensor, target: Tensor, hp_filter: Tensor, w
     target_hp = _hp_2d_laplacian(target, hp_filter)
 
     preds_var, target_var, target_preds_cov = _local_variance_covariance(preds_hp, target_hp, window)
+    return _scc_from_variance_covariance(preds_var, target_var, target_preds_cov)
+
 
+def _scc_from_variance_covariance(preds_var: Tensor, target_var: Tensor, target_preds_cov: Tensor) -> Tensor:
+    """Computes the Spatial Correlation Coefficient from the local variances and covariance."""
     preds_var[preds_var < 0] = 0
     target_var[target_var < 0] = 0
 
@@ -164,12 +185,90 @@ def _scc_per_channel_compute(preds: Tensor, target: Tensor, hp_filter: Tensor, w
     return scc
 
 
+def _scc_update_tiled(
+    preds: Union[Tensor, np.ndarray],
+    target: Union[Tensor, np.ndarray],
+    hp_filter: Tensor,
+    window_size: int,
+    tile_size: Union[int, Sequence[int]],
+    device: Optional[torch.device] = None,
+) -> Tensor:
+    """Compute the mean Spatial Correlation Coefficient of every image tile by tile.
+
+    A tile of the scc map is computed from the high-pass filtered region that its local windows cover, which in turn is
+    computed from the symmetrically padded input region that the high-pass filter covers. Both are read from the inputs
+    only, such that the full images and their filtered versions are never held in memory.
+
+    Args:
+        preds: estimated images of shape ``(N,C,H,W)`` or ``(N,H,W)``, a tensor or a (memory-mapped) ``numpy`` array
+        target: ground truth images of the same shape, a tensor or a (memory-mapped) ``numpy`` array
+        hp_filter: 2D high-pass filter.
+        window_size: size of window for local mean calculation.
+        tile_size: size of the tiles of the scc map, either one value or one per spatial dimension
+        device: device of the tiles, by default the device of ``preds`` if it is a tensor and cpu otherwise
+
+    Return:
+        Tensor of shape ``(N,)`` with the mean scc score of every image
+
+    """
+    _scc_check_shapes(preds, target, window_size)
+    tile_shape = _check_tile_size(tile_size, 2)
+    if device is None:
+        device = preds.device if isinstance(preds, Tensor) else torch.device("cpu")
+    read_preds = _region_reader(preds, torch.float32, device)
+    read_target = _region_reader(target, torch.float32, device)
+    if len(preds.shape) == 3:
+        read_preds = _unsqueezed_reader(read_preds)
+        read_target = _unsqueezed_reader(read_target)
+    sizes = list(preds.shape[-2:])
+
+    hp_filter = hp_filter[None, None, :].to(dtype=torch.float32, device=device).flip([2, 3])
+    window = torch.ones(size=(1, 1, window_size, window_size), dtype=torch.float32, device=device) / (window_size**2)
+    # offsets of the high-pass filter and of the (zero padded) local window relative to the output position
+    hp_offsets = [int(math.floor((k - 1) / 2)) for k in hp_filter.shape[2:]]
+    window_offset = int(math.ceil((window_size - 1) / 2))
+
+    scc_sum = torch.zeros(preds.shape[0], dtype=torch.float64, device=device)
+    for starts, stops in _tile_grid([0, 0], sizes, tile_shape):
+        # high-pass filtered region covered by the local windows, which is zero outside of the image
+        hp_starts = [a - window_offset for a in starts]
+        hp_stops = [b + window_size - 1 - window_offset for b in stops]
+        inner_starts = [max(a, 0) for a in hp_starts]
+        inner_stops = [min(b, n) for b, n in zip(hp_stops, sizes)]
+        in_starts = [a - o for a, o in zip(inner_starts, hp_offsets)]
+        in_stops = [b - o + k - 1 for b, o, k in zip(inner_stops, hp_offsets, hp_filter.shape[2:])]
+        hp_pad = (inner_starts[1] - hp_starts[1], hp_stops[1] - inner_stops[1])
+        hp_pad += (inner_starts[0] - hp_starts[0], hp_stops[0] - inner_stops[0])
+
+        hps = []
+        for read in (read_preds, read_target):
+            region = _read_padded_region(read, sizes, in_starts, in_stops, mode="symmetric")
+            region = region.reshape(-1, 1, *region.shape[2:])
+            hps.append(pad(conv2d(region, hp_filter) * 2.0, hp_pad))
+
+        scc = _scc_from_variance_covariance(*_valid_variance_covariance(hps[0], hps[1], window))
+        scc_sum += scc.reshape(preds.shape[0], -1).sum(-1, dtype=torch.float64)
+
+    num_channels = 1 if len(preds.shape) == 3 else preds.shape[1]
+    return (scc_sum / (num_channels * sizes[0] * sizes[1])).to(torch.float32)
+
+
+def _unsqueezed_reader(read: _RegionReader) -> _RegionReader:
+    """Add a channel dimension to the regions read from a batch of grayscale images."""
+
+    def read_unsqueezed(starts: Sequence[int], stops: Sequence[int]) -> Tensor:
+        return read(starts, stops).unsqueeze(1)
+
+    return read_unsqueezed
+
+
 def spatial_correlation_coefficient(
     preds: Tensor,
     target: Tensor,
     hp_filter: Optional[Tensor] = None,
     window_size: int = 8,
     reduction: Optional[Literal["mean", "none", None]] = "mean",
+    tile_size: Optional[Union[int, Sequence[int]]] = None,
 ) -> Tensor:
     """Compute Spatial Correlation Coefficient (SCC_).
 
@@ -180,6 +279,9 @@ def spatial_correlation_coefficient(
         window_size: Local window size integer. default: 8,
         reduction: Reduction method for output tensor. If ``None`` or ``"none"``,
                    returns a tensor with the per sample results. default: ``"mean"``.
+        tile_size: If set, the scc map is computed in tiles of this size, each extended by the support of the filters,
+            which bounds the peak memory for very large images while giving the same result. ``preds`` and ``target``
+            can then also be ``numpy`` arrays, e.g. ``numpy.memmap``, from which only the required regions are read.
 
     Return:
         Tensor with scc score
@@ -206,6 +308,9 @@ def spatial_correlation_coefficient(
         reduction = "none"
     if reduction not in ("mean", "none"):
         raise ValueError(f"Expected reduction to be 'mean' or 'none', but got {reduction}")
+    if tile_size is not None:
+        scc_per_image = _scc_update_tiled(preds, target, hp_filter, window_size, tile_size)
+        return scc_per_image if reduction == "none" else scc_per_image.mean()
     preds, target, hp_filter = _scc_update(preds, target, hp_filter, window_size)
 
     per_channel = [
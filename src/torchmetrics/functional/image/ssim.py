@@ -11,14 +11,26 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 from torch.nn import functional as F  # noqa: N812
 from typing_extensions import Literal
 
-from torchmetrics.functional.image.utils import _gaussian_kernel_2d, _gaussian_kernel_3d, _reflection_pad_3d
+from torchmetrics.functional.image.utils import (
+    _check_same_image_shape,
+    _check_tile_size,
+    _gaussian_1d,
+    _read_padded_region,
+    _reflection_pad_3d,
+    _region_reader,
+    _RegionReader,
+    _separable_filter,
+    _tile_grid,
+    _tiled_min_max,
+)
 from torchmetrics.utilities.checks import _check_same_shape
 from torchmetrics.utilities.distributed import reduce
 
@@ -42,111 +54,78 @@ def _ssim_check_inputs(preds: Tensor, target: Tensor) -> Tuple[Tensor, Tensor]:
     return preds, target
 
 
-def _ssim_update(
-    preds: Tensor,
-    target: Tensor,
-    gaussian_kernel: bool = True,
-    sigma: Union[float, Sequence[float]] = 1.5,
-    kernel_size: Union[int, Sequence[int]] = 11,
-    data_range: Optional[Union[float, Tuple[float, float]]] = None,
-    k1: float = 0.01,
-    k2: float = 0.03,
-    return_full_image: bool = False,
-    return_contrast_sensitivity: bool = False,
-) -> Union[Tensor, Tuple[Tensor, Tensor]]:
-    """Compute Structural Similarity Index Measure.
-
-    Args:
-        preds: estimated image
-        target: ground truth image
-        gaussian_kernel: If true (default), a gaussian kernel is used, if false a uniform kernel is used
-        sigma: Standard deviation of the gaussian kernel, anisotropic kernels are possible.
-            Ignored if a uniform kernel is used
-        kernel_size: the size of the uniform kernel, anisotropic kernels are possible.
-            Ignored if a Gaussian kernel is used
-        data_range: Range of the image. If ``None``, it is determined from the image (max - min)
-        k1: Parameter of SSIM.
-        k2: Parameter of SSIM.
-        return_full_image: If true, the full ``ssim`` image is returned as a second argument.
-            Mutually exclusive with ``return_contrast_sensitivity``
-        return_contrast_sensitivity: If true, the contrast term is returned as a second argument.
-            The luminance term can be obtained with luminance=ssim/contrast
-            Mutually exclusive with ``return_full_image``
-
-    """
-    is_3d = preds.ndim == 5
+def _ssim_check_kernel_args(
+    ndim: int, sigma: Union[float, Sequence[float]], kernel_size: Union[int, Sequence[int]]
+) -> Tuple[Sequence[float], Sequence[int]]:
+    """Check the kernel arguments of SSIM and expand them to one value per spatial dimension of an ``ndim`` input."""
+    is_3d = ndim == 5
 
     if not isinstance(kernel_size, Sequence):
         kernel_size = 3 * [kernel_size] if is_3d else 2 * [kernel_size]
     if not isinstance(sigma, Sequence):
         sigma = 3 * [sigma] if is_3d else 2 * [sigma]
 
-    if len(kernel_size) != len(target.shape) - 2:
+    if len(kernel_size) != ndim - 2:
         raise ValueError(
             f"`kernel_size` has dimension {len(kernel_size)}, but expected to be two less that target dimensionality,"
-            f" which is: {len(target.shape)}"
+            f" which is: {ndim}"
         )
     if len(kernel_size) not in (2, 3):
         raise ValueError(
             f"Expected `kernel_size` dimension to be 2 or 3. `kernel_size` dimensionality: {len(kernel_size)}"
         )
-    if len(sigma) != len(target.shape) - 2:
+    if len(sigma) != ndim - 2:
         raise ValueError(
             f"`kernel_size` has dimension {len(kernel_size)}, but expected to be two less that target dimensionality,"
-            f" which is: {len(target.shape)}"
+            f" which is: {ndim}"
         )
     if len(sigma) not in (2, 3):
         raise ValueError(
             f"Expected `kernel_size` dimension to be 2 or 3. `kernel_size` dimensionality: {len(kernel_size)}"
         )
 
-    if return_full_image and return_contrast_sensitivity:
-        raise ValueError("Arguments `return_full_image` and `return_contrast_sensitivity` are mutually exclusive.")
-
     if any(x % 2 == 0 or x <= 0 for x in kernel_size):
         raise ValueError(f"Expected `kernel_size` to have odd positive number. Got {kernel_size}.")
 
     if any(y <= 0 for y in sigma):
         raise ValueError(f"Expected `sigma` to have positive number. Got {sigma}.")
+    return sigma, kernel_size
 
-    if data_range is None:
-        data_range = max(preds.max() - preds.min(), target.max() - target.min())  # type: ignore[call-overload]
-    elif isinstance(data_range, tuple):
-        preds = torch.clamp(preds, min=data_range[0], max=data_range[1])
-        target = torch.clamp(target, min=data_range[0], max=data_range[1])
-        data_range = data_range[1] - data_range[0]
 
-    c1 = pow(k1 * data_range, 2)  # type: ignore[operator]
-    c2 = pow(k2 * data_range, 2)  # type: ignore[operator]
-    device = preds.device
-
-    channel = preds.size(1)
-    dtype = preds.dtype
+def _ssim_kernels(
+    gaussian_kernel: bool,
+    sigma: Sequence[float],
+    kernel_size: Sequence[int],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> Tuple[List[int], List[Tensor]]:
+    """Return the reflection padding of each spatial dimension and the 1D kernels of the separable SSIM filter."""
     gauss_kernel_size = [int(3.5 * s + 0.5) * 2 + 1 for s in sigma]
+    pads = [(k - 1) // 2 for k in gauss_kernel_size]
 
-    pad_h = (gauss_kernel_size[0] - 1) // 2
-    pad_w = (gauss_kernel_size[1] - 1) // 2
-
-    if is_3d:
-        pad_d = (gauss_kernel_size[2] - 1) // 2
-        preds = _reflection_pad_3d(preds, pad_d, pad_w, pad_h)
-        target = _reflection_pad_3d(target, pad_d, pad_w, pad_h)
-        if gaussian_kernel:
-            kernel = _gaussian_kernel_3d(channel, gauss_kernel_size, sigma, dtype, device)
+    # both kernels are separable, so they are applied as one 1D kernel per spatial dimension
+    if gaussian_kernel:
+        kernels = [_gaussian_1d(k, float(s), dtype, device) for k, s in zip(gauss_kernel_size, sigma)]
     else:
-        preds = F.pad(preds, (pad_w, pad_w, pad_h, pad_h), mode="reflect")
-        target = F.pad(target, (pad_w, pad_w, pad_h, pad_h), mode="reflect")
-        if gaussian_kernel:
-            kernel = _gaussian_kernel_2d(channel, gauss_kernel_size, sigma, dtype, device)
+        kernels = [torch.full((k,), 1 / k, dtype=dtype, device=device) for k in kernel_size]
+    return pads, kernels
 
-    if not gaussian_kernel:
-        kernel = torch.ones((channel, 1, *kernel_size), dtype=dtype, device=device) / torch.prod(
-            torch.tensor(kernel_size, dtype=dtype, device=device)
-        )
 
+def _ssim_maps(
+    preds: Tensor,
+    target: Tensor,
+    kernels: Sequence[Tensor],
+    c1: Union[float, Tensor],
+    c2: Union[float, Tensor],
+    return_contrast_sensitivity: bool = False,
+) -> Tuple[Tensor, Optional[Tensor]]:
+    """Compute the ssim map (and contrast sensitivity map) of padded images, without cropping the padded border."""
+    dtype = preds.dtype
+
+    # all first and second order moments are filtered together
     input_list = torch.cat((preds, target, preds * preds, target * target, preds * target))  # (5 * B, C, H, W)
 
-    outputs = F.conv3d(input_list, kernel, groups=channel) if is_3d else F.conv2d(input_list, kernel, groups=channel)
+    outputs = _separable_filter(input_list, kernels)
 
     output_list = outputs.split(preds.shape[0])
 
@@ -163,18 +142,74 @@ def _ssim_update(
     lower = (sigma_pred_sq + sigma_target_sq).to(dtype) + c2
 
     ssim_idx_full_image = ((2 * mu_pred_target + c1) * upper) / ((mu_pred_sq + mu_target_sq + c1) * lower)
+    return ssim_idx_full_image, upper / lower if return_contrast_sensitivity else None
+
+
+def _ssim_update(
+    preds: Tensor,
+    target: Tensor,
+    gaussian_kernel: bool = True,
+    sigma: Union[float, Sequence[float]] = 1.5,
+    kernel_size: Union[int, Sequence[int]] = 11,
+    data_range: Optional[Union[float, Tuple[float, float]]] = None,
+    k1: float = 0.01,
+    k2: float = 0.03,
+    return_full_image: bool = False,
+    return_contrast_sensitivity: bool = False,
+) -> Union[Tensor, Tuple[Tensor, Tensor]]:
+    """Compute Structural Similarity Index Measure.
+
+    Args:
+        preds: estimated image
+        target: ground truth image
+        gaussian_kernel: If true (default), a gaussian kernel is used, if false a uniform kernel is used
+        sigma: Standard deviation of the gaussian kernel, anisotropic kernels are possible.
+            Ignored if a uniform kernel is used
+        kernel_size: the size of the uniform kernel, anisotropic kernels are possible.
+            Ignored if a Gaussian kernel is used
+        data_range: Range of the image. If ``None``, it is determined from the image (max - min)
+        k1: Parameter of SSIM.
+        k2: Parameter of SSIM.
+        return_full_image: If true, the full ``ssim`` image is returned as a second argument.
+            Mutually exclusive with ``return_contrast_sensitivity``
+        return_contrast_sensitivity: If true, the contrast term is returned as a second argument.
+            The luminance term can be obtained with luminance=ssim/contrast
+            Mutually exclusive with ``return_full_image``
 
+    """
+    is_3d = preds.ndim == 5
+    sigma, kernel_size = _ssim_check_kernel_args(len(target.shape), sigma, kernel_size)
+
+    if return_full_image and return_contrast_sensitivity:
+        raise ValueError("Arguments `return_full_image` and `return_contrast_sensitivity` are mutually exclusive.")
+
+    if data_range is None:
+        data_range = max(preds.max() - preds.min(), target.max() - target.min())
+    elif isinstance(data_range, tuple):
+        preds = torch.clamp(preds, min=data_range[0], max=data_range[1])
+        target = torch.clamp(target, min=data_range[0], max=data_range[1])
+        data_range = data_range[1] - data_range[0]
+
+    c1 = pow(k1 * data_range, 2)
+    c2 = pow(k2 * data_range, 2)
+
+    pads, kernels = _ssim_kernels(gaussian_kernel, sigma, kernel_size, preds.dtype, preds.device)
     if is_3d:
-        ssim_idx = ssim_idx_full_image[..., pad_h:-pad_h, pad_w:-pad_w, pad_d:-pad_d]
+        pad_h, pad_w, pad_d = pads
+        preds = _reflection_pad_3d(preds, pad_d, pad_w, pad_h)
+        target = _reflection_pad_3d(target, pad_d, pad_w, pad_h)
     else:
-        ssim_idx = ssim_idx_full_image[..., pad_h:-pad_h, pad_w:-pad_w]
+        pad_h, pad_w = pads
+        preds = F.pad(preds, (pad_w, pad_w, pad_h, pad_h), mode="reflect")
+        target = F.pad(target, (pad_w, pad_w, pad_h, pad_h), mode="reflect")
 
-    if return_contrast_sensitivity:
-        contrast_sensitivity = upper / lower
-        if is_3d:
-            contrast_sensitivity = contrast_sensitivity[..., pad_h:-pad_h, pad_w:-pad_w, pad_d:-pad_d]
-        else:
-            contrast_sensitivity = contrast_sensitivity[..., pad_h:-pad_h, pad_w:-pad_w]
+    ssim_idx_full_image, contrast_sensitivity = _ssim_maps(preds, target, kernels, c1, c2, return_contrast_sensitivity)
+
+    crop: Tuple[Any, ...] = (..., *(slice(pad, -pad) for pad in pads))
+    ssim_idx = ssim_idx_full_image[crop]
+
+    if contrast_sensitivity is not None:
+        contrast_sensitivity = contrast_sensitivity[crop]
         return ssim_idx.reshape(ssim_idx.shape[0], -1).mean(-1), contrast_sensitivity.reshape(
             contrast_sensitivity.shape[0], -1
         ).mean(-1)
@@ -185,6 +220,146 @@ def _ssim_update(
     return ssim_idx.reshape(ssim_idx.shape[0], -1).mean(-1)
 
 
+def _image_dtype(image: Union[Tensor, np.ndarray]) -> torch.dtype:
+    """Return the dtype of a tensor or the tensor dtype corresponding to a numpy array."""
+    if isinstance(image, Tensor):
+        return image.dtype
+    return torch.from_numpy(np.empty(0, dtype=image.dtype)).dtype
+
+
+def _ssim_tiled_means(
+    read_preds: _RegionReader,
+    read_target: _RegionReader,
+    sizes: Sequence[int],
+    tile_size: Sequence[int],
+    gaussian_kernel: bool,
+    sigma: Sequence[float],
+    kernel_size: Sequence[int],
+    data_range: Optional[Union[float, Tuple[float, float]]],
+    k1: float,
+    k2: float,
+    dtype: torch.dtype,
+    device: torch.device,
+    return_contrast_sensitivity: bool = False,
+) -> Tuple[Tensor, Optional[Tensor]]:
+    """Compute the per image mean of the ssim (and contrast sensitivity) maps tile by tile.
+
+    Every tile of the cropped ssim map is computed from a tile of the reflection padded images that is extended by the
+    support of the filter, such that the sums over all tiles are the same as over the full maps.
+
+    """
+    clamp_range = None
+    if data_range is None:
+        preds_min, preds_max = _tiled_min_max(read_preds, sizes, tile_size)
+        target_min, target_max = _tiled_min_max(read_target, sizes, tile_size)
+        data_range = max(preds_max - preds_min, target_max - target_min)
+    elif isinstance(data_range, tuple):
+        clamp_range = data_range
+        data_range = data_range[1] - data_range[0]
+
+    c1 = pow(k1 * data_range, 2)
+    c2 = pow(k2 * data_range, 2)
+
+    pads, kernels = _ssim_kernels(gaussian_kernel, sigma, kernel_size, dtype, device)
+    support = [k.shape[0] for k in kernels]
+    # size of the full (uncropped) ssim map of the padded images
+    map_sizes = [n + 2 * p - k + 1 for n, p, k in zip(sizes, pads, support)]
+
+    ssim_sum, cs_sum, count = None, None, 0
+    for starts, stops in _tile_grid(pads, [m - p for m, p in zip(map_sizes, pads)], tile_size):
+        # the map at position `o` depends on the padded images at positions `o` to `o + k - 1`
+        in_starts = [a - p for a, p in zip(starts, pads)]
+        in_stops = [b + k - 1 - p for b, k, p in zip(stops, support, pads)]
+        preds = _read_padded_region(read_preds, sizes, in_starts, in_stops)
+        target = _read_padded_region(read_target, sizes, in_starts, in_stops)
+        if clamp_range is not None:
+            preds = torch.clamp(preds, min=clamp_range[0], max=clamp_range[1])
+            target = torch.clamp(target, min=clamp_range[0], max=clamp_range[1])
+
+        ssim_map, cs_map = _ssim_maps(preds, target, kernels, c1, c2, return_contrast_sensitivity)
+        tile_ssim = ssim_map.reshape(ssim_map.shape[0], -1).sum(-1, dtype=torch.float64)
+        ssim_sum = tile_ssim if ssim_sum is None else ssim_sum + tile_ssim
+        if cs_map is not None:
+            tile_cs = cs_map.reshape(cs_map.shape[0], -1).sum(-1, dtype=torch.float64)
+            cs_sum = tile_cs if cs_sum is None else cs_sum + tile_cs
+        count += ssim_map[0].numel()
+
+    if ssim_sum is None:  # the cropped map is empty
+        batch_size = read_preds([0] * len(sizes), [1] * len(sizes)).shape[0]
+        ssim_sum = cs_sum = torch.zeros(batch_size, dtype=torch.float64, device=device)
+    ssim_mean = (ssim_sum / count).to(dtype)
+    cs_mean = (cs_sum / count).to(dtype) if return_contrast_sensitivity and cs_sum is not None else None
+    return ssim_mean, cs_mean
+
+
+def _ssim_update_tiled(
+    preds: Union[Tensor, np.ndarray],
+    target: Union[Tensor, np.ndarray],
+    tile_size: Union[int, Sequence[int]],
+    gaussian_kernel: bool = True,
+    sigma: Union[float, Sequence[float]] = 1.5,
+    kernel_size: Union[int, Sequence[int]] = 11,
+    data_range: Optional[Union[float, Tuple[float, float]]] = None,
+    k1: float = 0.01,
+    k2: float = 0.03,
+    return_contrast_sensitivity: bool = False,
+    device: Optional[torch.device] = None,
+) -> Union[Tensor, Tuple[Tensor, Tensor]]:
+    """Compute Structural Similarity Index Measure like ``_ssim_update``, but tile by tile.
+
+    Only tiles of the images, extended by the support of the filter, and their intermediate maps are kept in memory.
+    The images can be tensors or ``numpy`` arrays, e.g. memory-mapped with ``numpy.memmap``, in which case the tiles are
+    read from the array on demand and moved to ``device``.
+
+    Args:
+        preds: estimated image
+        target: ground truth image
+        tile_size: size of the tiles of the ssim map, either one value or one per spatial dimension
+        gaussian_kernel: If true (default), a gaussian kernel is used, if false a uniform kernel is used
+        sigma: Standard deviation of the gaussian kernel, anisotropic kernels are possible.
+            Ignored if a uniform kernel is used
+        kernel_size: the size of the uniform kernel, anisotropic kernels are possible.
+            Ignored if a Gaussian kernel is used
+        data_range: Range of the image. If ``None``, it is determined from the image (max - min) in an additional pass
+            over the tiles
+        k1: Parameter of SSIM.
+        k2: Parameter of SSIM.
+        return_contrast_sensitivity: If true, the contrast term is returned as a second argument.
+        device: device of the tiles, by default the device of ``preds`` if it is a tensor and cpu otherwise
+
+    """
+    _check_same_image_shape(preds, target)
+    if len(preds.shape) not in (4, 5):
+        raise ValueError(
+            "Expected `preds` and `target` to have BxCxHxW or BxCxDxHxW shape."
+            f" Got preds: {preds.shape} and target: {target.shape}."
+        )
+    sigma, kernel_size = _ssim_check_kernel_args(len(target.shape), sigma, kernel_size)
+    tile_shape = _check_tile_size(tile_size, len(preds.shape) - 2)
+    dtype = _image_dtype(preds)
+    if device is None:
+        device = preds.device if isinstance(preds, Tensor) else torch.device("cpu")
+
+    ssim_mean, cs_mean = _ssim_tiled_means(
+        _region_reader(preds, dtype, device),
+        _region_reader(target, dtype, device),
+        preds.shape[2:],
+        tile_shape,
+        gaussian_kernel,
+        sigma,
+        kernel_size,
+        data_range,
+        k1,
+        k2,
+        dtype,
+        device,
+        return_contrast_sensitivity,
+    )
+    if cs_mean is not None:
+        return ssim_mean, cs_mean
+    return ssim_mean
+
+
 def _ssim_compute(
     similarities: Tensor,
     reduction: Literal["elementwise_mean", "sum", "none", None] = "elementwise_mean",
@@ -218,6 +393,7 @@ def structural_similarity_index_measure(
     k2: float = 0.03,
     return_full_image: bool = False,
     return_contrast_sensitivity: bool = False,
+    tile_size: Optional[Union[int, Sequence[int]]] = None,
 ) -> Union[Tensor, Tuple[Tensor, Tensor]]:
     """Compute Structural Similarity Index Measure.
 
@@ -245,6 +421,11 @@ def structural_similarity_index_measure(
         return_contrast_sensitivity: If true, the constant term is returned as a second argument.
             The luminance term can be obtained with luminance=ssim/contrast
             Mutually exclusive with ``return_full_image``
+        tile_size: If set, the ssim map is computed in tiles of this size (one value or one per spatial dimension),
+            each extended by the support of the filter, which bounds the peak memory for very large images and
+            volumes while giving the same result. ``preds`` and ``target`` can then also be ``numpy`` arrays, e.g.
+            ``numpy.memmap``, from which only the required regions are read. If ``data_range`` is ``None``, it is
+            determined in an additional pass over the tiles. Not supported with ``return_full_image``.
 
     Return:
         Tensor with SSIM score
@@ -260,6 +441,9 @@ def structural_similarity_index_measure(
             If one of the elements of ``kernel_size`` is not an ``odd positive number``.
         ValueError:
             If one of the elements of ``sigma`` is not a ``positive number``.
+        ValueError:
+            If ``tile_size`` is not a positive integer or a sequence of positive integers, or is combined with
+            ``return_full_image``.
 
     Example:
         >>> from torchmetrics.functional.image import structural_similarity_index_measure
@@ -269,6 +453,26 @@ def structural_similarity_index_measure(
         tensor(0.9219)
 
     """
+    if tile_size is not None:
+        if return_full_image:
+            raise ValueError("Arguments `tile_size` and `return_full_image` are mutually exclusive.")
+        similarity_pack = _ssim_update_tiled(
+            preds,
+            target,
+            tile_size,
+            gaussian_kernel,
+            sigma,
+            kernel_size,
+            data_range,
+            k1,
+            k2,
+            return_contrast_sensitivity,
+        )
+        if isinstance(similarity_pack, tuple):
+            similarity, contrast_sensitivity = similarity_pack
+            return _ssim_compute(similarity, reduction), contrast_sensitivity
+        return _ssim_compute(similarity_pack, reduction)
+
     preds, target = _ssim_check_inputs(preds, target)
     similarity_pack = _ssim_update(
         preds,
@@ -380,23 +584,7 @@ def _multiscale_ssim_update(
     if not isinstance(sigma, Sequence):
         sigma = 3 * [sigma] if is_3d else 2 * [sigma]
 
-    if preds.size()[-1] < 2 ** len(betas) or preds.size()[-2] < 2 ** len(betas):
-        raise ValueError(
-            f"For a given number of `betas` parameters {len(betas)}, the image height and width dimensions must be"
-            f" larger than or equal to {2 ** len(betas)}."
-        )
-
-    _betas_div = max(1, (len(betas) - 1)) ** 2
-    if preds.size()[-2] // _betas_div <= kernel_size[0] - 1:
-        raise ValueError(
-            f"For a given number of `betas` parameters {len(betas)} and kernel size {kernel_size[0]},"
-            f" the image height must be larger than {(kernel_size[0] - 1) * _betas_div}."
-        )
-    if preds.size()[-1] // _betas_div <= kernel_size[1] - 1:
-        raise ValueError(
-            f"For a given number of `betas` parameters {len(betas)} and kernel size {kernel_size[1]},"
-            f" the image width must be larger than {(kernel_size[1] - 1) * _betas_div}."
-        )
+    _multiscale_ssim_check_sizes(preds.shape, kernel_size, betas)
 
     for _ in range(len(betas)):
         sim, contrast_sensitivity = _get_normalized_sim_and_cs(
@@ -414,6 +602,34 @@ def _multiscale_ssim_update(
             raise ValueError("length of kernel_size is neither 2 nor 3")
 
     mcs_list[-1] = sim
+    return _multiscale_ssim_combine(mcs_list, betas, normalize)
+
+
+def _multiscale_ssim_check_sizes(shape: Sequence[int], kernel_size: Sequence[int], betas: Tuple[float, ...]) -> None:
+    """Check that images of the given shape are large enough for the number of scales of MS-SSIM."""
+    if shape[-1] < 2 ** len(betas) or shape[-2] < 2 ** len(betas):
+        raise ValueError(
+            f"For a given number of `betas` parameters {len(betas)}, the image height and width dimensions must be"
+            f" larger than or equal to {2 ** len(betas)}."
+        )
+
+    _betas_div = max(1, (len(betas) - 1)) ** 2
+    if shape[-2] // _betas_div <= kernel_size[0] - 1:
+        raise ValueError(
+            f"For a given number of `betas` parameters {len(betas)} and kernel size {kernel_size[0]},"
+            f" the image height must be larger than {(kernel_size[0] - 1) * _betas_div}."
+        )
+    if shape[-1] // _betas_div <= kernel_size[1] - 1:
+        raise ValueError(
+            f"For a given number of `betas` parameters {len(betas)} and kernel size {kernel_size[1]},"
+            f" the image width must be larger than {(kernel_size[1] - 1) * _betas_div}."
+        )
+
+
+def _multiscale_ssim_combine(
+    mcs_list: List[Tensor], betas: Tuple[float, ...], normalize: Optional[Literal["relu", "simple"]] = None
+) -> Tensor:
+    """Combine the contrast sensitivities of all but the last scale and the similarity of the last scale."""
     mcs_stack = torch.stack(mcs_list)
 
     if normalize == "simple":
@@ -424,6 +640,106 @@ def _multiscale_ssim_update(
     return torch.prod(mcs_weighted, axis=0)  # type: ignore[call-overload]
 
 
+def _pooled_region_reader(read: _RegionReader, num_pools: int) -> _RegionReader:
+    """Create a function reading regions of an image that is average pooled ``num_pools`` times by a factor of 2.
+
+    A region of the pooled image is computed from the corresponding region of the original image only, which gives the
+    same values as pooling the full image.
+
+    """
+    factor = 2**num_pools
+
+    def read_pooled(starts: Sequence[int], stops: Sequence[int]) -> Tensor:
+        region = read([a * factor for a in starts], [b * factor for b in stops])
+        for _ in range(num_pools):
+            region = F.avg_pool2d(region, (2, 2)) if len(starts) == 2 else F.avg_pool3d(region, (2, 2, 2))
+        return region
+
+    return read_pooled
+
+
+def _multiscale_ssim_update_tiled(
+    preds: Union[Tensor, np.ndarray],
+    target: Union[Tensor, np.ndarray],
+    tile_size: Union[int, Sequence[int]],
+    gaussian_kernel: bool = True,
+    sigma: Union[float, Sequence[float]] = 1.5,
+    kernel_size: Union[int, Sequence[int]] = 11,
+    data_range: Optional[Union[float, Tuple[float, float]]] = None,
+    k1: float = 0.01,
+    k2: float = 0.03,
+    betas: Tuple[float, ...] = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333),
+    normalize: Optional[Literal["relu", "simple"]] = None,
+    device: Optional[torch.device] = None,
+) -> Tensor:
+    """Compute Multi-Scale Structural Similarity Index Measure like ``_multiscale_ssim_update``, but tile by tile.
+
+    Every scale is evaluated tile by tile on regions of the downsampled images, which are computed from the
+    corresponding regions of the original images, such that the full images are never held in memory. The tile size
+    of a scale is ``tile_size`` divided by its downsampling factor, so the regions read from the original images have
+    roughly the same size at every scale.
+
+    Args:
+        preds: estimated image, a tensor or a (memory-mapped) ``numpy`` array
+        target: ground truth image, a tensor or a (memory-mapped) ``numpy`` array
+        tile_size: size of the tiles of the ssim map at full resolution, either one value or one per spatial dimension
+        gaussian_kernel: If true, a gaussian kernel is used, if false a uniform kernel is used
+        sigma: Standard deviation of the gaussian kernel
+        kernel_size: size of the gaussian kernel
+        data_range: Range of the image. If ``None``, it is determined from the image (max - min) at every scale
+        k1: Parameter of structural similarity index measure.
+        k2: Parameter of structural similarity index measure.
+        betas: Exponent parameters for individual similarities and contrastive sensitives returned by different image
+            resolutions.
+        normalize: Normalization of the similarities and contrast sensitivities, see ``_multiscale_ssim_update``
+        device: device of the tiles, by default the device of ``preds`` if it is a tensor and cpu otherwise
+
+    """
+    _check_same_image_shape(preds, target)
+    if len(preds.shape) not in (4, 5):
+        raise ValueError(
+            "Expected `preds` and `target` to have BxCxHxW or BxCxDxHxW shape."
+            f" Got preds: {preds.shape} and target: {target.shape}."
+        )
+    ndim = len(preds.shape) - 2
+    sigma, kernel_size = _ssim_check_kernel_args(len(preds.shape), sigma, kernel_size)
+    tile_shape = _check_tile_size(tile_size, ndim)
+    _multiscale_ssim_check_sizes(preds.shape, kernel_size, betas)
+    dtype = _image_dtype(preds)
+    if device is None:
+        device = preds.device if isinstance(preds, Tensor) else torch.device("cpu")
+    read_preds = _region_reader(preds, dtype, device)
+    read_target = _region_reader(target, dtype, device)
+
+    mcs_list: List[Tensor] = []
+    for scale in range(len(betas)):
+        sizes = [n // 2**scale for n in preds.shape[2:]]
+        scale_tile_size = [-(-t // 2**scale) for t in tile_shape]
+        sim, contrast_sensitivity = _ssim_tiled_means(
+            _pooled_region_reader(read_preds, scale),
+            _pooled_region_reader(read_target, scale),
+            sizes,
+            scale_tile_size,
+            gaussian_kernel,
+            sigma,
+            kernel_size,
+            data_range,
+            k1,
+            k2,
+            dtype,
+            device,
+            return_contrast_sensitivity=True,
+        )
+        assert contrast_sensitivity is not None  # noqa: S101  # needed for mypy
+        if normalize == "relu":
+            sim = torch.relu(sim)
+            contrast_sensitivity = torch.relu(contrast_sensitivity)
+        mcs_list.append(contrast_sensitivity)
+
+    mcs_list[-1] = sim
+    return _multiscale_ssim_combine(mcs_list, betas, normalize)
+
+
 def _multiscale_ssim_compute(
     mcs_per_image: Tensor,
     reduction: Literal["elementwise_mean", "sum", "none", None] = "elementwise_mean",
@@ -457,6 +773,7 @@ def multiscale_structural_similarity_index_measure(
     k2: float = 0.03,
     betas: Tuple[float, ...] = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333),
     normalize: Optional[Literal["relu", "simple"]] = "relu",
+    tile_size: Optional[Union[int, Sequence[int]]] = None,
 ) -> Tensor:
     """Compute `MultiScaleSSIM`_, Multi-scale Structural Similarity Index Measure.
 
@@ -485,6 +802,9 @@ def multiscale_structural_similarity_index_measure(
         normalize: When MultiScaleSSIM loss is used for training, it is desirable to use normalizes to improve the
             training stability. This `normalize` argument is out of scope of the original implementation [1], and it is
             adapted from https://github.com/jorge-pessoa/pytorch-msssim instead.
+        tile_size: If set, every scale is computed in tiles of this size at full resolution (one value or one per
+            spatial dimension), which bounds the peak memory for very large images and volumes while giving the same
+            result. ``preds`` and ``target`` can then also be ``numpy`` arrays, e.g. ``numpy.memmap``.
 
     Return:
         Tensor with Multi-Scale SSIM score
@@ -521,6 +841,12 @@ def multiscale_structural_similarity_index_measure(
     if normalize and normalize not in ("relu", "simple"):
         raise ValueError("Argument `normalize` to be expected either `None` or one of 'relu' or 'simple'")
 
+    if tile_size is not None:
+        mcs_per_image = _multiscale_ssim_update_tiled(
+            preds, target, tile_size, gaussian_kernel, sigma, kernel_size, data_range, k1, k2, betas, normalize
+        )
+        return _multiscale_ssim_compute(mcs_per_image, reduction)
+
     preds, target = _ssim_check_inputs(preds, target)
     mcs_per_image = _multiscale_ssim_update(
         preds, target, gaussian_kernel, sigma, kernel_size, data_range, k1, k2, betas, normalize
@@ -1,8 +1,13 @@
-from typing import Sequence, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 from torch.nn import functional as F  # noqa: N812
+from typing_extensions import Literal
+
+_RegionReader = Callable[[Sequence[int], Sequence[int]], Tensor]
 
 
 def _gaussian(kernel_size: int, sigma: float, dtype: torch.dtype, device: Union[torch.device, str]) -> Tensor:
@@ -24,6 +29,57 @@ def _gaussian(kernel_size: int, sigma: float, dtype: torch.dtype, device: Union[
     return (gauss / gauss.sum()).unsqueeze(dim=0)  # (1, kernel_size)
 
 
+@lru_cache(maxsize=32)
+def _gaussian_weights(kernel_size: int, sigma: float) -> Tuple[float, ...]:
+    """Compute the weights of a 1D gaussian kernel, cached per size and sigma.
+
+    Only Python floats are cached, so that no tensor is shared between calls, which could be an inference tensor or
+    keep device memory alive.
+
+    """
+    return tuple(_gaussian(kernel_size, sigma, torch.float64, "cpu").squeeze(0).tolist())
+
+
+def _gaussian_1d(kernel_size: int, sigma: float, dtype: torch.dtype, device: Union[torch.device, str]) -> Tensor:
+    """Compute 1D gaussian kernel of shape ``(kernel_size,)`` from the cached weights.
+
+    Example:
+        >>> _gaussian_1d(3, 1, torch.float, 'cpu')
+        tensor([0.2741, 0.4519, 0.2741])
+
+    """
+    return torch.tensor(_gaussian_weights(kernel_size, sigma), dtype=dtype, device=device)
+
+
+def _separable_filter(inputs: Tensor, kernels: Sequence[Tensor]) -> Tensor:
+    """Filter the trailing spatial dimensions of the input with a separable kernel, without padding.
+
+    The kernel is given as one 1D kernel per spatial dimension. Each of them is applied as a weighted sum of shifted
+    views of the input, which takes ``K`` instead of ``K**2`` (``K**3`` for volumes) multiply-adds per element for a
+    kernel of size ``K``, and the same kernel is applied to all batch and channel elements.
+
+    Args:
+        inputs: tensor of shape ``(..., *spatial)``
+        kernels: 1D kernels, one for each of the ``len(kernels)`` last dimensions of ``inputs``
+
+    Example:
+        >>> x = torch.arange(16, dtype=torch.float).reshape(1, 1, 4, 4)
+        >>> _separable_filter(x, [torch.ones(3) / 3, torch.ones(3) / 3])
+        tensor([[[[ 5.,  6.],
+                  [ 9., 10.]]]])
+
+    """
+    for i in reversed(range(len(kernels))):
+        kernel = kernels[i]
+        dim = inputs.ndim - len(kernels) + i
+        size = inputs.shape[dim] - kernel.shape[0] + 1
+        out = inputs.narrow(dim, 0, size) * kernel[0]
+        for k in range(1, kernel.shape[0]):
+            out = out.addcmul_(inputs.narrow(dim, k, size), kernel[k])
+        inputs = out
+    return inputs
+
+
 def _gaussian_kernel_2d(
     channel: int,
     kernel_size: Sequence[int],
@@ -170,3 +226,108 @@ def _reflection_pad_3d(inputs: Tensor, pad_h: int, pad_w: int, pad_d: int) -> Te
 
     """
     return F.pad(inputs, (pad_h, pad_h, pad_w, pad_w, pad_d, pad_d), mode="reflect")
+
+
+def _tile_ranges(start: int, stop: int, tile_size: int) -> List[Tuple[int, int]]:
+    """Split the range ``[start, stop)`` into consecutive ranges of at most ``tile_size`` elements."""
+    return [(i, min(i + tile_size, stop)) for i in range(start, stop, tile_size)]
+
+
+def _tile_grid(
+    starts: Sequence[int], stops: Sequence[int], tile_size: Sequence[int]
+) -> List[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    """Split a (multi-dimensional) region into tiles, returned as a list of ``(tile_starts, tile_stops)``."""
+    tiles: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = [((), ())]
+    for start, stop, size in zip(starts, stops, tile_size):
+        tiles = [((*a, i), (*b, j)) for a, b in tiles for i, j in _tile_ranges(start, stop, size)]
+    return tiles
+
+
+def _check_same_image_shape(preds: Union[Tensor, np.ndarray], target: Union[Tensor, np.ndarray]) -> None:
+    """Check that two images, given as tensors or (memory-mapped) arrays, have the same shape."""
+    if preds.shape != target.shape:
+        raise RuntimeError(
+            f"Predictions and targets are expected to have the same shape, but got {preds.shape} and {target.shape}."
+        )
+
+
+def _check_tile_size(tile_size: Union[int, Sequence[int]], ndim: int) -> Tuple[int, ...]:
+    """Check the ``tile_size`` argument and expand it to one value per spatial dimension."""
+    if isinstance(tile_size, int):
+        tile_size = ndim * [tile_size]
+    if len(tile_size) != ndim or not all(isinstance(t, int) and t > 0 for t in tile_size):
+        raise ValueError(
+            f"Expected argument `tile_size` to be a positive integer or a sequence of {ndim} positive integers,"
+            f" but got {tile_size}"
+        )
+    return tuple(tile_size)
+
+
+def _region_reader(
+    image: Union[Tensor, np.ndarray], dtype: Optional[torch.dtype] = None, device: Optional[torch.device] = None
+) -> _RegionReader:
+    """Create a function reading regions of the trailing spatial dimensions of a tensor or (memory-mapped) array.
+
+    Only the requested region of a ``numpy`` array, for example a ``numpy.memmap``, is read and converted to a tensor.
+
+    """
+
+    def read(starts: Sequence[int], stops: Sequence[int]) -> Tensor:
+        index: Tuple[Any, ...] = (..., *(slice(a, b) for a, b in zip(starts, stops)))
+        region = image[index]
+        if not isinstance(region, Tensor):
+            region = torch.from_numpy(np.ascontiguousarray(region))
+        return region.to(dtype=dtype, device=device)
+
+    return read
+
+
+def _read_padded_region(
+    read: _RegionReader,
+    sizes: Sequence[int],
+    starts: Sequence[int],
+    stops: Sequence[int],
+    mode: Literal["reflect", "symmetric", "constant"] = "reflect",
+) -> Tensor:
+    """Read the region ``[starts, stops)`` of an image that is virtually padded on all sides.
+
+    The region may exceed the image of spatial size ``sizes``, in which case the missing values are filled in the same
+    way as padding the whole image would: ``"reflect"`` mirrors without repeating the edge (as ``F.pad``),
+    ``"symmetric"`` mirrors including the edge and ``"constant"`` fills zeros.
+
+    """
+    if mode == "constant":
+        inner_starts = [min(max(a, 0), n) for a, n in zip(starts, sizes)]
+        inner_stops = [max(min(b, n), a) for b, n, a in zip(stops, sizes, inner_starts)]
+        region = read(inner_starts, inner_stops)
+        pad: List[int] = []
+        for a, b, ia, ib in zip(starts, stops, inner_starts, inner_stops):
+            pad = [ia - a, b - ib, *pad]
+        return F.pad(region, pad) if any(pad) else region
+
+    indices = []
+    for a, b, n in zip(starts, stops, sizes):
+        idx = torch.arange(a, b)
+        if mode == "reflect":
+            idx = idx.abs()
+            idx = torch.where(idx >= n, 2 * (n - 1) - idx, idx)
+        else:
+            idx = torch.where(idx < 0, -idx - 1, idx)
+            idx = torch.where(idx >= n, 2 * n - 1 - idx, idx)
+        indices.append(idx)
+    region = read([int(i.min()) for i in indices], [int(i.max()) + 1 for i in indices])
+    for dim, idx in zip(range(region.ndim - len(sizes), region.ndim), indices):
+        local = idx - idx.min()
+        if not torch.equal(local, torch.arange(len(idx))):
+            region = region.index_select(dim, local.to(region.device))
+    return region
+
+
+def _tiled_min_max(read: _RegionReader, sizes: Sequence[int], tile_size: Sequence[int]) -> Tuple[Tensor, Tensor]:
+    """Compute the minimum and maximum of an image by reading it tile by tile."""
+    min_val, max_val = None, None
+    for starts, stops in _tile_grid([0] * len(sizes), sizes, tile_size):
+        region = read(starts, stops)
+        min_val = region.min() if min_val is None else torch.minimum(min_val, region.min())
+        max_val = region.max() if max_val is None else torch.maximum(max_val, region.max())
+    return min_val, max_val  # type: ignore[return-value]
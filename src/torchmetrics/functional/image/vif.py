@@ -11,10 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
 import torch
 from torch import Tensor
 from torch.nn.functional import conv2d
 
+from torchmetrics.functional.image.utils import (
+    _check_same_image_shape,
+    _check_tile_size,
+    _region_reader,
+    _tile_grid,
+)
 from torchmetrics.utilities.distributed import reduce
 
 
@@ -30,6 +39,44 @@ def _filter(win_size: float, sigma: float, dtype: torch.dtype, device: torch.dev
     return g
 
 
+def _vif_scale_sums(
+    preds: Tensor, target: Tensor, kernel: Tensor, eps: Tensor, sigma_n_sq: Tensor
+) -> Tuple[Tensor, Tensor]:
+    """Compute the sums of the information of ``preds`` and ``target`` over the vif maps of one scale."""
+    mu_target = conv2d(target, kernel)
+    mu_preds = conv2d(preds, kernel)
+    mu_target_sq = mu_target**2
+    mu_preds_sq = mu_preds**2
+    mu_target_preds = mu_target * mu_preds
+
+    sigma_target_sq = torch.clamp(conv2d(target**2, kernel) - mu_target_sq, min=0.0)
+    sigma_preds_sq = torch.clamp(conv2d(preds**2, kernel) - mu_preds_sq, min=0.0)
+    sigma_target_preds = conv2d(target * preds, kernel) - mu_target_preds
+
+    g = sigma_target_preds / (sigma_target_sq + eps)
+    sigma_v_sq = sigma_preds_sq - g * sigma_target_preds
+
+    mask = sigma_target_sq < eps
+    g[mask] = 0
+    sigma_v_sq[mask] = sigma_preds_sq[mask]
+    sigma_target_sq[mask] = 0
+
+    mask = sigma_preds_sq < eps
+    g[mask] = 0
+    sigma_v_sq[mask] = 0
+
+    mask = g < 0
+    sigma_v_sq[mask] = sigma_preds_sq[mask]
+    g[mask] = 0
+    sigma_v_sq = torch.clamp(sigma_v_sq, min=eps)
+
+    preds_vif_scale = torch.log10(1.0 + (g**2.0) * sigma_target_sq / (sigma_v_sq + sigma_n_sq))
+    return (
+        torch.sum(preds_vif_scale, dim=[1, 2, 3]),
+        torch.sum(torch.log10(1.0 + sigma_target_sq / sigma_n_sq), dim=[1, 2, 3]),
+    )
+
+
 def _vif_per_channel(preds: Tensor, target: Tensor, sigma_n_sq: float) -> Tensor:
     dtype = preds.dtype
     device = preds.device
@@ -50,46 +97,96 @@ def _vif_per_channel(preds: Tensor, target: Tensor, sigma_n_sq: float) -> Tensor
             target = conv2d(target, kernel)[:, :, ::2, ::2]
             preds = conv2d(preds, kernel)[:, :, ::2, ::2]
 
-        mu_target = conv2d(target, kernel)
-        mu_preds = conv2d(preds, kernel)
-        mu_target_sq = mu_target**2
-        mu_preds_sq = mu_preds**2
-        mu_target_preds = mu_target * mu_preds
-
-        sigma_target_sq = torch.clamp(conv2d(target**2, kernel) - mu_target_sq, min=0.0)
-        sigma_preds_sq = torch.clamp(conv2d(preds**2, kernel) - mu_preds_sq, min=0.0)
-        sigma_target_preds = conv2d(target * preds, kernel) - mu_target_preds
+        preds_vif_scale, target_vif_scale = _vif_scale_sums(preds, target, kernel, eps, sigma_n_sq)
+        preds_vif = preds_vif + preds_vif_scale
+        target_vif = target_vif + target_vif_scale
+    return preds_vif / target_vif
 
-        g = sigma_target_preds / (sigma_target_sq + eps)
-        sigma_v_sq = sigma_preds_sq - g * sigma_target_preds
 
-        mask = sigma_target_sq < eps
-        g[mask] = 0
-        sigma_v_sq[mask] = sigma_preds_sq[mask]
-        sigma_target_sq[mask] = 0
+def _vif_update_tiled(
+    preds: Union[Tensor, np.ndarray],
+    target: Union[Tensor, np.ndarray],
+    sigma_n_sq: float,
+    tile_size: Union[int, Sequence[int]],
+    device: Optional[torch.device] = None,
+) -> Tensor:
+    """Compute the vif-p score of every image and channel like ``_vif_per_channel``, but tile by tile.
 
-        mask = sigma_preds_sq < eps
-        g[mask] = 0
-        sigma_v_sq[mask] = 0
+    A tile of the vif maps of a scale is computed from the region of the input images that it depends on through the
+    filtering and downsampling of the previous scales, such that the full images are never held in memory. The tile
+    size of a scale is ``tile_size`` divided by its downsampling factor.
 
-        mask = g < 0
-        sigma_v_sq[mask] = sigma_preds_sq[mask]
-        g[mask] = 0
-        sigma_v_sq = torch.clamp(sigma_v_sq, min=eps)
+    Args:
+        preds: predicted images of shape ``(N,C,H,W)``, a tensor or a (memory-mapped) ``numpy`` array
+        target: ground truth images of shape ``(N,C,H,W)``, a tensor or a (memory-mapped) ``numpy`` array
+        sigma_n_sq: variance of the visual noise
+        tile_size: size of the tiles at full resolution, either one value or one per spatial dimension
+        device: device of the tiles, by default the device of ``preds`` if it is a tensor and cpu otherwise
 
-        preds_vif_scale = torch.log10(1.0 + (g**2.0) * sigma_target_sq / (sigma_v_sq + sigma_n_sq))
-        preds_vif = preds_vif + torch.sum(preds_vif_scale, dim=[1, 2, 3])
-        target_vif = target_vif + torch.sum(torch.log10(1.0 + sigma_target_sq / sigma_n_sq), dim=[1, 2, 3])
-    return preds_vif / target_vif
+    Returns:
+        Tensor of shape ``(N, C)`` with the vif-p score of every image and channel
 
+    """
+    _check_same_image_shape(preds, target)
+    tile_shape = _check_tile_size(tile_size, 2)
+    if isinstance(preds, Tensor):
+        dtype = preds.dtype
+        device = preds.device if device is None else device
+    else:
+        dtype = torch.from_numpy(np.empty(0, dtype=preds.dtype)).dtype
+        device = torch.device("cpu") if device is None else device
+    read_preds, read_target = _region_reader(preds, dtype, device), _region_reader(target, dtype, device)
+    batch_size, channels = preds.shape[:2]
 
-def visual_information_fidelity(preds: Tensor, target: Tensor, sigma_n_sq: float = 2.0) -> Tensor:
+    eps = torch.tensor(1e-10, dtype=dtype, device=device)
+    sigma_n_sq = torch.tensor(sigma_n_sq, dtype=dtype, device=device)
+    kernel_sizes = [2 ** (4 - scale) + 1 for scale in range(4)]
+    kernels = [_filter(float(n), n / 5, dtype=dtype, device=device)[None, None, :] for n in kernel_sizes]
+
+    # spatial size of the (downsampled) images of every scale
+    sizes = [list(preds.shape[2:])]
+    for n in kernel_sizes[1:]:
+        sizes.append([-(-(size - n + 1) // 2) for size in sizes[-1]])
+
+    preds_vif = torch.zeros(batch_size * channels, dtype=torch.float64, device=device)
+    target_vif = torch.zeros(batch_size * channels, dtype=torch.float64, device=device)
+    for scale, n in enumerate(kernel_sizes):
+        scale_tile_size = [-(-t // 2**scale) for t in tile_shape]
+        for starts, stops in _tile_grid([0, 0], [size - n + 1 for size in sizes[scale]], scale_tile_size):
+            # region of the images of every scale that the tile depends on, from the current scale down to the input
+            regions = [(list(starts), [b + n - 1 for b in stops])]
+            for prev in range(scale, 0, -1):
+                a, b = regions[-1]
+                regions.append(([2 * x for x in a], [2 * (y - 1) + kernel_sizes[prev] for y in b]))
+
+            shape = [b - a for a, b in zip(*regions[-1])]
+            tile_preds = read_preds(*regions[-1]).reshape(batch_size * channels, 1, *shape)
+            tile_target = read_target(*regions[-1]).reshape(batch_size * channels, 1, *shape)
+            for prev in range(1, scale + 1):
+                tile_preds = conv2d(tile_preds, kernels[prev])[:, :, ::2, ::2]
+                tile_target = conv2d(tile_target, kernels[prev])[:, :, ::2, ::2]
+
+            preds_vif_tile, target_vif_tile = _vif_scale_sums(tile_preds, tile_target, kernels[scale], eps, sigma_n_sq)
+            preds_vif += preds_vif_tile.double()
+            target_vif += target_vif_tile.double()
+    return (preds_vif / target_vif).to(dtype).reshape(batch_size, channels)
+
+
+def visual_information_fidelity(
+    preds: Tensor,
+    target: Tensor,
+    sigma_n_sq: float = 2.0,
+    tile_size: Optional[Union[int, Sequence[int]]] = None,
+) -> Tensor:
     """Compute Pixel Based Visual Information Fidelity (VIF_).
 
     Args:
         preds: predicted images of shape ``(N,C,H,W)``. ``(H, W)`` has to be at least ``(41, 41)``.
         target: ground truth images of shape ``(N,C,H,W)``. ``(H, W)`` has to be at least ``(41, 41)``
         sigma_n_sq: variance of the visual noise
+        tile_size: If set, the vif maps of every scale are computed in tiles of this size at full resolution, which
+            bounds the peak memory for very large images while giving the same result. ``preds`` and ``target`` can
+            then also be ``numpy`` arrays, e.g. ``numpy.memmap``, from which only the required regions are read.
 
     Return:
         Tensor with vif-p score
@@ -103,13 +200,18 @@ def visual_information_fidelity(preds: Tensor, target: Tensor, sigma_n_sq: float
     # https://github.com/photosynthesis-team/piq/blob/01e16b7d8c76bc8765fb6a69560d806148b8046a/piq/vif.py and
     # https://github.com/andrewekhalel/sewar/blob/ac76e7bc75732fde40bb0d3908f4b6863400cc27/sewar/full_ref.py#L357.
 
-    if preds.size(-1) < 41 or preds.size(-2) < 41:
-        raise ValueError(f"Invalid size of preds. Expected at least 41x41, but got {preds.size(-1)}x{preds.size(-2)}!")
+    if preds.shape[-1] < 41 or preds.shape[-2] < 41:
+        raise ValueError(
+            f"Invalid size of preds. Expected at least 41x41, but got {preds.shape[-1]}x{preds.shape[-2]}!"
+        )
 
-    if target.size(-1) < 41 or target.size(-2) < 41:
+    if target.shape[-1] < 41 or target.shape[-2] < 41:
         raise ValueError(
-            f"Invalid size of target. Expected at least 41x41, but got {target.size(-1)}x{target.size(-2)}!"
+            f"Invalid size of target. Expected at least 41x41, but got {target.shape[-1]}x{target.shape[-2]}!"
         )
 
+    if tile_size is not None:
+        return reduce(_vif_update_tiled(preds, target, sigma_n_sq, tile_size), "elementwise_mean")
+
     per_channel = [_vif_per_channel(preds[:, i, :, :], target[:, i, :, :], sigma_n_sq) for i in range(preds.size(1))]
     return reduce(torch.cat(per_channel), "elementwise_mean")
@@ -16,7 +16,11 @@ from typing import TYPE_CHECKING, Dict, List, Literal, Tuple, Union
 import torch
 from torch import Tensor
 
-from torchmetrics.functional.multimodal.clip_score import _get_clip_model_and_processor
+from torchmetrics.functional.multimodal.clip_score import (
+    _clip_preprocess_images,
+    _clip_text_features,
+    _get_clip_model_and_processor,
+)
 from torchmetrics.utilities.checks import _SKIP_SLOW_DOCTEST, _try_proceed_with_timeout
 from torchmetrics.utilities.imports import _PIQ_GREATER_EQUAL_0_8, _TRANSFORMERS_GREATER_EQUAL_4_10
 
@@ -159,20 +163,15 @@ def _clip_iqa_get_anchor_vectors(
         device: The device to use for the calculation
 
     """
-    if model_name_or_path == "clip_iqa":
-        text_processed = processor(text=prompts_list)
-        anchors_text = torch.zeros(
-            len(prompts_list), processor.tokenizer.model_max_length, dtype=torch.long, device=device
-        )
-        for i, tp in enumerate(text_processed["input_ids"]):
-            anchors_text[i, : len(tp)] = torch.tensor(tp, dtype=torch.long, device=device)
-
-        anchors = model.encode_text(anchors_text).float()
-    else:
-        text_processed = processor(text=prompts_list, return_tensors="pt", padding=True)
-        anchors = model.get_text_features(
-            text_processed["input_ids"].to(device), text_processed["attention_mask"].to(device)
-        )
+    if model_name_or_path != "clip_iqa":
+        return _clip_text_features(prompts_list, model, processor, torch.device(device))
+
+    text_processed = processor(text=prompts_list)
+    anchors_text = torch.zeros(len(prompts_list), processor.tokenizer.model_max_length, dtype=torch.long, device=device)
+    for i, tp in enumerate(text_processed["input_ids"]):
+        anchors_text[i, : len(tp)] = torch.tensor(tp, dtype=torch.long, device=device)
+
+    anchors = model.encode_text(anchors_text).float()
     return anchors / anchors.norm(p=2, dim=-1, keepdim=True)
 
 
@@ -194,8 +193,7 @@ def _clip_iqa_update(
         images = (images - default_mean) / default_std
         img_features = model.encode_image(images.float(), pos_embedding=False).float()
     else:
-        processed_input = processor(images=[i.cpu() for i in images], return_tensors="pt", padding=True)
-        img_features = model.get_image_features(processed_input["pixel_values"].to(device))
+        img_features = model.get_image_features(_clip_preprocess_images(images, processor))
     return img_features / img_features.norm(p=2, dim=-1, keepdim=True)
 
 
@@ -11,15 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, List, Tuple, Union
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 import torch
 from torch import Tensor
+from torch.nn import functional as F  # noqa: N812
 from typing_extensions import Literal
 
 from torchmetrics.utilities import rank_zero_warn
 from torchmetrics.utilities.checks import _SKIP_SLOW_DOCTEST, _try_proceed_with_timeout
-from torchmetrics.utilities.imports import _TRANSFORMERS_GREATER_EQUAL_4_10
+from torchmetrics.utilities.imports import _TORCH_GREATER_EQUAL_1_11, _TRANSFORMERS_GREATER_EQUAL_4_10
 
 if TYPE_CHECKING and _TRANSFORMERS_GREATER_EQUAL_4_10:
     from transformers import CLIPModel as _CLIPModel
@@ -41,11 +43,157 @@ else:
     _CLIPProcessor = None
 
 
+def _clip_image_processor_config(processor: _CLIPProcessor) -> Tuple[Any, Any, Optional[float], Any]:
+    """Read the resize, crop, rescale and normalization settings from the image processor of ``processor``.
+
+    Settings of steps the processor skips are ``None``.
+
+    """
+    image_processor = getattr(processor, "image_processor", None) or processor.feature_extractor
+
+    def _size(size: Any, default_to_shortest_edge: bool) -> Tuple[str, Tuple[int, ...]]:
+        if isinstance(size, int):
+            return ("shortest_edge", (size,)) if default_to_shortest_edge else ("exact", (size, size))
+        if "shortest_edge" in size:
+            return "shortest_edge", (size["shortest_edge"],)
+        return "exact", (size["height"], size["width"])
+
+    resize = _size(image_processor.size, True) if image_processor.do_resize else None
+    crop = _size(image_processor.crop_size, False)[1] if image_processor.do_center_crop else None
+    rescale = None
+    if getattr(image_processor, "do_rescale", True):
+        rescale = getattr(image_processor, "rescale_factor", 1 / 255)
+    normalize = (image_processor.image_mean, image_processor.image_std) if image_processor.do_normalize else None
+    return resize, crop, rescale, normalize
+
+
+def _resize_like_pil(images: Tensor, size: Tuple[int, int]) -> Tensor:
+    """Resize a batch of images with bicubic interpolation the way PIL, and therefore the HuggingFace processor, does.
+
+    PIL resizes the width and the height in two separate antialiased passes and stores the intermediate image as
+    ``uint8``, which clips the overshoot of the bicubic kernel. Both passes are done here in the same order, clipped to
+    ``[0, 255]`` (``[0, 1]`` for floating point images in that range) and rounded for integer images, which reproduces
+    the processor up to two gray levels.
+
+    """
+    is_integer = not images.is_floating_point()
+    images = images.float()
+    max_value = images.new_tensor(255.0)
+    if not is_integer:
+        max_value = torch.where(images.amax() <= 1, images.new_tensor(1.0), max_value)
+    for pass_size in [(images.shape[-2], size[1]), size]:
+        if tuple(images.shape[-2:]) == pass_size:
+            continue
+        images = F.interpolate(images, size=pass_size, mode="bicubic", align_corners=False, antialias=True)
+        images = torch.minimum(images.clamp(min=0), max_value)
+        if is_integer:
+            images = images.round()
+    return images
+
+
+def _clip_preprocess_images(images: Union[Tensor, List[Tensor]], processor: _CLIPProcessor) -> Tensor:
+    """Resize, center crop and normalize the images on their own device like the image processor of ``processor``.
+
+    Images of the same shape are processed as one batch. Older versions of torch, which cannot do antialiased bicubic
+    interpolation, fall back to the processor itself.
+
+    """
+    device = images[0].device
+    if not _TORCH_GREATER_EQUAL_1_11:
+        return processor(images=[i.cpu() for i in images], return_tensors="pt")["pixel_values"].to(device)
+
+    resize, crop, rescale, normalize = _clip_image_processor_config(processor)
+    if isinstance(images, Tensor):
+        batches = [images]
+    elif all(i.shape == images[0].shape for i in images):
+        batches = [torch.stack(images)]
+    else:
+        batches = [i[None] for i in images]
+    pixel_values = []
+    for batch in batches:
+        height, width = batch.shape[-2:]
+        if resize is not None and resize[0] == "shortest_edge":
+            short, long = min(height, width), max(height, width)
+            new_short, new_long = resize[1][0], int(resize[1][0] * long / short)
+            batch = _resize_like_pil(batch, (new_long, new_short) if width <= height else (new_short, new_long))
+        elif resize is not None:
+            batch = _resize_like_pil(batch, resize[1])
+        batch = batch.float()
+        if crop is not None:
+            top, left = (batch.shape[-2] - crop[0]) // 2, (batch.shape[-1] - crop[1]) // 2
+            batch = batch[..., top : top + crop[0], left : left + crop[1]]
+        if rescale is not None:
+            batch = batch * rescale
+        if normalize is not None:
+            mean = torch.tensor(normalize[0], device=device).view(1, -1, 1, 1)
+            std = torch.tensor(normalize[1], device=device).view(1, -1, 1, 1)
+            batch = (batch - mean) / std
+        pixel_values.append(batch)
+    return torch.cat(pixel_values)
+
+
+def _clip_text_features(text: List[str], model: _CLIPModel, processor: _CLIPProcessor, device: torch.device) -> Tensor:
+    """Compute the normalized CLIP embeddings of a list of captions."""
+    processed_input = processor(text=text, return_tensors="pt", padding=True)
+
+    max_position_embeddings = model.config.text_config.max_position_embeddings
+    if processed_input["attention_mask"].shape[-1] > max_position_embeddings:
+        rank_zero_warn(
+            f"Encountered caption longer than {max_position_embeddings=}. Will truncate captions to this length."
+            "If longer captions are needed, initialize argument `model_name_or_path` with a model that supports"
+            "longer sequences",
+            UserWarning,
+        )
+        processed_input["attention_mask"] = processed_input["attention_mask"][..., :max_position_embeddings]
+        processed_input["input_ids"] = processed_input["input_ids"][..., :max_position_embeddings]
+
+    txt_features = model.get_text_features(
+        processed_input["input_ids"].to(device), processed_input["attention_mask"].to(device)
+    )
+    return txt_features / txt_features.norm(p=2, dim=-1, keepdim=True)
+
+
+class _CLIPTextEmbeddingCache:
+    """Least recently used cache of the normalized CLIP text embeddings, keyed by the caption.
+
+    Only captions that are not in the cache are tokenized and embedded, each unique caption once per call. The text
+    encoder attends to the caption tokens only, so the embedding of a caption does not depend on the other captions
+    it is padded with. The cached embeddings are detached, the cache is only meant for evaluation.
+
+    Args:
+        max_size: Maximum number of captions to keep
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._embeddings: "OrderedDict[str, Tensor]" = OrderedDict()
+
+    def __call__(self, text: List[str], model: _CLIPModel, processor: _CLIPProcessor, device: torch.device) -> Tensor:
+        """Return the normalized embeddings of ``text`` as a tensor of shape ``(len(text), embedding_dim)``."""
+        missing = [t for t in dict.fromkeys(text) if t not in self._embeddings]
+        if missing:
+            with torch.no_grad():
+                txt_features = _clip_text_features(missing, model, processor, device)
+            self._embeddings.update(zip(missing, txt_features))
+        for t in text:
+            self._embeddings.move_to_end(t)
+        txt_features = torch.stack([self._embeddings[t] for t in text]).to(device)
+        while len(self._embeddings) > self.max_size:
+            self._embeddings.popitem(last=False)
+        return txt_features
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        self._embeddings.clear()
+
+
 def _clip_score_update(
     images: Union[Tensor, List[Tensor]],
     text: Union[str, List[str]],
     model: _CLIPModel,
     processor: _CLIPProcessor,
+    text_embedding_cache: Optional[_CLIPTextEmbeddingCache] = None,
 ) -> Tuple[Tensor, int]:
     if not isinstance(images, list):
         if images.ndim == 3:
@@ -64,26 +212,12 @@ def _clip_score_update(
             f"Expected the number of images and text examples to be the same but got {len(images)} and {len(text)}"
         )
     device = images[0].device
-    processed_input = processor(text=text, images=[i.cpu() for i in images], return_tensors="pt", padding=True)
-
-    img_features = model.get_image_features(processed_input["pixel_values"].to(device))
+    img_features = model.get_image_features(_clip_preprocess_images(images, processor))
     img_features = img_features / img_features.norm(p=2, dim=-1, keepdim=True)
 
-    max_position_embeddings = model.config.text_config.max_position_embeddings
-    if processed_input["attention_mask"].shape[-1] > max_position_embeddings:
-        rank_zero_warn(
-            f"Encountered caption longer than {max_position_embeddings=}. Will truncate captions to this length."
-            "If longer captions are needed, initialize argument `model_name_or_path` with a model that supports"
-            "longer sequences",
-            UserWarning,
-        )
-        processed_input["attention_mask"] = processed_input["attention_mask"][..., :max_position_embeddings]
-        processed_input["input_ids"] = processed_input["input_ids"][..., :max_position_embeddings]
-
-    txt_features = model.get_text_features(
-        processed_input["input_ids"].to(device), processed_input["attention_mask"].to(device)
-    )
-    txt_features = txt_features / txt_features.norm(p=2, dim=-1, keepdim=True)
+    if text_embedding_cache is None:
+        text_embedding_cache = _CLIPTextEmbeddingCache(max_size=0)
+    txt_features = text_embedding_cache(text, model, processor, device)
 
     # cosine similarity between feature vectors
     score = 100 * (img_features * txt_features).sum(axis=-1)
@@ -11,50 +11,66 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import torch
-from torch import Tensor, tensor
+from torch import Tensor
 
-from torchmetrics.utilities.checks import _check_retrieval_functional_inputs
+from torchmetrics.utilities.checks import (
+    _check_retrieval_functional_inputs,
+    _check_retrieval_top_k,
+    _retrieval_top_k_list,
+)
 
 
-def retrieval_average_precision(preds: Tensor, target: Tensor, top_k: Optional[int] = None) -> Tensor:
+def retrieval_average_precision(
+    preds: Tensor, target: Tensor, top_k: Optional[Union[int, Sequence[int]]] = None
+) -> Tensor:
     """Compute average precision (for information retrieval), as explained in `IR Average precision`_.
 
     ``preds`` and ``target`` should be of the same shape and live on the same device. If no ``target`` is ``True``,
     ``0`` is returned. ``target`` must be either `bool` or `integers` and ``preds`` must be ``float``,
-    otherwise an error is raised.
+    otherwise an error is raised. Passing a list of integers as ``top_k`` evaluates all the cutoffs with a single sort
+    of the documents.
 
     Args:
         preds: estimated probabilities of each document to be relevant.
         target: ground truth about each document being relevant or not.
-        top_k: consider only the top k elements (default: ``None``, which considers them all)
+        top_k: consider only the top k elements (default: ``None``, which considers them all). Can also be a list of
+            cutoffs, in which case the average precision at every cutoff is returned.
 
     Return:
         a single-value tensor with the average precision (AP) of the predictions ``preds`` w.r.t. the labels ``target``.
+        If ``top_k`` is a list, a tensor with one value per cutoff (in the same order) is returned.
 
     Raises:
         ValueError:
-            If ``top_k`` is not ``None`` or an integer larger than 0.
+            If ``top_k`` is not ``None``, an integer larger than 0 or a list of such integers.
 
     Example:
+        >>> from torch import tensor
         >>> from torchmetrics.functional.retrieval import retrieval_average_precision
         >>> preds = tensor([0.2, 0.3, 0.5])
         >>> target = tensor([True, False, True])
         >>> retrieval_average_precision(preds, target)
         tensor(0.8333)
+        >>> retrieval_average_precision(preds, target, top_k=[1, 3])
+        tensor([1.0000, 0.8333])
 
     """
     preds, target = _check_retrieval_functional_inputs(preds, target)
 
-    top_k = top_k or preds.shape[-1]
-    if not isinstance(top_k, int) and top_k <= 0:
-        raise ValueError(f"Argument ``top_k`` has to be a positive integer or None, but got {top_k}.")
+    _check_retrieval_top_k(top_k)
+    num_documents = preds.shape[-1]
+    cutoffs = torch.tensor(_retrieval_top_k_list(top_k, num_documents), device=preds.device)
+    max_k = min(int(cutoffs.max()), num_documents)
 
-    target = target[preds.topk(min(top_k, preds.shape[-1]), sorted=True, dim=-1)[1]]
-    if not target.sum():
-        return tensor(0.0, device=preds.device)
+    relevant = target[preds.topk(max_k, sorted=True, dim=-1)[1]] > 0
+    num_relevant = relevant.cumsum(dim=-1)
+    # precision at every relevant position, accumulated so that each cutoff can be read off directly
+    positions = torch.arange(1, max_k + 1, device=preds.device, dtype=torch.float32)
+    precision_sum = torch.where(relevant, num_relevant / positions, 0.0).cumsum(dim=-1)
 
-    positions = torch.arange(1, len(target) + 1, device=target.device, dtype=torch.float32)[target > 0]
-    return torch.div((torch.arange(len(positions), device=positions.device, dtype=torch.float32) + 1), positions).mean()
+    index = cutoffs.clamp(max=max_k) - 1
+    res = precision_sum[index] / num_relevant[index].clamp(min=1)
+    return res if isinstance(top_k, (list, tuple)) else res[0]
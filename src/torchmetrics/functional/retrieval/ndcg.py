@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import torch
 from torch import Tensor
 
-from torchmetrics.utilities.checks import _check_retrieval_functional_inputs
+from torchmetrics.utilities.checks import (
+    _check_retrieval_functional_inputs,
+    _check_retrieval_top_k,
+    _retrieval_top_k_list,
+)
 
 
 def _tie_average_dcg(target: Tensor, preds: Tensor, discount_cumsum: Tensor) -> Tensor:
@@ -25,10 +29,10 @@ def _tie_average_dcg(target: Tensor, preds: Tensor, discount_cumsum: Tensor) ->
     Args:
         target: ground truth about each document relevance.
         preds: estimated probabilities of each document to be relevant.
-        discount_cumsum: cumulative sum of the discount.
+        discount_cumsum: cumulative sum of the discount, with shape ``(num_cutoffs, num_documents)``.
 
     Returns:
-        The cumulative gain of the tied elements.
+        The cumulative gain of the tied elements for every cutoff.
 
     """
     _, inv, counts = torch.unique(-preds, return_inverse=True, return_counts=True)
@@ -36,56 +40,62 @@ def _tie_average_dcg(target: Tensor, preds: Tensor, discount_cumsum: Tensor) ->
     ranked.scatter_add_(0, inv, target.to(dtype=ranked.dtype))
     ranked = ranked / counts
     groups = counts.cumsum(dim=0) - 1
-    discount_sums = torch.zeros_like(counts, dtype=torch.float32)
-    discount_sums[0] = discount_cumsum[groups[0]]
-    discount_sums[1:] = discount_cumsum[groups].diff()
-    return (ranked * discount_sums).sum()
+    discount_sums = torch.zeros(discount_cumsum.shape[0], len(counts), device=counts.device)
+    discount_sums[:, 0] = discount_cumsum[:, groups[0]]
+    discount_sums[:, 1:] = discount_cumsum[:, groups].diff(dim=-1)
+    return (ranked * discount_sums).sum(dim=-1)
 
 
-def _dcg_sample_scores(target: Tensor, preds: Tensor, top_k: int, ignore_ties: bool) -> Tensor:
+def _dcg_sample_scores(target: Tensor, preds: Tensor, top_k: Tensor, ignore_ties: bool) -> Tensor:
     """Translated version of sklearns `_dcg_sample_scores` function.
 
     Args:
         target: ground truth about each document relevance.
         preds: estimated probabilities of each document to be relevant.
-        top_k: consider only the top k elements
+        top_k: tensor of cutoffs, the gain is computed for each of them after a single ranking of the documents
         ignore_ties: If True, ties are ignored. If False, ties are averaged.
 
     Returns:
-        The cumulative gain
+        The cumulative gain for every cutoff
 
     """
     discount = 1.0 / (torch.log2(torch.arange(target.shape[-1], device=target.device) + 2.0))
-    discount[top_k:] = 0.0
+    # discount is truncated independently for each cutoff: ``(num_cutoffs, num_documents)``
+    discount = discount * (torch.arange(target.shape[-1], device=target.device) < top_k.unsqueeze(-1))
 
     if ignore_ties:
         ranking = preds.argsort(descending=True)
         ranked = target[ranking]
-        cumulative_gain = (discount * ranked).sum()
+        cumulative_gain = (discount * ranked).sum(dim=-1)
     else:
         discount_cumsum = discount.cumsum(dim=-1)
         cumulative_gain = _tie_average_dcg(target, preds, discount_cumsum)
     return cumulative_gain
 
 
-def retrieval_normalized_dcg(preds: Tensor, target: Tensor, top_k: Optional[int] = None) -> Tensor:
+def retrieval_normalized_dcg(
+    preds: Tensor, target: Tensor, top_k: Optional[Union[int, Sequence[int]]] = None
+) -> Tensor:
     """Compute `Normalized Discounted Cumulative Gain`_ (for information retrieval).
 
     ``preds`` and ``target`` should be of the same shape and live on the same device.
     ``target`` must be either `bool` or `integers` and ``preds`` must be ``float``,
-    otherwise an error is raised.
+    otherwise an error is raised. Passing a list of integers as ``top_k`` evaluates all the cutoffs with a single
+    ranking of the documents.
 
     Args:
         preds: estimated probabilities of each document to be relevant.
         target: ground truth about each document relevance.
-        top_k: consider only the top k elements (default: ``None``, which considers them all)
+        top_k: consider only the top k elements (default: ``None``, which considers them all). Can also be a list of
+            cutoffs, in which case the nDCG at every cutoff is returned.
 
     Return:
         A single-value tensor with the nDCG of the predictions ``preds`` w.r.t. the labels ``target``.
+        If ``top_k`` is a list, a tensor with one value per cutoff (in the same order) is returned.
 
     Raises:
         ValueError:
-            If ``top_k`` parameter is not `None` or an integer larger than 0
+            If ``top_k`` parameter is not `None`, an integer larger than 0 or a list of such integers.
 
     Example:
         >>> from torchmetrics.functional.retrieval import retrieval_normalized_dcg
@@ -93,21 +103,21 @@ def retrieval_normalized_dcg(preds: Tensor, target: Tensor, top_k: Optional[int]
         >>> target = torch.tensor([10, 0, 0, 1, 5])
         >>> retrieval_normalized_dcg(preds, target)
         tensor(0.6957)
+        >>> retrieval_normalized_dcg(preds, target, top_k=[1, 3, 5])
+        tensor([0.5000, 0.4124, 0.6957])
 
     """
     preds, target = _check_retrieval_functional_inputs(preds, target, allow_non_binary_target=True)
 
-    top_k = preds.shape[-1] if top_k is None else top_k
+    _check_retrieval_top_k(top_k)
+    cutoffs = torch.tensor(_retrieval_top_k_list(top_k, preds.shape[-1]), device=preds.device)
 
-    if not (isinstance(top_k, int) and top_k > 0):
-        raise ValueError("`top_k` has to be a positive integer or None")
-
-    gain = _dcg_sample_scores(target, preds, top_k, ignore_ties=False)
-    normalized_gain = _dcg_sample_scores(target, target, top_k, ignore_ties=True)
+    gain = _dcg_sample_scores(target, preds, cutoffs, ignore_ties=False)
+    normalized_gain = _dcg_sample_scores(target, target, cutoffs, ignore_ties=True)
 
     # filter undefined scores
     all_irrelevant = normalized_gain == 0
     gain[all_irrelevant] = 0
     gain[~all_irrelevant] /= normalized_gain[~all_irrelevant]
 
-    return gain.mean()
+    return gain if isinstance(top_k, (list, tuple)) else gain[0]
@@ -11,14 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Optional, Sequence, Union
 
-from torch import Tensor, tensor
+import torch
+from torch import Tensor
 
-from torchmetrics.utilities.checks import _check_retrieval_functional_inputs
+from torchmetrics.utilities.checks import (
+    _check_retrieval_functional_inputs,
+    _check_retrieval_top_k,
+    _retrieval_top_k_list,
+)
 
 
-def retrieval_precision(preds: Tensor, target: Tensor, top_k: Optional[int] = None, adaptive_k: bool = False) -> Tensor:
+def retrieval_precision(
+    preds: Tensor, target: Tensor, top_k: Optional[Union[int, Sequence[int]]] = None, adaptive_k: bool = False
+) -> Tensor:
     """Compute the precision metric for information retrieval.
 
     Precision is the fraction of relevant documents among all the retrieved documents.
@@ -26,28 +33,33 @@ def retrieval_precision(preds: Tensor, target: Tensor, top_k: Optional[int] = No
     ``preds`` and ``target`` should be of the same shape and live on the same device. If no ``target`` is ``True``,
     ``0`` is returned. ``target`` must be either `bool` or `integers` and ``preds`` must be ``float``,
     otherwise an error is raised. If you want to measure Precision@K, ``top_k`` must be a positive integer.
+    Passing a list of integers as ``top_k`` evaluates all the cutoffs with a single sort of the documents.
 
     Args:
         preds: estimated probabilities of each document to be relevant.
         target: ground truth about each document being relevant or not.
-        top_k: consider only the top k elements (default: ``None``, which considers them all)
+        top_k: consider only the top k elements (default: ``None``, which considers them all). Can also be a list of
+            cutoffs, in which case the precision at every cutoff is returned.
         adaptive_k: adjust `k` to `min(k, number of documents)` for each query
 
     Returns:
         A single-value tensor with the precision (at ``top_k``) of the predictions ``preds`` w.r.t. the labels
-          ``target``.
+          ``target``. If ``top_k`` is a list, a tensor with one value per cutoff (in the same order) is returned.
 
     Raises:
         ValueError:
-            If ``top_k`` is not `None` or an integer larger than 0.
+            If ``top_k`` is not `None`, an integer larger than 0 or a list of such integers.
         ValueError:
             If ``adaptive_k`` is not boolean.
 
     Example:
+        >>> from torch import tensor
         >>> preds = tensor([0.2, 0.3, 0.5])
         >>> target = tensor([True, False, True])
         >>> retrieval_precision(preds, target, top_k=2)
         tensor(0.5000)
+        >>> retrieval_precision(preds, target, top_k=[1, 2, 3])
+        tensor([1.0000, 0.5000, 0.6667])
 
     """
     preds, target = _check_retrieval_functional_inputs(preds, target)
@@ -55,14 +67,16 @@ def retrieval_precision(preds: Tensor, target: Tensor, top_k: Optional[int] = No
     if not isinstance(adaptive_k, bool):
         raise ValueError("`adaptive_k` has to be a boolean")
 
-    if top_k is None or (adaptive_k and top_k > preds.shape[-1]):
-        top_k = preds.shape[-1]
-
-    if not (isinstance(top_k, int) and top_k > 0):
-        raise ValueError("`top_k` has to be a positive integer or None")
+    _check_retrieval_top_k(top_k)
+    num_documents = preds.shape[-1]
+    cutoffs = torch.tensor(_retrieval_top_k_list(top_k, num_documents), device=preds.device)
+    if adaptive_k:
+        cutoffs = cutoffs.clamp(max=num_documents)
 
     if not target.sum():
-        return tensor(0.0, device=preds.device)
-
-    relevant = target[preds.topk(min(top_k, preds.shape[-1]), dim=-1)[1]].sum().float()
-    return relevant / top_k
+        res = torch.zeros(len(cutoffs), device=preds.device)
+    else:
+        max_k = min(int(cutoffs.max()), num_documents)
+        relevant = target[preds.topk(max_k, dim=-1)[1]].cumsum(dim=-1)
+        res = relevant[cutoffs.clamp(max=max_k) - 1].float() / cutoffs
+    return res if isinstance(top_k, (list, tuple)) else res[0]
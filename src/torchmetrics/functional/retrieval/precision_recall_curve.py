@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import torch
 from torch import Tensor
@@ -98,3 +98,95 @@ def retrieval_precision_recall_curve(
     precision = relevant / topk
 
     return precision, recall, topk
+
+
+def _retrieval_pad_queries(
+    preds: Tensor, target: Tensor, split_sizes: Tensor, max_docs: int
+) -> Tuple[Tensor, Tensor, Tensor]:
+    """Scatter the documents of consecutive queries into padded ``(num_queries, max_docs)`` matrices.
+
+    Args:
+        preds: estimated probabilities of each document to be relevant, grouped by query.
+        target: ground truth about each document being relevant or not, grouped by query.
+        split_sizes: number of documents of each query.
+        max_docs: size of the largest query.
+
+    Returns:
+        Padded predictions, where padding is set to ``-inf`` so that it is always ranked last
+        Padded targets, where padding is set to ``0``
+        Boolean mask of the valid (non-padding) positions
+
+    """
+    num_queries = split_sizes.shape[0]
+    query = torch.repeat_interleave(torch.arange(num_queries, device=preds.device), split_sizes)
+    offsets = _cumsum(split_sizes, dim=0) - split_sizes
+    position = torch.arange(preds.shape[0], device=preds.device) - offsets[query]
+
+    padded_preds = preds.new_full((num_queries, max_docs), -float("inf"))
+    padded_target = target.new_zeros((num_queries, max_docs))
+    valid = torch.zeros(num_queries, max_docs, dtype=torch.bool, device=preds.device)
+    padded_preds[query, position] = preds
+    padded_target[query, position] = target
+    valid[query, position] = True
+    return padded_preds, padded_target, valid
+
+
+def _retrieval_precision_recall_curve_padded(
+    preds: Tensor, target: Tensor, valid: Tensor, max_k: int, adaptive_k: bool = False
+) -> Tuple[Tensor, Tensor]:
+    """Compute the precision and recall at every k from 1 to ``max_k`` for a padded batch of queries.
+
+    All queries are ranked with a single sort over the last dimension, after which the relevant documents are
+    accumulated with a single cumulative sum.
+
+    Args:
+        preds: padded predictions of shape ``(num_queries, max_docs)``, see ``_retrieval_pad_queries``.
+        target: padded targets of shape ``(num_queries, max_docs)``.
+        valid: boolean mask of shape ``(num_queries, max_docs)`` with the non-padding positions.
+        max_k: compute recall and precision for all possible top k from 1 to max_k.
+        adaptive_k: adjust `k` to `min(k, number of documents)` for each query.
+
+    Returns:
+        Tensor of shape ``(num_queries, max_k)`` with the precision values for each k
+        Tensor of shape ``(num_queries, max_k)`` with the recall values for each k
+
+    """
+    num_queries, max_docs = preds.shape
+    num_docs = valid.sum(dim=-1, keepdim=True)
+    # a stable sort keeps padding after any valid document, even when both are ``-inf``
+    ranking = torch.sort(preds.masked_fill(~valid, -float("inf")), dim=-1, descending=True, stable=True)[1]
+    relevant = target.gather(-1, ranking[:, : min(max_k, max_docs)]).float()
+    relevant = _cumsum(pad(relevant, (0, max(0, max_k - max_docs)), "constant", 0.0), dim=-1)
+
+    top_k = torch.arange(1, max_k + 1, device=preds.device).expand(num_queries, max_k)
+    if adaptive_k:
+        top_k = torch.minimum(top_k, num_docs)
+
+    recall = relevant / target.sum(dim=-1, keepdim=True).clamp(min=1)
+    precision = relevant / top_k
+    return precision, recall
+
+
+def _retrieval_chunk_queries(split_sizes: List[int], memory_budget: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Split consecutive queries in chunks whose padded ``(queries, documents)`` matrix fits in ``memory_budget``.
+
+    Args:
+        split_sizes: number of documents of each query.
+        memory_budget: maximum number of elements of each padded chunk. ``None`` processes all queries at once. A
+            single query larger than the budget is always processed alone.
+
+    Returns:
+        List of ``(start, end)`` query ranges
+
+    """
+    if memory_budget is None:
+        return [(0, len(split_sizes))]
+
+    chunks, start, max_docs = [], 0, 0
+    for end, size in enumerate(split_sizes):
+        max_docs = max(max_docs, size)
+        if end > start and (end - start + 1) * max_docs > memory_budget:
+            chunks.append((start, end))
+            start, max_docs = end, size
+    chunks.append((start, len(split_sizes)))
+    return chunks
@@ -11,15 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import torch
-from torch import Tensor, tensor
+from torch import Tensor
 
-from torchmetrics.utilities.checks import _check_retrieval_functional_inputs
+from torchmetrics.utilities.checks import (
+    _check_retrieval_functional_inputs,
+    _check_retrieval_top_k,
+    _retrieval_top_k_list,
+)
 
 
-def retrieval_recall(preds: Tensor, target: Tensor, top_k: Optional[int] = None) -> Tensor:
+def retrieval_recall(preds: Tensor, target: Tensor, top_k: Optional[Union[int, Sequence[int]]] = None) -> Tensor:
     """Compute the recall metric for information retrieval.
 
     Recall is the fraction of relevant documents retrieved among all the relevant documents.
@@ -27,37 +31,42 @@ def retrieval_recall(preds: Tensor, target: Tensor, top_k: Optional[int] = None)
     ``preds`` and ``target`` should be of the same shape and live on the same device. If no ``target`` is ``True``,
     ``0`` is returned. ``target`` must be either `bool` or `integers` and ``preds`` must be ``float``,
     otherwise an error is raised. If you want to measure Recall@K, ``top_k`` must be a positive integer.
+    Passing a list of integers as ``top_k`` evaluates all the cutoffs with a single sort of the documents.
 
     Args:
         preds: estimated probabilities of each document to be relevant.
         target: ground truth about each document being relevant or not.
-        top_k: consider only the top k elements (default: `None`, which considers them all)
+        top_k: consider only the top k elements (default: `None`, which considers them all). Can also be a list of
+            cutoffs, in which case the recall at every cutoff is returned.
 
     Returns:
         A single-value tensor with the recall (at ``top_k``) of the predictions ``preds`` w.r.t. the labels ``target``.
+        If ``top_k`` is a list, a tensor with one value per cutoff (in the same order) is returned.
 
     Raises:
         ValueError:
-            If ``top_k`` parameter is not `None` or an integer larger than 0
+            If ``top_k`` parameter is not `None`, an integer larger than 0 or a list of such integers.
 
     Example:
+        >>> from torch import tensor
         >>> from  torchmetrics.functional import retrieval_recall
         >>> preds = tensor([0.2, 0.3, 0.5])
         >>> target = tensor([True, False, True])
         >>> retrieval_recall(preds, target, top_k=2)
         tensor(0.5000)
+        >>> retrieval_recall(preds, target, top_k=[1, 3])
+        tensor([0.5000, 1.0000])
 
     """
     preds, target = _check_retrieval_functional_inputs(preds, target)
 
-    if top_k is None:
-        top_k = preds.shape[-1]
-
-    if not (isinstance(top_k, int) and top_k > 0):
-        raise ValueError("`top_k` has to be a positive integer or None")
+    _check_retrieval_top_k(top_k)
+    num_documents = preds.shape[-1]
+    cutoffs = torch.tensor(_retrieval_top_k_list(top_k, num_documents), device=preds.device)
 
     if not target.sum():
-        return tensor(0.0, device=preds.device)
-
-    relevant = target[torch.argsort(preds, dim=-1, descending=True)][:top_k].sum().float()
-    return relevant / target.sum()
+        res = torch.zeros(len(cutoffs), device=preds.device)
+    else:
+        relevant = target[torch.argsort(preds, dim=-1, descending=True)].cumsum(dim=-1)
+        res = relevant[cutoffs.clamp(max=num_documents) - 1].float() / target.sum()
+    return res if isinstance(top_k, (list, tuple)) else res[0]
@@ -11,7 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from torchmetrics.functional.segmentation.average_surface_distance import average_surface_distance
 from torchmetrics.functional.segmentation.generalized_dice import generalized_dice_score
+from torchmetrics.functional.segmentation.hausdorff_distance import hausdorff_distance
 from torchmetrics.functional.segmentation.mean_iou import mean_iou
+from torchmetrics.functional.segmentation.normalized_surface_dice import normalized_surface_dice
 
-__all__ = ["generalized_dice_score", "mean_iou"]
+__all__ = [
+    "average_surface_distance",
+    "generalized_dice_score",
+    "hausdorff_distance",
+    "mean_iou",
+    "normalized_surface_dice",
+]
@@ -0,0 +1,120 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import torch
+from torch import Tensor
+from typing_extensions import Literal
+
+from torchmetrics.functional.segmentation.utils import (
+    _batched_surface_distances,
+    _surface_distance_format,
+    _surface_distance_validate_args,
+)
+
+
+def _average_surface_distance_validate_args(
+    num_classes: int,
+    include_background: bool,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"],
+    spacing: Optional[Union[Tensor, List[float]]],
+    symmetric: bool,
+    input_format: Literal["one-hot", "index"],
+) -> None:
+    """Validate the arguments of the metric."""
+    _surface_distance_validate_args(num_classes, include_background, distance_metric, spacing, input_format)
+    if not isinstance(symmetric, bool):
+        raise ValueError(f"Expected argument `symmetric` must be a boolean, but got {symmetric}.")
+
+
+def _average_surface_distance_update(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    symmetric: bool = True,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Compute the average surface distance of every sample and class, returned as a tensor of shape ``(B, C)``."""
+    preds, target = _surface_distance_format(preds, target, num_classes, include_background, input_format)
+    edges_preds, edges_target, distances_to_target, distances_to_preds = _batched_surface_distances(
+        preds, target, distance_metric, spacing
+    )
+    reduce_axis = list(range(2, preds.ndim))
+    num_preds, num_target = edges_preds.sum(dim=reduce_axis), edges_target.sum(dim=reduce_axis)
+    total = torch.where(edges_preds, distances_to_target, 0.0).sum(dim=reduce_axis)
+    count = num_preds
+    if symmetric:
+        total = total + torch.where(edges_target, distances_to_preds, 0.0).sum(dim=reduce_axis)
+        count = count + num_target
+
+    score = total / count.clamp(min=1)
+    score = torch.where((num_preds == 0) | (num_target == 0), torch.tensor(float("inf"), device=total.device), score)
+    return torch.where((num_preds == 0) & (num_target == 0), torch.tensor(float("nan"), device=total.device), score)
+
+
+def average_surface_distance(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    symmetric: bool = True,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Calculate the average surface distance between the edges of predicted and target segmentation masks.
+
+    The average surface distance is the mean distance from the points on the edge of the predicted mask to the
+    closest point on the edge of the target mask. With ``symmetric=True`` the distances from the edge of the target
+    mask to the edge of the predicted mask are included in the mean as well. All samples and classes are processed
+    at once with the same batched edge detection and distance transform as
+    :func:`~torchmetrics.functional.segmentation.hausdorff_distance`.
+
+    The score is infinite if exactly one of the masks is empty and ``nan`` if both are empty.
+
+    Args:
+        preds: Predicted segmentation masks of shape ``(B, C, H, W[, D])`` or class indices of shape
+            ``(B, H, W[, D])``, see ``input_format``
+        target: Ground truth segmentation masks with the same shape as ``preds``
+        num_classes: Number of classes
+        include_background: Whether to include the background class, the first class, in the computation
+        distance_metric: The distance metric to use, one of ``"euclidean"``, ``"chessboard"`` or ``"taxicab"``
+        spacing: The spacing between the pixels along each spatial dimension, defaults to one for all dimensions
+        symmetric: Whether to average over the distances in both directions or only from ``preds`` to ``target``
+        input_format: What kind of input the function receives. Choose between ``"one-hot"`` for one-hot encoded tensors
+            or ``"index"`` for index tensors
+
+    Returns:
+        The average surface distance of every sample and class as a tensor of shape ``(B, C)``
+
+    Example:
+        >>> import torch
+        >>> from torchmetrics.functional.segmentation import average_surface_distance
+        >>> preds = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> target = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> preds[:, 1, 2:6, 2:6] = 1
+        >>> target[:, 1, 3:7, 3:6] = 1
+        >>> average_surface_distance(preds, target, num_classes=2)
+        tensor([[0.6552]])
+
+    """
+    _average_surface_distance_validate_args(
+        num_classes, include_background, distance_metric, spacing, symmetric, input_format
+    )
+    return _average_surface_distance_update(
+        preds, target, num_classes, include_background, distance_metric, spacing, symmetric, input_format
+    )
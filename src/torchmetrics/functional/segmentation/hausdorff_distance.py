@@ -0,0 +1,151 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import torch
+from torch import Tensor
+from typing_extensions import Literal
+
+from torchmetrics.functional.segmentation.utils import (
+    _batched_surface_distances,
+    _surface_distance_format,
+    _surface_distance_validate_args,
+)
+
+
+def _hausdorff_distance_validate_args(
+    num_classes: int,
+    include_background: bool,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"],
+    spacing: Optional[Union[Tensor, List[float]]],
+    directed: bool,
+    percentile: Optional[float],
+    input_format: Literal["one-hot", "index"],
+) -> None:
+    """Validate the arguments of the metric."""
+    _surface_distance_validate_args(num_classes, include_background, distance_metric, spacing, input_format)
+    if not isinstance(directed, bool):
+        raise ValueError(f"Expected argument `directed` must be a boolean, but got {directed}.")
+    if percentile is not None and not (isinstance(percentile, (int, float)) and 0 <= percentile <= 100):
+        raise ValueError(f"Expected argument `percentile` to be `None` or a number in [0, 100], but got {percentile}.")
+
+
+def _masked_percentile(values: Tensor, mask: Tensor, percentile: float) -> Tensor:
+    """Compute the percentile of the masked ``values`` over all but the first two dimensions.
+
+    The values of every mask are sorted with the unmasked elements, replaced by ``nan``, moved to the end, so the
+    percentile is interpolated linearly between two gathered elements like ``torch.quantile`` does. Rows without
+    masked elements give ``nan``.
+
+    """
+    values = torch.where(mask, values, torch.tensor(float("nan"), device=values.device)).flatten(2)
+    values = values.sort(dim=-1).values
+    position = (percentile / 100) * (mask.flatten(2).sum(-1, keepdim=True) - 1).clamp(min=0)
+    lower, upper = position.floor(), position.ceil()
+    low = values.gather(-1, lower.long()).squeeze(-1)
+    high = values.gather(-1, upper.long()).squeeze(-1)
+    # avoid ``inf - inf`` when both elements are infinite
+    return torch.where(high == low, low, low + (high - low) * (position - lower).squeeze(-1))
+
+
+def _directed_hausdorff_distance(distances: Tensor, edges: Tensor, percentile: Optional[float]) -> Tensor:
+    """Compute the (percentile of the) largest distance of the edges of every mask of shape ``(B, C, ...)``."""
+    if percentile is not None:
+        return _masked_percentile(distances, edges, percentile)
+    reduce_axis = list(range(2, edges.ndim))
+    return torch.where(edges, distances, torch.tensor(-float("inf"), device=distances.device)).amax(dim=reduce_axis)
+
+
+def _hausdorff_distance_update(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    directed: bool = False,
+    percentile: Optional[float] = None,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Compute the Hausdorff distance of every sample and class, returned as a tensor of shape ``(B, C)``."""
+    preds, target = _surface_distance_format(preds, target, num_classes, include_background, input_format)
+    edges_preds, edges_target, distances_to_target, distances_to_preds = _batched_surface_distances(
+        preds, target, distance_metric, spacing
+    )
+    score = _directed_hausdorff_distance(distances_to_target, edges_preds, percentile)
+    if not directed:
+        score = torch.maximum(score, _directed_hausdorff_distance(distances_to_preds, edges_target, percentile))
+
+    reduce_axis = list(range(2, preds.ndim))
+    empty_preds, empty_target = ~edges_preds.any(dim=reduce_axis), ~edges_target.any(dim=reduce_axis)
+    score = torch.where(empty_preds | empty_target, torch.tensor(float("inf"), device=score.device), score)
+    return torch.where(empty_preds & empty_target, torch.tensor(float("nan"), device=score.device), score)
+
+
+def hausdorff_distance(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    directed: bool = False,
+    percentile: Optional[float] = None,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Calculate the `Hausdorff Distance`_ between the edges of predicted and target segmentation masks.
+
+    The Hausdorff distance is the largest distance from a point on the edge of one mask to the closest point on the
+    edge of the other mask, taken in both directions unless ``directed=True``. With ``percentile`` the given
+    percentile of the distances is used instead of the largest one, e.g. ``percentile=95`` for the commonly used
+    95th percentile Hausdorff distance. All samples and classes are processed at once: the edges are found with a
+    single convolution and the distances with the linear time separable distance transform.
+
+    The score is infinite if exactly one of the masks is empty and ``nan`` if both are empty.
+
+    Args:
+        preds: Predicted segmentation masks of shape ``(B, C, H, W[, D])`` or class indices of shape
+            ``(B, H, W[, D])``, see ``input_format``
+        target: Ground truth segmentation masks with the same shape as ``preds``
+        num_classes: Number of classes
+        include_background: Whether to include the background class, the first class, in the computation
+        distance_metric: The distance metric to use, one of ``"euclidean"``, ``"chessboard"`` or ``"taxicab"``
+        spacing: The spacing between the pixels along each spatial dimension, defaults to one for all dimensions
+        directed: Whether to only compute the distances from the edges of ``preds`` to the edges of ``target``
+        percentile: Percentile of the distances to use instead of the largest one, a number in ``[0, 100]``
+        input_format: What kind of input the function receives. Choose between ``"one-hot"`` for one-hot encoded tensors
+            or ``"index"`` for index tensors
+
+    Returns:
+        The Hausdorff distance of every sample and class as a tensor of shape ``(B, C)``
+
+    Example:
+        >>> import torch
+        >>> from torchmetrics.functional.segmentation import hausdorff_distance
+        >>> preds = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> target = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> preds[:, 1, 2:6, 2:6] = 1
+        >>> target[:, 1, 3:7, 3:6] = 1
+        >>> hausdorff_distance(preds, target, num_classes=2)
+        tensor([[1.4142]])
+        >>> hausdorff_distance(preds, target, num_classes=2, distance_metric="chessboard", spacing=[2, 1])
+        tensor([[2.]])
+
+    """
+    _hausdorff_distance_validate_args(
+        num_classes, include_background, distance_metric, spacing, directed, percentile, input_format
+    )
+    return _hausdorff_distance_update(
+        preds, target, num_classes, include_background, distance_metric, spacing, directed, percentile, input_format
+    )
@@ -17,7 +17,7 @@ import torch
 from torch import Tensor
 from typing_extensions import Literal
 
-from torchmetrics.functional.segmentation.utils import _ignore_background
+from torchmetrics.functional.segmentation.utils import _ignore_background, _index_class_counts
 from torchmetrics.utilities.checks import _check_same_shape
 from torchmetrics.utilities.compute import _safe_divide
 
@@ -50,16 +50,17 @@ def _mean_iou_update(
     _check_same_shape(preds, target)
 
     if input_format == "index":
-        preds = torch.nn.functional.one_hot(preds, num_classes=num_classes).movedim(-1, 1)
-        target = torch.nn.functional.one_hot(target, num_classes=num_classes).movedim(-1, 1)
-
-    if not include_background:
-        preds, target = _ignore_background(preds, target)
-
-    reduce_axis = list(range(2, preds.ndim))
-    intersection = torch.sum(preds & target, dim=reduce_axis)
-    target_sum = torch.sum(target, dim=reduce_axis)
-    pred_sum = torch.sum(preds, dim=reduce_axis)
+        intersection, pred_sum, target_sum = _index_class_counts(preds, target, num_classes)
+        if not include_background and num_classes > 1:
+            intersection, pred_sum, target_sum = intersection[:, 1:], pred_sum[:, 1:], target_sum[:, 1:]
+    else:
+        if not include_background:
+            preds, target = _ignore_background(preds, target)
+
+        reduce_axis = list(range(2, preds.ndim))
+        intersection = torch.sum(preds & target, dim=reduce_axis)
+        target_sum = torch.sum(target, dim=reduce_axis)
+        pred_sum = torch.sum(preds, dim=reduce_axis)
     union = target_sum + pred_sum - intersection
     return intersection, union
 
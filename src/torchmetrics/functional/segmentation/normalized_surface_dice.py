@@ -0,0 +1,123 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Sequence, Union
+
+import torch
+from torch import Tensor
+from typing_extensions import Literal
+
+from torchmetrics.functional.segmentation.utils import (
+    _batched_surface_distances,
+    _surface_distance_format,
+    _surface_distance_validate_args,
+)
+
+
+def _normalized_surface_dice_validate_args(
+    num_classes: int,
+    tolerance: Union[float, Sequence[float]],
+    include_background: bool,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"],
+    spacing: Optional[Union[Tensor, List[float]]],
+    input_format: Literal["one-hot", "index"],
+) -> None:
+    """Validate the arguments of the metric."""
+    _surface_distance_validate_args(num_classes, include_background, distance_metric, spacing, input_format)
+    tolerances = [tolerance] if isinstance(tolerance, (int, float)) else list(tolerance)
+    if len(tolerances) not in [1, num_classes] or any(not (0 <= t < float("inf")) for t in tolerances):
+        raise ValueError(
+            "Expected argument `tolerance` to be a non-negative number or a sequence of `num_classes` non-negative"
+            f" numbers, but got {tolerance}."
+        )
+
+
+def _normalized_surface_dice_update(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    tolerance: Union[float, Sequence[float]],
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Compute the normalized surface dice of every sample and class, returned as a tensor of shape ``(B, C)``."""
+    preds, target = _surface_distance_format(preds, target, num_classes, include_background, input_format)
+    edges_preds, edges_target, distances_to_target, distances_to_preds = _batched_surface_distances(
+        preds, target, distance_metric, spacing
+    )
+    tolerance = torch.as_tensor(tolerance, dtype=distances_to_target.dtype, device=preds.device).flatten()
+    if tolerance.numel() > 1 and tolerance.numel() != preds.shape[1]:
+        # the tolerance of the ignored background class
+        tolerance = tolerance[1:]
+    tolerance = tolerance.reshape(1, -1, *(preds.ndim - 2) * [1])
+
+    reduce_axis = list(range(2, preds.ndim))
+    within = (edges_preds & (distances_to_target <= tolerance)).sum(dim=reduce_axis)
+    within += (edges_target & (distances_to_preds <= tolerance)).sum(dim=reduce_axis)
+    count = edges_preds.sum(dim=reduce_axis) + edges_target.sum(dim=reduce_axis)
+    return torch.where(count > 0, within / count.clamp(min=1), torch.tensor(float("nan"), device=count.device))
+
+
+def normalized_surface_dice(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    tolerance: Union[float, Sequence[float]],
+    include_background: bool = False,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+    input_format: Literal["one-hot", "index"] = "one-hot",
+) -> Tensor:
+    """Calculate the `Normalized Surface Dice`_ between the edges of predicted and target segmentation masks.
+
+    The normalized surface dice is the fraction of the points on the edges of both masks that lie within ``tolerance``
+    of the edge of the other mask. All samples and classes are processed at once with the same batched edge detection
+    and distance transform as :func:`~torchmetrics.functional.segmentation.hausdorff_distance`.
+
+    The score is zero if exactly one of the masks is empty and ``nan`` if both are empty.
+
+    Args:
+        preds: Predicted segmentation masks of shape ``(B, C, H, W[, D])`` or class indices of shape
+            ``(B, H, W[, D])``, see ``input_format``
+        target: Ground truth segmentation masks with the same shape as ``preds``
+        num_classes: Number of classes
+        tolerance: The largest distance at which two edges still count as matching, either a single value or one value
+            per class, including the background class
+        include_background: Whether to include the background class, the first class, in the computation
+        distance_metric: The distance metric to use, one of ``"euclidean"``, ``"chessboard"`` or ``"taxicab"``
+        spacing: The spacing between the pixels along each spatial dimension, defaults to one for all dimensions
+        input_format: What kind of input the function receives. Choose between ``"one-hot"`` for one-hot encoded tensors
+            or ``"index"`` for index tensors
+
+    Returns:
+        The normalized surface dice of every sample and class as a tensor of shape ``(B, C)``
+
+    Example:
+        >>> import torch
+        >>> from torchmetrics.functional.segmentation import normalized_surface_dice
+        >>> preds = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> target = torch.zeros(1, 2, 8, 8, dtype=torch.long)
+        >>> preds[:, 1, 2:6, 2:6] = 1
+        >>> target[:, 1, 3:7, 3:6] = 1
+        >>> normalized_surface_dice(preds, target, num_classes=2, tolerance=1)
+        tensor([[0.9545]])
+
+    """
+    _normalized_surface_dice_validate_args(
+        num_classes, tolerance, include_background, distance_metric, spacing, input_format
+    )
+    return _normalized_surface_dice_update(
+        preds, target, num_classes, tolerance, include_background, distance_metric, spacing, input_format
+    )
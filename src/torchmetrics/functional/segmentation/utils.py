@@ -13,7 +13,7 @@
 # limitations under the License.
 import functools
 import math
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import torch
 from torch import Tensor
@@ -31,6 +31,27 @@ def _ignore_background(preds: Tensor, target: Tensor) -> Tuple[Tensor, Tensor]:
     return preds, target
 
 
+def _index_class_counts(preds: Tensor, target: Tensor, num_classes: int) -> Tuple[Tensor, Tensor, Tensor]:
+    """Count the intersection, prediction and target elements of every sample and class of index tensors.
+
+    Gives the same ``(N, C)`` counts as summing the one-hot encodings of ``preds`` and ``target`` over all but the
+    first dimension, but with a single ``scatter_add_`` over ``target * num_classes + preds`` offset by the sample, so
+    only a ``(N, C, C)`` confusion matrix is materialized instead of the ``(N, C, ...)`` one-hot tensors. Unlike
+    ``bincount``, ``scatter_add_`` needs no dense fallback in deterministic mode or on XLA and MPS devices.
+
+    """
+    if preds.numel() > 0 and (min(preds.min(), target.min()) < 0 or max(preds.max(), target.max()) >= num_classes):
+        raise ValueError(f"Expected the class indices in `preds` and `target` to be in the range [0, {num_classes}).")
+    batch_size = preds.shape[0]
+    offset = torch.arange(batch_size, device=preds.device).unsqueeze(1) * num_classes**2
+    unique_mapping = offset + target.reshape(batch_size, -1).long() * num_classes + preds.reshape(batch_size, -1).long()
+    unique_mapping = unique_mapping.flatten()
+    confmat = torch.zeros(batch_size * num_classes**2, dtype=torch.long, device=preds.device)
+    confmat.scatter_add_(0, unique_mapping, torch.ones_like(unique_mapping))
+    confmat = confmat.reshape(batch_size, num_classes, num_classes)
+    return confmat.diagonal(dim1=1, dim2=2), confmat.sum(1), confmat.sum(2)
+
+
 def check_if_binarized(x: Tensor) -> None:
     """Check if the input is binarized.
 
@@ -181,11 +202,138 @@ def binary_erosion(
     return (torch.reshape(result, image.shape) + 1).byte()
 
 
+def _taxicab_pass(g: Tensor, spacing: float) -> Tensor:
+    """Compute ``min_q g[..., q] + spacing * |p - q|`` along the last dimension with two cumulative minimum scans."""
+    pos = torch.arange(g.shape[-1], dtype=g.dtype, device=g.device) * spacing
+    forward = torch.cummin(g - pos, dim=-1).values + pos
+    backward = torch.cummin((g + pos).flip(-1), dim=-1).values.flip(-1) - pos
+    return torch.minimum(forward, backward)
+
+
+def _lower_envelope_pass(
+    g: Tensor, spacing: float, metric: Literal["euclidean", "chessboard"], chunk_size: int = 2**22
+) -> Tensor:
+    """Compute the lower envelope of the distance functions centred at every element along the last dimension.
+
+    For ``"euclidean"`` the function centred at ``i`` is ``(spacing * (x - i))**2 + g[i]`` and for ``"chessboard"``
+    it is ``max(spacing * |x - i|, g[i])``. The envelope is built with the linear time scan of Felzenszwalb and
+    Huttenlocher in the formulation of Meijster et al., which keeps the indices of the functions on the envelope and
+    the positions where they start. The scan is sequential along the line, but vectorized over all lines, which are
+    processed in chunks of about ``chunk_size`` elements to bound the memory.
+
+    """
+    num_lines, length = g.shape
+    if length == 1:
+        return g
+    pos = torch.arange(length, device=g.device)
+
+    def f(x: Tensor, i: Tensor, g_i: Tensor) -> Tensor:
+        if metric == "euclidean":
+            return (spacing * (x - i)) ** 2 + g_i
+        return torch.maximum(spacing * (x - i).abs(), g_i)
+
+    def sep(i: Tensor, u: int, g_i: Tensor, g_u: Tensor) -> Tensor:
+        """Position after which the function centred at ``u`` is below the one centred at ``i < u``."""
+        if metric == "euclidean":
+            return (spacing**2 * (u * u - i * i) + g_u - g_i) / (2 * spacing**2 * (u - i))
+        middle = (i + u) / 2
+        return torch.where(
+            g_i <= g_u, torch.maximum(i + g_u / spacing, middle), torch.minimum(u - g_i / spacing, middle)
+        )
+
+    out = torch.empty_like(g)
+    for chunk in range(0, num_lines, max(1, chunk_size // length)):
+        g_chunk = g[chunk : chunk + max(1, chunk_size // length)]
+        lines = torch.arange(g_chunk.shape[0], device=g.device)
+        # index of the function and start position of every segment of the envelope, ``top`` is the last segment
+        centre = torch.zeros_like(g_chunk)
+        start = torch.zeros_like(g_chunk)
+        top = torch.zeros_like(lines)
+        # index, start and value of the last segment of every line, kept apart to avoid gathering them at every step
+        top_centre, top_start = torch.zeros_like(g_chunk[:, 0]), torch.zeros_like(g_chunk[:, 0])
+        top_g = g_chunk[:, 0].clone()
+        for u in range(1, length):
+            g_u, u_pos = g_chunk[:, u], torch.tensor(float(u), dtype=g.dtype, device=g.device)
+            # remove segments on which the new function is already below the envelope, only few lines need more than
+            # one removal, so the following ones are done on the subset of lines that is still removing segments
+            pop = f(top_start, top_centre, top_g) > f(top_start, u_pos, g_u)
+            idx = lines[pop]
+            while idx.numel() > 0:
+                top[idx] -= 1
+                top_idx = top[idx].clamp(min=0)
+                top_centre[idx] = centre[idx, top_idx]
+                top_start[idx] = start[idx, top_idx]
+                top_g[idx] = g_chunk[idx, top_centre[idx].long()]
+                pop = (top[idx] >= 0) & (
+                    f(top_start[idx], top_centre[idx], top_g[idx]) > f(top_start[idx], u_pos, g_u[idx])
+                )
+                idx = idx[pop]
+
+            empty = top < 0
+            w = torch.floor(sep(top_centre, u, top_g, g_u)) + 1
+            push = ~empty & (w < length)
+            update = empty | push
+            top = torch.where(empty, torch.zeros_like(top), top + push.long())
+            top_start = torch.where(push, w, torch.where(empty, torch.zeros_like(w), top_start))
+            top_centre = torch.where(update, torch.full_like(top_centre, u), top_centre)
+            top_g = torch.where(update, g_u, top_g)
+            # lines without a new segment write into the unused slot after their last segment
+            slot = (top + (~update).long()).unsqueeze(1)
+            centre.scatter_(1, slot, top_centre.unsqueeze(1))
+            start.scatter_(1, slot, top_start.unsqueeze(1))
+
+        # the segment of every position is the last one starting before or at it
+        start = torch.where(pos <= top.unsqueeze(1), start, torch.tensor(float(length), dtype=g.dtype))
+        segment = torch.searchsorted(start, pos.to(g.dtype).expand(len(lines), length).contiguous(), right=True) - 1
+        i = centre.gather(1, segment)
+        out[chunk : chunk + len(lines)] = f(pos.to(g.dtype), i, g_chunk.gather(1, i.long()))
+    return out
+
+
+def _distance_transform_separable(
+    x: Tensor,
+    sampling: List[float],
+    metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+) -> Tensor:
+    """Calculate the exact distance transform over the last ``len(sampling)`` dimensions in linear time.
+
+    The distance transform is computed one dimension at a time: the first pass finds the distance to the closest
+    background element along every line and every further pass combines these distances along the next dimension,
+    with cumulative minimum scans for the taxicab distance and the lower envelope of ``_lower_envelope_pass``
+    otherwise. All leading dimensions are treated as batch dimensions. Elements of an input without any background
+    element get an infinite distance.
+
+    """
+    spatial_dims = len(sampling)
+    shape = x.shape
+    # any finite distance is smaller than ``big``, which replaces infinity in the passes
+    big = 1.0 + sum(n * s for n, s in zip(shape[-spatial_dims:], sampling))
+    g = torch.where(x == 0, 0.0, big).to(torch.float64)
+
+    for k, dim in enumerate(range(x.ndim - spatial_dims, x.ndim)):
+        g = g.movedim(dim, -1)
+        moved_shape = g.shape
+        g = g.reshape(-1, moved_shape[-1])
+        if k == 0 or metric == "taxicab":
+            g = _taxicab_pass(g, float(sampling[k]))
+            if metric == "euclidean":
+                g = g**2
+        else:
+            g = _lower_envelope_pass(g, float(sampling[k]), metric)
+        g = g.reshape(moved_shape).movedim(-1, dim)
+
+    if metric == "euclidean":
+        g = torch.where(g >= big**2, torch.inf, g.sqrt())
+    else:
+        g = torch.where(g >= big, torch.inf, g)
+    return g.to(torch.get_default_dtype())
+
+
 def distance_transform(
     x: Tensor,
     sampling: Optional[Union[Tensor, List[float]]] = None,
     metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
-    engine: Literal["pytorch", "scipy"] = "pytorch",
+    engine: Literal["pytorch", "scipy", "separable"] = "pytorch",
 ) -> Tensor:
     """Calculate distance transform of a binary tensor.
 
@@ -196,17 +344,21 @@ def distance_transform(
     The memory consumption of this function is in the worst cast N/2**2 where N is the number of pixel. Since we need
     to compare all foreground pixels to all background pixels, the memory consumption is quadratic in the number of
     pixels. The memory consumption can be reduced by using the ``scipy`` engine, which is more memory efficient but
-    should also be slower for larger images.
+    should also be slower for larger images. The ``separable`` engine computes the exact distance transform one
+    dimension at a time with the linear time algorithm of Felzenszwalb and Huttenlocher, which only needs memory
+    linear in the number of pixels, stays on the device of the input and also supports 3D volumes.
 
     Args:
-        x: The binary tensor to calculate the distance transform of.
+        x: The binary tensor to calculate the distance transform of. Can be a 3D volume for the ``separable`` engine.
         sampling: Only relevant when distance is calculated using the euclidean distance. The sampling refers to the
             pixel spacing in the image, i.e. the distance between two adjacent pixels. If not provided, the pixel
             spacing is assumed to be 1.
         metric: The distance to use for the distance transform. Can be one of ``"euclidean"``, ``"chessboard"``
             or ``"taxicab"``.
-        engine: The engine to use for the distance transform. Can be one of ``["pytorch", "scipy"]``. In general,
-            the ``pytorch`` engine is faster, but the ``scipy`` engine is more memory efficient.
+        engine: The engine to use for the distance transform. Can be one of ``["pytorch", "scipy", "separable"]``.
+            In general, the ``pytorch`` engine is faster for small images, but the ``scipy`` engine is more memory
+            efficient. The ``separable`` engine is both fast and memory efficient for large images and volumes and
+            returns infinity if ``x`` contains no background.
 
     Returns:
         The distance transform of the input tensor.
@@ -229,7 +381,9 @@ def distance_transform(
     """
     if not isinstance(x, Tensor):
         raise ValueError(f"Expected argument `x` to be of type `torch.Tensor` but got `{type(x)}`.")
-    if x.ndim != 2:
+    if engine == "separable" and x.ndim not in (2, 3):
+        raise ValueError(f"Expected argument `x` to be of rank 2 or 3 but got rank `{x.ndim}`.")
+    if engine != "separable" and x.ndim != 2:
         raise ValueError(f"Expected argument `x` to be of rank 2 but got rank `{x.ndim}`.")
     if sampling is not None and not isinstance(sampling, list):
         raise ValueError(
@@ -239,14 +393,19 @@ def distance_transform(
         raise ValueError(
             f"Expected argument `metric` to be one of `['euclidean', 'chessboard', 'taxicab']` but got `{metric}`."
         )
-    if engine not in ["pytorch", "scipy"]:
-        raise ValueError(f"Expected argument `engine` to be one of `['pytorch', 'scipy']` but got `{engine}`.")
+    if engine not in ["pytorch", "scipy", "separable"]:
+        raise ValueError(
+            f"Expected argument `engine` to be one of `['pytorch', 'scipy', 'separable']` but got `{engine}`."
+        )
 
     if sampling is None:
-        sampling = [1, 1]
+        sampling = x.ndim * [1]
     else:
-        if len(sampling) != 2:
-            raise ValueError(f"Expected argument `sampling` to have length 2 but got length `{len(sampling)}`.")
+        if len(sampling) != x.ndim:
+            raise ValueError(f"Expected argument `sampling` to have length {x.ndim} but got length `{len(sampling)}`.")
+
+    if engine == "separable":
+        return _distance_transform_separable(x, [float(s) for s in sampling], metric)
 
     if engine == "pytorch":
         # calculate distance from every foreground pixel to every background pixel
@@ -390,6 +549,104 @@ def surface_distance(
     return dis[preds]
 
 
+def _surface_distance_validate_args(
+    num_classes: int,
+    include_background: bool,
+    distance_metric: str,
+    spacing: Optional[Union[Tensor, List[float]]],
+    input_format: str,
+) -> None:
+    """Validate the arguments shared by the surface distance metrics."""
+    if not isinstance(num_classes, int) or num_classes <= 0:
+        raise ValueError(f"Expected argument `num_classes` must be a positive integer, but got {num_classes}.")
+    if not isinstance(include_background, bool):
+        raise ValueError(f"Expected argument `include_background` must be a boolean, but got {include_background}.")
+    if distance_metric not in ["euclidean", "chessboard", "taxicab"]:
+        raise ValueError(
+            "Expected argument `distance_metric` to be one of 'euclidean', 'chessboard', 'taxicab',"
+            f" but got {distance_metric}."
+        )
+    if spacing is not None and (len(spacing) not in [2, 3] or any(s <= 0 for s in spacing)):
+        raise ValueError(f"Expected argument `spacing` to be `None` or 2 or 3 positive values, but got {spacing}.")
+    if input_format not in ["one-hot", "index"]:
+        raise ValueError(f"Expected argument `input_format` to be one of 'one-hot', 'index', but got {input_format}.")
+
+
+def _surface_distance_format(
+    preds: Tensor,
+    target: Tensor,
+    num_classes: int,
+    include_background: bool,
+    input_format: Literal["one-hot", "index"],
+) -> Tuple[Tensor, Tensor]:
+    """Convert the inputs of the surface distance metrics to boolean one-hot masks of shape ``(B, C, ...)``."""
+    _check_same_shape(preds, target)
+    if input_format == "index":
+        preds = torch.nn.functional.one_hot(preds.long(), num_classes=num_classes).movedim(-1, 1)
+        target = torch.nn.functional.one_hot(target.long(), num_classes=num_classes).movedim(-1, 1)
+    if preds.ndim not in [4, 5]:
+        raise ValueError(
+            "Expected both `preds` and `target` to have two or three spatial dimensions after the batch and class"
+            f" dimensions, but got shape {tuple(preds.shape)}."
+        )
+    check_if_binarized(preds)
+    check_if_binarized(target)
+    if not include_background:
+        preds, target = _ignore_background(preds, target)
+    return preds.bool(), target.bool()
+
+
+def _batched_mask_edges(preds: Tensor, target: Tensor) -> Tuple[Tensor, Tensor]:
+    """Get the edges of a batch of boolean masks of shape ``(B, C, ...)`` with a single convolution.
+
+    An element is on the edge if it belongs to the mask and one of its neighbours along the axes does not, the
+    definition used by ``mask_edges`` without ``spacing``. Elements outside of the image count as background. Instead
+    of unfolding every neighbourhood, the neighbours inside the mask are counted by a convolution with the structuring
+    element, which keeps the memory at the size of the masks.
+
+    """
+    spatial_dims = preds.ndim - 2
+    conv_operator = conv2d if spatial_dims == 2 else conv3d
+    structure = generate_binary_structure(spatial_dims, 1).float().to(preds.device)
+    masks = torch.stack([preds, target]).reshape(-1, 1, *preds.shape[2:])
+    neighbours = conv_operator(masks.float(), structure[None, None], padding=1)
+    edges = (masks & (neighbours < structure.sum())).reshape(2, *preds.shape)
+    return edges[0], edges[1]
+
+
+def _batched_surface_distances(
+    preds: Tensor,
+    target: Tensor,
+    distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+    spacing: Optional[Union[Tensor, List[float]]] = None,
+) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Get the edges of a batch of boolean masks of shape ``(B, C, ...)`` and the distances between them.
+
+    Returns the edges of ``preds`` and ``target`` together with, for every element, the distance to the closest edge
+    of ``target`` and of ``preds`` respectively. The distances are infinite for masks whose counterpart is empty. Both
+    distance maps of all masks are computed by a single call of the linear time separable distance transform. All
+    outputs are cropped to the bounding box of the edges of the whole batch, which does not change the distances
+    between the edges.
+
+    """
+    edges_preds, edges_target = _batched_mask_edges(preds, target)
+    any_edge = (edges_preds | edges_target).flatten(0, 1).any(0)
+    if any_edge.any():
+        crop: Tuple[Any, ...] = (...,)
+        for dim in range(any_edge.ndim):
+            nonzero = any_edge.any(dim=[d for d in range(any_edge.ndim) if d != dim]).nonzero()
+            crop += (slice(int(nonzero[0]), int(nonzero[-1]) + 1),)
+        edges_preds, edges_target = edges_preds[crop], edges_target[crop]
+    sampling = [1.0] * (preds.ndim - 2) if spacing is None else [float(s) for s in spacing]
+    if len(sampling) != preds.ndim - 2:
+        raise ValueError(
+            f"Expected argument `spacing` to have one value per spatial dimension of the inputs ({preds.ndim - 2}),"
+            f" but got {len(sampling)} values."
+        )
+    distances = _distance_transform_separable(~torch.stack([edges_target, edges_preds]), sampling, distance_metric)
+    return edges_preds, edges_target, distances[0], distances[1]
+
+
 @functools.lru_cache
 def get_neighbour_tables(
     spacing: Union[Tuple[int, int], Tuple[int, int, int]], device: Optional[torch.device] = None
@@ -39,14 +39,14 @@ def _cer_update(
         preds = [preds]
     if isinstance(target, str):
         target = [target]
-    errors = tensor(0, dtype=torch.float)
-    total = tensor(0, dtype=torch.float)
+    errors = 0
+    total = 0
     for pred, tgt in zip(preds, target):
         pred_tokens = pred
         tgt_tokens = tgt
         errors += _edit_distance(list(pred_tokens), list(tgt_tokens))
         total += len(tgt_tokens)
-    return errors, total
+    return tensor(errors, dtype=torch.float), tensor(total, dtype=torch.float)
 
 
 def _cer_compute(errors: Tensor, total: Tensor) -> Tensor:
@@ -38,7 +38,7 @@ def _edit_distance_update(
         )
 
     distance = [
-        _LE_distance(t, op_substitute=substitution_cost)(p)[0]  # type: ignore[arg-type]
+        _LE_distance(t, op_substitute=substitution_cost).distance(p)  # type: ignore[arg-type]
         for p, t in zip(preds, target)
     ]
     return torch.tensor(distance, dtype=torch.int)
@@ -39,6 +39,9 @@ _BEAM_WIDTH = 25
 _MAX_CACHE_SIZE = 10000
 _INT_INFINITY = int(1e16)
 
+# a node of the prefix tree caching the rows of the edit distance matrix, maps a token to the next node and its row
+_CacheNode = Dict[str, Tuple[dict, List[int]]]
+
 
 @unique
 class _EditOperations(str, Enum):
@@ -58,6 +61,10 @@ class _LevenshteinEditDistance:
     from https://github.com/mjpost/sacrebleu/blob/master/sacrebleu/metrics/lib_ter.py,
     where the most of this implementation is adapted and copied from.
 
+    The rows of the edit distance matrix only hold the costs as plain integers. The edit operation of a cell is the
+    first of substitution (or no-op), deletion and insertion whose cost reaches the cost of the cell, which is exactly
+    the preference used to fill the matrix, so the trace is recovered from the costs along the path only.
+
     Args:
         reference_tokens: list of reference tokens
         op_insert: cost of insertion operation
@@ -72,7 +79,7 @@ class _LevenshteinEditDistance:
         self.reference_tokens = reference_tokens
         self.reference_len = len(reference_tokens)
 
-        self.cache: Dict[str, Tuple[int, str]] = {}
+        self.cache: _CacheNode = {}
         self.cache_size = 0
 
         self.op_insert = op_insert
@@ -91,23 +98,37 @@ class _LevenshteinEditDistance:
             A tuple of a calculated edit distance and a trace of executed operations.
 
         """
+        edit_distance = self._edit_distance_matrix(prediction_tokens)
+        return edit_distance[-1][-1], self._get_trace(prediction_tokens, edit_distance)
+
+    def distance(self, prediction_tokens: List[str]) -> int:
+        """Calculate only the edit distance between self._words_ref and the hypothesis, without the trace.
+
+        Args:
+            prediction_tokens: A tokenized predicted sentence.
+
+        Return:
+            The calculated edit distance.
+
+        """
+        return self._edit_distance_matrix(prediction_tokens)[-1][-1]
+
+    def _edit_distance_matrix(self, prediction_tokens: List[str]) -> List[List[int]]:
+        """Calculate the rows of the edit distance matrix that are not cached yet and add them to the cache."""
         # Use cached edit distance for already computed words
-        start_position, cached_edit_distance = self._find_cache(prediction_tokens)
+        start_position, node, cached_edit_distance = self._find_cache(prediction_tokens)
         # Calculate the rest of the edit distance matrix
-        edit_distance_int, edit_distance, trace = self._levenshtein_edit_distance(
-            prediction_tokens, start_position, cached_edit_distance
-        )
+        edit_distance = self._levenshtein_edit_distance(prediction_tokens, start_position, cached_edit_distance)
         # Update our cache with the newly calculated rows
-        self._add_cache(prediction_tokens, edit_distance)
-
-        return edit_distance_int, trace
+        self._add_cache(node, prediction_tokens[start_position:], edit_distance[len(cached_edit_distance) :])
+        return edit_distance
 
     def _levenshtein_edit_distance(
         self,
         prediction_tokens: List[str],
         prediction_start: int,
-        cache: List[List[Tuple[int, _EditOperations]]],
-    ) -> Tuple[int, List[List[Tuple[int, _EditOperations]]], Tuple[_EditOperations, ...]]:
+        cache: List[List[int]],
+    ) -> List[List[int]]:
         """Dynamic programming algorithm to compute the Levenhstein edit distance.
 
         Args:
@@ -116,16 +137,18 @@ class _LevenshteinEditDistance:
             cache: A cached Levenshtein edit distance.
 
         Returns:
-            Edit distance between the predicted sentence and the reference sentence
+            The edit distance matrix between the predicted sentence and the reference sentence, the edit distance is
+            the last element of the last row.
 
         """
         prediction_len = len(prediction_tokens)
+        reference_tokens = self.reference_tokens
+        reference_len = self.reference_len
+        op_insert, op_delete, op_substitute = self.op_insert, self.op_delete, self.op_substitute
+        op_nothing, op_undefined = self.op_nothing, self.op_undefined
 
-        empty_rows: List[List[Tuple[int, _EditOperations]]] = [
-            list(self._get_empty_row(self.reference_len)) for _ in range(prediction_len - prediction_start)
-        ]
-        edit_distance: List[List[Tuple[int, _EditOperations]]] = cache + empty_rows
-        length_ratio = self.reference_len / prediction_len if prediction_tokens else 1.0
+        edit_distance = list(cache)
+        length_ratio = reference_len / prediction_len if prediction_tokens else 1.0
 
         # Ensure to not end up with zero overlaip with previous role
         beam_width = math.ceil(length_ratio / 2 + _BEAM_WIDTH) if length_ratio / 2 > _BEAM_WIDTH else _BEAM_WIDTH
@@ -134,52 +157,40 @@ class _LevenshteinEditDistance:
         for i in range(prediction_start + 1, prediction_len + 1):
             pseudo_diag = math.floor(i * length_ratio)
             min_j = max(0, pseudo_diag - beam_width)
-            max_j = (
-                self.reference_len + 1 if i == prediction_len else min(self.reference_len + 1, pseudo_diag + beam_width)
-            )
-
-            for j in range(min_j, max_j):
-                if j == 0:
-                    edit_distance[i][j] = (
-                        edit_distance[i - 1][j][0] + self.op_delete,
-                        _EditOperations.OP_DELETE,
-                    )
-                else:
-                    if prediction_tokens[i - 1] == self.reference_tokens[j - 1]:
-                        cost_substitute = self.op_nothing
-                        operation_substitute = _EditOperations.OP_NOTHING
-                    else:
-                        cost_substitute = self.op_substitute
-                        operation_substitute = _EditOperations.OP_SUBSTITUTE
-
-                    # Tercom prefers no-op/sub, then insertion, then deletion. But since we flip the trace and compute
-                    # the alignment from the inverse, we need to swap order of insertion and  deletion in the
-                    # preference.
-                    # Copied from: https://github.com/mjpost/sacrebleu/blob/master/sacrebleu/metrics/ter.py.
-                    operations = (
-                        (edit_distance[i - 1][j - 1][0] + cost_substitute, operation_substitute),
-                        (edit_distance[i - 1][j][0] + self.op_delete, _EditOperations.OP_DELETE),
-                        (edit_distance[i][j - 1][0] + self.op_insert, _EditOperations.OP_INSERT),
-                    )
-
-                    for operation_cost, operation_name in operations:
-                        if edit_distance[i][j][0] > operation_cost:
-                            edit_distance[i][j] = operation_cost, operation_name
-
-        trace = self._get_trace(prediction_len, edit_distance)
-
-        return edit_distance[-1][-1][0], edit_distance[len(cache) :], trace
-
-    def _get_trace(
-        self, prediction_len: int, edit_distance: List[List[Tuple[int, _EditOperations]]]
-    ) -> Tuple[_EditOperations, ...]:
+            max_j = reference_len + 1 if i == prediction_len else min(reference_len + 1, pseudo_diag + beam_width)
+
+            previous_row = edit_distance[i - 1]
+            token = prediction_tokens[i - 1]
+            row = [op_undefined] * min_j
+            if min_j == 0:
+                row.append(previous_row[0] + op_delete)
+                min_j = 1
+            left = row[-1]
+            for diagonal, up, reference_token in zip(
+                previous_row[min_j - 1 : max_j - 1], previous_row[min_j:max_j], reference_tokens[min_j - 1 : max_j - 1]
+            ):
+                # Tercom prefers no-op/sub, then insertion, then deletion. But since we flip the trace and compute
+                # the alignment from the inverse, we need to swap order of insertion and  deletion in the
+                # preference. Only a strictly lower cost replaces an earlier option.
+                # Copied from: https://github.com/mjpost/sacrebleu/blob/master/sacrebleu/metrics/ter.py.
+                cost = diagonal + (op_nothing if token == reference_token else op_substitute)
+                if up + op_delete < cost:
+                    cost = up + op_delete
+                if left + op_insert < cost:
+                    cost = left + op_insert
+                left = cost if cost < op_undefined else op_undefined
+                row.append(left)
+            row += [op_undefined] * (reference_len + 1 - len(row))
+            edit_distance.append(row)
+
+        return edit_distance
+
+    def _get_trace(self, prediction_tokens: List[str], edit_distance: List[List[int]]) -> Tuple[_EditOperations, ...]:
         """Get a trace of executed operations from the edit distance matrix.
 
         Args:
-            prediction_len: A length of a tokenized predicted sentence.
-            edit_distance:
-                A matrix of the Levenshtedin edit distance. The element part of the matrix is a tuple of an edit
-                operation cost and an edit operation itself.
+            prediction_tokens: A tokenized predicted sentence.
+            edit_distance: A matrix of the Levenshtein edit distance costs.
 
         Return:
             A trace of executed operations returned as a tuple of `_EDIT_OPERATIONS` enumerates.
@@ -189,109 +200,108 @@ class _LevenshteinEditDistance:
                 If an unknown operation has been applied.
 
         """
-        trace: Tuple[_EditOperations, ...] = ()
-        i = prediction_len
+        trace: List[_EditOperations] = []
+        i = len(prediction_tokens)
         j = self.reference_len
 
         while i > 0 or j > 0:
-            operation = edit_distance[i][j][1]
-            trace = (operation, *trace)
+            cost = edit_distance[i][j]
+            if i == 0:
+                operation = _EditOperations.OP_INSERT
+            elif j == 0:
+                operation = _EditOperations.OP_DELETE
+            elif cost >= self.op_undefined:
+                raise ValueError(f"Unknown operation {_EditOperations.OP_UNDEFINED!r}")
+            elif prediction_tokens[i - 1] == self.reference_tokens[j - 1] and edit_distance[i - 1][j - 1] == cost:
+                operation = _EditOperations.OP_NOTHING
+            elif prediction_tokens[i - 1] != self.reference_tokens[j - 1] and (
+                edit_distance[i - 1][j - 1] + self.op_substitute == cost
+            ):
+                operation = _EditOperations.OP_SUBSTITUTE
+            elif edit_distance[i - 1][j] + self.op_delete == cost:
+                operation = _EditOperations.OP_DELETE
+            else:
+                operation = _EditOperations.OP_INSERT
+            trace.append(operation)
             if operation in (_EditOperations.OP_SUBSTITUTE, _EditOperations.OP_NOTHING):
                 i -= 1
                 j -= 1
             elif operation == _EditOperations.OP_INSERT:
                 j -= 1
-            elif operation == _EditOperations.OP_DELETE:
-                i -= 1
             else:
-                raise ValueError(f"Unknown operation {operation!r}")
+                i -= 1
 
-        return trace
+        return tuple(reversed(trace))
 
-    def _add_cache(self, prediction_tokens: List[str], edit_distance: List[List[Tuple[int, _EditOperations]]]) -> None:
+    def _add_cache(self, node: _CacheNode, prediction_tokens: List[str], rows: List[List[int]]) -> None:
         """Add newly computed rows to cache.
 
-        Since edit distance is only calculated on the hypothesis suffix that was not in cache, the number of rows in
-        `edit_distance` matrx may be shorter than hypothesis length. In that case we skip over these initial words.
-
         Args:
-            prediction_tokens: A tokenized predicted sentence.
-            edit_distance:
-                A matrix of the Levenshtedin edit distance. The element part of the matrix is a tuple of an edit
-                operation cost and an edit operation itself.
+            node: The node of the cache the first of the ``prediction_tokens`` is added to.
+            prediction_tokens: The tokens of the predicted sentence that were not in the cache yet.
+            rows: The newly computed rows of the Levenshtein edit distance matrix, one for every token.
 
         """
         if self.cache_size >= _MAX_CACHE_SIZE:
             return
 
-        node = self.cache
-
-        # how many initial words to skip
-        skip_num = len(prediction_tokens) - len(edit_distance)
-
-        # Jump through the cache to the current position
-        for i in range(skip_num):
-            node = node[prediction_tokens[i]][0]  # type: ignore
-
         # Update cache with newly computed rows
-        for word, row in zip(prediction_tokens[skip_num:], edit_distance):
+        for word, row in zip(prediction_tokens, rows):
             if word not in node:
-                node[word] = ({}, tuple(row))  # type: ignore
+                node[word] = ({}, row)
                 self.cache_size += 1
-            value = node[word]
-            node = value[0]  # type: ignore
+            node = node[word][0]
 
-    def _find_cache(self, prediction_tokens: List[str]) -> Tuple[int, List[List[Tuple[int, _EditOperations]]]]:
+    def _find_cache(self, prediction_tokens: List[str]) -> Tuple[int, _CacheNode, List[List[int]]]:
         """Find the already calculated rows of the Levenshtein edit distance metric.
 
         Args:
             prediction_tokens: A tokenized predicted sentence.
 
         Return:
-            A tuple of a start hypothesis position and `edit_distance` matrix.
+            A tuple of a start hypothesis position, the cache node reached and `edit_distance` matrix.
 
             prediction_start: An index where a predicted sentence to be considered from.
-            edit_distance:
-                A matrix of the cached Levenshtedin edit distance. The element part of the matrix is a tuple of an edit
-                operation cost and an edit operation itself.
+            node: The node of the cache the rows of the remaining tokens are to be added to.
+            edit_distance: A matrix of the cached Levenshtein edit distance costs.
 
         """
         node = self.cache
         start_position = 0
-        edit_distance: List[List[Tuple[int, _EditOperations]]] = [self._get_initial_row(self.reference_len)]
+        edit_distance: List[List[int]] = [self._get_initial_row(self.reference_len)]
         for word in prediction_tokens:
             if word in node:
                 start_position += 1
-                node, row = node[word]  # type: ignore
-                edit_distance.append(row)  # type: ignore
+                node, row = node[word]
+                edit_distance.append(row)
             else:
                 break
 
-        return start_position, edit_distance
+        return start_position, node, edit_distance
 
-    def _get_empty_row(self, length: int) -> List[Tuple[int, _EditOperations]]:
+    def _get_empty_row(self, length: int) -> List[int]:
         """Precomputed empty matrix row for Levenhstein edit distance.
 
         Args:
             length: A length of a tokenized sentence.
 
         Return:
-            A list of tuples containing infinite edit operation costs and yet undefined edit operations.
+            A list of infinite edit operation costs.
 
         """
-        return [(int(self.op_undefined), _EditOperations.OP_UNDEFINED)] * (length + 1)
+        return [int(self.op_undefined)] * (length + 1)
 
-    def _get_initial_row(self, length: int) -> List[Tuple[int, _EditOperations]]:
+    def _get_initial_row(self, length: int) -> List[int]:
         """First row corresponds to insertion operations of the reference, so 1 edit operation per reference word.
 
         Args:
             length: A length of a tokenized sentence.
 
         Return:
-            A list of tuples containing edit operation costs of insert and insert edit operations.
+            A list of edit operation costs of insert edit operations.
 
         """
-        return [(i * self.op_insert, _EditOperations.OP_INSERT) for i in range(length + 1)]
+        return [i * self.op_insert for i in range(length + 1)]
 
 
 def _validate_inputs(
@@ -327,7 +337,12 @@ def _validate_inputs(
 
 
 def _edit_distance(prediction_tokens: List[str], reference_tokens: List[str]) -> int:
-    """Dynamic programming algorithm to compute the edit distance.
+    """Bit-parallel algorithm to compute the edit distance.
+
+    Implements the algorithm of Myers in the formulation of Hyyrö. The vertical differences of a column of the dynamic
+    programming matrix are held in the bits of two integers, one bit per token of the longer sentence, and every token
+    of the shorter sentence updates the whole column with a few bitwise operations. Python integers have arbitrary
+    precision, so sentences of any length are handled the same way.
 
     Args:
         prediction_tokens: A tokenized predicted sentence
@@ -336,18 +351,28 @@ def _edit_distance(prediction_tokens: List[str], reference_tokens: List[str]) ->
         Edit distance between the predicted sentence and the reference sentence
 
     """
-    dp = [[0] * (len(reference_tokens) + 1) for _ in range(len(prediction_tokens) + 1)]
-    for i in range(len(prediction_tokens) + 1):
-        dp[i][0] = i
-    for j in range(len(reference_tokens) + 1):
-        dp[0][j] = j
-    for i in range(1, len(prediction_tokens) + 1):
-        for j in range(1, len(reference_tokens) + 1):
-            if prediction_tokens[i - 1] == reference_tokens[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1]
-            else:
-                dp[i][j] = min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1]) + 1
-    return dp[-1][-1]
+    if len(prediction_tokens) < len(reference_tokens):
+        prediction_tokens, reference_tokens = reference_tokens, prediction_tokens
+    # positions of every token in the longer sentence as a bit mask
+    token_masks: Dict[str, int] = {}
+    for i, token in enumerate(prediction_tokens):
+        token_masks[token] = token_masks.get(token, 0) | (1 << i)
+
+    all_ones = (1 << len(prediction_tokens)) - 1
+    # the vertical differences of the first column are all +1
+    positive_v, negative_v = all_ones, 0
+    for token in reference_tokens:
+        eq = token_masks.get(token, 0)
+        x_v = eq | negative_v
+        x_h = (((eq & positive_v) + positive_v) ^ positive_v) | eq
+        positive_h = negative_v | (all_ones & ~(x_h | positive_v))
+        negative_h = positive_v & x_h
+        positive_h = all_ones & ((positive_h << 1) | 1)
+        negative_h = all_ones & (negative_h << 1)
+        positive_v = negative_h | (all_ones & ~(x_v | positive_h))
+        negative_v = positive_h & x_v
+    # the distance is the length of the shorter sentence plus the sum of the vertical differences of the last column
+    return len(reference_tokens) + bin(positive_v).count("1") - bin(negative_v).count("1")
 
 
 def _flip_trace(trace: Tuple[_EditOperations, ...]) -> Tuple[_EditOperations, ...]:
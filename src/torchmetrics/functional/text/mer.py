@@ -39,15 +39,15 @@ def _mer_update(
         preds = [preds]
     if isinstance(target, str):
         target = [target]
-    errors = tensor(0, dtype=torch.float)
-    total = tensor(0, dtype=torch.float)
+    errors = 0
+    total = 0
     for pred, tgt in zip(preds, target):
         pred_tokens = pred.split()
         tgt_tokens = tgt.split()
         errors += _edit_distance(pred_tokens, tgt_tokens)
         total += max(len(tgt_tokens), len(pred_tokens))
 
-    return errors, total
+    return tensor(errors, dtype=torch.float), tensor(total, dtype=torch.float)
 
 
 def _mer_compute(errors: Tensor, total: Tensor) -> Tensor:
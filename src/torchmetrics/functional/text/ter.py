@@ -205,6 +205,9 @@ def _preprocess_sentence(sentence: str, tokenizer: _TercomTokenizer) -> str:
 def _find_shifted_pairs(pred_words: List[str], target_words: List[str]) -> Iterator[Tuple[int, int, int]]:
     """Find matching word sub-sequences in two lists of words. Ignores sub- sequences starting at the same position.
 
+    The positions of every word in ``target_words`` are indexed once, so only the start positions where the first words
+    match are visited instead of all pairs of start positions.
+
     Args:
         pred_words: A list of a tokenized hypothesis sentence.
         target_words: A list of a tokenized reference sentence.
@@ -221,8 +224,12 @@ def _find_shifted_pairs(pred_words: List[str], target_words: List[str]) -> Itera
             A length of a word span to be considered.
 
     """
-    for pred_start in range(len(pred_words)):
-        for target_start in range(len(target_words)):
+    target_positions: Dict[str, List[int]] = {}
+    for target_start, word in enumerate(target_words):
+        target_positions.setdefault(word, []).append(target_start)
+
+    for pred_start, word in enumerate(pred_words):
+        for target_start in target_positions.get(word, []):
             # this is slightly different from what tercom does but this should
             # really only kick in in degenerate cases
             if abs(target_start - pred_start) > _MAX_SHIFT_DIST:
@@ -372,7 +379,7 @@ def _shift_words(
 
             # Elements of the tuple are designed to replicate Tercom ranking of shifts:
             candidate = (
-                edit_distance - cached_edit_distance(shifted_words)[0],  # highest score first
+                edit_distance - cached_edit_distance.distance(shifted_words),  # highest score first
                 length,  # then, longest match first
                 -pred_start,  # then, earliest match first
                 -idx,  # then, earliest target position first
@@ -422,7 +429,7 @@ def _translation_edit_rate(pred_words: List[str], target_words: List[str]) -> Te
         num_shifts += 1
         input_words = new_input_words
 
-    edit_distance, _ = cached_edit_distance(input_words)
+    edit_distance = cached_edit_distance.distance(input_words)
     total_edits = num_shifts + edit_distance
 
     return tensor(total_edits)
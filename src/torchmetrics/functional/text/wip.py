@@ -13,6 +13,7 @@
 # limitations under the License.
 from typing import List, Tuple, Union
 
+import torch
 from torch import Tensor, tensor
 
 from torchmetrics.functional.text.helper import _edit_distance
@@ -38,10 +39,10 @@ def _wip_update(
         preds = [preds]
     if isinstance(target, str):
         target = [target]
-    total = tensor(0.0)
-    errors = tensor(0.0)
-    target_total = tensor(0.0)
-    preds_total = tensor(0.0)
+    total = 0
+    errors = 0
+    target_total = 0
+    preds_total = 0
     for pred, tgt in zip(preds, target):
         pred_tokens = pred.split()
         target_tokens = tgt.split()
@@ -50,7 +51,11 @@ def _wip_update(
         preds_total += len(pred_tokens)
         total += max(len(target_tokens), len(pred_tokens))
 
-    return errors - total, target_total, preds_total
+    return (
+        tensor(errors - total, dtype=torch.float),
+        tensor(target_total, dtype=torch.float),
+        tensor(preds_total, dtype=torch.float),
+    )
 
 
 def _wip_compute(errors: Tensor, target_total: Tensor, preds_total: Tensor) -> Tensor:
@@ -11,15 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Optional, Sequence, Union
 
-from torch import Tensor
+from torch import Tensor, tensor
 from typing_extensions import Literal
 
-from torchmetrics.functional.image.d_lambda import _spectral_distortion_index_compute, _spectral_distortion_index_update
+from torchmetrics.functional.image.d_lambda import (
+    _spectral_distortion_index_band_sums,
+    _spectral_distortion_index_from_band_sums,
+    _spectral_distortion_index_update,
+)
 from torchmetrics.metric import Metric
-from torchmetrics.utilities import rank_zero_warn
-from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -70,19 +72,15 @@ class SpectralDistortionIndex(Metric):
     plot_lower_bound: float = 0.0
     plot_upper_bound: float = 1.0
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    preds_band_sums: Tensor
+    target_band_sums: Tensor
+    preds_numel: Tensor
+    target_numel: Tensor
 
     def __init__(
         self, p: int = 1, reduction: Literal["elementwise_mean", "sum", "none"] = "elementwise_mean", **kwargs: Any
     ) -> None:
         super().__init__(**kwargs)
-        rank_zero_warn(
-            "Metric `SpectralDistortionIndex` will save all targets and"
-            " predictions in buffer. For large datasets this may lead"
-            " to large memory footprint."
-        )
-
         if not isinstance(p, int) or p <= 0:
             raise ValueError(f"Expected `p` to be a positive integer. Got p: {p}.")
         self.p = p
@@ -90,20 +88,32 @@ class SpectralDistortionIndex(Metric):
         if reduction not in allowed_reductions:
             raise ValueError(f"Expected argument `reduction` be one of {allowed_reductions} but got {reduction}")
         self.reduction = reduction
-        self.add_state("preds", default=[], dist_reduce_fx="cat")
-        self.add_state("target", default=[], dist_reduce_fx="cat")
+        # the band sums broadcast to ``(C, C)`` on the first update, as the number of bands is not known beforehand
+        self.add_state("preds_band_sums", default=tensor(0.0), dist_reduce_fx="sum")
+        self.add_state("target_band_sums", default=tensor(0.0), dist_reduce_fx="sum")
+        self.add_state("preds_numel", default=tensor(0), dist_reduce_fx="sum")
+        self.add_state("target_numel", default=tensor(0), dist_reduce_fx="sum")
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with preds and target."""
         preds, target = _spectral_distortion_index_update(preds, target)
-        self.preds.append(preds)
-        self.target.append(target)
+        preds_sums, preds_numel = _spectral_distortion_index_band_sums(preds)
+        target_sums, target_numel = _spectral_distortion_index_band_sums(target)
+        self.preds_band_sums = self.preds_band_sums + preds_sums
+        self.target_band_sums = self.target_band_sums + target_sums
+        self.preds_numel += preds_numel
+        self.target_numel += target_numel
 
     def compute(self) -> Tensor:
         """Compute and returns spectral distortion index."""
-        preds = dim_zero_cat(self.preds)
-        target = dim_zero_cat(self.target)
-        return _spectral_distortion_index_compute(preds, target, self.p, self.reduction)
+        return _spectral_distortion_index_from_band_sums(
+            self.preds_band_sums,
+            self.preds_numel,
+            self.target_band_sums,
+            self.target_numel,
+            self.p,
+            self.reduction,
+        )
 
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
@@ -17,9 +17,8 @@ from typing import Any, List, Optional, Sequence, Union
 from torch import Tensor
 from typing_extensions import Literal
 
-from torchmetrics.functional.image.ergas import _ergas_compute, _ergas_update
+from torchmetrics.functional.image.ergas import _ergas_band_statistics, _ergas_from_band_statistics, _ergas_update
 from torchmetrics.metric import Metric
-from torchmetrics.utilities import rank_zero_warn
 from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
@@ -77,8 +76,8 @@ class ErrorRelativeGlobalDimensionlessSynthesis(Metric):
     full_state_update: bool = False
     plot_lower_bound: float = 0.0
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    rmse_per_band: List[Tensor]
+    mean_target: List[Tensor]
 
     def __init__(
         self,
@@ -87,28 +86,24 @@ class ErrorRelativeGlobalDimensionlessSynthesis(Metric):
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        rank_zero_warn(
-            "Metric `UniversalImageQualityIndex` will save all targets and"
-            " predictions in buffer. For large datasets this may lead"
-            " to large memory footprint."
-        )
-
-        self.add_state("preds", default=[], dist_reduce_fx="cat")
-        self.add_state("target", default=[], dist_reduce_fx="cat")
+
+        self.add_state("rmse_per_band", default=[], dist_reduce_fx="cat")
+        self.add_state("mean_target", default=[], dist_reduce_fx="cat")
         self.ratio = ratio
         self.reduction = reduction
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
         preds, target = _ergas_update(preds, target)
-        self.preds.append(preds)
-        self.target.append(target)
+        rmse_per_band, mean_target = _ergas_band_statistics(preds, target)
+        self.rmse_per_band.append(rmse_per_band)
+        self.mean_target.append(mean_target)
 
     def compute(self) -> Tensor:
         """Compute explained variance over state."""
-        preds = dim_zero_cat(self.preds)
-        target = dim_zero_cat(self.target)
-        return _ergas_compute(preds, target, self.ratio, self.reduction)
+        rmse_per_band = dim_zero_cat(self.rmse_per_band)
+        mean_target = dim_zero_cat(self.mean_target)
+        return _ergas_from_band_statistics(rmse_per_band, mean_target, self.ratio, self.reduction)
 
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
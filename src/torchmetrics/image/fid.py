@@ -11,17 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import torch
 from torch import Tensor
 from torch.nn import Module
 from torch.nn.functional import adaptive_avg_pool2d
+from typing_extensions import Literal
 
 from torchmetrics.metric import Metric
+from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCH_FIDELITY_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
+from torchmetrics.utilities.prints import rank_zero_only
 
 if not _MATPLOTLIB_AVAILABLE:
     __doctest_skip__ = ["FrechetInceptionDistance.plot"]
@@ -156,7 +161,175 @@ class NoTrainInceptionV3(_FeatureExtractorInceptionV3):
         return out[0].reshape(x.shape[0], -1)
 
 
-def _compute_fid(mu1: Tensor, sigma1: Tensor, mu2: Tensor, sigma2: Tensor) -> Tensor:
+def _feature_extractor_fingerprint(extractor: Module) -> str:
+    """Return a string identifying a feature extractor, used for keying cached reference statistics.
+
+    The default inception network is identified by its requested feature layer, custom networks by their class and a
+    hash of their weights, such that statistics are never reused across different checkpoints of the same architecture.
+
+    """
+    # imported lazily to keep the image package independent of the wrappers
+    from torchmetrics.wrappers.feature_share import NetworkCache
+
+    if isinstance(extractor, NetworkCache):
+        extractor = extractor.network
+    if isinstance(extractor, NoTrainInceptionV3):
+        return f"{type(extractor).__name__}:{','.join(extractor.features_list)}"
+    digest = hashlib.sha1()  # noqa: S324
+    for name, tensor in extractor.state_dict().items():
+        digest.update(name.encode())
+        digest.update(tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes())
+    return f"{type(extractor).__module__}.{type(extractor).__qualname__}:{digest.hexdigest()}"
+
+
+def _save_reference_stats(path: str, key: Dict[str, Any], states: Dict[str, Tensor]) -> None:
+    """Save reference statistics together with the key describing how they were computed."""
+    rank_zero_only(torch.save)({"key": key, "states": {k: v.detach().cpu() for k, v in states.items()}}, path)
+
+
+def _load_reference_stats(path: str, key: Dict[str, Any]) -> Dict[str, Tensor]:
+    """Load reference statistics and check that they were computed with the same configuration."""
+    stats = torch.load(path, map_location="cpu")
+    if stats["key"] != key:
+        raise ValueError(
+            f"The reference statistics in {path} were computed with configuration {stats['key']}, which does not"
+            f" match the configuration of this metric {key}."
+        )
+    return stats["states"]
+
+
+class _ReferenceStatsMixin(ABC):
+    """Save and load the statistics of the real distribution of a metric comparing real and generated images.
+
+    Subclasses return the states to save from ``_reference_stats_states`` and keep loaded states with
+    ``_set_reference_stats_states``. Saved statistics are keyed by ``_reference_stats_key``, such that they are only
+    loaded into a metric with the same configuration.
+
+    """
+
+    inception: Module
+    normalize: bool
+
+    def _reference_stats_key(self) -> Dict[str, Any]:
+        return {
+            "metric": type(self).__name__,
+            "feature_extractor": _feature_extractor_fingerprint(self.inception),
+            "normalize": self.normalize,
+        }
+
+    @abstractmethod
+    def _reference_stats_states(self) -> Dict[str, Tensor]:
+        """Return the states describing the real distribution."""
+
+    @abstractmethod
+    def _set_reference_stats_states(self, states: Dict[str, Tensor]) -> None:
+        """Keep the loaded states describing the real distribution."""
+
+    def save_real_features(self, path: str) -> None:
+        """Save the statistics of the real distribution to disk.
+
+        The saved file contains the real states of the metric (synced across processes), keyed by the feature
+        extractor, the normalization and any other configuration the states depend on. Loading it with
+        :meth:`load_real_features` allows skipping the inference on the real images entirely.
+
+        Args:
+            path: path of the file to write to
+
+        """
+        with self.sync_context():
+            _save_reference_stats(path, self._reference_stats_key(), self._reference_stats_states())
+
+    def load_real_features(self, path: str) -> None:
+        """Load statistics of the real distribution that were saved with :meth:`save_real_features`.
+
+        The loaded statistics are added to the real statistics accumulated with ``update`` and, contrary to these, are
+        kept when the metric is reset. They are not part of the synced states, such that every process can load the
+        same file.
+
+        Args:
+            path: path of the file to read from
+
+        Raises:
+            ValueError:
+                If the statistics were computed with a different configuration, e.g. a different feature extractor or
+                normalization
+
+        """
+        self._set_reference_stats_states(_load_reference_stats(path, self._reference_stats_key()))
+        self._computed = None
+
+
+class _ReferenceFeatureBankMixin(_ReferenceStatsMixin):
+    """Save and load the real features of a metric that keeps them in a ``real_features`` list state."""
+
+    real_features: List[Tensor]
+    _reference_features: Optional[Tensor]
+
+    def _accumulated_real_features(self) -> Tensor:
+        """Return the real features accumulated with ``update``."""
+        return dim_zero_cat(self.real_features)
+
+    def _real_features(self) -> Tensor:
+        """Return the accumulated real features, including a loaded reference feature bank."""
+        if self._reference_features is None:
+            return self._accumulated_real_features()
+        reference = self._reference_features.to(self.device)
+        if not self.real_features:
+            return reference
+        return torch.cat([self._accumulated_real_features(), reference])
+
+    def _reference_stats_states(self) -> Dict[str, Tensor]:
+        return {"real_features": self._real_features()}
+
+    def _set_reference_stats_states(self, states: Dict[str, Tensor]) -> None:
+        self._reference_features = states["real_features"]
+
+
+def _symmetric_sqrtm(sigma: Tensor) -> Tensor:
+    """Compute the principal square root of a symmetric positive semi-definite matrix through ``eigh``."""
+    eigvals, eigvecs = torch.linalg.eigh(sigma)
+    return (eigvecs * eigvals.clamp(min=0).sqrt()) @ eigvecs.t()
+
+
+def _newton_schulz_sqrtm_trace(mat: Tensor, num_iters: int = 50, tol: float = 1e-10) -> Tensor:
+    """Compute the trace of the square root of ``mat`` with the coupled Newton-Schulz iteration.
+
+    The iteration only relies on matrix products and converges for matrices with non-negative real eigenvalues, such
+    as the product of two covariance matrices, after scaling them to unit Frobenius norm. For rank-deficient input,
+    e.g. covariances estimated from fewer samples than features, the iteration eventually diverges once rounding errors
+    dominate. The tolerance is therefore bounded from below by the square root of the machine epsilon of ``mat`` and the
+    last finite trace is returned if the iteration diverges, which keeps the result finite but limits its accuracy in
+    single precision. Pass ``float64`` input for accurate results on rank-deficient matrices.
+
+    """
+    norm = torch.linalg.matrix_norm(mat)
+    if norm == 0:
+        return norm
+    tol = max(tol, torch.finfo(mat.dtype).eps ** 0.5)
+    eye = torch.eye(mat.shape[-1], dtype=mat.dtype, device=mat.device)
+    y, z = mat / norm, eye
+    trace = y.trace()
+    for _ in range(num_iters):
+        t = 0.5 * (3 * eye - z @ y)
+        y, z = y @ t, t @ z
+        new_trace = y.trace()
+        if not torch.isfinite(new_trace):
+            break
+        converged = (new_trace - trace).abs() <= tol * new_trace.abs()
+        trace = new_trace
+        if converged:
+            break
+    return trace * norm.sqrt()
+
+
+def _compute_fid(
+    mu1: Tensor,
+    sigma1: Tensor,
+    mu2: Tensor,
+    sigma2: Tensor,
+    sqrtm_method: Literal["eigvals", "eigh", "newton_schulz"] = "eigvals",
+    sigma1_sqrt: Optional[Tensor] = None,
+) -> Tensor:
     r"""Compute adjusted version of `Fid Score`_.
 
     The Frechet Inception Distance between two multivariate Gaussians X_x ~ N(mu_1, sigm_1)
@@ -167,6 +340,9 @@ def _compute_fid(mu1: Tensor, sigma1: Tensor, mu2: Tensor, sigma2: Tensor) -> Te
         sigma1: covariance matrix over activations calculated on predicted (x) samples
         mu2: mean of activations calculated on target (y) samples
         sigma2: covariance matrix over activations calculated on target (y) samples
+        sqrtm_method: method used for the trace of the matrix square root, see
+            :class:`~torchmetrics.image.fid.FrechetInceptionDistance`
+        sigma1_sqrt: optional precomputed square root of ``sigma1``, only used if ``sqrtm_method="eigh"``
 
     Returns:
         Scalar value of the distance between sets.
@@ -174,12 +350,20 @@ def _compute_fid(mu1: Tensor, sigma1: Tensor, mu2: Tensor, sigma2: Tensor) -> Te
     """
     a = (mu1 - mu2).square().sum(dim=-1)
     b = sigma1.trace() + sigma2.trace()
-    c = torch.linalg.eigvals(sigma1 @ sigma2).sqrt().real.sum(dim=-1)
+    if sqrtm_method == "eigh":
+        # Tr(sqrt(sigm_1*sigm_2)) = Tr(sqrt(sigm_1^0.5*sigm_2*sigm_1^0.5)), where the latter is symmetric
+        if sigma1_sqrt is None:
+            sigma1_sqrt = _symmetric_sqrtm(sigma1)
+        c = torch.linalg.eigvalsh(sigma1_sqrt @ sigma2 @ sigma1_sqrt).clamp(min=0).sqrt().sum(dim=-1)
+    elif sqrtm_method == "newton_schulz":
+        c = _newton_schulz_sqrtm_trace(sigma1 @ sigma2)
+    else:
+        c = torch.linalg.eigvals(sigma1 @ sigma2).sqrt().real.sum(dim=-1)
 
     return a + b - 2 * c
 
 
-class FrechetInceptionDistance(Metric):
+class FrechetInceptionDistance(_ReferenceStatsMixin, Metric):
     r"""Calculate Fréchet inception distance (FID_) which is used to access the quality of generated images.
 
     .. math::
@@ -236,7 +420,8 @@ class FrechetInceptionDistance(Metric):
 
         reset_real_features: Whether to also reset the real features. Since in many cases the real dataset does not
             change, the features can be cached them to avoid recomputing them which is costly. Set this to ``False`` if
-            your dataset does not change.
+            your dataset does not change. To also skip the real features across runs and processes, see
+            :meth:`save_real_features` and :meth:`load_real_features`.
         normalize:
             Argument for controlling the input image dtype normalization:
 
@@ -250,6 +435,18 @@ class FrechetInceptionDistance(Metric):
               - True: if input imgs are expected to be in the data type of torch.float32.
               - False: if input imgs are expected to be in the data type of torch.int8.
         input_img_size: tuple of integers. Indicates input img size to the custom feature extractor network if provided.
+        sqrtm_method:
+            Method used to compute the trace of the matrix square root :math:`(\Sigma \Sigma_w)^{\frac{1}{2}}`:
+
+            - ``"eigvals"``: eigenvalues of the (non-symmetric) product of the covariance matrices
+            - ``"eigh"``: eigenvalues of the symmetric matrix
+              :math:`\Sigma^{\frac{1}{2}} \Sigma_w \Sigma^{\frac{1}{2}}`. The square root of the real covariance
+              is cached between ``compute`` calls as long as the real statistics do not change, which makes repeated
+              evaluation against fixed real statistics (see ``reset_real_features``) several times cheaper.
+            - ``"newton_schulz"``: coupled Newton-Schulz iteration, which only relies on matrix products and is
+              therefore mostly interesting on GPU. The result is an approximation of the exact value, whose accuracy
+              is limited in single precision when the covariances are rank-deficient (fewer samples than features).
+
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -263,6 +460,8 @@ class FrechetInceptionDistance(Metric):
             If ``feature`` is not an ``str``, ``int`` or ``torch.nn.Module``
         ValueError:
             If ``reset_real_features`` is not an ``bool``
+        ValueError:
+            If ``sqrtm_method`` is not one of ``"eigvals"``, ``"eigh"`` or ``"newton_schulz"``
 
     Example:
         >>> import torch
@@ -301,6 +500,7 @@ class FrechetInceptionDistance(Metric):
         reset_real_features: bool = True,
         normalize: bool = False,
         input_img_size: Tuple[int, int, int] = (3, 299, 299),
+        sqrtm_method: Literal["eigvals", "eigh", "newton_schulz"] = "eigvals",
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -309,6 +509,16 @@ class FrechetInceptionDistance(Metric):
             raise ValueError("Argument `normalize` expected to be a bool")
         self.normalize = normalize
         self.used_custom_model = False
+        self.input_img_size = tuple(input_img_size)
+        self._reference_stats: Optional[Dict[str, Tensor]] = None
+
+        allowed_sqrtm_methods = ("eigvals", "eigh", "newton_schulz")
+        if sqrtm_method not in allowed_sqrtm_methods:
+            raise ValueError(
+                f"Argument `sqrtm_method` expected to be one of {allowed_sqrtm_methods}, but got {sqrtm_method}"
+            )
+        self.sqrtm_method = sqrtm_method
+        self._cov_real_sqrt: Optional[Tuple[Tensor, Tensor]] = None
 
         if isinstance(feature, int):
             num_features = feature
@@ -377,18 +587,62 @@ class FrechetInceptionDistance(Metric):
             self.fake_features_cov_sum += features.t().mm(features)
             self.fake_features_num_samples += imgs.shape[0]
 
+    def _real_stats(self) -> Tuple[Tensor, Tensor, Tensor]:
+        """Return the accumulated real statistics, including loaded reference statistics."""
+        real_stats = (self.real_features_sum, self.real_features_cov_sum, self.real_features_num_samples)
+        if self._reference_stats is None:
+            return real_stats
+        names = ("real_features_sum", "real_features_cov_sum", "real_features_num_samples")
+        return tuple(s + self._reference_stats[n].to(s.device) for s, n in zip(real_stats, names))  # type: ignore
+
     def compute(self) -> Tensor:
         """Calculate FID score based on accumulated extracted features from the two distributions."""
-        if self.real_features_num_samples < 2 or self.fake_features_num_samples < 2:
+        real_features_sum, real_features_cov_sum, real_features_num_samples = self._real_stats()
+        if real_features_num_samples < 2 or self.fake_features_num_samples < 2:
             raise RuntimeError("More than one sample is required for both the real and fake distributed to compute FID")
-        mean_real = (self.real_features_sum / self.real_features_num_samples).unsqueeze(0)
+        mean_real = (real_features_sum / real_features_num_samples).unsqueeze(0)
         mean_fake = (self.fake_features_sum / self.fake_features_num_samples).unsqueeze(0)
 
-        cov_real_num = self.real_features_cov_sum - self.real_features_num_samples * mean_real.t().mm(mean_real)
-        cov_real = cov_real_num / (self.real_features_num_samples - 1)
+        cov_real_num = real_features_cov_sum - real_features_num_samples * mean_real.t().mm(mean_real)
+        cov_real = cov_real_num / (real_features_num_samples - 1)
         cov_fake_num = self.fake_features_cov_sum - self.fake_features_num_samples * mean_fake.t().mm(mean_fake)
         cov_fake = cov_fake_num / (self.fake_features_num_samples - 1)
-        return _compute_fid(mean_real.squeeze(0), cov_real, mean_fake.squeeze(0), cov_fake).to(self.orig_dtype)
+        return _compute_fid(
+            mean_real.squeeze(0),
+            cov_real,
+            mean_fake.squeeze(0),
+            cov_fake,
+            sqrtm_method=self.sqrtm_method,
+            sigma1_sqrt=self._cached_cov_real_sqrt(cov_real) if self.sqrtm_method == "eigh" else None,
+        ).to(self.orig_dtype)
+
+    def _cached_cov_real_sqrt(self, cov_real: Tensor) -> Tensor:
+        """Return the square root of the real covariance, reusing the last one if the covariance did not change."""
+        if self._cov_real_sqrt is not None:
+            cached_cov, cached_sqrt = self._cov_real_sqrt
+            if (
+                cached_cov.shape == cov_real.shape
+                and cached_cov.device == cov_real.device
+                and torch.equal(cached_cov, cov_real)
+            ):
+                return cached_sqrt
+        cov_real_sqrt = _symmetric_sqrtm(cov_real)
+        self._cov_real_sqrt = (cov_real, cov_real_sqrt)
+        return cov_real_sqrt
+
+    def _reference_stats_key(self) -> Dict[str, Any]:
+        return {
+            **super()._reference_stats_key(),
+            "num_features": self.real_features_sum.shape[0],
+            "input_img_size": self.input_img_size,
+        }
+
+    def _reference_stats_states(self) -> Dict[str, Tensor]:
+        names = ("real_features_sum", "real_features_cov_sum", "real_features_num_samples")
+        return dict(zip(names, self._real_stats()))
+
+    def _set_reference_stats_states(self, states: Dict[str, Tensor]) -> None:
+        self._reference_stats = states
 
     def reset(self) -> None:
         """Reset metric states."""
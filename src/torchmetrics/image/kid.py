@@ -17,7 +17,10 @@ import torch
 from torch import Tensor
 from torch.nn import Module
 
-from torchmetrics.image.fid import NoTrainInceptionV3
+from torchmetrics.image.fid import (
+    NoTrainInceptionV3,
+    _ReferenceFeatureBankMixin,
+)
 from torchmetrics.metric import Metric
 from torchmetrics.utilities import rank_zero_warn
 from torchmetrics.utilities.data import dim_zero_cat
@@ -31,19 +34,23 @@ __doctest_requires__ = {("KernelInceptionDistance", "KernelInceptionDistance.plo
 
 
 def maximum_mean_discrepancy(k_xx: Tensor, k_xy: Tensor, k_yy: Tensor) -> Tensor:
-    """Adapted from `KID Score`_."""
-    m = k_xx.shape[0]
+    """Adapted from `KID Score`_.
+
+    The kernel matrices can have leading batch dimensions, in which case one value is returned per matrix.
 
-    diag_x = torch.diag(k_xx)
-    diag_y = torch.diag(k_yy)
+    """
+    m = k_xx.shape[-1]
+
+    diag_x = torch.diagonal(k_xx, dim1=-2, dim2=-1)
+    diag_y = torch.diagonal(k_yy, dim1=-2, dim2=-1)
 
     kt_xx_sums = k_xx.sum(dim=-1) - diag_x
     kt_yy_sums = k_yy.sum(dim=-1) - diag_y
-    k_xy_sums = k_xy.sum(dim=0)
+    k_xy_sums = k_xy.sum(dim=-2)
 
-    kt_xx_sum = kt_xx_sums.sum()
-    kt_yy_sum = kt_yy_sums.sum()
-    k_xy_sum = k_xy_sums.sum()
+    kt_xx_sum = kt_xx_sums.sum(dim=-1)
+    kt_yy_sum = kt_yy_sums.sum(dim=-1)
+    k_xy_sum = k_xy_sums.sum(dim=-1)
 
     value = (kt_xx_sum + kt_yy_sum) / (m * (m - 1))
     value -= 2 * k_xy_sum / (m**2)
@@ -53,21 +60,40 @@ def maximum_mean_discrepancy(k_xx: Tensor, k_xy: Tensor, k_yy: Tensor) -> Tensor
 def poly_kernel(f1: Tensor, f2: Tensor, degree: int = 3, gamma: Optional[float] = None, coef: float = 1.0) -> Tensor:
     """Adapted from `KID Score`_."""
     if gamma is None:
-        gamma = 1.0 / f1.shape[1]
-    return (f1 @ f2.T * gamma + coef) ** degree
+        gamma = 1.0 / f1.shape[-1]
+    return (f1 @ f2.transpose(-2, -1) * gamma + coef) ** degree
 
 
 def poly_mmd(
     f_real: Tensor, f_fake: Tensor, degree: int = 3, gamma: Optional[float] = None, coef: float = 1.0
 ) -> Tensor:
-    """Adapted from `KID Score`_."""
+    """Adapted from `KID Score`_.
+
+    The features can have leading batch dimensions, e.g. ``(S, m, d)`` to evaluate ``S`` subsets with one batched
+    matrix product.
+
+    """
     k_11 = poly_kernel(f_real, f_real, degree, gamma, coef)
     k_22 = poly_kernel(f_fake, f_fake, degree, gamma, coef)
     k_12 = poly_kernel(f_real, f_fake, degree, gamma, coef)
     return maximum_mean_discrepancy(k_11, k_12, k_22)
 
 
-class KernelInceptionDistance(Metric):
+def _reservoir_sample(features: Tensor, keys: Tensor, max_features: int) -> Tuple[Tensor, Tensor]:
+    """Keep the ``max_features`` features with the smallest random keys.
+
+    Every feature gets an independent uniform key when it is added, such that the features with the smallest keys are
+    a uniform sample without replacement of all features seen so far. Because the sample of a union is the sample of
+    the union of the samples, the reservoirs of different processes can simply be concatenated and sampled again.
+
+    """
+    if keys.shape[0] <= max_features:
+        return features, keys
+    keys, idx = keys.topk(max_features, largest=False)
+    return features[idx], keys
+
+
+class KernelInceptionDistance(_ReferenceFeatureBankMixin, Metric):
     r"""Calculate Kernel Inception Distance (KID) which is used to access the quality of generated images.
 
     .. math::
@@ -126,7 +152,16 @@ class KernelInceptionDistance(Metric):
         coef: Bias term in the polynomial kernel.
         reset_real_features: Whether to also reset the real features. Since in many cases the real dataset does not
             change, the features can cached them to avoid recomputing them which is costly. Set this to ``False`` if
-            your dataset does not change.
+            your dataset does not change. To also skip the real features across runs and processes, see
+            :meth:`save_real_features` and :meth:`load_real_features`.
+        max_features: Maximum number of features used per distribution. By default (``None``) all extracted
+            features are kept. If set, a uniform random sample (reservoir) of ``max_features`` of the features passed
+            to ``update`` is used instead, which bounds the memory of the metric independently of the number of
+            images: the states are compacted back to ``max_features`` features whenever they exceed twice that
+            size. The reservoirs of different processes are merged into a uniform sample of all features.
+        memory_budget: Maximum number of kernel matrix elements computed at once. The subsets are evaluated in
+            chunks of ``(chunk, subset_size, subset_size)`` batched kernel matrices such that the peak memory of
+            ``compute`` stays proportional to this budget. ``None`` evaluates all subsets at once.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -146,6 +181,10 @@ class KernelInceptionDistance(Metric):
             If ``coef`` is not an float larger than 0
         ValueError:
             If ``reset_real_features`` is not an ``bool``
+        ValueError:
+            If ``max_features`` is neither ``None`` or an integer larger than 0
+        ValueError:
+            If ``memory_budget`` is neither ``None`` or an integer larger than 0
 
     Example:
         >>> import torch
@@ -170,6 +209,8 @@ class KernelInceptionDistance(Metric):
 
     real_features: List[Tensor]
     fake_features: List[Tensor]
+    real_keys: List[Tensor]
+    fake_keys: List[Tensor]
     inception: Module
     feature_network: str = "inception"
 
@@ -183,15 +224,18 @@ class KernelInceptionDistance(Metric):
         coef: float = 1.0,
         reset_real_features: bool = True,
         normalize: bool = False,
+        max_features: Optional[int] = None,
+        memory_budget: Optional[int] = 2**25,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
 
-        rank_zero_warn(
-            "Metric `Kernel Inception Distance` will save all extracted features in buffer."
-            " For large datasets this may lead to large memory footprint.",
-            UserWarning,
-        )
+        if max_features is None:
+            rank_zero_warn(
+                "Metric `Kernel Inception Distance` will save all extracted features in buffer."
+                " For large datasets this may lead to large memory footprint.",
+                UserWarning,
+            )
 
         self.used_custom_model = False
 
@@ -242,9 +286,22 @@ class KernelInceptionDistance(Metric):
             raise ValueError("Argument `normalize` expected to be a bool")
         self.normalize = normalize
 
+        if max_features is not None and not (isinstance(max_features, int) and max_features > 0):
+            raise ValueError("Argument `max_features` expected to be `None` or integer larger than 0")
+        self.max_features = max_features
+
+        if memory_budget is not None and not (isinstance(memory_budget, int) and memory_budget > 0):
+            raise ValueError("Argument `memory_budget` expected to be `None` or integer larger than 0")
+        self.memory_budget = memory_budget
+
+        self._reference_features: Optional[Tensor] = None
+
         # states for extracted features
         self.add_state("real_features", [], dist_reduce_fx=None)
         self.add_state("fake_features", [], dist_reduce_fx=None)
+        # random keys of the features, only used if `max_features` is set
+        self.add_state("real_keys", [], dist_reduce_fx=None)
+        self.add_state("fake_keys", [], dist_reduce_fx=None)
 
     def update(self, imgs: Tensor, real: bool) -> None:
         """Update the state with extracted features.
@@ -258,10 +315,44 @@ class KernelInceptionDistance(Metric):
         imgs = (imgs * 255).byte() if self.normalize and (not self.used_custom_model) else imgs
         features = self.inception(imgs)
 
+        if self.max_features is None:
+            if real:
+                self.real_features.append(features)
+            else:
+                self.fake_features.append(features)
+            return
+
+        keys = torch.rand(features.shape[0], device=features.device)
         if real:
-            self.real_features.append(features)
+            self.real_features, self.real_keys = self._add_to_reservoir(
+                self.real_features, self.real_keys, features, keys, self.max_features
+            )
         else:
-            self.fake_features.append(features)
+            self.fake_features, self.fake_keys = self._add_to_reservoir(
+                self.fake_features, self.fake_keys, features, keys, self.max_features
+            )
+
+    @staticmethod
+    def _add_to_reservoir(
+        features: List[Tensor], keys: List[Tensor], new_features: Tensor, new_keys: Tensor, max_features: int
+    ) -> Tuple[List[Tensor], List[Tensor]]:
+        """Add features to a reservoir state, compacting it once it holds more than ``2 * max_features`` features."""
+        if keys and keys[0].shape[0] >= max_features:
+            # at least `max_features` stored keys are smaller than this threshold, larger keys are never sampled
+            keep = new_keys < keys[0].max()
+            new_features, new_keys = new_features[keep], new_keys[keep]
+        features, keys = [*features, new_features], [*keys, new_keys]
+        if sum(k.shape[0] for k in keys) > 2 * max_features:
+            sampled_features, sampled_keys = _reservoir_sample(dim_zero_cat(features), dim_zero_cat(keys), max_features)
+            features, keys = [sampled_features], [sampled_keys]
+        return features, keys
+
+    def _sampled_features(self, features: List[Tensor], keys: List[Tensor]) -> Tensor:
+        """Concatenate a feature state, reducing the merged reservoirs of all processes to ``max_features``."""
+        features = dim_zero_cat(features)
+        if self.max_features is None:
+            return features
+        return _reservoir_sample(features, dim_zero_cat(keys), self.max_features)[0]
 
     def compute(self) -> Tuple[Tensor, Tensor]:
         """Calculate KID score based on accumulated extracted features from the two distributions.
@@ -273,8 +364,8 @@ class KernelInceptionDistance(Metric):
             kid_std (:class:`~torch.Tensor`): float scalar tensor with standard deviation value over subsets
 
         """
-        real_features = dim_zero_cat(self.real_features)
-        fake_features = dim_zero_cat(self.fake_features)
+        real_features = self._real_features()
+        fake_features = self._sampled_features(self.fake_features, self.fake_keys)
 
         n_samples_real = real_features.shape[0]
         if n_samples_real < self.subset_size:
@@ -283,25 +374,34 @@ class KernelInceptionDistance(Metric):
         if n_samples_fake < self.subset_size:
             raise ValueError("Argument `subset_size` should be smaller than the number of samples")
 
-        kid_scores_ = []
+        idx_real, idx_fake = [], []
         for _ in range(self.subsets):
-            perm = torch.randperm(n_samples_real)
-            f_real = real_features[perm[: self.subset_size]]
-            perm = torch.randperm(n_samples_fake)
-            f_fake = fake_features[perm[: self.subset_size]]
-
-            o = poly_mmd(f_real, f_fake, self.degree, self.gamma, self.coef)
-            kid_scores_.append(o)
-        kid_scores = torch.stack(kid_scores_)
+            idx_real.append(torch.randperm(n_samples_real)[: self.subset_size])
+            idx_fake.append(torch.randperm(n_samples_fake)[: self.subset_size])
+        idx_real, idx_fake = torch.stack(idx_real), torch.stack(idx_fake)
+
+        # three kernel matrices of size (subset_size, subset_size) are computed per subset
+        chunk_size = self.subsets
+        if self.memory_budget is not None:
+            chunk_size = max(1, self.memory_budget // (3 * self.subset_size**2))
+        scores = [
+            poly_mmd(real_features[r], fake_features[f], self.degree, self.gamma, self.coef)
+            for r, f in zip(idx_real.split(chunk_size), idx_fake.split(chunk_size))
+        ]
+        kid_scores = torch.cat(scores)
         return kid_scores.mean(), kid_scores.std(unbiased=False)
 
+    def _accumulated_real_features(self) -> Tensor:
+        """Return the real features accumulated with ``update``, sampled from the reservoir if it is bounded."""
+        return self._sampled_features(self.real_features, self.real_keys)
+
     def reset(self) -> None:
         """Reset metric states."""
         if not self.reset_real_features:
             # remove temporarily to avoid resetting
-            value = self._defaults.pop("real_features")
+            values = {name: self._defaults.pop(name) for name in ("real_features", "real_keys")}
             super().reset()
-            self._defaults["real_features"] = value
+            self._defaults.update(values)
         else:
             super().reset()
 
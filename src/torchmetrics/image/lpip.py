@@ -17,7 +17,13 @@ import torch
 from torch import Tensor
 from typing_extensions import Literal
 
-from torchmetrics.functional.image.lpips import _LPIPS, _lpips_compute, _lpips_update, _NoTrainLpips
+from torchmetrics.functional.image.lpips import (
+    _LPIPS,
+    _lpips_compute,
+    _lpips_update,
+    _NoTrainLpips,
+    _validate_evaluation_args,
+)
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.checks import _SKIP_SLOW_DOCTEST, _try_proceed_with_timeout
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCHVISION_AVAILABLE
@@ -67,6 +73,12 @@ class LearnedPerceptualImagePatchSimilarity(Metric):
         reduction: str indicating how to reduce over the batch dimension. Choose between `'sum'` or `'mean'`.
         normalize: by default this is ``False`` meaning that the input is expected to be in the [-1,1] range. If set
             to ``True`` will instead expect input to be in the ``[0,1]`` range.
+        max_batch_size: if set, the images of every update are passed through the network in chunks of at most this
+            many pairs to bound the memory of the activations. The result does not depend on it.
+        inference_dtype: if set, e.g. to ``torch.float16`` or ``torch.bfloat16``, the network runs under
+            ``torch.autocast`` in this dtype. This is faster on hardware with reduced precision support, but every
+            score deviates from the full precision score by a relative error of about ``1e-3`` for ``float16`` and
+            ``1e-2`` for ``bfloat16``, a few units of the rounding error of the dtype.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -76,6 +88,10 @@ class LearnedPerceptualImagePatchSimilarity(Metric):
             If ``net_type`` is not one of ``"vgg"``, ``"alex"`` or ``"squeeze"``
         ValueError:
             If ``reduction`` is not one of ``"mean"`` or ``"sum"``
+        ValueError:
+            If ``max_batch_size`` is not a positive integer or ``None``
+        ValueError:
+            If ``inference_dtype`` is not a floating point ``torch.dtype`` or ``None``
 
     Example:
         >>> import torch
@@ -108,6 +124,8 @@ class LearnedPerceptualImagePatchSimilarity(Metric):
         net_type: Literal["vgg", "alex", "squeeze"] = "alex",
         reduction: Literal["sum", "mean"] = "mean",
         normalize: bool = False,
+        max_batch_size: Optional[int] = None,
+        inference_dtype: Optional[torch.dtype] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -132,12 +150,23 @@ class LearnedPerceptualImagePatchSimilarity(Metric):
             raise ValueError(f"Argument `normalize` should be an bool but got {normalize}")
         self.normalize = normalize
 
+        _validate_evaluation_args(max_batch_size, inference_dtype)
+        self.max_batch_size = max_batch_size
+        self.inference_dtype = inference_dtype
+
         self.add_state("sum_scores", torch.tensor(0.0), dist_reduce_fx="sum")
         self.add_state("total", torch.tensor(0.0), dist_reduce_fx="sum")
 
     def update(self, img1: Tensor, img2: Tensor) -> None:
         """Update internal states with lpips score."""
-        loss, total = _lpips_update(img1, img2, net=self.net, normalize=self.normalize)
+        loss, total = _lpips_update(
+            img1,
+            img2,
+            net=self.net,
+            normalize=self.normalize,
+            max_batch_size=self.max_batch_size,
+            inference_dtype=self.inference_dtype,
+        )
         self.sum_scores += loss.sum()
         self.total += total
 
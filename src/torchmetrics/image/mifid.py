@@ -17,7 +17,11 @@ import torch
 from torch import Tensor
 from torch.nn import Module
 
-from torchmetrics.image.fid import NoTrainInceptionV3, _compute_fid
+from torchmetrics.image.fid import (
+    NoTrainInceptionV3,
+    _compute_fid,
+    _ReferenceFeatureBankMixin,
+)
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TORCH_FIDELITY_AVAILABLE
@@ -63,7 +67,7 @@ def _mifid_compute(
     return fid_value / (distance + 10e-15) if fid_value > 1e-8 else torch.zeros_like(fid_value)
 
 
-class MemorizationInformedFrechetInceptionDistance(Metric):
+class MemorizationInformedFrechetInceptionDistance(_ReferenceFeatureBankMixin, Metric):
     r"""Calculate Memorization-Informed Frechet Inception Distance (MIFID_).
 
     MIFID is a improved variation of the Frechet Inception Distance (FID_) that penalizes memorization of the training
@@ -111,7 +115,8 @@ class MemorizationInformedFrechetInceptionDistance(Metric):
 
         reset_real_features: Whether to also reset the real features. Since in many cases the real dataset does not
             change, the features can be cached them to avoid recomputing them which is costly. Set this to ``False`` if
-            your dataset does not change.
+            your dataset does not change. To also skip the real features across runs and processes, see
+            :meth:`save_real_features` and :meth:`load_real_features`.
         cosine_distance_eps: Epsilon value for the cosine distance. If the cosine distance is larger than this value
             it is set to 1 and thus ignored in the MIFID calculation.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
@@ -193,6 +198,8 @@ class MemorizationInformedFrechetInceptionDistance(Metric):
             raise ValueError("Argument `cosine_distance_eps` expected to be a float greater than 0 and less than 1")
         self.cosine_distance_eps = cosine_distance_eps
 
+        self._reference_features: Optional[Tensor] = None
+
         # states for extracted features
         self.add_state("real_features", [], dist_reduce_fx=None)
         self.add_state("fake_features", [], dist_reduce_fx=None)
@@ -211,7 +218,7 @@ class MemorizationInformedFrechetInceptionDistance(Metric):
 
     def compute(self) -> Tensor:
         """Calculate FID score based on accumulated extracted features from the two distributions."""
-        real_features = dim_zero_cat(self.real_features)
+        real_features = self._real_features()
         fake_features = dim_zero_cat(self.fake_features)
 
         mean_real, mean_fake = torch.mean(real_features, dim=0), torch.mean(fake_features, dim=0)
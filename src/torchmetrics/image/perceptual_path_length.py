@@ -15,7 +15,7 @@ from typing import Any, Literal, Optional, Tuple, Union
 
 from torch import Tensor, nn
 
-from torchmetrics.functional.image.lpips import _LPIPS
+from torchmetrics.functional.image.lpips import _LPIPS, _validate_evaluation_args
 from torchmetrics.functional.image.perceptual_path_length import (
     GeneratorType,
     _perceptual_path_length_validate_arguments,
@@ -75,6 +75,8 @@ class PerceptualPathLength(Metric):
         upper_discard: Upper quantile to discard from the distances, before computing the mean and standard deviation.
         sim_net: Similarity network to use. Can be a `nn.Module` or one of 'alex', 'vgg', 'squeeze', where the three
             latter options correspond to the pretrained networks from the `LPIPS`_ paper.
+        max_batch_size: If set, the image pairs of every batch are passed through the similarity network in chunks of
+            at most this many pairs to bound the memory of the activations. The result does not depend on it.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -96,6 +98,8 @@ class PerceptualPathLength(Metric):
             If ``lower_discard`` is not a float between 0 and 1 or None.
         ValueError:
             If ``upper_discard`` is not a float between 0 and 1 or None.
+        ValueError:
+            If ``max_batch_size`` is not a positive integer or None.
 
     Example::
         >>> from torchmetrics.image import PerceptualPathLength
@@ -137,6 +141,7 @@ class PerceptualPathLength(Metric):
         lower_discard: Optional[float] = 0.01,
         upper_discard: Optional[float] = 0.99,
         sim_net: Union[nn.Module, Literal["alex", "vgg", "squeeze"]] = "vgg",
+        max_batch_size: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -156,6 +161,8 @@ class PerceptualPathLength(Metric):
         self.resize = resize
         self.lower_discard = lower_discard
         self.upper_discard = upper_discard
+        _validate_evaluation_args(max_batch_size, None)
+        self.max_batch_size = max_batch_size
 
         if isinstance(sim_net, nn.Module):
             self.net = sim_net
@@ -175,6 +182,7 @@ class PerceptualPathLength(Metric):
             generator=self.generator,
             num_samples=self.num_samples,
             conditional=self.conditional,
+            batch_size=self.batch_size,
             interpolation_method=self.interpolation_method,
             epsilon=self.epsilon,
             resize=self.resize,
@@ -182,4 +190,5 @@ class PerceptualPathLength(Metric):
             upper_discard=self.upper_discard,
             sim_net=self.net,
             device=self.device,
+            max_batch_size=self.max_batch_size,
         )
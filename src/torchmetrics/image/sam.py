@@ -73,8 +73,7 @@ class SpectralAngleMapper(Metric):
     plot_lower_bound: float = 0.0
     plot_upper_bound: float = 1.0
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    sam_score: List[Tensor]
     sum_sam: Tensor
     numel: Tensor
 
@@ -90,11 +89,10 @@ class SpectralAngleMapper(Metric):
             )
         if reduction == "none" or reduction is None:
             rank_zero_warn(
-                "Metric `SpectralAngleMapper` will save all targets and predictions in the buffer when using"
+                "Metric `SpectralAngleMapper` will save the spectral angle of every pixel in the buffer when using"
                 "`reduction=None` or `reduction='none'. For large datasets, this may lead to a large memory footprint."
             )
-            self.add_state("preds", default=[], dist_reduce_fx="cat")
-            self.add_state("target", default=[], dist_reduce_fx="cat")
+            self.add_state("sam_score", default=[], dist_reduce_fx="cat")
         else:
             self.add_state("sum_sam", tensor(0.0), dist_reduce_fx="sum")
             self.add_state("numel", tensor(0), dist_reduce_fx="sum")
@@ -104,8 +102,7 @@ class SpectralAngleMapper(Metric):
         """Update state with predictions and targets."""
         preds, target = _sam_update(preds, target)
         if self.reduction == "none" or self.reduction is None:
-            self.preds.append(preds)
-            self.target.append(target)
+            self.sam_score.append(_sam_compute(preds, target, reduction="none"))
         else:
             sam_score = _sam_compute(preds, target, reduction="sum")
             self.sum_sam += sam_score
@@ -115,9 +112,7 @@ class SpectralAngleMapper(Metric):
     def compute(self) -> Tensor:
         """Compute spectra over state."""
         if self.reduction == "none" or self.reduction is None:
-            preds = dim_zero_cat(self.preds)
-            target = dim_zero_cat(self.target)
-            return _sam_compute(preds, target, self.reduction)
+            return dim_zero_cat(self.sam_score)
         return self.sum_sam / self.numel if self.reduction == "elementwise_mean" else self.sum_sam
 
     def plot(
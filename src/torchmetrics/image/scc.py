@@ -11,13 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Optional
+from typing import Any, Optional, Sequence, Union
 
 import torch
 from torch import Tensor, tensor
 
 from torchmetrics.functional.image.scc import _scc_per_channel_compute as _scc_compute
-from torchmetrics.functional.image.scc import _scc_update
+from torchmetrics.functional.image.scc import _scc_update, _scc_update_tiled
 from torchmetrics.metric import Metric
 
 
@@ -36,6 +36,10 @@ class SpatialCorrelationCoefficient(Metric):
     Args:
         hp_filter: High-pass filter tensor. default: tensor([[-1,-1,-1],[-1,8,-1],[-1,-1,-1]]).
         window_size: Local window size integer. default: 8.
+        tile_size: If set, the scc map is computed in tiles of this size, each extended by the support of the filters,
+            which bounds the peak memory for very large images while giving the same result. ``preds`` and ``target``
+            can then also be ``numpy`` arrays, e.g. ``numpy.memmap``, from which only the required regions are read
+            and moved to the device of the metric.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Example:
@@ -57,7 +61,13 @@ class SpatialCorrelationCoefficient(Metric):
     scc_score: Tensor
     total: Tensor
 
-    def __init__(self, high_pass_filter: Optional[Tensor] = None, window_size: int = 8, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        high_pass_filter: Optional[Tensor] = None,
+        window_size: int = 8,
+        tile_size: Optional[Union[int, Sequence[int]]] = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
 
         if high_pass_filter is None:
@@ -65,12 +75,20 @@ class SpatialCorrelationCoefficient(Metric):
 
         self.hp_filter = high_pass_filter
         self.ws = window_size
+        self.tile_size = tile_size
 
         self.add_state("scc_score", default=tensor(0.0), dist_reduce_fx="sum")
         self.add_state("total", default=tensor(0.0), dist_reduce_fx="sum")
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
+        if self.tile_size is not None:
+            scc_per_image = _scc_update_tiled(
+                preds, target, self.hp_filter, self.ws, self.tile_size, device=self.device
+            )
+            self.scc_score += torch.sum(scc_per_image)
+            self.total += preds.shape[0]
+            return
         preds, target, hp_filter = _scc_update(preds, target, self.hp_filter, self.ws)
         scc_per_channel = [
             _scc_compute(preds[:, i, :, :].unsqueeze(1), target[:, i, :, :].unsqueeze(1), hp_filter, self.ws)
@@ -17,7 +17,13 @@ import torch
 from torch import Tensor
 from typing_extensions import Literal
 
-from torchmetrics.functional.image.ssim import _multiscale_ssim_update, _ssim_check_inputs, _ssim_update
+from torchmetrics.functional.image.ssim import (
+    _multiscale_ssim_update,
+    _multiscale_ssim_update_tiled,
+    _ssim_check_inputs,
+    _ssim_update,
+    _ssim_update_tiled,
+)
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.data import dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
@@ -64,6 +70,11 @@ class StructuralSimilarityIndexMeasure(Metric):
         return_contrast_sensitivity: If true, the constant term is returned as a second argument.
             The luminance term can be obtained with luminance=ssim/contrast
             Mutually exclusive with ``return_full_image``
+        tile_size: If set, the ssim map is computed in tiles of this size (one value or one per spatial dimension),
+            each extended by the support of the filter, which bounds the peak memory for very large images and
+            volumes while giving the same result. ``preds`` and ``target`` can then also be ``numpy`` arrays, e.g.
+            ``numpy.memmap``, from which only the required regions are read and moved to the device of the metric.
+            Not supported with ``return_full_image``.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Example:
@@ -97,10 +108,14 @@ class StructuralSimilarityIndexMeasure(Metric):
         k2: float = 0.03,
         return_full_image: bool = False,
         return_contrast_sensitivity: bool = False,
+        tile_size: Optional[Union[int, Sequence[int]]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
 
+        if tile_size is not None and return_full_image:
+            raise ValueError("Arguments `tile_size` and `return_full_image` are mutually exclusive.")
+
         valid_reduction = ("elementwise_mean", "sum", "none", None)
         if reduction not in valid_reduction:
             raise ValueError(f"Argument `reduction` must be one of {valid_reduction}, but got {reduction}")
@@ -124,22 +139,38 @@ class StructuralSimilarityIndexMeasure(Metric):
         self.k2 = k2
         self.return_full_image = return_full_image
         self.return_contrast_sensitivity = return_contrast_sensitivity
+        self.tile_size = tile_size
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
-        preds, target = _ssim_check_inputs(preds, target)
-        similarity_pack = _ssim_update(
-            preds,
-            target,
-            self.gaussian_kernel,
-            self.sigma,
-            self.kernel_size,
-            self.data_range,
-            self.k1,
-            self.k2,
-            self.return_full_image,
-            self.return_contrast_sensitivity,
-        )
+        if self.tile_size is not None:
+            similarity_pack = _ssim_update_tiled(
+                preds,
+                target,
+                self.tile_size,
+                self.gaussian_kernel,
+                self.sigma,
+                self.kernel_size,
+                self.data_range,
+                self.k1,
+                self.k2,
+                self.return_contrast_sensitivity,
+                device=self.device,
+            )
+        else:
+            preds, target = _ssim_check_inputs(preds, target)
+            similarity_pack = _ssim_update(
+                preds,
+                target,
+                self.gaussian_kernel,
+                self.sigma,
+                self.kernel_size,
+                self.data_range,
+                self.k1,
+                self.k2,
+                self.return_full_image,
+                self.return_contrast_sensitivity,
+            )
 
         if isinstance(similarity_pack, tuple):
             similarity, image = similarity_pack
@@ -254,6 +285,9 @@ class MultiScaleStructuralSimilarityIndexMeasure(Metric):
         normalize: When MultiScaleStructuralSimilarityIndexMeasure loss is used for training, it is desirable to use
             normalizes to improve the training stability. This `normalize` argument is out of scope of the original
             implementation [1], and it is adapted from https://github.com/jorge-pessoa/pytorch-msssim instead.
+        tile_size: If set, every scale is computed in tiles of this size at full resolution (one value or one per
+            spatial dimension), which bounds the peak memory for very large images and volumes while giving the same
+            result. ``preds`` and ``target`` can then also be ``numpy`` arrays, e.g. ``numpy.memmap``.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Return:
@@ -299,6 +333,7 @@ class MultiScaleStructuralSimilarityIndexMeasure(Metric):
         k2: float = 0.03,
         betas: Tuple[float, ...] = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333),
         normalize: Literal["relu", "simple", None] = "relu",
+        tile_size: Optional[Union[int, Sequence[int]]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -341,22 +376,39 @@ class MultiScaleStructuralSimilarityIndexMeasure(Metric):
         if normalize and normalize not in ("relu", "simple"):
             raise ValueError("Argument `normalize` to be expected either `None` or one of 'relu' or 'simple'")
         self.normalize = normalize
+        self.tile_size = tile_size
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
-        preds, target = _ssim_check_inputs(preds, target)
-        similarity = _multiscale_ssim_update(
-            preds,
-            target,
-            self.gaussian_kernel,
-            self.sigma,
-            self.kernel_size,
-            self.data_range,
-            self.k1,
-            self.k2,
-            self.betas,
-            self.normalize,
-        )
+        if self.tile_size is not None:
+            similarity = _multiscale_ssim_update_tiled(
+                preds,
+                target,
+                self.tile_size,
+                self.gaussian_kernel,
+                self.sigma,
+                self.kernel_size,
+                self.data_range,
+                self.k1,
+                self.k2,
+                self.betas,
+                self.normalize,
+                device=self.device,
+            )
+        else:
+            preds, target = _ssim_check_inputs(preds, target)
+            similarity = _multiscale_ssim_update(
+                preds,
+                target,
+                self.gaussian_kernel,
+                self.sigma,
+                self.kernel_size,
+                self.data_range,
+                self.k1,
+                self.k2,
+                self.betas,
+                self.normalize,
+            )
 
         if self.reduction in ("none", None):
             self.similarity.append(similarity)
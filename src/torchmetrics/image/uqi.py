@@ -71,8 +71,7 @@ class UniversalImageQualityIndex(Metric):
     plot_lower_bound: float = 0.0
     plot_upper_bound: float = 1.0
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    uqi_score: List[Tensor]
     sum_uqi: Tensor
     numel: Tensor
 
@@ -90,11 +89,11 @@ class UniversalImageQualityIndex(Metric):
             )
         if reduction is None or reduction == "none":
             rank_zero_warn(
-                "Metric `UniversalImageQualityIndex` will save all targets and predictions in the buffer when using"
-                "`reduction=None` or `reduction='none'. For large datasets, this may lead to a large memory footprint."
+                "Metric `UniversalImageQualityIndex` will save the quality index map of every image in the buffer when"
+                " using `reduction=None` or `reduction='none'. For large datasets, this may lead to a large memory"
+                " footprint."
             )
-            self.add_state("preds", default=[], dist_reduce_fx="cat")
-            self.add_state("target", default=[], dist_reduce_fx="cat")
+            self.add_state("uqi_score", default=[], dist_reduce_fx="cat")
         else:
             self.add_state("sum_uqi", tensor(0.0), dist_reduce_fx="sum")
             self.add_state("numel", tensor(0), dist_reduce_fx="sum")
@@ -106,8 +105,7 @@ class UniversalImageQualityIndex(Metric):
         """Update state with predictions and targets."""
         preds, target = _uqi_update(preds, target)
         if self.reduction is None or self.reduction == "none":
-            self.preds.append(preds)
-            self.target.append(target)
+            self.uqi_score.append(_uqi_compute(preds, target, self.kernel_size, self.sigma, reduction="none"))
         else:
             uqi_score = _uqi_compute(preds, target, self.kernel_size, self.sigma, reduction="sum")
             self.sum_uqi += uqi_score
@@ -117,9 +115,7 @@ class UniversalImageQualityIndex(Metric):
     def compute(self) -> Tensor:
         """Compute explained variance over state."""
         if self.reduction == "none" or self.reduction is None:
-            preds = dim_zero_cat(self.preds)
-            target = dim_zero_cat(self.target)
-            return _uqi_compute(preds, target, self.kernel_size, self.sigma, self.reduction)
+            return dim_zero_cat(self.uqi_score)
         return self.sum_uqi / self.numel if self.reduction == "elementwise_mean" else self.sum_uqi
 
     def plot(
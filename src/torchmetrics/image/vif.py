@@ -11,12 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any
+from typing import Any, Optional, Sequence, Union
 
 import torch
 from torch import Tensor, tensor
 
-from torchmetrics.functional.image.vif import _vif_per_channel
+from torchmetrics.functional.image.vif import _vif_per_channel, _vif_update_tiled
 from torchmetrics.metric import Metric
 
 
@@ -34,6 +34,10 @@ class VisualInformationFidelity(Metric):
 
     Args:
         sigma_n_sq: variance of the visual noise
+        tile_size: If set, the vif maps of every scale are computed in tiles of this size at full resolution, which
+            bounds the peak memory for very large images while giving the same result. ``preds`` and ``target`` can
+            then also be ``numpy`` arrays, e.g. ``numpy.memmap``, from which only the required regions are read and
+            moved to the device of the metric.
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Example:
@@ -55,7 +59,9 @@ class VisualInformationFidelity(Metric):
     vif_score: Tensor
     total: Tensor
 
-    def __init__(self, sigma_n_sq: float = 2.0, **kwargs: Any) -> None:
+    def __init__(
+        self, sigma_n_sq: float = 2.0, tile_size: Optional[Union[int, Sequence[int]]] = None, **kwargs: Any
+    ) -> None:
         super().__init__(**kwargs)
 
         if not isinstance(sigma_n_sq, float) and not isinstance(sigma_n_sq, int):
@@ -67,9 +73,16 @@ class VisualInformationFidelity(Metric):
         self.add_state("vif_score", default=tensor(0.0), dist_reduce_fx="sum")
         self.add_state("total", default=tensor(0.0), dist_reduce_fx="sum")
         self.sigma_n_sq = sigma_n_sq
+        self.tile_size = tile_size
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
+        if self.tile_size is not None:
+            self.vif_score += torch.sum(
+                _vif_update_tiled(preds, target, self.sigma_n_sq, self.tile_size, device=self.device).mean(1)
+            )
+            self.total += preds.shape[0]
+            return
         channels = preds.size(1)
         vif_per_channel = [
             _vif_per_channel(preds[:, i, :, :], target[:, i, :, :], self.sigma_n_sq) for i in range(channels)
@@ -18,7 +18,11 @@ from torch import Tensor
 from typing_extensions import Literal
 
 from torchmetrics import Metric
-from torchmetrics.functional.multimodal.clip_score import _clip_score_update, _get_clip_model_and_processor
+from torchmetrics.functional.multimodal.clip_score import (
+    _clip_score_update,
+    _CLIPTextEmbeddingCache,
+    _get_clip_model_and_processor,
+)
 from torchmetrics.utilities.checks import _SKIP_SLOW_DOCTEST, _try_proceed_with_timeout
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE, _TRANSFORMERS_GREATER_EQUAL_4_10
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
@@ -56,6 +60,10 @@ class CLIPScore(Metric):
 
     .. note:: Metric is not scriptable
 
+    The images are resized, center cropped and normalized on their own device. The text embeddings of the last
+    ``1024`` distinct captions are cached, so repeated captions are only embedded once. The cache is not cleared by
+    ``reset``, call ``metric.text_embedding_cache.clear()`` if the weights of the model are changed.
+
     As input to ``forward`` and ``update`` the metric accepts the following input
 
     - ``images`` (:class:`~torch.Tensor` or list of tensors): tensor with images feed to the feature extractor with. If
@@ -113,6 +121,7 @@ class CLIPScore(Metric):
     ) -> None:
         super().__init__(**kwargs)
         self.model, self.processor = _get_clip_model_and_processor(model_name_or_path)
+        self.text_embedding_cache = _CLIPTextEmbeddingCache()
         self.add_state("score", torch.tensor(0.0), dist_reduce_fx="sum")
         self.add_state("n_samples", torch.tensor(0, dtype=torch.long), dist_reduce_fx="sum")
 
@@ -130,7 +139,7 @@ class CLIPScore(Metric):
                 If the number of images and captions do not match
 
         """
-        score, n_samples = _clip_score_update(images, text, self.model, self.processor)
+        score, n_samples = _clip_score_update(images, text, self.model, self.processor, self.text_embedding_cache)
         self.score += score.sum(0)
         self.n_samples += n_samples
 
@@ -94,6 +94,7 @@ class RetrievalAUROC(RetrievalMetric):
     full_state_update: bool = False
     plot_lower_bound: float = 0.0
     plot_upper_bound: float = 1.0
+    top_k: Optional[int]
 
     def __init__(
         self,
@@ -18,6 +18,7 @@ from typing_extensions import Literal
 
 from torchmetrics.functional.retrieval.average_precision import retrieval_average_precision
 from torchmetrics.retrieval.base import RetrievalMetric
+from torchmetrics.utilities.checks import _check_retrieval_top_k
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -56,7 +57,10 @@ class RetrievalMAP(RetrievalMetric):
             - ``'error'``: raise a ``ValueError``
 
         ignore_index: Ignore predictions where the target is equal to this number.
-        top_k: Consider only the top k elements for each query (default: ``None``, which considers them all)
+        top_k:
+            Consider only the top k elements for each query (default: ``None``, which considers them all). Can also
+            be a list of cutoffs, e.g. ``[1, 5, 10]``: each query is then ranked once and the metric is computed at
+            every cutoff, returning a tensor with one value per cutoff (in the same order).
         aggregation:
             Specify how to aggregate over indexes. Can either a custom callable function that takes in a single tensor
             and returns a scalar value or one of the following strings:
@@ -74,7 +78,7 @@ class RetrievalMAP(RetrievalMetric):
         ValueError:
             If ``ignore_index`` is not `None` or an integer.
         ValueError:
-            If ``top_k`` is not ``None`` or not an integer greater than 0.
+            If ``top_k`` is not ``None``, an integer greater than 0 or a list of such integers.
 
     Example:
         >>> from torch import tensor
@@ -98,7 +102,7 @@ class RetrievalMAP(RetrievalMetric):
         self,
         empty_target_action: str = "neg",
         ignore_index: Optional[int] = None,
-        top_k: Optional[int] = None,
+        top_k: Optional[Union[int, Sequence[int]]] = None,
         aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
         **kwargs: Any,
     ) -> None:
@@ -109,12 +113,11 @@ class RetrievalMAP(RetrievalMetric):
             **kwargs,
         )
 
-        if top_k is not None and not isinstance(top_k, int) and top_k <= 0:
-            raise ValueError(f"Argument ``top_k`` has to be a positive integer or None, but got {top_k}")
-        self.k = top_k
+        _check_retrieval_top_k(top_k)
+        self.top_k = top_k
 
     def _metric(self, preds: Tensor, target: Tensor) -> Tensor:
-        return retrieval_average_precision(preds, target, top_k=self.k)
+        return retrieval_average_precision(preds, target, top_k=self.top_k)
 
     def plot(
         self, val: Optional[Union[Tensor, Sequence[Tensor]]] = None, ax: Optional[_AX_TYPE] = None
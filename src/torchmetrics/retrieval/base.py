@@ -12,15 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 import torch
-from torch import Tensor, tensor
+from torch import Tensor
 from typing_extensions import Literal
 
 from torchmetrics import Metric
 from torchmetrics.utilities.checks import _check_retrieval_inputs
 from torchmetrics.utilities.data import _flexible_bincount, dim_zero_cat
+from torchmetrics.utilities.distributed import _all_to_all_by_rank, gather_all_tensors
 
 
 def _retrieval_aggregate(
@@ -40,6 +41,37 @@ def _retrieval_aggregate(
     return aggregation(values, dim=dim)
 
 
+def _retrieval_sharded_aggregate(
+    values: Tensor,
+    aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
+    group: Optional[Any] = None,
+) -> Tensor:
+    """Aggregate per-query values that are sharded across processes into a single value.
+
+    Only the partial statistics (sum or extremum, and number of queries) of each process are reduced, so the
+    per-query values never have to leave the process that computed them. This is why only ``mean``, ``min`` and
+    ``max`` are supported.
+
+    """
+    if aggregation not in ("mean", "min", "max"):
+        raise ValueError(f"Sharded aggregation only supports `mean`, `min` or `max`, but got {aggregation}.")
+    count = torch.tensor([values.shape[0]], dtype=values.dtype, device=values.device)
+    if aggregation == "mean":
+        stats = torch.cat([values.sum(dim=0).flatten(), count])
+        torch.distributed.all_reduce(stats, op=torch.distributed.ReduceOp.SUM, group=group)
+        total, count = stats[:-1].reshape(values.shape[1:]), stats[-1]
+        return total / count if count > 0 else torch.zeros_like(total)
+
+    if values.shape[0]:
+        extremum = values.min(dim=0).values if aggregation == "min" else values.max(dim=0).values
+    else:
+        extremum = torch.full(values.shape[1:], float("inf" if aggregation == "min" else "-inf"), device=values.device)
+    op = torch.distributed.ReduceOp.MIN if aggregation == "min" else torch.distributed.ReduceOp.MAX
+    torch.distributed.all_reduce(extremum, op=op, group=group)
+    torch.distributed.all_reduce(count, op=torch.distributed.ReduceOp.SUM, group=group)
+    return extremum if count > 0 else torch.zeros_like(extremum)
+
+
 class RetrievalMetric(Metric, ABC):
     """Works with binary target data. Accepts float predictions from a model output.
 
@@ -83,6 +115,16 @@ class RetrievalMetric(Metric, ABC):
             - ``'max'``: max value is returned
             - ``'min'``: min value is returned
 
+        sync_mode:
+            Specify how the states are synchronized in a distributed setting. Choose from:
+
+            - ``'gather'``: every process gathers the ``indexes``, ``preds`` and ``target`` of all the other
+              processes and computes the metric over all queries (default)
+            - ``'shard'``: the rows of each query are routed with an all-to-all exchange to a single process,
+              selected as ``indexes % world_size``. Every process then only computes the scores of its own queries
+              and only the aggregated statistics are reduced across processes. Only supported with ``aggregation``
+              being one of ``'mean'``, ``'min'`` or ``'max'``, and ignores any custom ``dist_sync_fn``.
+
         kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
     Raises:
@@ -90,6 +132,9 @@ class RetrievalMetric(Metric, ABC):
             If ``empty_target_action`` is not one of ``error``, ``skip``, ``neg`` or ``pos``.
         ValueError:
             If ``ignore_index`` is not `None` or an integer.
+        ValueError:
+            If ``sync_mode`` is not one of ``gather`` or ``shard``, or if ``sync_mode='shard'`` is combined with an
+            ``aggregation`` different from ``mean``, ``min`` or ``max``.
 
     """
 
@@ -100,12 +145,14 @@ class RetrievalMetric(Metric, ABC):
     indexes: List[Tensor]
     preds: List[Tensor]
     target: List[Tensor]
+    top_k: Optional[Union[int, Sequence[int]]] = None
 
     def __init__(
         self,
         empty_target_action: str = "neg",
         ignore_index: Optional[int] = None,
         aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
+        sync_mode: Literal["gather", "shard"] = "gather",
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -127,6 +174,16 @@ class RetrievalMetric(Metric, ABC):
             )
         self.aggregation = aggregation
 
+        if sync_mode not in ("gather", "shard"):
+            raise ValueError(f"Argument `sync_mode` must be one of `gather` or `shard`, but got {sync_mode}.")
+        if sync_mode == "shard" and aggregation not in ("mean", "min", "max"):
+            raise ValueError(
+                "Argument `sync_mode='shard'` only supports `aggregation` being one of `mean`, `min` or `max`,"
+                f" but got {aggregation}."
+            )
+        self.sync_mode = sync_mode
+        self._shard_group: Optional[Any] = None
+
         self.add_state("indexes", default=[], dist_reduce_fx=None)
         self.add_state("preds", default=[], dist_reduce_fx=None)
         self.add_state("target", default=[], dist_reduce_fx=None)
@@ -160,7 +217,12 @@ class RetrievalMetric(Metric, ABC):
         preds = preds[indices]
         target = target[indices]
 
-        split_sizes = _flexible_bincount(indexes).detach().cpu().tolist()
+        # with ``sync_mode='shard'`` a process can end up without any query
+        split_sizes = _flexible_bincount(indexes).detach().cpu().tolist() if indexes.numel() else []
+
+        # with multiple cutoffs every query produces one value per cutoff
+        num_cutoffs = len(self.top_k) if isinstance(self.top_k, (list, tuple)) else None
+        empty_shape = () if num_cutoffs is None else (num_cutoffs,)
 
         res = []
         for mini_preds, mini_target in zip(
@@ -170,16 +232,44 @@ class RetrievalMetric(Metric, ABC):
                 if self.empty_target_action == "error":
                     raise ValueError("`compute` method was provided with a query with no positive target.")
                 if self.empty_target_action == "pos":
-                    res.append(tensor(1.0))
+                    res.append(torch.ones(empty_shape))
                 elif self.empty_target_action == "neg":
-                    res.append(tensor(0.0))
+                    res.append(torch.zeros(empty_shape))
             else:
                 # ensure list contains only float tensors
                 res.append(self._metric(mini_preds, mini_target))
 
-        if res:
-            return _retrieval_aggregate(torch.stack([x.to(preds) for x in res]), self.aggregation)
-        return tensor(0.0).to(preds)
+        values = torch.stack([x.to(preds) for x in res]) if res else torch.zeros(0, *empty_shape).to(preds)
+        return self._aggregate(values)
+
+    def _aggregate(self, values: Tensor) -> Tensor:
+        """Aggregate the per-query ``values`` into the final metric value.
+
+        If the states were synced with ``sync_mode='shard'``, ``values`` only contains the queries of this process and
+        the aggregation is completed by reducing the partial statistics across processes.
+
+        """
+        if self.sync_mode == "shard" and self._is_synced:
+            return _retrieval_sharded_aggregate(values, self.aggregation, group=self._shard_group)
+        if not values.shape[0]:
+            return torch.zeros(values.shape[1:]).to(values)
+        return _retrieval_aggregate(values, self.aggregation, dim=0 if values.ndim > 1 else None)
+
+    def _sync_dist(self, dist_sync_fn: Callable = gather_all_tensors, process_group: Optional[Any] = None) -> None:
+        """Sync the states, routing every query to a single process if ``sync_mode='shard'``."""
+        if self.sync_mode == "gather":
+            super()._sync_dist(dist_sync_fn, process_group=process_group)
+            return
+
+        self._shard_group = process_group or self.process_group
+        group = self._shard_group if self._shard_group is not None else torch.distributed.group.WORLD
+        indexes = dim_zero_cat(self.indexes) if self.indexes else torch.tensor([], dtype=torch.long, device=self.device)
+        preds = dim_zero_cat(self.preds) if self.preds else torch.tensor([], device=self.device)
+        target = dim_zero_cat(self.target) if self.target else torch.tensor([], dtype=torch.long, device=self.device)
+
+        destination = torch.remainder(indexes, torch.distributed.get_world_size(group))
+        indexes, preds, target = _all_to_all_by_rank(destination, [indexes, preds, target], group=group)
+        self.indexes, self.preds, self.target = [indexes], [preds], [target]
 
     @abstractmethod
     def _metric(self, preds: Tensor, target: Tensor) -> Tensor:
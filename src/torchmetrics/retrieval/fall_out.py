@@ -18,7 +18,7 @@ from torch import Tensor, tensor
 from typing_extensions import Literal
 
 from torchmetrics.functional.retrieval.fall_out import retrieval_fall_out
-from torchmetrics.retrieval.base import RetrievalMetric, _retrieval_aggregate
+from torchmetrics.retrieval.base import RetrievalMetric
 from torchmetrics.utilities.data import _flexible_bincount, dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
@@ -93,6 +93,7 @@ class RetrievalFallOut(RetrievalMetric):
     full_state_update: bool = False
     plot_lower_bound: float = 0.0
     plot_upper_bound: float = 1.0
+    top_k: Optional[int]
 
     def __init__(
         self,
@@ -129,7 +130,7 @@ class RetrievalFallOut(RetrievalMetric):
         preds = preds[indices]
         target = target[indices]
 
-        split_sizes = _flexible_bincount(indexes).detach().cpu().tolist()
+        split_sizes = _flexible_bincount(indexes).detach().cpu().tolist() if indexes.numel() else []
 
         res = []
         for mini_preds, mini_target in zip(
@@ -146,11 +147,7 @@ class RetrievalFallOut(RetrievalMetric):
                 # ensure list contains only float tensors
                 res.append(self._metric(mini_preds, mini_target))
 
-        return (
-            _retrieval_aggregate(torch.stack([x.to(preds) for x in res]), aggregation=self.aggregation)
-            if res
-            else tensor(0.0).to(preds)
-        )
+        return self._aggregate(torch.stack([x.to(preds) for x in res]) if res else torch.zeros(0).to(preds))
 
     def _metric(self, preds: Tensor, target: Tensor) -> Tensor:
         return retrieval_fall_out(preds, target, top_k=self.top_k)
@@ -18,6 +18,7 @@ from typing_extensions import Literal
 
 from torchmetrics.functional.retrieval.ndcg import retrieval_normalized_dcg
 from torchmetrics.retrieval.base import RetrievalMetric
+from torchmetrics.utilities.checks import _check_retrieval_top_k
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -57,7 +58,10 @@ class RetrievalNormalizedDCG(RetrievalMetric):
             - ``'error'``: raise a ``ValueError``
 
         ignore_index: Ignore predictions where the target is equal to this number.
-        top_k: Consider only the top k elements for each query (default: ``None``, which considers them all)
+        top_k:
+            Consider only the top k elements for each query (default: ``None``, which considers them all). Can also
+            be a list of cutoffs, e.g. ``[1, 5, 10]``: each query is then ranked once and the metric is computed at
+            every cutoff, returning a tensor with one value per cutoff (in the same order).
         aggregation:
             Specify how to aggregate over indexes. Can either a custom callable function that takes in a single tensor
             and returns a scalar value or one of the following strings:
@@ -75,7 +79,7 @@ class RetrievalNormalizedDCG(RetrievalMetric):
         ValueError:
             If ``ignore_index`` is not `None` or an integer.
         ValueError:
-            If ``top_k`` is not ``None`` or not an integer greater than 0.
+            If ``top_k`` is not ``None``, an integer greater than 0 or a list of such integers.
 
     Example:
         >>> from torch import tensor
@@ -86,6 +90,9 @@ class RetrievalNormalizedDCG(RetrievalMetric):
         >>> ndcg = RetrievalNormalizedDCG()
         >>> ndcg(preds, target, indexes=indexes)
         tensor(0.8467)
+        >>> ndcg_at_k = RetrievalNormalizedDCG(top_k=[1, 2, 4])
+        >>> ndcg_at_k(preds, target, indexes=indexes)
+        tensor([0.5000, 0.6934, 0.8467])
 
     """
 
@@ -99,7 +106,7 @@ class RetrievalNormalizedDCG(RetrievalMetric):
         self,
         empty_target_action: str = "neg",
         ignore_index: Optional[int] = None,
-        top_k: Optional[int] = None,
+        top_k: Optional[Union[int, Sequence[int]]] = None,
         aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
         **kwargs: Any,
     ) -> None:
@@ -110,8 +117,7 @@ class RetrievalNormalizedDCG(RetrievalMetric):
             **kwargs,
         )
 
-        if top_k is not None and not (isinstance(top_k, int) and top_k > 0):
-            raise ValueError("`top_k` has to be a positive integer or None")
+        _check_retrieval_top_k(top_k)
         self.top_k = top_k
         self.allow_non_binary_target = True
 
@@ -18,6 +18,7 @@ from typing_extensions import Literal
 
 from torchmetrics.functional.retrieval.precision import retrieval_precision
 from torchmetrics.retrieval.base import RetrievalMetric
+from torchmetrics.utilities.checks import _check_retrieval_top_k
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -56,7 +57,10 @@ class RetrievalPrecision(RetrievalMetric):
             - ``'error'``: raise a ``ValueError``
 
         ignore_index: Ignore predictions where the target is equal to this number.
-        top_k: Consider only the top k elements for each query (default: ``None``, which considers them all)
+        top_k:
+            Consider only the top k elements for each query (default: ``None``, which considers them all). Can also
+            be a list of cutoffs, e.g. ``[1, 5, 10]``: each query is then ranked once and the metric is computed at
+            every cutoff, returning a tensor with one value per cutoff (in the same order).
         adaptive_k: Adjust ``top_k`` to ``min(k, number of documents)`` for each query
         aggregation:
             Specify how to aggregate over indexes. Can either a custom callable function that takes in a single tensor
@@ -75,7 +79,7 @@ class RetrievalPrecision(RetrievalMetric):
         ValueError:
             If ``ignore_index`` is not `None` or an integer.
         ValueError:
-            If ``top_k`` is not ``None`` or not an integer greater than 0.
+            If ``top_k`` is not ``None``, an integer greater than 0 or a list of such integers.
         ValueError:
             If ``adaptive_k`` is not boolean.
 
@@ -101,7 +105,7 @@ class RetrievalPrecision(RetrievalMetric):
         self,
         empty_target_action: str = "neg",
         ignore_index: Optional[int] = None,
-        top_k: Optional[int] = None,
+        top_k: Optional[Union[int, Sequence[int]]] = None,
         adaptive_k: bool = False,
         aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
         **kwargs: Any,
@@ -113,8 +117,7 @@ class RetrievalPrecision(RetrievalMetric):
             **kwargs,
         )
 
-        if top_k is not None and not (isinstance(top_k, int) and top_k > 0):
-            raise ValueError("`top_k` has to be a positive integer or None")
+        _check_retrieval_top_k(top_k)
         if not isinstance(adaptive_k, bool):
             raise ValueError("`adaptive_k` has to be a boolean")
         self.top_k = top_k
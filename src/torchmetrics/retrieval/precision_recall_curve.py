@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from itertools import accumulate
 from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 import torch
@@ -18,7 +19,11 @@ from torch import Tensor
 from typing_extensions import Literal
 
 from torchmetrics import Metric
-from torchmetrics.functional.retrieval.precision_recall_curve import retrieval_precision_recall_curve
+from torchmetrics.functional.retrieval.precision_recall_curve import (
+    _retrieval_chunk_queries,
+    _retrieval_pad_queries,
+    _retrieval_precision_recall_curve_padded,
+)
 from torchmetrics.retrieval.base import _retrieval_aggregate
 from torchmetrics.utilities.checks import _check_retrieval_inputs
 from torchmetrics.utilities.data import _flexible_bincount, dim_zero_cat
@@ -47,12 +52,14 @@ def _retrieval_recall_at_fixed_precision(
         Maximum recall value, corresponding it best k
 
     """
-    try:
-        max_recall, best_k = max((r, k) for p, r, k in zip(precision, recall, top_k) if p >= min_precision)
-
-    except ValueError:
+    valid = precision >= min_precision
+    if not valid.any():
         max_recall = torch.tensor(0.0, device=recall.device, dtype=recall.dtype)
         best_k = torch.tensor(len(top_k))
+    else:
+        max_recall = recall[valid].max()
+        # among the k reaching the maximum recall, the largest one is returned
+        best_k = top_k[valid & (recall == max_recall)].max()
 
     if max_recall == 0.0:
         best_k = torch.tensor(len(top_k), device=top_k.device, dtype=top_k.dtype)
@@ -60,6 +67,14 @@ def _retrieval_recall_at_fixed_precision(
     return max_recall, best_k
 
 
+def _retrieval_running_reduce(running: List[Tensor], values: Tensor, reduce: Literal["sum", "min", "max"]) -> Tensor:
+    """Reduce the per-query curves of a chunk into a single ``(1, max_k)`` row, combined with the running row."""
+    values = torch.cat([*running, values])
+    if reduce == "sum":
+        return values.sum(dim=0, keepdim=True)
+    return values.amin(dim=0, keepdim=True) if reduce == "min" else values.amax(dim=0, keepdim=True)
+
+
 class RetrievalPrecisionRecallCurve(Metric):
     """Compute precision-recall pairs for different k (from 1 to `max_k`).
 
@@ -110,6 +125,12 @@ class RetrievalPrecisionRecallCurve(Metric):
             - ``'max'``: max value is returned
             - ``'min'``: min value is returned
 
+        memory_budget:
+            Maximum number of elements of the padded ``(queries, documents)`` matrices that are ranked at once. Queries
+            are evaluated in chunks so that the peak memory of ``compute`` stays proportional to this budget. With
+            ``aggregation`` set to ``'mean'``, ``'min'`` or ``'max'`` the curves of every chunk are reduced right away,
+            otherwise the ``(queries, max_k)`` curves of all queries are kept for the final aggregation. By default
+            (``None``) all queries are evaluated at once.
         kwargs:
             Additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
@@ -120,6 +141,8 @@ class RetrievalPrecisionRecallCurve(Metric):
             If ``ignore_index`` is not `None` or an integer.
         ValueError:
             If ``max_k`` parameter is not `None` or not an integer larger than 0.
+        ValueError:
+            If ``memory_budget`` is not `None` or not an integer larger than 0.
 
     Example:
         >>> from torch import tensor
@@ -153,6 +176,7 @@ class RetrievalPrecisionRecallCurve(Metric):
         empty_target_action: str = "neg",
         ignore_index: Optional[int] = None,
         aggregation: Union[Literal["mean", "median", "min", "max"], Callable] = "mean",
+        memory_budget: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -184,6 +208,10 @@ class RetrievalPrecisionRecallCurve(Metric):
             )
         self.aggregation = aggregation
 
+        if memory_budget is not None and not (isinstance(memory_budget, int) and memory_budget > 0):
+            raise ValueError("`memory_budget` has to be a positive integer or None")
+        self.memory_budget = memory_budget
+
         self.add_state("indexes", default=[], dist_reduce_fx=None)
         self.add_state("preds", default=[], dist_reduce_fx=None)
         self.add_state("target", default=[], dist_reduce_fx=None)
@@ -212,44 +240,66 @@ class RetrievalPrecisionRecallCurve(Metric):
         preds = preds[indices]
         target = target[indices]
 
-        split_sizes = _flexible_bincount(indexes).detach().cpu().tolist()
+        split_sizes = _flexible_bincount(indexes)
+        # a single host transfer of the query sizes, needed to size the padded chunks
+        sizes = split_sizes.detach().cpu().tolist()
+        offsets = [0, *accumulate(sizes)]
 
         # don't want to change self.max_k
         max_k = self.max_k
         if max_k is None:
             # set max_k as size of max group by size
-            max_k = max(split_sizes)
-
-        precisions, recalls = [], []
+            max_k = max(sizes)
+
+        # ``mean``, ``min`` and ``max`` are reduced chunk by chunk to a running sum or extremum, any other aggregation
+        # needs the curves of all queries at once
+        reduce: Optional[Literal["sum", "min", "max"]] = None
+        if self.aggregation == "mean":
+            reduce = "sum"
+        elif self.aggregation == "min" or self.aggregation == "max":
+            reduce = self.aggregation
+        precisions: List[Tensor] = []
+        recalls: List[Tensor] = []
+        num_queries = 0
+        for start, end in _retrieval_chunk_queries(sizes, self.memory_budget):
+            chunk_preds, chunk_target, valid = _retrieval_pad_queries(
+                preds[offsets[start] : offsets[end]],
+                target[offsets[start] : offsets[end]],
+                split_sizes[start:end],
+                max(sizes[start:end]),
+            )
+            precision, recall = _retrieval_precision_recall_curve_padded(
+                chunk_preds, chunk_target, valid, max_k, self.adaptive_k
+            )
 
-        for mini_preds, mini_target in zip(
-            torch.split(preds, split_sizes, dim=0), torch.split(target, split_sizes, dim=0)
-        ):
-            if not mini_target.sum():
+            empty = chunk_target.sum(dim=-1) == 0
+            if empty.any():
                 if self.empty_target_action == "error":
                     raise ValueError("`compute` method was provided with a query with no positive target.")
-                if self.empty_target_action == "pos":
-                    recalls.append(torch.ones(max_k, device=preds.device))
-                    precisions.append(torch.ones(max_k, device=preds.device))
-                elif self.empty_target_action == "neg":
-                    recalls.append(torch.zeros(max_k, device=preds.device))
-                    precisions.append(torch.zeros(max_k, device=preds.device))
+                if self.empty_target_action == "skip":
+                    precision, recall = precision[~empty], recall[~empty]
+                else:
+                    fill = 1.0 if self.empty_target_action == "pos" else 0.0
+                    precision = precision.masked_fill(empty.unsqueeze(-1), fill)
+                    recall = recall.masked_fill(empty.unsqueeze(-1), fill)
+
+            if not precision.shape[0]:
+                continue
+            num_queries += precision.shape[0]
+            if reduce is not None:
+                precisions = [_retrieval_running_reduce(precisions, precision, reduce)]
+                recalls = [_retrieval_running_reduce(recalls, recall, reduce)]
             else:
-                precision, recall, _ = retrieval_precision_recall_curve(mini_preds, mini_target, max_k, self.adaptive_k)
-
                 precisions.append(precision)
                 recalls.append(recall)
 
-        precision = (
-            _retrieval_aggregate(torch.stack([x.to(preds) for x in precisions]), aggregation=self.aggregation, dim=0)
-            if precisions
-            else torch.zeros(max_k).to(preds)
-        )
-        recall = (
-            _retrieval_aggregate(torch.stack([x.to(preds) for x in recalls]), aggregation=self.aggregation, dim=0)
-            if recalls
-            else torch.zeros(max_k).to(preds)
-        )
+        if not precisions:
+            precision = recall = torch.zeros(max_k).to(preds)
+        elif self.aggregation == "mean":
+            precision, recall = precisions[0][0].to(preds) / num_queries, recalls[0][0].to(preds) / num_queries
+        else:
+            precision = _retrieval_aggregate(torch.cat(precisions).to(preds), aggregation=self.aggregation, dim=0)
+            recall = _retrieval_aggregate(torch.cat(recalls).to(preds), aggregation=self.aggregation, dim=0)
         top_k = torch.arange(1, max_k + 1, device=preds.device)
 
         return precision, recall, top_k
@@ -331,7 +381,8 @@ class RetrievalRecallAtFixedPrecision(RetrievalPrecisionRecallCurve):
         ignore_index:
             Ignore predictions where the target is equal to this number.
         kwargs:
-            Additional keyword arguments, see :ref:`Metric kwargs` for more info.
+            Additional keyword arguments, see :ref:`Metric kwargs` for more info. ``memory_budget`` is also accepted
+            to evaluate the queries in chunks, see :class:`~torchmetrics.retrieval.RetrievalPrecisionRecallCurve`.
 
     Raises:
         ValueError:
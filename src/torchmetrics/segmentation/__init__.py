@@ -11,7 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from torchmetrics.segmentation.average_surface_distance import AverageSurfaceDistance
 from torchmetrics.segmentation.generalized_dice import GeneralizedDiceScore
+from torchmetrics.segmentation.hausdorff_distance import HausdorffDistance
 from torchmetrics.segmentation.mean_iou import MeanIoU
+from torchmetrics.segmentation.normalized_surface_dice import NormalizedSurfaceDice
 
-__all__ = ["GeneralizedDiceScore", "MeanIoU"]
+__all__ = [
+    "AverageSurfaceDistance",
+    "GeneralizedDiceScore",
+    "HausdorffDistance",
+    "MeanIoU",
+    "NormalizedSurfaceDice",
+]
@@ -0,0 +1,197 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, List, Optional, Sequence, Union
+
+import torch
+from torch import Tensor
+from typing_extensions import Literal
+
+from torchmetrics.functional.segmentation.normalized_surface_dice import (
+    _normalized_surface_dice_update,
+    _normalized_surface_dice_validate_args,
+)
+from torchmetrics.metric import Metric
+from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
+from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
+
+if not _MATPLOTLIB_AVAILABLE:
+    __doctest_skip__ = ["NormalizedSurfaceDice.plot"]
+
+
+class NormalizedSurfaceDice(Metric):
+    r"""Compute the `Normalized Surface Dice`_ between the edges of predicted and target segmentation masks.
+
+    The normalized surface dice is the fraction of the points on the edges of both masks that lie within ``tolerance``
+    of the edge of the other mask. The metric is averaged over all samples and classes.
+
+    As input to ``forward`` and ``update`` the metric accepts the following input:
+
+        - ``preds`` (:class:`~torch.Tensor`): An one-hot boolean tensor of shape ``(N, C, H, W[, D])`` with ``N`` being
+          the number of samples and ``C`` the number of classes. Alternatively, an integer tensor of shape
+          ``(N, H, W[, D])`` can be provided, where the integer values correspond to the class index. The input type
+          can be controlled with the ``input_format`` argument.
+        - ``target`` (:class:`~torch.Tensor`): The ground truth in the same format as ``preds``.
+
+    As output to ``forward`` and ``compute`` the metric returns the following output:
+
+        - ``nsd`` (:class:`~torch.Tensor`): The mean normalized surface dice. If ``per_class`` is set to ``True``, the
+          output will be a tensor of shape ``(C,)`` with the mean score of each class.
+
+    Samples in which both the predicted and the target mask of a class are empty are left out of the average, samples
+    in which only one of them is empty have a score of zero. The states only hold the sum and the count of the scores
+    per class, the distances of the individual edge points are never stored. All samples and classes of a
+    batch are processed at once: the edges are found with a single convolution and the distances with the linear time
+    separable distance transform.
+
+    Args:
+        num_classes: The number of classes in the segmentation problem.
+        tolerance: The largest distance at which two edges still count as matching, either a single value or one value
+            per class, including the background class
+        include_background: Whether to include the background class, the first class, in the computation
+        distance_metric: The distance metric to use, one of ``"euclidean"``, ``"chessboard"`` or ``"taxicab"``
+        spacing: The spacing between the pixels along each spatial dimension, defaults to one for all dimensions
+        per_class: Whether to compute the score for each class separately. If set to ``False``, the metric will
+            compute the mean score over all classes.
+        input_format: What kind of input the function receives. Choose between ``"one-hot"`` for one-hot encoded tensors
+            or ``"index"`` for index tensors
+        kwargs: Additional keyword arguments, see :ref:`Metric kwargs` for more info.
+
+    Raises:
+        ValueError:
+            If ``num_classes`` is not a positive integer
+        ValueError:
+            If ``include_background`` or ``per_class`` is not a boolean
+        ValueError:
+            If ``distance_metric`` is not one of ``"euclidean"``, ``"chessboard"`` or ``"taxicab"``
+        ValueError:
+            If ``spacing`` is not ``None`` or 2 or 3 positive values
+        ValueError:
+            If ``tolerance`` is not a non-negative number or a sequence of ``num_classes`` non-negative numbers
+        ValueError:
+            If ``input_format`` is not one of ``"one-hot"`` or ``"index"``
+
+    Example:
+        >>> import torch
+        >>> from torchmetrics.segmentation import NormalizedSurfaceDice
+        >>> preds = torch.zeros(2, 3, 16, 16, dtype=torch.long)
+        >>> target = torch.zeros(2, 3, 16, 16, dtype=torch.long)
+        >>> preds[:, 1, 2:8, 2:8] = 1
+        >>> target[:, 1, 3:9, 2:7] = 1
+        >>> preds[:, 2, 10:14, 9:15] = 1
+        >>> target[:, 2, 9:14, 11:15] = 1
+        >>> nsd = NormalizedSurfaceDice(num_classes=3, tolerance=1)
+        >>> nsd(preds, target)
+        tensor(0.9202)
+        >>> nsd = NormalizedSurfaceDice(num_classes=3, tolerance=1, per_class=True)
+        >>> nsd(preds, target)
+        tensor([0.9737, 0.8667])
+
+    """
+
+    score: Tensor
+    total: Tensor
+    full_state_update: bool = False
+    is_differentiable: bool = False
+    higher_is_better: bool = True
+    plot_lower_bound: float = 0.0
+    plot_upper_bound: float = 1.0
+
+    def __init__(
+        self,
+        num_classes: int,
+        tolerance: Union[float, Sequence[float]],
+        include_background: bool = False,
+        distance_metric: Literal["euclidean", "chessboard", "taxicab"] = "euclidean",
+        spacing: Optional[Union[Tensor, List[float]]] = None,
+        per_class: bool = False,
+        input_format: Literal["one-hot", "index"] = "one-hot",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        _normalized_surface_dice_validate_args(
+            num_classes, tolerance, include_background, distance_metric, spacing, input_format
+        )
+        if not isinstance(per_class, bool):
+            raise ValueError(f"Expected argument `per_class` must be a boolean, but got {per_class}.")
+        self.num_classes = num_classes
+        self.tolerance = tolerance
+        self.include_background = include_background
+        self.distance_metric = distance_metric
+        self.spacing = spacing
+        self.per_class = per_class
+        self.input_format = input_format
+
+        num_classes = num_classes - 1 if not include_background and num_classes > 1 else num_classes
+        self.add_state("score", default=torch.zeros(num_classes), dist_reduce_fx="sum")
+        self.add_state("total", default=torch.zeros(num_classes), dist_reduce_fx="sum")
+
+    def update(self, preds: Tensor, target: Tensor) -> None:
+        """Update the state with the new data."""
+        score = _normalized_surface_dice_update(
+            preds,
+            target,
+            self.num_classes,
+            self.tolerance,
+            self.include_background,
+            self.distance_metric,
+            self.spacing,
+            self.input_format,
+        )
+        valid = ~torch.isnan(score)
+        self.score += torch.where(valid, score, 0.0).sum(0)
+        self.total += valid.sum(0)
+
+    def compute(self) -> Tensor:
+        """Compute the final normalized surface dice."""
+        return self.score / self.total if self.per_class else self.score.sum() / self.total.sum()
+
+    def plot(self, val: Union[Tensor, Sequence[Tensor], None] = None, ax: Optional[_AX_TYPE] = None) -> _PLOT_OUT_TYPE:
+        """Plot a single or multiple values from the metric.
+
+        Args:
+            val: Either a single result from calling `metric.forward` or `metric.compute` or a list of these results.
+                If no value is provided, will automatically call `metric.compute` and plot that result.
+            ax: An matplotlib axis object. If provided will add plot to that axis
+
+        Returns:
+            Figure and Axes object
+
+        Raises:
+            ModuleNotFoundError:
+                If `matplotlib` is not installed
+
+        .. plot::
+            :scale: 75
+
+            >>> # Example plotting a single value
+            >>> import torch
+            >>> from torchmetrics.segmentation import NormalizedSurfaceDice
+            >>> metric = NormalizedSurfaceDice(num_classes=3, tolerance=1, input_format="index")
+            >>> metric.update(torch.randint(0, 3, (4, 32, 32)), torch.randint(0, 3, (4, 32, 32)))
+            >>> fig_, ax_ = metric.plot()
+
+        .. plot::
+            :scale: 75
+
+            >>> # Example plotting multiple values
+            >>> import torch
+            >>> from torchmetrics.segmentation import NormalizedSurfaceDice
+            >>> metric = NormalizedSurfaceDice(num_classes=3, tolerance=1, input_format="index")
+            >>> values = [ ]
+            >>> for _ in range(10):
+            ...     values.append(metric(torch.randint(0, 3, (4, 32, 32)), torch.randint(0, 3, (4, 32, 32))))
+            >>> fig_, ax_ = metric.plot(values)
+
+        """
+        return self._plot(val, ax)
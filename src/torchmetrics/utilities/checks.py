@@ -16,7 +16,7 @@ import os
 import sys
 from functools import partial
 from time import perf_counter
-from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, no_type_check
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union, no_type_check
 from unittest.mock import Mock
 
 import torch
@@ -586,6 +586,33 @@ def _check_retrieval_inputs(
     return indexes.long().flatten(), preds, target
 
 
+def _check_retrieval_top_k(top_k: Optional[Union[int, Sequence[int]]]) -> None:
+    """Check that ``top_k`` is ``None``, a positive integer or a non-empty sequence of positive integers.
+
+    Raises:
+        ValueError:
+            If ``top_k`` is neither ``None``, a positive integer nor a non-empty list/tuple of positive integers.
+
+    """
+    if isinstance(top_k, (list, tuple)):
+        if not top_k or not all(isinstance(k, int) and k > 0 for k in top_k):
+            raise ValueError(
+                "`top_k` has to be a positive integer or None, or a non-empty sequence of positive integers,"
+                f" but got {top_k}"
+            )
+    elif top_k is not None and not (isinstance(top_k, int) and top_k > 0):
+        raise ValueError("`top_k` has to be a positive integer or None")
+
+
+def _retrieval_top_k_list(top_k: Optional[Union[int, Sequence[int]]], num_documents: int) -> List[int]:
+    """Convert ``top_k`` to a list of cutoffs, where ``None`` means all the documents of the query."""
+    if top_k is None:
+        return [num_documents]
+    if isinstance(top_k, int):
+        return [top_k]
+    return list(top_k)
+
+
 def _check_retrieval_target_and_prediction_types(
     preds: Tensor,
     target: Tensor,
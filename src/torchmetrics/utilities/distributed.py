@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Sequence
 
 import torch
 from torch import Tensor
@@ -145,3 +145,126 @@ def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tens
         slice_param = [slice(dim_size) for dim_size in item_size]
         gathered_result[idx] = gathered_result[idx][slice_param]
     return gathered_result
+
+
+def _all_to_all_by_rank(destination: Tensor, tensors: Sequence[Tensor], group: Optional[Any] = None) -> List[Tensor]:
+    """Route the rows of several tensors to the process given by ``destination`` using all-to-all exchanges.
+
+    Contrary to ``gather_all_tensors``, each process only receives the rows that were assigned to it, so memory and
+    communication are split across the processes instead of being replicated on all of them.
+
+    Args:
+        destination: long tensor of shape ``(N,)`` with the rank that should receive each row
+        tensors: tensors with first dimension ``N`` that should be routed together
+        group: the process group to exchange the rows in. Defaults to all processes (world)
+
+    Return:
+        list with the received rows of each tensor, ordered by the rank of the sender
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    world_size = torch.distributed.get_world_size(group)
+    destination, order = torch.sort(destination, stable=True)
+
+    # 1. Exchange the number of rows that each process will send to every other process
+    send_counts = torch.bincount(destination, minlength=world_size)
+    recv_counts = torch.empty_like(send_counts)
+    torch.distributed.all_to_all_single(recv_counts, send_counts, group=group)
+    send_splits, recv_splits = send_counts.tolist(), recv_counts.tolist()
+
+    # 2. Exchange the rows themselves, already sorted by destination so that every split is contiguous
+    received = []
+    for tensor in tensors:
+        tensor = tensor[order].contiguous()
+        output = tensor.new_empty((sum(recv_splits), *tensor.shape[1:]))
+        torch.distributed.all_to_all_single(output, tensor, recv_splits, send_splits, group=group)
+        received.append(output)
+    return received
+
+
+_PACKED_DTYPES = (
+    torch.bool,
+    torch.uint8,
+    torch.int8,
+    torch.int16,
+    torch.int32,
+    torch.int64,
+    torch.float16,
+    torch.bfloat16,
+    torch.float32,
+    torch.float64,
+)
+# every run of tensors with the same dtype starts at a multiple of this number of bytes, such that it can be viewed
+# as any dtype
+_PACKED_ALIGNMENT = 8
+
+
+def _gather_tensor_lists(
+    tensor_lists: Sequence[List[Tensor]],
+    device: torch.device,
+    group: Optional[Any] = None,
+    dist_sync_fn: Callable = gather_all_tensors,
+) -> List[List[Tensor]]:
+    """Gather several lists of tensors of arbitrary shape and dtype from all processes with two gather calls.
+
+    The tensors are packed in a CSR-like layout: the bytes of all tensors are concatenated into a single flat
+    ``uint8`` buffer and an index table holds the list, dtype and shape of each tensor. After gathering, the tensors
+    are unpacked as views into the gathered buffers, so the communication scales with the number of bytes instead of
+    the number of tensors.
+
+    Args:
+        tensor_lists: lists of tensors to gather, the lists may have a different length on every process
+        device: device to place the packed buffers on, should be the same type of device on all processes
+        group: the process group to gather the tensors from. Defaults to all processes (world)
+        dist_sync_fn: function to gather a single tensor from all processes
+
+    Return:
+        one list per input list, in which the ``i``-th element of every process is followed by the ``i``-th element
+        of the next process, in the same way as when gathering each element separately
+
+    """
+    rows, chunks, num_bytes, previous = [], [], 0, None
+    for list_index, tensors in enumerate(tensor_lists):
+        for tensor in tensors:
+            if (list_index, tensor.dtype) != previous and num_bytes % _PACKED_ALIGNMENT:
+                chunks.append(torch.zeros(-num_bytes % _PACKED_ALIGNMENT, dtype=torch.uint8, device=device))
+                num_bytes += chunks[-1].numel()
+            previous = (list_index, tensor.dtype)
+            chunks.append(tensor.detach().to(device).contiguous().reshape(-1).view(torch.uint8))
+            num_bytes += chunks[-1].numel()
+            rows.append([list_index, _PACKED_DTYPES.index(tensor.dtype), tensor.ndim, *tensor.shape])
+    width = max((len(row) for row in rows), default=3)
+    index = torch.tensor([row + [0] * (width - len(row)) for row in rows], dtype=torch.long, device=device)
+    buffer = torch.cat(chunks) if chunks else torch.zeros(0, dtype=torch.uint8, device=device)
+
+    gathered_buffers = dist_sync_fn(buffer, group=group)
+    gathered_index = dist_sync_fn(index.reshape(-1, width), group=group)
+
+    per_rank: List[List[List[Tensor]]] = []
+    for rank_buffer, rank_index in zip(gathered_buffers, gathered_index):
+        unpacked: List[List[Tensor]] = [[] for _ in tensor_lists]
+        rank_rows, offset, start = rank_index.tolist(), 0, 0
+        # tensors of the same list and dtype are contiguous, so each run is viewed as its dtype and split at once
+        while start < len(rank_rows):
+            list_index, dtype_index = rank_rows[start][:2]
+            stop = start
+            while stop < len(rank_rows) and rank_rows[stop][:2] == [list_index, dtype_index]:
+                stop += 1
+            shapes = [row[3 : 3 + row[2]] for row in rank_rows[start:stop]]
+            numels = [int(torch.Size(shape).numel()) for shape in shapes]
+            dtype = _PACKED_DTYPES[dtype_index]
+            run_bytes = sum(numels) * torch.empty(0, dtype=dtype).element_size()
+            values = rank_buffer[offset : offset + run_bytes].view(dtype).split(numels)
+            unpacked[list_index].extend(v if len(s) == 1 else v.view(s) for v, s in zip(values, shapes))
+            offset += run_bytes + (-run_bytes % _PACKED_ALIGNMENT)
+            start = stop
+        per_rank.append(unpacked)
+
+    output = []
+    for list_index in range(len(tensor_lists)):
+        lists = [unpacked[list_index] for unpacked in per_rank]
+        length = max(len(values) for values in lists)
+        output.append([values[i] for i in range(length) for values in lists if i < len(values)])
+    return output
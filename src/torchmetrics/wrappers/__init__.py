@@ -13,7 +13,7 @@
 # limitations under the License.
 from torchmetrics.wrappers.bootstrapping import BootStrapper
 from torchmetrics.wrappers.classwise import ClasswiseWrapper
-from torchmetrics.wrappers.feature_share import FeatureShare
+from torchmetrics.wrappers.feature_share import FeatureShare, NetworkCache
 from torchmetrics.wrappers.minmax import MinMaxMetric
 from torchmetrics.wrappers.multioutput import MultioutputWrapper
 from torchmetrics.wrappers.multitask import MultitaskWrapper
@@ -36,5 +36,6 @@ __all__ = [
     "MultioutputWrapper",
     "MultitaskWrapper",
     "MetricTracker",
+    "NetworkCache",
     "Running",
 ]
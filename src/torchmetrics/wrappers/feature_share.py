@@ -11,36 +11,182 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from functools import lru_cache
-from typing import Any, Dict, Optional, Sequence, Union
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
+import torch
+from torch import Tensor
 from torch.nn import Module
 
 from torchmetrics.collections import MetricCollection
 from torchmetrics.metric import Metric
 from torchmetrics.utilities import rank_zero_warn
 
-__doctest_requires__ = {("FeatureShare",): ["torch_fidelity"]}
+__doctest_requires__ = {("FeatureShare", "NetworkCache"): ["torch_fidelity"]}
+
+_PRIMITIVE_TYPES = (str, bytes, int, float, bool, type(None), torch.dtype, torch.device)
+
+
+class _Uncacheable(Exception):  # noqa: N818
+    """Raised when the arguments of a call cannot be fingerprinted safely."""
+
+
+def _fingerprint(obj: Any, tensors: List[Tensor]) -> Hashable:
+    """Compute a cheap fingerprint of the arguments of a network call, collecting the fingerprinted tensors.
+
+    Tensors are identified by their memory location and layout together with their version counter, which is
+    incremented by every in-place operation. Tensors created in ``torch.inference_mode`` do not track a version
+    counter, so in-place modifications of them are not detected. Only primitive values and (nested) containers of
+    tensors and primitives are supported, anything else raises ``_Uncacheable``.
+
+    """
+    if isinstance(obj, Tensor):
+        if obj.requires_grad or obj.layout != torch.strided:
+            raise _Uncacheable
+        tensors.append(obj)
+        version = None if obj.is_inference() else obj._version
+        return ("tensor", obj.data_ptr(), version, tuple(obj.shape), obj.stride(), obj.dtype, obj.device)
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, tuple(_fingerprint(o, tensors) for o in obj))
+    if isinstance(obj, dict):
+        return ("dict", tuple((_fingerprint(k, tensors), _fingerprint(v, tensors)) for k, v in obj.items()))
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+    raise _Uncacheable
+
+
+def _nbytes(obj: Any) -> int:
+    """Return the number of bytes of all tensors in a (nested) network output."""
+    if isinstance(obj, Tensor):
+        return obj.element_size() * obj.nelement()
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(o) for o in obj)
+    if isinstance(obj, dict):
+        return sum(_nbytes(o) for o in obj.values())
+    return 0
 
 
 class NetworkCache(Module):
     """Create a cached version of a network to be shared between metrics.
 
     Because the different metrics may invoke the same network multiple times, we can save time by caching the input-
-    output pairs of the network.
+    output pairs of the network. Calls are keyed on a cheap content fingerprint of their arguments (memory location,
+    version counter, shape, strides, dtype and device of every tensor), such that different tensor objects viewing the
+    same data hit the cache while tensors that were modified in-place miss it, except for tensors created in
+    ``torch.inference_mode`` which carry no version counter. Entries are evicted in least recently
+    used order once the cache holds more than ``max_size`` entries or more than ``max_bytes`` bytes of outputs.
+
+    Besides ``forward``, the methods of the network (e.g. ``get_image_features`` of a CLIP model) are cached as well.
+    Calls with arguments that cannot be fingerprinted, such as tensors requiring gradients, are never cached.
+
+    Args:
+        network: the network to cache
+        max_size: maximum number of cached calls. ``None`` means no limit on the number of calls.
+        max_bytes: maximum number of bytes of cached outputs. ``None`` means no limit on the size of the outputs.
+
+    Example::
+        >>> import torch
+        >>> from torchmetrics.image import FrechetInceptionDistance, InceptionScore
+        >>> from torchmetrics.wrappers import NetworkCache
+        >>> fid = FrechetInceptionDistance(feature=64)
+        >>> inception = InceptionScore(feature=64)
+        >>> cache = NetworkCache(fid.inception, max_bytes=2**28)
+        >>> cache.attach(fid)
+        >>> cache.attach(inception)
+        >>> imgs = torch.randint(255, (10, 3, 64, 64), dtype=torch.uint8)
+        >>> fid.update(imgs, real=True)
+        >>> inception.update(imgs)  # the features computed by ``fid`` are reused
 
     """
 
-    def __init__(self, network: Module, max_size: int = 100) -> None:
+    def __init__(self, network: Module, max_size: Optional[int] = 100, max_bytes: Optional[int] = None) -> None:
         super().__init__()
+        if max_size is not None and not (isinstance(max_size, int) and max_size >= 0):
+            raise ValueError(f"Argument `max_size` expected to be `None` or a non-negative integer, but got {max_size}")
+        if max_bytes is not None and not (isinstance(max_bytes, int) and max_bytes >= 0):
+            raise ValueError(
+                f"Argument `max_bytes` expected to be `None` or a non-negative integer, but got {max_bytes}"
+            )
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.network = network
-        self.network.forward = lru_cache(maxsize=self.max_size)(network.forward)
+        self._cache: "OrderedDict[Hashable, Tuple[List[weakref.ref], Any, int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self.network.forward = self._cached_method("forward", network.forward)
 
     def forward(self, *args: Any, **kwargs: Any) -> Any:
         """Call the network with the given arguments."""
         return self.network(*args, **kwargs)
 
+    def __getattr__(self, name: str) -> Any:
+        """Fall back to the attributes of the network, caching its methods."""
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            if name == "network" or "network" not in self.__dict__.get("_modules", {}):
+                raise
+        attr = getattr(self._modules["network"], name)
+        if callable(attr) and getattr(attr, "__self__", None) is self._modules["network"]:
+            return self._cached_method(name, attr)
+        return attr
+
+    def _cached_method(self, name: str, method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tensors: List[Tensor] = []
+            try:
+                key = (name, _fingerprint(args, tensors), _fingerprint(kwargs, tensors))
+            except _Uncacheable:
+                return method(*args, **kwargs)
+
+            entry = self._cache.get(key)
+            # the tensors of the cached call must still be alive, otherwise their memory may have been reused
+            if entry is not None and all(ref() is not None for ref in entry[0]):
+                self._cache.move_to_end(key)
+                return entry[1]
+
+            out = method(*args, **kwargs)
+            self._store(key, [weakref.ref(t) for t in tensors], out)
+            return out
+
+        return wrapper
+
+    def _store(self, key: Hashable, refs: List[weakref.ref], out: Any) -> None:
+        if key in self._cache:
+            self._cache_bytes -= self._cache.pop(key)[2]
+        nbytes = _nbytes(out)
+        self._cache[key] = (refs, out, nbytes)
+        self._cache_bytes += nbytes
+        while self._cache and (
+            (self.max_size is not None and len(self._cache) > self.max_size)
+            or (self.max_bytes is not None and self._cache_bytes > self.max_bytes)
+        ):
+            self._cache_bytes -= self._cache.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        """Remove all cached calls."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def attach(self, metric: Metric) -> None:
+        """Use the cached network as the feature network of ``metric``.
+
+        This allows sharing the cache between metrics that are not part of the same :class:`FeatureShare` collection.
+
+        Raises:
+            AttributeError:
+                If the metric does not have a ``feature_network`` attribute
+
+        """
+        if not hasattr(metric, "feature_network"):
+            raise AttributeError(
+                f"Tried to set the cached network to metric {type(metric).__name__}, but it did not have a"
+                " `feature_network` attribute."
+            )
+        setattr(metric, metric.feature_network, self)
+
 
 class FeatureShare(MetricCollection):
     """Specialized metric collection that facilitates sharing features between metrics.
@@ -65,6 +211,9 @@ class FeatureShare(MetricCollection):
         max_cache_size: maximum number of input-output pairs to cache per metric. By default, this is none which means
             that the cache will be set to the number of metrics in the collection meaning that all features will be
             cached and shared across all metrics per batch.
+        max_cache_bytes: maximum number of bytes of cached network outputs. By default, this is none which means that
+            the cache is only limited by ``max_cache_size``. See :class:`~torchmetrics.wrappers.NetworkCache` for how
+            the calls are cached.
 
     Example::
         >>> import torch
@@ -86,6 +235,7 @@ class FeatureShare(MetricCollection):
         self,
         metrics: Union[Metric, Sequence[Metric], Dict[str, Metric]],
         max_cache_size: Optional[int] = None,
+        max_cache_bytes: Optional[int] = None,
     ) -> None:
         # disable compute groups because the feature sharing is more custom
         super().__init__(metrics=metrics, compute_groups=False)
@@ -104,7 +254,7 @@ class FeatureShare(MetricCollection):
                 " attribute. Please make sure that the metric has an attribute with that name,"
                 " else it cannot be shared."
             ) from err
-        cached_net = NetworkCache(network_to_share, max_size=max_cache_size)
+        cached_net = NetworkCache(network_to_share, max_size=max_cache_size, max_bytes=max_cache_bytes)
 
         # set the cached network to all metrics
         for metric_name, metric in self.items():
@@ -20,7 +20,7 @@ import pytest
 import torch
 from torch import tensor
 from torchmetrics import Metric
-from torchmetrics.utilities.distributed import gather_all_tensors
+from torchmetrics.utilities.distributed import _gather_tensor_lists, gather_all_tensors
 from torchmetrics.utilities.exceptions import TorchMetricsUserError
 from torchmetrics.utilities.imports import _TORCH_GREATER_EQUAL_2_1
 
@@ -77,6 +77,19 @@ def _test_ddp_gather_uneven_tensors_multidim(rank: int, worldsize: int = NUM_PRO
         assert (val == torch.ones_like(val)).all()
 
 
+def _test_ddp_gather_tensor_lists(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    boxes = [torch.full((i + 1, 4), float(rank)) for i in range(rank + 1)]
+    masks = [torch.ones(rank, 3, 2, dtype=torch.bool), torch.arange(5, dtype=torch.int32)][: rank + 1]
+    result_boxes, result_masks = _gather_tensor_lists([boxes, masks], device=torch.device("cpu"))
+    # the i-th element of every process follows the i-th element of the previous process
+    expected_ranks = [r for i in range(worldsize) for r in range(worldsize) if i <= r]
+    assert [int(b[0, 0]) for b in result_boxes] == expected_ranks
+    assert [b.shape[0] for b in result_boxes] == [i + 1 for i in range(worldsize) for r in range(worldsize) if i <= r]
+    assert result_masks[0].dtype == torch.bool
+    assert result_masks[0].shape == (0, 3, 2)
+    assert torch.equal(result_masks[-1], torch.arange(5, dtype=torch.int32))
+
+
 def _test_ddp_compositional_tensor(rank: int, worldsize: int = NUM_PROCESSES) -> None:
     dummy = DummyMetricSum()
     dummy._reductions = {"x": torch.sum}
@@ -97,6 +110,7 @@ def _test_ddp_compositional_tensor(rank: int, worldsize: int = NUM_PROCESSES) ->
         _test_ddp_sum_cat,
         _test_ddp_gather_uneven_tensors,
         _test_ddp_gather_uneven_tensors_multidim,
+        _test_ddp_gather_tensor_lists,
         _test_ddp_compositional_tensor,
     ],
 )
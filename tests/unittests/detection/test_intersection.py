@@ -23,7 +23,7 @@ from torchmetrics.detection.iou import IntersectionOverUnion
 from torchmetrics.functional.detection.ciou import complete_intersection_over_union
 from torchmetrics.functional.detection.diou import distance_intersection_over_union
 from torchmetrics.functional.detection.giou import generalized_intersection_over_union
-from torchmetrics.functional.detection.iou import intersection_over_union
+from torchmetrics.functional.detection.iou import _batched_box_iou, intersection_over_union
 from torchmetrics.utilities.imports import _TORCHVISION_GREATER_EQUAL_0_13
 
 # todo: check if some older versions have these functions too?
@@ -350,3 +350,20 @@ def test_corner_case():
     iou = metric(preds, target)
     for val in iou.values():
         assert val == torch.tensor(1.0)
+
+
+@pytest.mark.skipif(not _TORCHVISION_GREATER_EQUAL_0_13, reason="test requires torchvision >= 0.13")
+@pytest.mark.parametrize(
+    ("iou_type", "base_fn"), [("iou", tv_iou), ("giou", tv_giou), ("diou", tv_diou), ("ciou", tv_ciou)]
+)
+def test_batched_box_iou(iou_type, base_fn):
+    """Test that the batched kernel used by the modular metrics matches torchvision image by image."""
+    xy = torch.rand(3, 7, 2) * 100
+    preds = torch.cat([xy, xy + torch.rand(3, 7, 2) * 50 + 1], dim=-1)
+    xy = torch.rand(3, 5, 2) * 100
+    target = torch.cat([xy, xy + torch.rand(3, 5, 2) * 50 + 1], dim=-1)
+
+    out = _batched_box_iou(preds, target, iou_type)
+    assert out.shape == (3, 7, 5)
+    for p, t, o in zip(preds, target, out):
+        assert torch.allclose(o, base_fn(p, t))
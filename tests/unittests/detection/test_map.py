@@ -26,6 +26,12 @@ from pycocotools.coco import COCO
 from pycocotools.cocoeval import COCOeval
 from torch import IntTensor, Tensor
 from torchmetrics.detection.mean_ap import MeanAveragePrecision
+from torchmetrics.functional.detection._coco_eval import (
+    _coco_rle_area,
+    _coco_rle_decode,
+    _coco_rle_encode,
+    _coco_rle_iou,
+)
 from torchmetrics.utilities.imports import (
     _FASTER_COCO_EVAL_AVAILABLE,
     _PYCOCOTOOLS_AVAILABLE,
@@ -67,7 +73,7 @@ _coco_segm_input = _generate_coco_inputs("segm")
 
 @pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
 @pytest.mark.parametrize("iou_type", ["bbox", "segm"])
-@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval"])
+@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval", "torch"])
 def test_tm_to_coco(tmpdir, iou_type, backend):
     """Test that the conversion from TM to COCO format works."""
     preds, target = _coco_bbox_input if iou_type == "bbox" else _coco_segm_input
@@ -117,6 +123,34 @@ def test_tm_to_coco(tmpdir, iou_type, backend):
         assert sample_found, "target not found"
 
 
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+def test_coco_json_roundtrip(tmp_path):
+    """Test that the streamed json files of `tm_to_coco` are read back image by image by `coco_to_tm`."""
+    preds = [
+        {"boxes": Tensor([[10, 10, 5, 5], [1, 2, 3, 4]]), "scores": Tensor([0.5, 0.7]), "labels": IntTensor([1, 2])},
+        {"boxes": Tensor([[3, 3, 6, 6]]), "scores": Tensor([0.9]), "labels": IntTensor([2])},
+        {"boxes": Tensor(0, 4), "scores": Tensor(0), "labels": IntTensor(0)},
+    ]
+    target = [
+        {"boxes": Tensor([[10, 11, 5, 5]]), "labels": IntTensor([1])},
+        {"boxes": Tensor([[3, 3, 5, 6], [0, 0, 2, 2]]), "labels": IntTensor([2, 1])},
+        {"boxes": Tensor([[1, 1, 4, 4]]), "labels": IntTensor([1])},
+    ]
+    metric = MeanAveragePrecision(box_format="xywh")
+    metric.update(preds, target)
+    metric.tm_to_coco(str(tmp_path / "tm_map_input"))
+    preds_2, target_2 = MeanAveragePrecision.coco_to_tm(
+        str(tmp_path / "tm_map_input_preds.json"), str(tmp_path / "tm_map_input_target.json"), iou_type="bbox"
+    )
+    assert len(preds_2) == len(target_2) == len(target)
+    for p1, p2 in zip(preds, preds_2):
+        for key in ("boxes", "scores", "labels"):
+            assert torch.allclose(p1[key].reshape(p2[key].shape).to(p2[key].dtype), p2[key])
+    for t1, t2 in zip(target, target_2):
+        for key in ("boxes", "labels"):
+            assert torch.allclose(t1[key].to(t2[key].dtype), t2[key])
+
+
 def _compare_against_coco_fn(preds, target, iou_type, iou_thresholds=None, rec_thresholds=None, class_metrics=True):
     """Taken from https://github.com/cocodataset/cocoapi/blob/master/PythonAPI/pycocoEvalDemo.ipynb."""
     with contextlib.redirect_stdout(io.StringIO()):
@@ -178,7 +212,7 @@ def _compare_against_coco_fn(preds, target, iou_type, iou_thresholds=None, rec_t
 @pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
 @pytest.mark.parametrize("iou_type", ["bbox", "segm"])
 @pytest.mark.parametrize("ddp", [pytest.param(True, marks=pytest.mark.DDP), False])
-@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval"])
+@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval", "torch"])
 class TestMAPUsingCOCOReference(MetricTester):
     """Test map metric on the reference coco data."""
 
@@ -233,7 +267,7 @@ class TestMAPUsingCOCOReference(MetricTester):
         )
 
 
-@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval"])
+@pytest.mark.parametrize("backend", ["pycocotools", "faster_coco_eval", "torch"])
 def test_compare_both_same_time(tmpdir, backend):
     """Test that the class support evaluating both bbox and segm at the same time."""
     _skip_if_faster_coco_eval_missing(backend)
@@ -272,6 +306,99 @@ def test_compare_both_same_time(tmpdir, backend):
         assert torch.allclose(res[f"segm_{k}"], v, atol=1e-2)
 
 
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+@pytest.mark.parametrize("iou_type", ["bbox", "segm"])
+@pytest.mark.parametrize("average", ["macro", "micro"])
+def test_torch_backend_matches_pycocotools(iou_type, average):
+    """Test that the native torch backend reproduces the results of pycocotools, including the extended summary."""
+    preds, target = _coco_bbox_input if iou_type == "bbox" else _coco_segm_input
+    results = {}
+    for backend in ("pycocotools", "torch"):
+        metric = MeanAveragePrecision(
+            iou_type=iou_type,
+            box_format="xywh",
+            class_metrics=True,
+            extended_summary=True,
+            average=average,
+            backend=backend,
+        )
+        for bp, bt in zip(preds, target):
+            metric.update(bp, bt)
+        results[backend] = metric.compute()
+
+    expected, result = results["pycocotools"], results["torch"]
+    assert expected.keys() == result.keys()
+    for key, value in expected.items():
+        if key == "ious":
+            assert value.keys() == result[key].keys()
+            for pair, iou in value.items():
+                if isinstance(iou, Tensor):
+                    assert torch.allclose(result[key][pair], iou, atol=1e-6)
+                else:
+                    assert len(result[key][pair]) == 0
+        else:
+            assert torch.allclose(result[key].to(value.dtype), value, atol=1e-6)
+
+
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+@pytest.mark.parametrize("iou_type", ["bbox", "segm"])
+@pytest.mark.parametrize("average", ["macro", "micro"])
+def test_torch_backend_incremental(iou_type, average):
+    """Test that matching detections during update gives the same results as matching them during compute."""
+    preds, target = _coco_bbox_input if iou_type == "bbox" else _coco_segm_input
+    results = []
+    for incremental in (False, True):
+        metric = MeanAveragePrecision(
+            iou_type=iou_type,
+            box_format="xywh",
+            class_metrics=True,
+            average=average,
+            backend="torch",
+            incremental=incremental,
+        )
+        for bp, bt in zip(preds, target):
+            metric.update(bp, bt)
+        results.append(metric.compute())
+
+    expected, result = results
+    assert len(metric.detection_mask) == 0
+    assert len(metric.groundtruth_mask) == 0
+    assert expected.keys() == result.keys()
+    for key, value in expected.items():
+        assert torch.allclose(result[key], value, atol=1e-6)
+
+    with pytest.raises(ValueError, match="Argument `incremental=True` is only supported with.*"):
+        MeanAveragePrecision(backend="pycocotools", incremental=True)
+    with pytest.raises(ValueError, match="Argument `incremental=True` cannot be combined with.*"):
+        MeanAveragePrecision(backend="torch", incremental=True, extended_summary=True)
+
+
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+@pytest.mark.parametrize("shape", [(5, 17, 23), (3, 1, 40), (0, 8, 8)])
+def test_rle_mask_encoding(shape):
+    """Test that the packed run-length encoding of masks is lossless and gives the same IoU as pycocotools."""
+    from pycocotools import mask as mask_utils
+
+    generator = torch.Generator().manual_seed(42)
+    det_masks = torch.rand(*shape, generator=generator) > 0.6
+    gt_masks = torch.rand(*shape, generator=generator) > 0.4
+    if len(det_masks) > 0:
+        det_masks[0] = True
+    crowds = torch.arange(len(gt_masks)) % 2 == 1
+
+    det_rle, gt_rle = _coco_rle_encode(det_masks), _coco_rle_encode(gt_masks)
+    assert det_rle.dtype == torch.int32
+    assert torch.equal(_coco_rle_decode(det_rle), det_masks)
+    assert torch.equal(_coco_rle_area(gt_rle), gt_masks.flatten(1).sum(1).double())
+
+    def _encode(masks):
+        return [mask_utils.encode(np.asfortranarray(m.numpy().astype(np.uint8))) for m in masks]
+
+    expected = mask_utils.iou(_encode(det_masks), _encode(gt_masks), crowds.tolist())
+    result = _coco_rle_iou(det_rle, gt_rle, crowds)
+    assert np.allclose(result.numpy(), np.asarray(expected).reshape(result.shape))
+
+
 _inputs = {
     "preds": [
         [
@@ -455,6 +582,7 @@ def _generate_random_segm_input(device, batch_size=2, num_preds_size=10, num_gt_
     "backend",
     [
         pytest.param("pycocotools"),
+        pytest.param("torch"),
         pytest.param(
             "faster_coco_eval",
             marks=pytest.mark.skipif(
@@ -925,3 +1053,79 @@ class TestMapProperties:
             ValueError, match="When providing a list of max detection thresholds it should have length 3.*"
         ):
             MeanAveragePrecision(max_detection_thresholds=max_detection_thresholds, backend=backend)
+
+
+def _generate_random_detection_inputs(iou_type, num_images=8, num_classes=3, size=32):
+    """Generate random targets and predictions made of jittered targets and random false positives."""
+    generator = torch.Generator().manual_seed(42)
+
+    def _random_boxes(num):
+        xy = torch.randint(0, size // 2, (num, 2), generator=generator)
+        wh = torch.randint(4, size // 2, (num, 2), generator=generator)
+        return torch.cat([xy, xy + wh], dim=1)
+
+    def _sample(boxes, labels, scores=None):
+        sample = {"labels": labels}
+        if iou_type == "bbox":
+            sample["boxes"] = boxes.float()
+        else:
+            masks = torch.zeros(len(boxes), size, size, dtype=torch.bool)
+            for i, (x0, y0, x1, y1) in enumerate(boxes.tolist()):
+                masks[i, y0:y1, x0:x1] = True
+            sample["masks"] = masks
+        if scores is not None:
+            sample["scores"] = scores
+        return sample
+
+    preds, target = [], []
+    for _ in range(num_images):
+        num_target, num_false = (int(n) for n in torch.randint(1, 5, (2,), generator=generator))
+        target_boxes = _random_boxes(num_target)
+        target_labels = torch.randint(0, num_classes, (num_target,), generator=generator)
+        jitter = torch.randint(-2, 3, target_boxes.shape, generator=generator)
+        pred_boxes = torch.cat([(target_boxes + jitter).clamp(0, size), _random_boxes(num_false)])
+        pred_labels = torch.cat([target_labels, torch.randint(0, num_classes, (num_false,), generator=generator)])
+        scores = torch.rand(num_target + num_false, generator=generator)
+        preds.append(_sample(pred_boxes, pred_labels, scores))
+        target.append(_sample(target_boxes, target_labels))
+    return preds, target
+
+
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+@pytest.mark.parametrize("iou_type", ["bbox", "segm"])
+@pytest.mark.parametrize(
+    ("iou_thresholds", "rec_thresholds"), [(None, None), ([0.2, 0.5, 0.8], [0.0, 0.25, 0.5, 0.75, 1.0])]
+)
+def test_legacy_map_num_threads(iou_type, iou_thresholds, rec_thresholds):
+    """Test that the legacy implementation gives the same results when evaluating with multiple threads."""
+    from torchmetrics.detection._mean_ap import MeanAveragePrecision as LegacyMeanAveragePrecision
+
+    preds, target = _generate_random_detection_inputs(iou_type)
+    results = []
+    for num_threads in (1, 3):
+        metric = LegacyMeanAveragePrecision(
+            iou_type=iou_type,
+            iou_thresholds=iou_thresholds,
+            rec_thresholds=rec_thresholds,
+            class_metrics=True,
+            num_threads=num_threads,
+        )
+        metric.update(preds[:4], target[:4])
+        metric.update(preds[4:], target[4:])
+        results.append(metric.compute())
+
+    assert results[0].keys() == results[1].keys()
+    for key in results[0]:
+        assert torch.equal(results[0][key], results[1][key]), key
+    assert results[0]["map_per_class"].numel() > 1
+    assert 0 < results[0]["map"] < 1
+
+
+@pytest.mark.skipif(_pytest_condition, reason="test requires that torchvision=>0.8.0 and pycocotools is installed")
+@pytest.mark.parametrize("num_threads", [0, -1, 1.5, "2"])
+def test_legacy_map_num_threads_error(num_threads):
+    """Test that the legacy implementation raises an error on an invalid number of threads."""
+    from torchmetrics.detection._mean_ap import MeanAveragePrecision as LegacyMeanAveragePrecision
+
+    with pytest.raises(ValueError, match="Expected argument `num_threads` to be an integer larger than 0.*"):
+        LegacyMeanAveragePrecision(num_threads=num_threads)
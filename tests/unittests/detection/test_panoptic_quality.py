@@ -231,3 +231,18 @@ def test_ignore_mask(inputs: _Input, args: Dict[str, Any], cat_dim: int):
     target_new = torch.cat([target, ignored_regions], dim=cat_dim)
     value_new = panoptic_quality(preds_new, target_new, **args)
     assert value == value_new
+
+
+@pytest.mark.skipif(not _TORCH_GREATER_EQUAL_1_12, reason="PanopticQuality metric only supports PyTorch >= 1.12")
+def test_batched_update_matches_per_sample_update():
+    """Test that segments with the same color in different samples of a batch are evaluated independently."""
+    preds = torch.cat([_INPUTS_0.preds[0], _INPUTS_0.target[0], _INPUTS_0.preds[0].flip(1)])
+    target = torch.cat([_INPUTS_0.target[0], _INPUTS_0.target[0], _INPUTS_0.target[0]])
+    batched = PanopticQuality(**_ARGS_0)
+    batched.update(preds, target)
+    per_sample = PanopticQuality(**_ARGS_0)
+    for p, t in zip(preds, target):
+        per_sample.update(p.unsqueeze(0), t.unsqueeze(0))
+    for state in ("iou_sum", "true_positives", "false_positives", "false_negatives"):
+        assert torch.allclose(getattr(batched, state), getattr(per_sample, state))
+    assert torch.allclose(batched.compute(), per_sample.compute())
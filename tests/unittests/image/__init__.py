@@ -13,6 +13,22 @@
 # limitations under the License.
 import os
 
+import torch
+from torch.nn import Module
+
 from unittests import _PATH_ALL_TESTS
 
 _SAMPLE_IMAGE = os.path.join(_PATH_ALL_TESTS, "_data", "image", "i01_01_5.bmp")
+
+
+class _SmallFeatureExtractor(Module):
+    """Cheap feature extractor of ``(N, 3, 16, 16)`` images for the metrics built on an inception network."""
+
+    def __init__(self, seed: int = 42) -> None:
+        super().__init__()
+        torch.manual_seed(seed)
+        self.extractor = torch.nn.Linear(3 * 16 * 16, 32)
+        self.num_features = 32
+
+    def forward(self, img) -> torch.Tensor:
+        return self.extractor(img.float().flatten(1) / 255)
@@ -145,3 +145,17 @@ def test_error_on_invalid_type(metric_class=ErrorRelativeGlobalDimensionlessSynt
     metric = metric_class()
     with pytest.raises(TypeError, match="Expected `preds` and `target` to have the same data type.*"):
         metric(torch.randn([3, 16, 16]), torch.randn([3, 16, 16], dtype=torch.float64))
+
+
+def test_state_is_per_band():
+    """Test that the metric only keeps per image and band statistics, also for images of different sizes."""
+    metric = ErrorRelativeGlobalDimensionlessSynthesis(reduction="none")
+    preds = [torch.rand(2, 4, 32, 32), torch.rand(3, 4, 20, 24)]
+    target = [torch.rand(2, 4, 32, 32), torch.rand(3, 4, 20, 24)]
+    for p, t in zip(preds, target):
+        metric.update(p, t)
+    assert [s.shape for s in metric.rmse_per_band] == [(2, 4), (3, 4)]
+    expected = torch.cat([
+        error_relative_global_dimensionless_synthesis(p, t, reduction="none") for p, t in zip(preds, target)
+    ])
+    assert torch.allclose(metric.compute(), expected)
@@ -19,9 +19,11 @@ import pytest
 import torch
 from torch.nn import Module
 from torch.utils.data import Dataset
-from torchmetrics.image.fid import FrechetInceptionDistance, NoTrainInceptionV3
+from torchmetrics.image.fid import FrechetInceptionDistance, NoTrainInceptionV3, _newton_schulz_sqrtm_trace
 from torchmetrics.utilities.imports import _TORCH_FIDELITY_AVAILABLE
 
+from unittests.image import _SmallFeatureExtractor
+
 torch.manual_seed(42)
 
 
@@ -227,3 +229,63 @@ def test_dtype_transfer_to_submodule():
 
     out = metric.inception(imgs)
     assert out.dtype == torch.float64
+
+
+def test_save_and_load_real_features(tmpdir):
+    """Test that saved real statistics reproduce the score without recomputing the real features."""
+    real = [torch.randint(0, 255, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    fake = [torch.randint(0, 200, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    metric = FrechetInceptionDistance(feature=_SmallFeatureExtractor(), input_img_size=(3, 16, 16))
+    for r, f in zip(real, fake):
+        metric.update(r, real=True)
+        metric.update(f, real=False)
+    metric.save_real_features(f"{tmpdir}/fid_real.pt")
+
+    loaded = FrechetInceptionDistance(feature=_SmallFeatureExtractor(), input_img_size=(3, 16, 16))
+    loaded.load_real_features(f"{tmpdir}/fid_real.pt")
+    for _ in range(2):  # reference statistics are kept on reset
+        for f in fake:
+            loaded.update(f, real=False)
+        assert torch.allclose(loaded.compute(), metric.compute())
+        loaded.reset()
+
+    with pytest.raises(ValueError, match="does not match the configuration of this metric"):
+        FrechetInceptionDistance(feature=_SmallFeatureExtractor(seed=0)).load_real_features(f"{tmpdir}/fid_real.pt")
+    with pytest.raises(ValueError, match="does not match the configuration of this metric"):
+        FrechetInceptionDistance(feature=_SmallFeatureExtractor(), normalize=True).load_real_features(
+            f"{tmpdir}/fid_real.pt"
+        )
+
+
+@pytest.mark.parametrize("sqrtm_method", ["eigh", "newton_schulz"])
+def test_sqrtm_method(sqrtm_method):
+    """Test that the alternative matrix square root methods match the default eigenvalue computation."""
+    real = torch.randint(0, 255, (100, 3, 16, 16), dtype=torch.uint8)
+    fake = [torch.randint(0, 200, (100, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    metric = FrechetInceptionDistance(feature=_SmallFeatureExtractor(), reset_real_features=False)
+    other = FrechetInceptionDistance(
+        feature=_SmallFeatureExtractor(), reset_real_features=False, sqrtm_method=sqrtm_method
+    )
+    metric.update(real, real=True)
+    other.update(real, real=True)
+    for f in fake:  # the square root of the real covariance is reused in the second iteration
+        metric.update(f, real=False)
+        other.update(f, real=False)
+        assert torch.allclose(other.compute(), metric.compute(), rtol=1e-5)
+        metric.reset()
+        other.reset()
+
+    with pytest.raises(ValueError, match="Argument `sqrtm_method` expected to be one of .*"):
+        FrechetInceptionDistance(feature=_SmallFeatureExtractor(), sqrtm_method="svd")
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float64])
+def test_newton_schulz_rank_deficient(dtype):
+    """Test that the Newton-Schulz iteration stays finite for covariances estimated from fewer samples than features."""
+    torch.manual_seed(42)
+    sigma1 = torch.randn(40, 64, dtype=torch.float64).t().cov()
+    sigma2 = torch.randn(40, 64, dtype=torch.float64).t().cov()
+    expected = torch.linalg.eigvals(sigma1 @ sigma2).sqrt().real.sum()
+    res = _newton_schulz_sqrtm_trace((sigma1 @ sigma2).to(dtype))
+    assert torch.isfinite(res)
+    assert torch.allclose(res.double(), expected, rtol=1e-2 if dtype == torch.float32 else 1e-6)
@@ -18,9 +18,11 @@ import pytest
 import torch
 from torch.nn import Module
 from torch.utils.data import Dataset
-from torchmetrics.image.kid import KernelInceptionDistance
+from torchmetrics.image.kid import KernelInceptionDistance, poly_kernel, poly_mmd
 from torchmetrics.utilities.imports import _TORCH_FIDELITY_AVAILABLE
 
+from unittests.image import _SmallFeatureExtractor
+
 torch.manual_seed(42)
 
 
@@ -218,3 +220,79 @@ def test_normalize_arg_false():
     metric = KernelInceptionDistance(normalize=False)
     with pytest.raises(ValueError, match="Expecting image as torch.Tensor with dtype=torch.uint8"):
         metric.update(img, real=True)
+
+
+def test_save_and_load_real_features(tmpdir):
+    """Test that a saved real feature bank reproduces the score without recomputing the real features."""
+    real = [torch.randint(0, 255, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    fake = [torch.randint(0, 200, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    metric = KernelInceptionDistance(feature=_SmallFeatureExtractor(), subsets=3, subset_size=10)
+    for r, f in zip(real, fake):
+        metric.update(r, real=True)
+        metric.update(f, real=False)
+    torch.manual_seed(0)
+    expected = metric.compute()
+    metric.save_real_features(f"{tmpdir}/kid_real.pt")
+
+    loaded = KernelInceptionDistance(feature=_SmallFeatureExtractor(), subsets=3, subset_size=10)
+    loaded.load_real_features(f"{tmpdir}/kid_real.pt")
+    for f in fake:
+        loaded.update(f, real=False)
+    torch.manual_seed(0)
+    for res, exp in zip(loaded.compute(), expected):
+        assert torch.allclose(res, exp)
+
+    with pytest.raises(ValueError, match="does not match the configuration of this metric"):
+        KernelInceptionDistance(feature=_SmallFeatureExtractor(seed=0)).load_real_features(f"{tmpdir}/kid_real.pt")
+
+
+@pytest.mark.parametrize("memory_budget", [None, 1, 3 * 10**2 * 2])
+def test_batched_subsets_match_loop(memory_budget):
+    """Test that evaluating the subsets in batched chunks matches evaluating them one by one."""
+    real = torch.randint(0, 255, (40, 3, 16, 16), dtype=torch.uint8)
+    fake = torch.randint(0, 200, (40, 3, 16, 16), dtype=torch.uint8)
+    metric = KernelInceptionDistance(
+        feature=_SmallFeatureExtractor(), subsets=5, subset_size=10, memory_budget=memory_budget
+    )
+    metric.update(real, real=True)
+    metric.update(fake, real=False)
+    torch.manual_seed(0)
+    kid_mean, kid_std = metric.compute()
+
+    f_real, f_fake = metric.real_features[0], metric.fake_features[0]
+    torch.manual_seed(0)
+    scores = []
+    for _ in range(5):
+        r = f_real[torch.randperm(40)[:10]]
+        f = f_fake[torch.randperm(40)[:10]]
+        scores.append(poly_mmd(r, f))
+    scores = torch.stack(scores)
+    assert torch.allclose(kid_mean, scores.mean(), atol=1e-6)
+    assert torch.allclose(kid_std, scores.std(unbiased=False), atol=1e-6)
+
+
+def test_max_features_reservoir():
+    """Test that the feature reservoir is bounded and that reservoirs of different processes merge correctly."""
+    metrics = [KernelInceptionDistance(feature=_SmallFeatureExtractor(), max_features=30) for _ in range(2)]
+    for metric in metrics:
+        for _ in range(10):
+            metric.update(torch.randint(0, 255, (20, 3, 16, 16), dtype=torch.uint8), real=True)
+        assert sum(f.shape[0] for f in metric.real_features) <= 60
+        assert metric._real_features().shape == (30, 32)
+
+    # gathering the states of two processes gives the sample of all features with the smallest keys
+    features = torch.cat([torch.cat(m.real_features) for m in metrics])
+    keys = torch.cat([torch.cat(m.real_keys) for m in metrics])
+    metrics[0].real_features = [torch.cat(m.real_features) for m in metrics]
+    metrics[0].real_keys = [torch.cat(m.real_keys) for m in metrics]
+    assert torch.equal(metrics[0]._real_features(), features[keys.argsort()[:30]])
+
+    with pytest.raises(ValueError, match="Argument `max_features` expected to be `None` or integer larger than 0"):
+        KernelInceptionDistance(feature=_SmallFeatureExtractor(), max_features=0)
+
+
+def test_poly_kernel_autograd():
+    """Test that the polynomial kernel can be differentiated with respect to the features."""
+    f1 = torch.randn(10, 8, dtype=torch.float64, requires_grad=True)
+    f2 = torch.randn(12, 8, dtype=torch.float64, requires_grad=True)
+    assert torch.autograd.gradcheck(poly_kernel, (f1, f2))
@@ -120,6 +120,12 @@ def test_error_on_wrong_init():
     with pytest.raises(ValueError, match="Argument `reduction` must be one .*"):
         LearnedPerceptualImagePatchSimilarity(net_type="squeeze", reduction=None)
 
+    with pytest.raises(ValueError, match="Argument `max_batch_size` must be a positive integer or `None`.*"):
+        LearnedPerceptualImagePatchSimilarity(net_type="squeeze", max_batch_size=0)
+
+    with pytest.raises(ValueError, match="Argument `inference_dtype` must be a floating point `torch.dtype`.*"):
+        LearnedPerceptualImagePatchSimilarity(net_type="squeeze", inference_dtype=torch.int8)
+
 
 @pytest.mark.skipif(not _TORCHVISION_AVAILABLE, reason="test requires that torchvision is installed")
 @pytest.mark.parametrize(
@@ -148,3 +154,31 @@ def test_check_for_backprop():
     assert loss.requires_grad
     loss.backward()
     assert metric.net.lin0.model[1].weight.grad is None
+
+
+@pytest.mark.skipif(not _TORCHVISION_AVAILABLE, reason="test requires that torchvision is installed")
+def test_max_batch_size():
+    """Test that evaluating the network in chunks does not change the result."""
+    img1, img2 = _inputs.img1[0], _inputs.img2[0]
+    res = learned_perceptual_image_patch_similarity(img1, img2, net_type="squeeze", reduction="sum")
+    res_chunked = learned_perceptual_image_patch_similarity(
+        img1, img2, net_type="squeeze", reduction="sum", max_batch_size=1
+    )
+    assert torch.allclose(res, res_chunked, atol=1e-6)
+
+
+@pytest.mark.skipif(not _TORCHVISION_AVAILABLE, reason="test requires that torchvision is installed")
+@pytest.mark.parametrize("inference_dtype", [torch.bfloat16, torch.float16])
+def test_inference_dtype(inference_dtype):
+    """Test that reduced precision inference stays within the documented error bound."""
+    if inference_dtype == torch.float16 and not torch.cuda.is_available():
+        pytest.skip("test requires GPU machine for float16 autocast")
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    img1, img2 = _inputs.img1[0].to(device), _inputs.img2[0].to(device)
+    metric = LearnedPerceptualImagePatchSimilarity(net_type="squeeze", normalize=True).to(device)
+    metric_reduced = LearnedPerceptualImagePatchSimilarity(
+        net_type="squeeze", normalize=True, inference_dtype=inference_dtype
+    ).to(device)
+    res, res_reduced = metric(img1, img2), metric_reduced(img1, img2)
+    assert res_reduced.dtype == res.dtype
+    assert torch.allclose(res, res_reduced, rtol=1e-2 if inference_dtype == torch.bfloat16 else 1e-3)
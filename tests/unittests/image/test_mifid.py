@@ -22,6 +22,7 @@ from torchmetrics.image.mifid import MemorizationInformedFrechetInceptionDistanc
 from torchmetrics.utilities.imports import _TORCH_FIDELITY_AVAILABLE
 
 from unittests import _reference_cachier
+from unittests.image import _SmallFeatureExtractor
 
 
 @_reference_cachier
@@ -199,3 +200,28 @@ def test_normalize_arg(normalize):
 
     with context():
         metric.update(img, real=True)
+
+
+def test_save_and_load_real_features(tmpdir):
+    """Test that a saved real feature bank reproduces the score without recomputing the real features."""
+    real = [torch.randint(0, 255, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    fake = [torch.randint(0, 200, (20, 3, 16, 16), dtype=torch.uint8) for _ in range(2)]
+    metric = MemorizationInformedFrechetInceptionDistance(feature=_SmallFeatureExtractor())
+    for r, f in zip(real, fake):
+        metric.update(r, real=True)
+        metric.update(f, real=False)
+    expected = metric.compute()
+    metric.save_real_features(f"{tmpdir}/mifid_real.pt")
+
+    loaded = MemorizationInformedFrechetInceptionDistance(feature=_SmallFeatureExtractor())
+    loaded.load_real_features(f"{tmpdir}/mifid_real.pt")
+    for _ in range(2):  # the reference feature bank is kept on reset
+        for f in fake:
+            loaded.update(f, real=False)
+        assert torch.allclose(loaded.compute(), expected)
+        loaded.reset()
+
+    with pytest.raises(ValueError, match="does not match the configuration of this metric"):
+        MemorizationInformedFrechetInceptionDistance(feature=_SmallFeatureExtractor(seed=0)).load_real_features(
+            f"{tmpdir}/mifid_real.pt"
+        )
@@ -104,3 +104,18 @@ def test_ms_ssim_contrast_sensitivity():
         preds, target, data_range=1.0, kernel_size=3, betas=(1.0, 0.5, 0.25)
     )
     assert isinstance(out, torch.Tensor)
+
+
+@pytest.mark.parametrize("normalize", ["relu", "simple", None])
+def test_ms_ssim_tiled(normalize):
+    """Test that computing every scale in tiles gives the same result as the full computation."""
+    preds = torch.rand(2, 3, 180, 170, dtype=torch.float64)
+    target = 0.7 * preds + 0.3 * torch.rand(2, 3, 180, 170, dtype=torch.float64)
+    kwargs = {"kernel_size": 7, "sigma": 1.0, "normalize": normalize, "reduction": "none"}
+    expected = multiscale_structural_similarity_index_measure(preds, target, **kwargs)
+    tiled = multiscale_structural_similarity_index_measure(preds, target, tile_size=(48, 60), **kwargs)
+    assert torch.allclose(tiled, expected)
+
+    metric = MultiScaleStructuralSimilarityIndexMeasure(kernel_size=7, sigma=1.0, normalize=normalize, tile_size=48)
+    metric.update(preds.numpy(), target.numpy())
+    assert torch.allclose(metric.compute(), expected.mean().float())
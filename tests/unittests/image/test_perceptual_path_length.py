@@ -112,6 +112,7 @@ class DummyGenerator(torch.nn.Module):
         ({"resize": 0}, "Argument `resize` must be a positive integer or `None`, but got 0."),
         ({"lower_discard": -1}, "Argument `lower_discard` must be a float between 0 and 1 or `None`, but got -1"),
         ({"upper_discard": 2}, "Argument `upper_discard` must be a float between 0 and 1 or `None`, but got 2"),
+        ({"max_batch_size": 0}, "Argument `max_batch_size` must be a positive integer or `None`, but got 0."),
     ],
 )
 @skip_on_running_out_of_memory()
@@ -124,6 +125,33 @@ def test_raises_error_on_wrong_arguments(argument, match):
         PerceptualPathLength(**argument)
 
 
+class _MeanSquaredSimilarity(nn.Module):
+    """Similarity network that does not need any pretrained weights."""
+
+    def forward(self, img1, img2):
+        """Compute the mean squared difference of every image pair."""
+        return ((img1 - img2) ** 2).flatten(1).mean(1)
+
+
+@pytest.mark.skipif(not _TORCH_FIDELITY_AVAILABLE, reason="metric requires torch-fidelity")
+@pytest.mark.parametrize(("batch_size", "max_batch_size"), [(4, None), (4, 3), (5, 1)])
+def test_batching_does_not_change_result(batch_size, max_batch_size):
+    """Test that generating on a background thread and chunking the similarity network do not change the result."""
+    generator = DummyGenerator(128).eval()
+    seed_all(42)
+    expected = perceptual_path_length(generator, num_samples=10, batch_size=10, sim_net=_MeanSquaredSimilarity())
+    seed_all(42)
+    result = perceptual_path_length(
+        generator,
+        num_samples=10,
+        batch_size=batch_size,
+        sim_net=_MeanSquaredSimilarity(),
+        max_batch_size=max_batch_size,
+    )
+    for res, exp in zip(result, expected):
+        assert torch.allclose(res, exp)
+
+
 class _WrongGenerator1(nn.Module):
     pass
 
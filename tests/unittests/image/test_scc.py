@@ -84,3 +84,20 @@ class TestSpatialCorrelationCoefficient(MetricTester):
             reference_metric=partial(_reference_sewar_scc, **kwargs),
             metric_args=kwargs,
         )
+
+
+@pytest.mark.parametrize(("shape", "tile_size"), [((2, 3, 50, 47), 13), ((3, 40, 33), (7, 50))])
+@pytest.mark.parametrize("hp_filter", _kernels)
+def test_scc_tiled(shape, tile_size, hp_filter):
+    """Test that computing the scc map in tiles gives the same result as the full computation."""
+    preds = torch.randn(shape)
+    target = 0.5 * preds + torch.randn(shape)
+    expected = spatial_correlation_coefficient(preds, target, hp_filter, window_size=8, reduction="none")
+    tiled = spatial_correlation_coefficient(
+        preds, target, hp_filter, window_size=8, reduction="none", tile_size=tile_size
+    )
+    assert torch.allclose(tiled, expected, atol=1e-6)
+
+    metric = SpatialCorrelationCoefficient(hp_filter, window_size=8, tile_size=tile_size)
+    metric.update(preds.numpy(), target.numpy())
+    assert torch.allclose(metric.compute(), expected.mean(), atol=1e-6)
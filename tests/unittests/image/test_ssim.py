@@ -20,6 +20,12 @@ from pytorch_msssim import ssim
 from skimage.metrics import structural_similarity
 from torch import Tensor
 from torchmetrics.functional import structural_similarity_index_measure
+from torchmetrics.functional.image.utils import (
+    _gaussian_1d,
+    _gaussian_kernel_2d,
+    _gaussian_kernel_3d,
+    _separable_filter,
+)
 from torchmetrics.image import StructuralSimilarityIndexMeasure
 
 from unittests import NUM_BATCHES, _Input
@@ -341,3 +347,65 @@ def test_full_image_output(preds, target):
     assert len(out) == 2
     assert out[0].numel() == 1
     assert out[1].shape == preds[0].shape
+
+
+@pytest.mark.parametrize(
+    ("shape", "kernel_size", "sigma"),
+    [((2, 3, 20, 24), (11, 7), (1.5, 1.0)), ((2, 2, 12, 14, 16), (5, 7, 3), (0.8, 1.0, 0.5))],
+)
+def test_separable_filter_matches_full_kernel(shape, kernel_size, sigma):
+    """Test that filtering with the 1D gaussian kernels matches the convolution with the full gaussian kernel."""
+    x = torch.rand(shape, dtype=torch.float64)
+    channel = shape[1]
+    if len(kernel_size) == 2:
+        kernel = _gaussian_kernel_2d(channel, kernel_size, sigma, x.dtype, x.device)
+        expected = torch.nn.functional.conv2d(x, kernel, groups=channel)
+    else:
+        kernel = _gaussian_kernel_3d(channel, kernel_size, sigma, x.dtype, x.device)
+        expected = torch.nn.functional.conv3d(x, kernel, groups=channel)
+    kernels = [_gaussian_1d(k, s, x.dtype, x.device) for k, s in zip(kernel_size, sigma)]
+    assert torch.allclose(_separable_filter(x, kernels), expected)
+
+
+def test_ssim_inference_mode_then_autograd():
+    """Test that a call under inference mode does not leave cached kernels that break later differentiable calls."""
+    preds = torch.rand(2, 3, 16, 16)
+    target = torch.rand(2, 3, 16, 16)
+    with torch.inference_mode():
+        expected = structural_similarity_index_measure(preds, target, data_range=1.0)
+    preds.requires_grad_()
+    res = structural_similarity_index_measure(preds, target, data_range=1.0)
+    res.backward()
+    assert preds.grad is not None
+    assert torch.allclose(res.detach(), expected)
+
+
+@pytest.mark.parametrize(
+    ("shape", "tile_size"),
+    [((2, 3, 37, 45), 16), ((2, 3, 37, 45), (8, 100)), ((1, 2, 20, 23, 19), 7)],
+)
+@pytest.mark.parametrize("data_range", [None, (0.1, 0.9)])
+def test_tiled_matches_full(shape, tile_size, data_range, tmp_path):
+    """Test that computing the ssim map in tiles, also from memory-mapped arrays, gives the same result."""
+    from torchmetrics.functional.image import structural_similarity_index_measure
+
+    preds = torch.rand(shape, dtype=torch.float64)
+    target = 0.7 * preds + 0.3 * torch.rand(shape, dtype=torch.float64)
+    expected = structural_similarity_index_measure(
+        preds, target, data_range=data_range, reduction="none", return_contrast_sensitivity=True
+    )
+    tiled = structural_similarity_index_measure(
+        preds, target, data_range=data_range, reduction="none", return_contrast_sensitivity=True, tile_size=tile_size
+    )
+    assert torch.allclose(tiled[0], expected[0])
+    assert torch.allclose(tiled[1], expected[1])
+
+    preds_mmap = np.lib.format.open_memmap(tmp_path / "preds.npy", mode="w+", dtype=np.float64, shape=shape)
+    target_mmap = np.lib.format.open_memmap(tmp_path / "target.npy", mode="w+", dtype=np.float64, shape=shape)
+    preds_mmap[:], target_mmap[:] = preds.numpy(), target.numpy()
+    metric = StructuralSimilarityIndexMeasure(data_range=data_range, tile_size=tile_size)
+    metric.update(preds_mmap, target_mmap)
+    assert torch.allclose(metric.compute(), expected[0].mean().float())
+
+    with pytest.raises(ValueError, match="Arguments `tile_size` and `return_full_image` are mutually exclusive."):
+        structural_similarity_index_measure(preds, target, return_full_image=True, tile_size=tile_size)
@@ -62,3 +62,18 @@ class TestVIF(MetricTester):
         self.run_functional_metric_test(
             preds, target, metric_functional=visual_information_fidelity, reference_metric=_reference_sewar_vif
         )
+
+
+@pytest.mark.parametrize("tile_size", [16, (40, 100)])
+def test_vif_tiled(tile_size, tmp_path):
+    """Test that computing the vif maps in tiles, also from memory-mapped arrays, gives the same result."""
+    preds = torch.rand(2, 3, 97, 83, dtype=torch.float64)
+    target = 0.6 * preds + 0.4 * torch.rand(2, 3, 97, 83, dtype=torch.float64)
+    expected = visual_information_fidelity(preds, target)
+    assert torch.allclose(visual_information_fidelity(preds, target, tile_size=tile_size), expected)
+
+    preds_mmap = np.lib.format.open_memmap(tmp_path / "preds.npy", mode="w+", dtype=np.float64, shape=preds.shape)
+    preds_mmap[:] = preds.numpy()
+    metric = VisualInformationFidelity(tile_size=tile_size)
+    metric.update(preds_mmap, target.numpy())
+    assert torch.allclose(metric.compute(), expected.float())
@@ -19,9 +19,10 @@ import matplotlib.pyplot as plt
 import pytest
 import torch
 from torch import Tensor
-from torchmetrics.functional.multimodal.clip_score import clip_score
+from torchmetrics.functional.multimodal.clip_score import _clip_preprocess_images, clip_score
 from torchmetrics.multimodal.clip_score import CLIPScore
 from torchmetrics.utilities.imports import _TRANSFORMERS_GREATER_EQUAL_4_10
+from transformers import CLIPImageProcessor as _CLIPImageProcessor
 from transformers import CLIPModel as _CLIPModel
 from transformers import CLIPProcessor as _CLIPProcessor
 
@@ -80,6 +81,8 @@ class TestCLIPScore(MetricTester):
             check_scriptable=False,
             check_state_dict=False,
             check_batch=False,
+            # the images are resized on device, which matches the PIL resize of the processor up to two gray levels
+            atol=1e-2,
         )
 
     @skip_on_connection_issues()
@@ -92,6 +95,7 @@ class TestCLIPScore(MetricTester):
             metric_functional=clip_score,
             reference_metric=partial(_reference_clip_score, model_name_or_path=model_name_or_path),
             metric_args={"model_name_or_path": model_name_or_path},
+            atol=1e-2,
         )
 
     @skip_on_connection_issues()
@@ -143,3 +147,41 @@ class TestCLIPScore(MetricTester):
             match="Encountered caption longer than max_position_embeddings=77. Will truncate captions to this length.*",
         ):
             metric.update(preds[0], target[0])
+
+
+@pytest.mark.skipif(not _TRANSFORMERS_GREATER_EQUAL_4_10, reason="test requires transformers>=4.10")
+@pytest.mark.parametrize(
+    "images",
+    [
+        torch.randint(255, (2, 3, 64, 64)),
+        torch.randint(255, (2, 3, 224, 224)),
+        torch.randint(255, (2, 3, 300, 500)),
+        [torch.randint(255, (3, 513, 257)), torch.randint(255, (3, 100, 120))],
+        torch.rand(2, 3, 80, 90),
+    ],
+)
+def test_image_preprocessing(images):
+    """Test that the images are preprocessed on device like the CLIP image processor does."""
+    image_processor = _CLIPImageProcessor()
+    reference = image_processor(images=list(images), return_tensors="pt")["pixel_values"]
+
+    class _Processor:
+        def __init__(self) -> None:
+            self.image_processor = image_processor
+
+    result = _clip_preprocess_images(images, _Processor())
+    assert result.shape == reference.shape
+    # up to two gray levels, normalized by the smallest standard deviation
+    assert torch.allclose(result, reference, atol=2.01 / 255 / min(image_processor.image_std))
+
+
+@skip_on_connection_issues()
+@pytest.mark.skipif(not _TRANSFORMERS_GREATER_EQUAL_4_10, reason="test requires transformers>=4.10")
+def test_text_embedding_cache():
+    """Test that repeated captions are embedded once and give the same score as without the cache."""
+    metric = CLIPScore(model_name_or_path="openai/clip-vit-base-patch32")
+    images, text = _random_input.images[0], [captions[0], captions[0]]
+    for _ in range(2):
+        metric.update(images, text)
+    assert list(metric.text_embedding_cache._embeddings) == [captions[0]]
+    assert torch.allclose(metric.compute(), clip_score(images, text, "openai/clip-vit-base-patch32"))
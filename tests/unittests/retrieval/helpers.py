@@ -22,6 +22,7 @@ from numpy import array
 from torch import Tensor, tensor
 from typing_extensions import Literal
 
+from unittests import NUM_BATCHES, NUM_PROCESSES
 from unittests._helpers import seed_all
 from unittests._helpers.testers import Metric, MetricTester
 from unittests.retrieval._inputs import _input_retrieval_scores as _irs
@@ -302,6 +303,14 @@ _errors_test_class_metric_parameters_default = {
             "Argument `ignore_index` must be an integer or None.",
             {"ignore_index": -100.0},
         ),
+        # check sharded sync only accepts aggregations that can be reduced across processes
+        (
+            _irs.indexes,
+            _irs.preds,
+            _irs.target,
+            "Argument `sync_mode='shard'` only supports `aggregation` being one of `mean`, `min` or `max`",
+            {"sync_mode": "shard", "aggregation": "median"},
+        ),
         # check input shapes are consistent
         (
             _irs_bad_sz.indexes,
@@ -457,6 +466,25 @@ def _errors_test_functional_metric(
         metric_functional(preds, target, **kwargs_update)
 
 
+def _test_sharded_sync(rank: int, metric_class: Type[Metric], metric_args: dict, worldsize: int = NUM_PROCESSES):
+    """Worker function checking that ``sync_mode='shard'`` matches computing the metric over all the data."""
+    generator = torch.Generator().manual_seed(42)
+    indexes = torch.randint(high=10, size=(NUM_BATCHES, 32), generator=generator)
+    preds = torch.rand(NUM_BATCHES, 32, generator=generator)
+    target = torch.randint(high=2, size=(NUM_BATCHES, 32), generator=generator)
+
+    sharded = metric_class(sync_mode="shard", **metric_args)
+    reference = metric_class(sync_on_compute=False, **metric_args)
+    for i in range(NUM_BATCHES):
+        if i % worldsize == rank:
+            sharded.update(preds[i], target[i], indexes=indexes[i])
+        reference.update(preds[i], target[i], indexes=indexes[i])
+
+    assert torch.allclose(sharded.compute(), reference.compute(), atol=1e-6)
+    # the local states are restored after the sharded sync, so accumulation can continue
+    assert len(sharded.indexes) == len(range(rank, NUM_BATCHES, worldsize))
+
+
 class RetrievalMetricTester(MetricTester):
     """General tester class for retrieval metrics."""
 
@@ -556,6 +584,33 @@ class RetrievalMetricTester(MetricTester):
             indexes=indexes,  # every additional argument will be passed to retrieval metric and _ref_metric_adapted
         )
 
+    @staticmethod
+    def run_multiple_top_k_test(
+        indexes: Tensor,
+        preds: Tensor,
+        target: Tensor,
+        metric_class: Metric,
+        metric_functional: Callable,
+        metric_args: Optional[dict] = None,
+        top_k: Tuple[int, ...] = (1, 4, 10),
+    ) -> None:
+        """Test that a list of cutoffs gives the same result as evaluating each cutoff separately."""
+        metric_args = metric_args or {}
+        multi_metric = metric_class(top_k=list(top_k), **metric_args)
+        single_metrics = [metric_class(top_k=k, **metric_args) for k in top_k]
+        for i in range(indexes.shape[0]):
+            multi_metric.update(preds[i], target[i], indexes=indexes[i])
+            for m in single_metrics:
+                m.update(preds[i], target[i], indexes=indexes[i])
+
+            multi_res = metric_functional(preds[i], target[i], top_k=list(top_k))
+            single_res = torch.stack([metric_functional(preds[i], target[i], top_k=k) for k in top_k])
+            assert torch.allclose(multi_res, single_res, atol=1e-6)
+
+        multi_res = multi_metric.compute()
+        assert multi_res.shape == (len(top_k),)
+        assert torch.allclose(multi_res, torch.stack([m.compute() for m in single_metrics]), atol=1e-6)
+
     @staticmethod
     def run_metric_class_arguments_test(
         indexes: Tensor,
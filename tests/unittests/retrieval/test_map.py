@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+from functools import partial
 from typing import Callable, Optional, Union
 
 import numpy as np
@@ -21,6 +23,7 @@ from torchmetrics.functional.retrieval.average_precision import retrieval_averag
 from torchmetrics.retrieval.average_precision import RetrievalMAP
 from typing_extensions import Literal
 
+from unittests import NUM_PROCESSES, USE_PYTEST_POOL
 from unittests._helpers import seed_all
 from unittests.retrieval.helpers import (
     RetrievalMetricTester,
@@ -32,6 +35,7 @@ from unittests.retrieval.helpers import (
     _errors_test_class_metric_parameters_default,
     _errors_test_class_metric_parameters_no_pos_target,
     _errors_test_functional_metric_parameters_default,
+    _test_sharded_sync,
 )
 
 seed_all(42)
@@ -178,3 +182,15 @@ class TestMAP(RetrievalMetricTester):
             exception_type=ValueError,
             kwargs_update=metric_args,
         )
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.skipif(not USE_PYTEST_POOL, reason="DDP pool is not available.")
+@pytest.mark.parametrize("aggregation", ["mean", "min", "max"])
+def test_sharded_sync(aggregation):
+    """Test that routing each query to a single process gives the same result as gathering all states."""
+    pytest.pool.map(
+        partial(_test_sharded_sync, metric_class=RetrievalMAP, metric_args={"aggregation": aggregation}),
+        range(NUM_PROCESSES),
+    )
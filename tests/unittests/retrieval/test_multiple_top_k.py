@@ -0,0 +1,62 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Callable
+
+import pytest
+from torch import Tensor
+from torchmetrics import Metric
+from torchmetrics.functional.retrieval import (
+    retrieval_average_precision,
+    retrieval_normalized_dcg,
+    retrieval_precision,
+    retrieval_recall,
+)
+from torchmetrics.retrieval import RetrievalMAP, RetrievalNormalizedDCG, RetrievalPrecision, RetrievalRecall
+
+from unittests._helpers import seed_all
+from unittests.retrieval.helpers import RetrievalMetricTester, _default_metric_class_input_arguments
+
+seed_all(42)
+
+
+@pytest.mark.parametrize(
+    ("metric_class", "metric_functional", "metric_args"),
+    [
+        (RetrievalMAP, retrieval_average_precision, {}),
+        (RetrievalNormalizedDCG, retrieval_normalized_dcg, {}),
+        (RetrievalPrecision, retrieval_precision, {}),
+        (RetrievalPrecision, retrieval_precision, {"adaptive_k": True}),
+        (RetrievalRecall, retrieval_recall, {}),
+    ],
+)
+@pytest.mark.parametrize("empty_target_action", ["skip", "neg", "pos"])
+@pytest.mark.parametrize(**_default_metric_class_input_arguments)
+def test_multiple_top_k(
+    indexes: Tensor,
+    preds: Tensor,
+    target: Tensor,
+    empty_target_action: str,
+    metric_class: Metric,
+    metric_functional: Callable,
+    metric_args: dict,
+):
+    """Test that passing several cutoffs at once matches evaluating each of them separately."""
+    RetrievalMetricTester.run_multiple_top_k_test(
+        indexes=indexes,
+        preds=preds,
+        target=target,
+        metric_class=metric_class,
+        metric_functional=metric_functional,
+        metric_args={"empty_target_action": empty_target_action, **metric_args},
+    )
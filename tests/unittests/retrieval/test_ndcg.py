@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+from functools import partial
 from typing import Callable, Optional, Union
 
 import numpy as np
@@ -22,6 +24,7 @@ from torchmetrics.functional.retrieval.ndcg import retrieval_normalized_dcg
 from torchmetrics.retrieval.ndcg import RetrievalNormalizedDCG
 from typing_extensions import Literal
 
+from unittests import NUM_PROCESSES, USE_PYTEST_POOL
 from unittests._helpers import seed_all
 from unittests.retrieval.helpers import (
     RetrievalMetricTester,
@@ -34,6 +37,7 @@ from unittests.retrieval.helpers import (
     _errors_test_class_metric_parameters_with_nonbinary,
     _errors_test_functional_metric_parameters_k,
     _errors_test_functional_metric_parameters_with_nonbinary,
+    _test_sharded_sync,
 )
 
 seed_all(42)
@@ -212,3 +216,20 @@ def test_corner_case_with_tied_scores():
             retrieval_normalized_dcg(preds, target, top_k=k),
             torch.tensor([ndcg_score(target, preds, k=k)], dtype=torch.float32),
         )
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.skipif(not USE_PYTEST_POOL, reason="DDP pool is not available.")
+@pytest.mark.parametrize("aggregation", ["mean", "min", "max"])
+@pytest.mark.parametrize("top_k", [None, 5, [1, 5, 10]])
+def test_sharded_sync(aggregation, top_k):
+    """Test that routing each query to a single process gives the same result as gathering all states."""
+    pytest.pool.map(
+        partial(
+            _test_sharded_sync,
+            metric_class=RetrievalNormalizedDCG,
+            metric_args={"aggregation": aggregation, "top_k": top_k},
+        ),
+        range(NUM_PROCESSES),
+    )
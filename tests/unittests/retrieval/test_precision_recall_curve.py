@@ -21,6 +21,7 @@ from numpy import array
 from torch import Tensor, tensor
 from torchmetrics.retrieval import RetrievalPrecisionRecallCurve
 from torchmetrics.retrieval.base import _retrieval_aggregate
+from torchmetrics.retrieval.precision_recall_curve import _retrieval_recall_at_fixed_precision
 from typing_extensions import Literal
 
 from unittests._helpers import seed_all
@@ -186,3 +187,43 @@ class TestRetrievalPrecisionRecallCurve(RetrievalPrecisionRecallCurveTester):
             reference_metric=_compute_precision_recall_curve,
             metric_args=metric_args,
         )
+
+
+@pytest.mark.parametrize("memory_budget", [1, 16, 100])
+@pytest.mark.parametrize("adaptive_k", [False, True])
+@pytest.mark.parametrize("empty_target_action", ["neg", "skip", "pos"])
+@pytest.mark.parametrize("aggregation", ["mean", "median", "min", "max"])
+@pytest.mark.parametrize(**_default_metric_class_input_arguments)
+def test_memory_budget(indexes, preds, target, memory_budget, adaptive_k, empty_target_action, aggregation):
+    """Test that evaluating the queries in chunks gives the same curve as evaluating them all at once."""
+    metric_args = {
+        "max_k": 10,
+        "adaptive_k": adaptive_k,
+        "empty_target_action": empty_target_action,
+        "aggregation": aggregation,
+    }
+    chunked = RetrievalPrecisionRecallCurve(memory_budget=memory_budget, **metric_args)
+    reference = RetrievalPrecisionRecallCurve(**metric_args)
+    for i in range(indexes.shape[0]):
+        chunked.update(preds[i], target[i], indexes=indexes[i])
+        reference.update(preds[i], target[i], indexes=indexes[i])
+
+    for res, ref in zip(chunked.compute(), reference.compute()):
+        assert torch.allclose(res, ref)
+
+
+@pytest.mark.parametrize("min_precision", [0.0, 0.3, 0.6, 1.0])
+def test_recall_at_fixed_precision(min_precision):
+    """Test the vectorized search of the best k against a reference loop."""
+    precision = torch.rand(20)
+    recall = torch.rand(20).round(decimals=1)
+    top_k = torch.arange(1, 21)
+
+    candidates = [(r.item(), k.item()) for p, r, k in zip(precision, recall, top_k) if p >= min_precision]
+    ref_recall, ref_k = max(candidates) if candidates else (0.0, len(top_k))
+    if ref_recall == 0.0:
+        ref_k = len(top_k)
+
+    max_recall, best_k = _retrieval_recall_at_fixed_precision(precision, recall, top_k, min_precision)
+    assert torch.allclose(max_recall, torch.tensor(ref_recall))
+    assert best_k == ref_k
@@ -0,0 +1,131 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from functools import partial
+
+import pytest
+import torch
+from monai.metrics.surface_distance import compute_average_surface_distance
+from torchmetrics.functional.segmentation.average_surface_distance import average_surface_distance
+from torchmetrics.segmentation.average_surface_distance import AverageSurfaceDistance
+
+from unittests import BATCH_SIZE, NUM_BATCHES, NUM_CLASSES, _Input
+from unittests._helpers.testers import MetricTester
+
+_inputs1 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+)
+_inputs2 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+)
+_inputs3 = _Input(
+    preds=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+    target=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+)
+
+
+def _reference_average_surface_distance(
+    preds: torch.Tensor,
+    target: torch.Tensor,
+    input_format: str,
+    include_background: bool = False,
+    distance_metric: str = "euclidean",
+    symmetric: bool = True,
+    reduce: bool = True,
+):
+    """Calculate reference metric for `AverageSurfaceDistance`."""
+    if input_format == "index":
+        preds = torch.nn.functional.one_hot(preds, num_classes=NUM_CLASSES).movedim(-1, 1)
+        target = torch.nn.functional.one_hot(target, num_classes=NUM_CLASSES).movedim(-1, 1)
+    val = compute_average_surface_distance(
+        preds, target, include_background=include_background, symmetric=symmetric, distance_metric=distance_metric
+    )
+    return val.mean() if reduce else val
+
+
+@pytest.mark.parametrize(
+    "preds, target, input_format",
+    [
+        (_inputs1.preds, _inputs1.target, "one-hot"),
+        (_inputs2.preds, _inputs2.target, "one-hot"),
+        (_inputs3.preds, _inputs3.target, "index"),
+    ],
+)
+@pytest.mark.parametrize("include_background", [True, False])
+@pytest.mark.parametrize("distance_metric", ["euclidean", "chessboard", "taxicab"])
+@pytest.mark.parametrize("symmetric", [True, False])
+class TestAverageSurfaceDistance(MetricTester):
+    """Test class for `AverageSurfaceDistance` metric."""
+
+    atol = 1e-4
+
+    @pytest.mark.parametrize("ddp", [pytest.param(True, marks=pytest.mark.DDP), False])
+    def test_average_surface_distance_class(
+        self, preds, target, input_format, include_background, distance_metric, symmetric, ddp
+    ):
+        """Test class implementation of metric."""
+        self.run_class_metric_test(
+            ddp=ddp,
+            preds=preds,
+            target=target,
+            metric_class=AverageSurfaceDistance,
+            reference_metric=partial(
+                _reference_average_surface_distance,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+                symmetric=symmetric,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "symmetric": symmetric,
+                "input_format": input_format,
+            },
+        )
+
+    def test_average_surface_distance_functional(
+        self, preds, target, input_format, include_background, distance_metric, symmetric
+    ):
+        """Test functional implementation of metric."""
+        self.run_functional_metric_test(
+            preds=preds,
+            target=target,
+            metric_functional=average_surface_distance,
+            reference_metric=partial(
+                _reference_average_surface_distance,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+                symmetric=symmetric,
+                reduce=False,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "symmetric": symmetric,
+                "input_format": input_format,
+            },
+        )
+
+
+def test_average_surface_distance_spacing():
+    """Test anisotropic spacing against the reference."""
+    preds, target = _inputs2.preds[0], _inputs2.target[0]
+    result = average_surface_distance(preds, target, num_classes=NUM_CLASSES, spacing=[2.0, 0.5, 1.5])
+    expected = compute_average_surface_distance(preds, target, symmetric=True, spacing=[2.0, 0.5, 1.5])
+    assert torch.allclose(result, expected.to(result.dtype), atol=1e-4)
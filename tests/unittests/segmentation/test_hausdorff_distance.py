@@ -0,0 +1,150 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from functools import partial
+from typing import Optional
+
+import pytest
+import torch
+from monai.metrics.hausdorff_distance import compute_hausdorff_distance
+from torchmetrics.functional.segmentation.hausdorff_distance import hausdorff_distance
+from torchmetrics.segmentation.hausdorff_distance import HausdorffDistance
+
+from unittests import BATCH_SIZE, NUM_BATCHES, NUM_CLASSES, _Input
+from unittests._helpers.testers import MetricTester
+
+_inputs1 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+)
+_inputs2 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+)
+_inputs3 = _Input(
+    preds=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+    target=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+)
+
+
+def _reference_hausdorff_distance(
+    preds: torch.Tensor,
+    target: torch.Tensor,
+    input_format: str,
+    include_background: bool = False,
+    distance_metric: str = "euclidean",
+    percentile: Optional[float] = None,
+    reduce: bool = True,
+):
+    """Calculate reference metric for `HausdorffDistance`."""
+    if input_format == "index":
+        preds = torch.nn.functional.one_hot(preds, num_classes=NUM_CLASSES).movedim(-1, 1)
+        target = torch.nn.functional.one_hot(target, num_classes=NUM_CLASSES).movedim(-1, 1)
+    val = compute_hausdorff_distance(
+        preds, target, include_background=include_background, distance_metric=distance_metric, percentile=percentile
+    )
+    return val.mean() if reduce else val
+
+
+@pytest.mark.parametrize(
+    "preds, target, input_format",
+    [
+        (_inputs1.preds, _inputs1.target, "one-hot"),
+        (_inputs2.preds, _inputs2.target, "one-hot"),
+        (_inputs3.preds, _inputs3.target, "index"),
+    ],
+)
+@pytest.mark.parametrize("include_background", [True, False])
+@pytest.mark.parametrize(
+    ("distance_metric", "percentile"), [("euclidean", None), ("euclidean", 95), ("chessboard", None), ("taxicab", 50)]
+)
+class TestHausdorffDistance(MetricTester):
+    """Test class for `HausdorffDistance` metric."""
+
+    atol = 1e-4
+
+    @pytest.mark.parametrize("ddp", [pytest.param(True, marks=pytest.mark.DDP), False])
+    def test_hausdorff_distance_class(
+        self, preds, target, input_format, include_background, distance_metric, percentile, ddp
+    ):
+        """Test class implementation of metric."""
+        self.run_class_metric_test(
+            ddp=ddp,
+            preds=preds,
+            target=target,
+            metric_class=HausdorffDistance,
+            reference_metric=partial(
+                _reference_hausdorff_distance,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+                percentile=percentile,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "percentile": percentile,
+                "input_format": input_format,
+            },
+        )
+
+    def test_hausdorff_distance_functional(
+        self, preds, target, input_format, include_background, distance_metric, percentile
+    ):
+        """Test functional implementation of metric."""
+        self.run_functional_metric_test(
+            preds=preds,
+            target=target,
+            metric_functional=hausdorff_distance,
+            reference_metric=partial(
+                _reference_hausdorff_distance,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+                percentile=percentile,
+                reduce=False,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "percentile": percentile,
+                "input_format": input_format,
+            },
+        )
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("spacing", [[1, 1], [2.0, 0.5]])
+def test_hausdorff_distance_directed_spacing(directed, spacing):
+    """Test the directed distance and anisotropic spacing against the reference."""
+    preds, target = _inputs1.preds[0], _inputs1.target[0]
+    result = hausdorff_distance(preds, target, num_classes=NUM_CLASSES, spacing=spacing, directed=directed)
+    expected = compute_hausdorff_distance(preds, target, spacing=spacing, directed=directed)
+    assert torch.allclose(result, expected.to(result.dtype), atol=1e-4)
+
+
+def test_hausdorff_distance_empty_masks():
+    """Test that a sample with one empty mask is infinite and one with two empty masks is left out of the mean."""
+    preds = torch.zeros(2, 2, 8, 8, dtype=torch.long)
+    target = torch.zeros(2, 2, 8, 8, dtype=torch.long)
+    preds[0, 1, 2:5, 2:5] = 1
+    target[0, 1, 3:6, 2:5] = 1
+    preds[1, 1, 2:5, 2:5] = 1
+    assert torch.equal(hausdorff_distance(preds, target, num_classes=2)[:, 0], torch.tensor([1.0, float("inf")]))
+    assert hausdorff_distance(preds[:, :1], target[:, :1], num_classes=1, include_background=True).isnan().all()
+
+    metric = HausdorffDistance(num_classes=2, include_background=True, per_class=True)
+    metric.update(preds[:1], target[:1])
+    assert torch.allclose(metric.compute(), torch.tensor([float("nan"), 1.0]), equal_nan=True)
@@ -111,3 +111,37 @@ class TestMeanIoU(MetricTester):
                 "input_format": input_format,
             },
         )
+
+
+@pytest.mark.parametrize("include_background", [True, False])
+def test_mean_iou_index_matches_one_hot(include_background):
+    """Test that the index input path gives the same result as the one-hot input path."""
+    preds, target = _inputs3.preds[0], _inputs3.target[0]
+    one_hot_preds = torch.nn.functional.one_hot(preds, num_classes=NUM_CLASSES).movedim(-1, 1)
+    one_hot_target = torch.nn.functional.one_hot(target, num_classes=NUM_CLASSES).movedim(-1, 1)
+    args = {"num_classes": NUM_CLASSES, "include_background": include_background, "per_class": True}
+    assert torch.equal(
+        mean_iou(preds, target, input_format="index", **args),
+        mean_iou(one_hot_preds, one_hot_target, input_format="one-hot", **args),
+    )
+
+
+def test_mean_iou_index_out_of_range():
+    """Test that class indices outside of ``[0, num_classes)`` raise an error."""
+    preds, target = _inputs3.preds[0], _inputs3.target[0].clone()
+    target[0, 0, 0] = NUM_CLASSES
+    with pytest.raises(ValueError, match="Expected the class indices in `preds` and `target` to be in the range.*"):
+        mean_iou(preds, target, num_classes=NUM_CLASSES, input_format="index")
+
+
+def test_mean_iou_index_deterministic():
+    """Test that the index input path gives the same result with deterministic algorithms enabled."""
+    preds, target = _inputs3.preds[0], _inputs3.target[0]
+    args = {"num_classes": NUM_CLASSES, "per_class": True, "input_format": "index"}
+    expected = mean_iou(preds, target, **args)
+    deterministic = torch.are_deterministic_algorithms_enabled()
+    try:
+        torch.use_deterministic_algorithms(True)
+        assert torch.equal(mean_iou(preds, target, **args), expected)
+    finally:
+        torch.use_deterministic_algorithms(deterministic)
@@ -0,0 +1,132 @@
+# Copyright The Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from functools import partial
+
+import pytest
+import torch
+from monai.metrics.surface_dice import compute_surface_dice
+from torchmetrics.functional.segmentation.normalized_surface_dice import normalized_surface_dice
+from torchmetrics.segmentation.normalized_surface_dice import NormalizedSurfaceDice
+
+from unittests import BATCH_SIZE, NUM_BATCHES, NUM_CLASSES, _Input
+from unittests._helpers.testers import MetricTester
+
+_inputs1 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 32, 32)),
+)
+_inputs2 = _Input(
+    preds=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+    target=torch.randint(0, 2, (NUM_BATCHES, BATCH_SIZE, NUM_CLASSES, 12, 10, 8)),
+)
+_inputs3 = _Input(
+    preds=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+    target=torch.randint(0, NUM_CLASSES, (NUM_BATCHES, BATCH_SIZE, 32, 32)),
+)
+
+
+_tolerance = [float(i) / 2 for i in range(NUM_CLASSES)]
+
+
+def _reference_normalized_surface_dice(
+    preds: torch.Tensor,
+    target: torch.Tensor,
+    input_format: str,
+    include_background: bool = False,
+    distance_metric: str = "euclidean",
+    reduce: bool = True,
+):
+    """Calculate reference metric for `NormalizedSurfaceDice`."""
+    if input_format == "index":
+        preds = torch.nn.functional.one_hot(preds, num_classes=NUM_CLASSES).movedim(-1, 1)
+        target = torch.nn.functional.one_hot(target, num_classes=NUM_CLASSES).movedim(-1, 1)
+    val = compute_surface_dice(
+        preds,
+        target,
+        class_thresholds=_tolerance if include_background else _tolerance[1:],
+        include_background=include_background,
+        distance_metric=distance_metric,
+    )
+    return val.mean() if reduce else val
+
+
+@pytest.mark.parametrize(
+    "preds, target, input_format",
+    [
+        (_inputs1.preds, _inputs1.target, "one-hot"),
+        (_inputs2.preds, _inputs2.target, "one-hot"),
+        (_inputs3.preds, _inputs3.target, "index"),
+    ],
+)
+@pytest.mark.parametrize("include_background", [True, False])
+@pytest.mark.parametrize("distance_metric", ["euclidean", "chessboard", "taxicab"])
+class TestNormalizedSurfaceDice(MetricTester):
+    """Test class for `NormalizedSurfaceDice` metric."""
+
+    atol = 1e-4
+
+    @pytest.mark.parametrize("ddp", [pytest.param(True, marks=pytest.mark.DDP), False])
+    def test_normalized_surface_dice_class(self, preds, target, input_format, include_background, distance_metric, ddp):
+        """Test class implementation of metric."""
+        self.run_class_metric_test(
+            ddp=ddp,
+            preds=preds,
+            target=target,
+            metric_class=NormalizedSurfaceDice,
+            reference_metric=partial(
+                _reference_normalized_surface_dice,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "tolerance": _tolerance,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "input_format": input_format,
+            },
+        )
+
+    def test_normalized_surface_dice_functional(self, preds, target, input_format, include_background, distance_metric):
+        """Test functional implementation of metric."""
+        self.run_functional_metric_test(
+            preds=preds,
+            target=target,
+            metric_functional=normalized_surface_dice,
+            reference_metric=partial(
+                _reference_normalized_surface_dice,
+                input_format=input_format,
+                include_background=include_background,
+                distance_metric=distance_metric,
+                reduce=False,
+            ),
+            metric_args={
+                "num_classes": NUM_CLASSES,
+                "tolerance": _tolerance,
+                "include_background": include_background,
+                "distance_metric": distance_metric,
+                "input_format": input_format,
+            },
+        )
+
+
+@pytest.mark.parametrize(
+    ("tolerance", "match"),
+    [(-1.0, "Expected argument `tolerance`"), ([1.0, 2.0], "Expected argument `tolerance`")],
+)
+def test_normalized_surface_dice_raises(tolerance, match):
+    """Test that invalid tolerances raise an error."""
+    with pytest.raises(ValueError, match=match):
+        NormalizedSurfaceDice(num_classes=NUM_CLASSES, tolerance=tolerance)
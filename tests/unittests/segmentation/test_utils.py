@@ -163,6 +163,28 @@ def test_distance_transform(case, metric, device):
     assert torch.allclose(distance.cpu(), torch.from_numpy(scidistance).to(distance.dtype))
 
 
+@pytest.mark.parametrize("shape", [(16, 23), (9, 12, 7)])
+@pytest.mark.parametrize("metric", ["euclidean", "chessboard", "taxicab"])
+@pytest.mark.parametrize("sampling", [None, [2.0, 0.5, 1.5]])
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+def test_distance_transform_separable(shape, metric, sampling, device):
+    """Test that the separable engine is exact for 2D and 3D inputs."""
+    if device == "cuda" and not torch.cuda.is_available():
+        pytest.skip("CUDA device not available.")
+    if sampling is not None:
+        if metric != "euclidean":
+            pytest.skip("Scipy only supports sampling for the euclidean distance transform.")
+        sampling = sampling[: len(shape)]
+    torch.manual_seed(42)
+    case = (torch.rand(shape) > 0.1).int()
+    distance = distance_transform(case.to(device), sampling=sampling, metric=metric, engine="separable")
+    if metric == "euclidean":
+        scidistance = scidistance_transform_edt(case, sampling=sampling)
+    else:
+        scidistance = scidistance_transform_cdt(case, metric=metric)
+    assert torch.allclose(distance.cpu(), torch.from_numpy(scidistance).to(distance.dtype), atol=1e-5)
+
+
 @pytest.mark.parametrize("dim", [2, 3])
 @pytest.mark.parametrize("spacing", [1, 2])
 def test_neighbour_table(dim, spacing):
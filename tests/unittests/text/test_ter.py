@@ -11,12 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import random
 from functools import partial
 from typing import Sequence
 
 import pytest
 from torch import Tensor, tensor
-from torchmetrics.functional.text.ter import translation_edit_rate
+from torchmetrics.functional.text.ter import (
+    _MAX_SHIFT_DIST,
+    _MAX_SHIFT_SIZE,
+    _find_shifted_pairs,
+    translation_edit_rate,
+)
 from torchmetrics.text.ter import TranslationEditRate
 
 from unittests.text._helpers import TextTester
@@ -176,3 +182,23 @@ def test_ter_return_sentence_level_class():
     targets = _inputs_single_sentence_multiple_references.target
     _, sentence_ter = ter_metric(preds, targets)
     isinstance(sentence_ter, Tensor)
+
+
+def test_ter_find_shifted_pairs():
+    """Test that the indexed search for shift candidates yields the same pairs as comparing all start positions."""
+    rng = random.Random(42)  # noqa: S311
+    for _ in range(20):
+        pred_words = rng.choices(["a", "b", "c", "d"], k=rng.randint(1, 30))
+        target_words = rng.choices(["a", "b", "c", "d"], k=rng.randint(1, 30))
+        expected = []
+        for pred_start in range(len(pred_words)):
+            for target_start in range(len(target_words)):
+                if abs(target_start - pred_start) > _MAX_SHIFT_DIST:
+                    continue
+                for length in range(1, _MAX_SHIFT_SIZE):
+                    if pred_words[pred_start + length - 1] != target_words[target_start + length - 1]:
+                        break
+                    expected.append((pred_start, target_start, length))
+                    if len(pred_words) == pred_start + length or len(target_words) == target_start + length:
+                        break
+        assert list(_find_shifted_pairs(pred_words, target_words)) == expected
@@ -11,9 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import random
 from typing import List, Union
 
 import pytest
+from torchmetrics.functional.text.helper import _edit_distance
 from torchmetrics.functional.text.wer import word_error_rate
 from torchmetrics.text.wer import WordErrorRate
 
@@ -68,3 +70,29 @@ class TestWER(TextTester):
             metric_module=WordErrorRate,
             metric_functional=word_error_rate,
         )
+
+
+def _reference_edit_distance(prediction_tokens: List[str], reference_tokens: List[str]) -> int:
+    """Compute the edit distance with the full dynamic programming matrix."""
+    dp = [[0] * (len(reference_tokens) + 1) for _ in range(len(prediction_tokens) + 1)]
+    for i in range(len(prediction_tokens) + 1):
+        dp[i][0] = i
+    for j in range(len(reference_tokens) + 1):
+        dp[0][j] = j
+    for i in range(1, len(prediction_tokens) + 1):
+        for j in range(1, len(reference_tokens) + 1):
+            substitution = dp[i - 1][j - 1] + (prediction_tokens[i - 1] != reference_tokens[j - 1])
+            dp[i][j] = min(dp[i - 1][j] + 1, dp[i][j - 1] + 1, substitution)
+    return dp[-1][-1]
+
+
+@pytest.mark.parametrize("max_length", [0, 5, 63, 64, 65, 200])
+@pytest.mark.parametrize("vocabulary_size", [2, 30])
+def test_edit_distance(max_length, vocabulary_size):
+    """Test that the bit-parallel edit distance matches dynamic programming, also beyond a single 64-bit word."""
+    rng = random.Random(max_length * vocabulary_size)  # noqa: S311
+    for _ in range(20):
+        prediction_tokens = [str(rng.randrange(vocabulary_size)) for _ in range(rng.randint(0, max_length))]
+        reference_tokens = [str(rng.randrange(vocabulary_size)) for _ in range(rng.randint(0, max_length))]
+        expected = _reference_edit_distance(prediction_tokens, reference_tokens)
+        assert _edit_distance(prediction_tokens, reference_tokens) == expected
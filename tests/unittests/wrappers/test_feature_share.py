@@ -23,7 +23,7 @@ from torchmetrics.image import (
     LearnedPerceptualImagePatchSimilarity,
     StructuralSimilarityIndexMeasure,
 )
-from torchmetrics.wrappers import FeatureShare
+from torchmetrics.wrappers import FeatureShare, NetworkCache
 
 
 @pytest.mark.parametrize(
@@ -161,3 +161,107 @@ def test_same_result_as_individual():
     assert fs_res["InceptionScore"][1] == inception_res[1]
     assert fs_res["KernelInceptionDistance"][0] == kid_res[0]
     assert fs_res["KernelInceptionDistance"][1] == kid_res[1]
+
+
+class _CountingNetwork(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.linear = torch.nn.Linear(3 * 8 * 8, 16)
+        self.num_features = 16
+        self.calls = 0
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        self.calls += 1
+        return self.linear(x.float().flatten(1))
+
+    def get_features(self, x: torch.Tensor, scale: float = 1.0) -> torch.Tensor:
+        self.calls += 1
+        return scale * self.linear(x.float().flatten(1))
+
+
+def test_network_cache_fingerprint():
+    """Test that the cache is keyed on the content of the inputs and not on the identity of the tensor objects."""
+    net = _CountingNetwork()
+    cache = NetworkCache(net)
+    x = torch.randint(255, (4, 3, 8, 8), dtype=torch.uint8)
+
+    with torch.no_grad():
+        out = cache(x)
+        assert cache(x.view(4, 3, 8, 8)) is out  # different tensor object viewing the same data
+        assert net.calls == 1
+
+        x[0] = 0  # in-place modification invalidates the entry
+        assert not torch.equal(cache(x), out)
+        assert net.calls == 2
+
+        assert cache(x[:2]) is not None  # different shape
+        assert net.calls == 3
+
+        # methods of the network are cached as well, keyed on their name and arguments
+        feats = cache.get_features(x, scale=2.0)
+        assert cache.get_features(x, scale=2.0) is feats
+        cache.get_features(x, scale=3.0)
+        assert net.calls == 5
+        assert cache.num_features == 16
+
+    # inputs requiring gradients are never cached
+    y = torch.rand(4, 3, 8, 8, requires_grad=True)
+    cache(y)
+    cache(y)
+    assert net.calls == 7
+
+
+def test_network_cache_inference_mode():
+    """Test that inference tensors, which have no version counter, are cached as well."""
+    net = _CountingNetwork()
+    cache = NetworkCache(net)
+    fid = FrechetInceptionDistance(feature=_CountingNetwork())
+    cache.attach(fid)
+    with torch.inference_mode():
+        x = torch.randint(255, (4, 3, 8, 8), dtype=torch.uint8)
+        out = cache(x)
+        assert cache(x) is out
+        assert net.calls == 1
+        fid.update(x, real=True)
+        fid.update(x, real=False)
+    assert net.calls == 1
+
+
+def test_network_cache_max_bytes():
+    """Test that the least recently used entries are evicted once the outputs exceed the byte budget."""
+    net = _CountingNetwork()
+    cache = NetworkCache(net, max_size=None, max_bytes=2 * 4 * 16 * 4)  # two outputs of (4, 16) float32
+    xs = [torch.randint(255, (4, 3, 8, 8), dtype=torch.uint8) for _ in range(3)]
+    with torch.no_grad():
+        for x in xs:
+            cache(x)
+        assert net.calls == 3
+        cache(xs[2])
+        cache(xs[1])
+        assert net.calls == 3
+        cache(xs[0])  # was evicted
+        assert net.calls == 4
+
+
+def test_network_cache_attach():
+    """Test that a cache can be shared between metrics that are not in the same collection."""
+    net = _CountingNetwork()
+    fid = FrechetInceptionDistance(feature=net, reset_real_features=False)
+    kid = KernelInceptionDistance(feature=_CountingNetwork(), subsets=2, subset_size=5)
+    kid.inception.load_state_dict(net.state_dict())
+    fid_ref = FrechetInceptionDistance(feature=_CountingNetwork())
+    fid_ref.inception.load_state_dict(net.state_dict())
+
+    cache = NetworkCache(net)
+    cache.attach(fid)
+    cache.attach(kid)
+    for real in (True, False):
+        x = torch.randint(255, (10, 3, 8, 8), dtype=torch.uint8)
+        fid.update(x, real=real)
+        kid.update(x, real=real)
+        fid_ref.update(x, real=real)
+    assert net.calls == 2
+    assert torch.allclose(fid.compute(), fid_ref.compute())
+
+    with pytest.raises(AttributeError, match="Tried to set the cached network to metric.*"):
+        cache.attach(StructuralSimilarityIndexMeasure())